@@ -0,0 +1,243 @@
+#!/usr/bin/env python3
+"""
+VCP Historical Backfill Benchmark
+VeritasChain Standards Organization (VSO)
+
+Writes synthetic MT5 deal history as CSV exports (split by login, with
+MT5 column names and timestamps, plus an overlapping export of duplicate
+deals) and backfills it:
+1. Throughput in deals per minute, in-process and with a worker pool,
+   against VCPManagerAdapter.process_deals driven one deal at a time.
+2. Correctness: the archived chain links, sampled event hashes recompute,
+   the first events match VCPEventFactory.create_event byte for byte,
+   prices carry the symbol's digits and duplicates are dropped.
+3. Resume: a run interrupted after a few segments and restarted produces
+   the same archive as an uninterrupted one.
+
+Exits non-zero if a check fails.
+
+Usage:
+    python benchmarks/python/bench_backfill.py [--deals 300000] [--workers 2]
+"""
+
+import argparse
+import csv
+import filecmp
+import gzip
+import json
+import os
+import shutil
+import tempfile
+import time
+from datetime import datetime, timezone
+
+from vcp_bench import SRC_DIR  # noqa: F401  (puts the sidecar modules on sys.path)
+from vcp_backfill_v1_0 import STATE_FILE, Backfill, BackfillState, read_archive
+from vcp_loadgen_v1_0 import DEFAULT_SYMBOLS, DealStreamGenerator, LoadProfile
+from vcp_numeric_v1_0 import DigitsTable
+from vcp_sidecar_adapter_v1_0 import VCPManagerAdapter
+from vcp_sidecar_core_v1_0 import EventTypeCode, Tier, VCPEventFactory, VCPEventSerializer, compute_event_hash
+
+VENUE = "BENCH_VENUE"
+COLUMNS = ["Deal", "Order", "Time", "TimeMsc", "Login", "Symbol", "Price", "Volume", "Commission"]
+
+
+class _Interrupted(Exception):
+    pass
+
+
+class InterruptedBackfill(Backfill):
+    """Stops before writing segment number `stop_after`, as if the process were killed"""
+
+    def __init__(self, *args, stop_after: int, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.stop_after = stop_after
+
+    def _commit(self, state, lines, first_sequence, writer, pending):
+        if len(state.segments) >= self.stop_after:
+            raise _Interrupted()
+        super()._commit(state, lines, first_sequence, writer, pending)
+
+
+def write_exports(directory: str, count: int, files: int, seed: int):
+    """CSV exports split by login, plus one export repeating every 50th deal"""
+    deals = DealStreamGenerator(LoadProfile(accounts=200), seed=seed).deals(count)
+    paths = [os.path.join(directory, f"deals_{i}.csv") for i in range(files)]
+    handles = [open(path, "w", newline="") for path in paths]
+    writers = [csv.writer(handle) for handle in handles]
+    for writer in writers:
+        writer.writerow(COLUMNS)
+    duplicates = []
+    for index, deal in enumerate(deals):
+        row = [
+            deal["ticket"], deal["order"],
+            datetime.fromtimestamp(deal["time"], timezone.utc).strftime("%Y.%m.%d %H:%M:%S"),
+            deal["time_msc"], deal["login"], deal["symbol"],
+            repr(deal["price"]), repr(deal["volume"]), repr(deal["commission"]),
+        ]
+        writers[deal["login"] % files].writerow(row)
+        if index % 50 == 0:
+            duplicates.append(row)
+    for handle in handles:
+        handle.close()
+    overlap = os.path.join(directory, "deals_overlap.csv")
+    with open(overlap, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(COLUMNS)
+        writer.writerows(reversed(duplicates))
+    return paths + [overlap], deals
+
+
+def digits_table() -> DigitsTable:
+    table = DigitsTable()
+    for symbol, spec in DEFAULT_SYMBOLS.items():
+        table.set(symbol, spec.digits)
+    return table
+
+
+def archive_lines(directory: str):
+    state = BackfillState.load(os.path.join(directory, STATE_FILE))
+    for segment in state.segments:
+        with gzip.open(os.path.join(directory, segment["file"]), "rt", encoding="utf-8") as f:
+            yield from f
+
+
+def check_archive(directory: str, deals: list, sample_every: int) -> list:
+    failures = []
+    by_ticket = {deal["ticket"]: deal for deal in deals}
+    table = digits_table()
+    reference = VCPEventFactory(VENUE, Tier.SILVER)
+    prev_hash = "0" * 64
+    count = 0
+    last_position = (0, 0)
+    for index, line in enumerate(archive_lines(directory)):
+        record = json.loads(line)
+        count += 1
+        if record["security"]["prev_hash"] != prev_hash:
+            failures.append(f"chain break at event {index}")
+            break
+        prev_hash = record["security"]["event_hash"]
+        trade = record["payload"]["trade_data"]
+        deal = by_ticket[int(trade["exchange_order_id"])]
+        position = (deal["time_msc"], deal["ticket"])
+        if position <= last_position:
+            failures.append(f"event {index} out of (time_msc, ticket) order")
+            break
+        last_position = position
+        if trade["execution_price"] != table.price(deal["symbol"], deal["price"]):
+            failures.append(f"event {index}: price {trade['execution_price']} for {deal['price']} {deal['symbol']}")
+            break
+        if index % sample_every == 0:
+            event = VCPEventSerializer.from_dict(record)
+            if compute_event_hash(event) != event.security.event_hash:
+                failures.append(f"event hash mismatch at event {index}")
+                break
+        if index < 1000:
+            # The factory path, given the same IDs and chain head, must build the same event
+            reference.prev_hash = record["security"]["prev_hash"]
+            expected = reference.create_event(
+                EventTypeCode.EXE, deal["symbol"], str(deal["login"]), record["payload"],
+                trace_id=record["header"]["trace_id"], event_id=record["header"]["event_id"],
+                timestamp_ns=deal["time_msc"] * 1_000_000
+            )
+            if VCPEventSerializer.to_json(expected) != line.rstrip("\n"):
+                failures.append(f"event {index} differs from VCPEventFactory.create_event")
+                break
+    if count != len(deals):
+        failures.append(f"archive holds {count} events for {len(deals)} unique deals")
+    return failures
+
+
+def run_backfill(paths, out_dir, workers, args, backfill_class=Backfill, **kwargs):
+    backfill = backfill_class(
+        VENUE, out_dir, digits=digits_table(), workers=workers, batch_size=args.batch_size,
+        segment_events=args.segment_events, run_size=args.run_size, compresslevel=args.compresslevel, **kwargs
+    )
+    started = time.perf_counter()
+    state = backfill.run(paths)
+    return state, time.perf_counter() - started
+
+
+def process_deals_rate(deals: list, count: int) -> float:
+    """Deals per minute through process_deals, one deal per call"""
+    adapter = VCPManagerAdapter(VENUE, "http://127.0.0.1:9", "bench")
+    adapter.digits = digits_table()
+    sample = deals[:count]
+    started = time.perf_counter()
+    for deal in sample:
+        adapter.process_deals([deal], str(deal["login"]))
+    return len(sample) / (time.perf_counter() - started) * 60
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark and check the historical backfill")
+    parser.add_argument("--deals", type=int, default=300_000)
+    parser.add_argument("--files", type=int, default=4)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--batch-size", type=int, default=2000)
+    parser.add_argument("--segment-events", type=int, default=50_000)
+    parser.add_argument("--run-size", type=int, default=100_000, help="Rows sorted in memory per run")
+    parser.add_argument("--compresslevel", type=int, default=1)
+    parser.add_argument("--baseline", type=int, default=20_000, help="Deals through process_deals")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    work_dir = tempfile.mkdtemp(prefix="vcp-backfill-bench-")
+    failures = []
+    try:
+        paths, deals = write_exports(work_dir, args.deals, args.files, args.seed)
+        size = sum(os.path.getsize(path) for path in paths)
+        print(f"exports: {len(paths)} CSV files, {args.deals:,} deals (+{len(range(0, args.deals, 50)):,} "
+              f"duplicates), {size / 1e6:.1f} MB")
+
+        rows = [("process_deals, one per call", process_deals_rate(deals, args.baseline), None)]
+        outputs = {}
+        for workers in sorted({0, args.workers}):
+            out_dir = os.path.join(work_dir, f"out-{workers}")
+            state, elapsed = run_backfill(paths, out_dir, workers, args)
+            outputs[workers] = (out_dir, state)
+            label = "backfill, in-process" if workers == 0 else f"backfill, {workers} workers"
+            archived = sum(os.path.getsize(os.path.join(out_dir, s["file"])) for s in state.segments)
+            rows.append((label, state.events / elapsed * 60, archived))
+
+        print(f"\n{'path':<30} {'deals/min':>12} {'archive MB':>11}")
+        for label, per_minute, archived in rows:
+            print(f"{label:<30} {per_minute:>12,.0f} {archived / 1e6 if archived else 0:>11.1f}")
+
+        out_dir, state = outputs[args.workers]
+        failures += check_archive(out_dir, sorted(deals, key=lambda d: (d["time_msc"], d["ticket"])), 97)
+        if sum(1 for _ in read_archive(outputs[0][0])) != len(deals):
+            failures.append("in-process archive does not hold one event per unique deal")
+        if len({s.prev_hash for _, s in outputs.values()}) != 1:
+            failures.append("in-process and pooled backfills produced different chains")
+
+        # Interrupted after two segments, then resumed
+        resumed_dir = os.path.join(work_dir, "out-resumed")
+        try:
+            run_backfill(paths, resumed_dir, args.workers, args, InterruptedBackfill, stop_after=2)
+            failures.append("interrupted backfill was not interrupted")
+        except _Interrupted:
+            pass
+        partial = BackfillState.load(os.path.join(resumed_dir, STATE_FILE))
+        resumed, _ = run_backfill(paths, resumed_dir, args.workers, args)
+        identical = resumed.prev_hash == state.prev_hash and all(
+            filecmp.cmp(os.path.join(out_dir, s["file"]), os.path.join(resumed_dir, s["file"]), shallow=False)
+            for s in state.segments
+        )
+        print(f"\nresume: interrupted after {partial.events:,} events, resumed to {resumed.events:,}: "
+              f"{'identical archive' if identical else 'ARCHIVE DIFFERS'}")
+        if not identical:
+            failures.append("resumed backfill differs from an uninterrupted one")
+        print(f"checks: chain, hashes (every 97th), factory equivalence (first 1000), "
+              f"ordering, digits, duplicates: {'ok' if not failures else 'FAILED'}")
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    for failure in failures:
+        print(f"FAILED: {failure}")
+    if failures:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+VCP Sidecar Checkpoint Benchmark
+VeritasChain Standards Organization (VSO)
+
+Snapshot size, write time and restore time for a sidecar with millions of
+processed deals, open traces and correlator events, plus correctness checks:
+restored chain head, dedup set, trace map and correlator chains must match
+the originals, events queued but not acknowledged and poll cursors must
+survive a restart, and a corrupt checkpoint must fall back to <path>.prev.
+
+Usage:
+    python benchmarks/python/bench_checkpoint.py [--deals 1000000] [--traces 200000]
+"""
+
+import argparse
+import os
+import shutil
+import tempfile
+import time
+
+from vcp_bench import BenchResult, measure, print_results
+from vcp_checkpoint_v1_0 import SidecarCheckpointer
+from vcp_poller_v1_0 import CursorStore
+from vcp_sidecar_adapter_v1_0 import (
+    EventCorrelator, EventTypeCode, VCPEvent, VCPHeader, VCPManagerAdapter, VCPSecurity
+)
+
+CHAIN_TYPES = (EventTypeCode.ORD, EventTypeCode.ACK, EventTypeCode.EXE)
+
+
+def new_adapter() -> VCPManagerAdapter:
+    return VCPManagerAdapter("BENCH_VENUE", "http://127.0.0.1:9", "bench")
+
+
+def populate(adapter: VCPManagerAdapter, correlator: EventCorrelator, deals: int, traces: int):
+    adapter.processed_deals = {(50_000_000 + i, 1_700_000_000 + i) for i in range(deals)}
+    adapter.trace_id_map = {
+        str(10_000_000 + i): f"{i:08x}-0190-7000-8000-{i:012x}" for i in range(deals)
+    }
+    adapter.factory.prev_hash = "ab" * 32
+    adapter.factory.sequence = deals * 3
+
+    prev = "0" * 64
+    for t in range(traces):
+        trace_id = f"{t:08x}-0190-7000-8000-{t:012x}"
+        for k, code in enumerate(CHAIN_TYPES):
+            n = t * len(CHAIN_TYPES) + k
+            event_hash = f"{n:064x}"
+            correlator.add_event(VCPEvent(
+                header=VCPHeader(
+                    event_id=f"ev-{n}", trace_id=trace_id,
+                    timestamp_int=str(1_700_000_000_000_000_000 + n), timestamp_iso="",
+                    event_type=code.name, event_type_code=int(code),
+                    timestamp_precision="", clock_sync_status="", hash_algo="",
+                    venue_id="", symbol="", account_id=""
+                ),
+                security=VCPSecurity(event_hash=event_hash, prev_hash=prev)
+            ))
+            prev = event_hash
+
+
+def timed(name: str, fn, ops: int, **extra) -> BenchResult:
+    started = time.perf_counter()
+    fn()
+    result = BenchResult(name, ops, [time.perf_counter() - started])
+    result.extra = extra
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure checkpoint write/restore time")
+    parser.add_argument("--deals", type=int, default=1_000_000)
+    parser.add_argument("--traces", type=int, default=200_000)
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="vcp-ckpt-")
+    path = os.path.join(workdir, "sidecar.ckpt")
+    try:
+        adapter, correlator = new_adapter(), EventCorrelator()
+        populate(adapter, correlator, args.deals, args.traces)
+        events = args.traces * len(CHAIN_TYPES)
+        checkpointer = SidecarCheckpointer(adapter, path, correlator)
+
+        results = []
+        sizes = {}
+        results.append(timed("checkpoint.save", lambda: sizes.update(size=checkpointer.save()),
+                             args.deals, correlator_events=events))
+        results[-1].extra["bytes"] = sizes["size"]
+
+        restored, restored_corr = new_adapter(), EventCorrelator()
+        loader = SidecarCheckpointer(restored, path, restored_corr)
+        result = timed("checkpoint.restore", loader.restore, args.deals)
+        results.append(result)
+        restore_seconds = result.runs[0]
+
+        # Resave while everything is still packed (copied through, not materialized)
+        results.append(timed("checkpoint.resave_packed", loader.save, args.deals))
+
+        probes = [(50_000_000 + i, 1_700_000_000 + i) for i in range(0, args.deals, 97)]
+        tickets = [str(10_000_000 + i) for i in range(0, args.deals, 97)]
+        results.append(measure("checkpoint.packed_dedup_lookup",
+                               lambda: [k in restored.processed_deals for k in probes], len(probes)))
+        results.append(measure("checkpoint.packed_trace_lookup",
+                               lambda: [restored.trace_id_map[t] for t in tickets], len(tickets)))
+
+        sample = [0, args.traces // 2, args.traces - 1]
+        checks = {
+            "prev_hash": restored.factory.prev_hash == adapter.factory.prev_hash,
+            "sequence": restored.factory.sequence == adapter.factory.sequence,
+            "processed_deals": restored.processed_deals == adapter.processed_deals,
+            "trace_id_map": restored.trace_id_map == adapter.trace_id_map,
+        }
+        trace_ids = list(correlator.event_chains)
+        checks["correlator"] = all(
+            [(e.header.event_id, e.header.timestamp_int, e.header.event_type_code,
+              e.security.event_hash, e.security.prev_hash) for e in restored_corr.get_chain(tid)] ==
+            [(e.header.event_id, e.header.timestamp_int, e.header.event_type_code,
+              e.security.event_hash, e.security.prev_hash) for e in correlator.get_chain(tid)]
+            for tid in (trace_ids[i] for i in sample)
+        )
+        checks["integrity"] = restored_corr.verify_chain_integrity(trace_ids[0])["valid"]
+
+        # The restored adapter keeps deduplicating and reusing trace_ids
+        old_deal = {"ticket": 50_000_000, "time": 1_700_000_000, "order": 10_000_000}
+        new_deal = {"ticket": 90_000_000, "time": 1_800_000_000, "order": 10_000_000,
+                    "symbol": "EURUSD", "price": 1.0855, "volume": 1.0}
+        events = restored.process_deals([old_deal, new_deal], "100001")
+        checks["dedup"] = (
+            len(events) == 1 and
+            events[0].header.trace_id == adapter.trace_id_map["10000000"] and
+            restored.process_deals([new_deal], "100001") == []
+        )
+
+        # Crash with events still queued: the unacknowledged ones are queued again
+        live, cursors = new_adapter(), CursorStore()
+        crash = SidecarCheckpointer(live, os.path.join(workdir, "crash.ckpt"), cursors=cursors)
+        queued = [live.factory.create_heartbeat_event() for _ in range(5)]
+        for event in queued:
+            live.queue_event(event)
+        live._batch_sent(live.event_queue.get_batch(2), {"status": "ok"})
+        cursors.advance("100001", {"time": 1_700_000_123, "ticket": 42})
+        crash.save()
+        after, after_cursors = new_adapter(), CursorStore()
+        SidecarCheckpointer(after, crash.store.path, cursors=after_cursors).restore()
+        checks["unacked_requeued"] = (
+            [e.header.event_id for e in after.event_queue.get_batch(10)] ==
+            [e.header.event_id for e in queued[2:]]
+        )
+        checks["poll_cursors"] = after_cursors.snapshot() == {"100001": (1_700_000_123, 42, [])}
+
+        # Corrupt the newest snapshot: restore must fall back to <path>.prev
+        with open(path, "r+b") as f:
+            f.seek(os.path.getsize(path) // 2)
+            f.write(b"\xff" * 16)
+        fallback = new_adapter()
+        checks["fallback_prev"] = (
+            SidecarCheckpointer(fallback, path).restore() and
+            fallback.factory.sequence == adapter.factory.sequence
+        )
+
+        print_results(results)
+        print(f"\nrestore: {restore_seconds:.3f} s ({'OK' if restore_seconds < 1.0 else 'SLOW'}, target < 1 s)")
+        for name, ok in checks.items():
+            print(f"  {name:16} {'OK' if ok else 'MISMATCH'}")
+        if not all(checks.values()):
+            raise SystemExit(1)
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+VCP End-to-End Benchmarks
+VeritasChain Standards Organization (VSO)
+
+Deal processing, queueing and batch upload through VCPManagerAdapter
+against a local stand-in VCC server with configurable latency and errors.
+"""
+
+import time
+from typing import List
+
+from bench_macro import synthetic_deals
+from vcc_standin import StandinVCCServer
+from vcp_bench import BenchResult
+from vcp_sidecar_adapter_v1_0 import VCPManagerAdapter, Tier
+
+# (latency_ms, error_rate) profiles
+PROFILES = [
+    (0.0, 0.0),
+    (20.0, 0.0),
+    (20.0, 0.02),
+]
+
+
+def _run_once(deals, latency_ms: float, error_rate: float, batch_size: int, timeout: float):
+    with StandinVCCServer(latency_ms=latency_ms, error_rate=error_rate) as server:
+        adapter = VCPManagerAdapter(
+            venue_id="BENCH_VENUE",
+            vcc_endpoint=server.endpoint,
+            vcc_api_key="bench",
+            tier=Tier.SILVER,
+            batch_size=batch_size
+        )
+        started = time.perf_counter()
+        adapter.start()
+        for event in adapter.process_deals(deals, "100001"):
+            adapter.queue_event(event)
+
+        deadline = started + timeout
+        while server.stats.snapshot()["unique_events"] < len(deals):
+            if time.perf_counter() > deadline:
+                break
+            time.sleep(0.005)
+        elapsed = time.perf_counter() - started
+        adapter.stop()
+        return elapsed, server.stats.snapshot()
+
+
+def run(quick: bool = False) -> List[BenchResult]:
+    n = 1000 if quick else 5000
+    repeat = 1 if quick else 3
+    batch_size = 100
+    deals = synthetic_deals(n)
+    results = []
+
+    for latency_ms, error_rate in PROFILES:
+        runs, stats = [], {}
+        for _ in range(repeat):
+            elapsed, stats = _run_once(deals, latency_ms, error_rate, batch_size, timeout=120.0)
+            runs.append(elapsed)
+        name = f"e2e.adapter_upload.lat{latency_ms:g}ms.err{error_rate:g}"
+        result = BenchResult(
+            name, n, runs,
+            params={"events": n, "latency_ms": latency_ms,
+                    "error_rate": error_rate, "batch_size": batch_size}
+        )
+        result.extra = {
+            "delivered": f"{stats['unique_events']}/{n}",
+            "requests": stats["requests"],
+            "errors_injected": stats["errors_injected"],
+        }
+        results.append(result)
+
+    return results
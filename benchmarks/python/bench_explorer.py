@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+VCP Explorer Client Benchmark
+VeritasChain Standards Organization (VSO)
+
+Wall time to pull a large event set (default 100k) from a local stand-in
+Explorer with per-request latency. The pull runs sequentially, with
+prefetch of the next offset pages, and from a warm disk cache. Then Merkle
+proofs are fetched cold and warm, and a rate-limited pull compares the
+header-driven token bucket with a naive client that retries on 429.
+
+Usage:
+    python benchmarks/python/bench_explorer.py [--events 100000] [--latency-ms 20]
+"""
+
+import argparse
+import shutil
+import tempfile
+import time
+
+import requests
+
+from vcp_bench import BenchResult, print_results
+from explorer_standin import StandinExplorerServer, generate_events
+from vcp_explorer_v1_0 import ExplorerClient, RateLimiter
+from vcp_merkle_v1_0 import InclusionProof
+
+
+def pull(client: ExplorerClient, expected_ids) -> float:
+    started = time.perf_counter()
+    ids = [event["header"]["event_id"] for event in client.iter_events()]
+    elapsed = time.perf_counter() - started
+    if ids != expected_ids:
+        raise AssertionError(f"pulled {len(ids)} events, expected {len(expected_ids)} in order")
+    return elapsed
+
+
+def naive_pull(endpoint: str, page_size: int, total: int) -> int:
+    """Pages sequentially, sleeping Retry-After on every 429; returns 429s seen"""
+    session = requests.Session()
+    throttled = offset = 0
+    while offset < total:
+        response = session.get(f"{endpoint}/events", params={"limit": page_size, "offset": offset})
+        if response.status_code == 429:
+            throttled += 1
+            time.sleep(float(response.headers.get("Retry-After", 1)))
+            continue
+        offset += page_size
+    return throttled
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure Explorer client pull throughput")
+    parser.add_argument("--events", type=int, default=100_000)
+    parser.add_argument("--latency-ms", type=float, default=20.0)
+    parser.add_argument("--page-size", type=int, default=1000)
+    parser.add_argument("--proofs", type=int, default=500)
+    parser.add_argument("--rl-pages", type=int, default=60, help="Pages pulled in the rate-limited run")
+    parser.add_argument("--rl-page-size", type=int, default=100)
+    parser.add_argument("--rl-limit", type=int, default=20, help="Requests per second in the rate-limited run")
+    args = parser.parse_args()
+
+    events = generate_events(args.events)
+    expected_ids = [e.header.event_id for e in events]
+    results = []
+    cache_dir = tempfile.mkdtemp(prefix="vcp-explorer-")
+    n = args.events
+
+    with StandinExplorerServer(events, latency_ms=args.latency_ms, limit=1_000_000) as server:
+        def client(**kwargs):
+            limiter = RateLimiter(limit=1_000_000, window=60.0)
+            return ExplorerClient("bench-key", server.endpoint, page_size=args.page_size,
+                                  rate_limiter=limiter, **kwargs)
+
+        for prefetch in (0, 2, 4):
+            elapsed = pull(client(prefetch=prefetch), expected_ids)
+            results.append(BenchResult(f"explorer.pull_prefetch{prefetch}", n, [elapsed],
+                                       params={"latency_ms": args.latency_ms}))
+
+        cached = client(prefetch=4, cache_dir=cache_dir, cache_ttl=300)
+        results.append(BenchResult("explorer.pull_cache_cold", n, [pull(cached, expected_ids)]))
+        before = server.stats.snapshot()["requests"]
+        results.append(BenchResult("explorer.pull_cache_warm", n, [pull(cached, expected_ids)]))
+        warm_requests = server.stats.snapshot()["requests"] - before
+
+        step = max(1, n // args.proofs)
+        sample = expected_ids[::step][:args.proofs]
+        for name in ("explorer.proofs_cold", "explorer.proofs_warm"):
+            started = time.perf_counter()
+            proofs = [cached.get_merkle_proof(event_id) for event_id in sample]
+            results.append(BenchResult(name, len(sample), [time.perf_counter() - started]))
+        if not all(InclusionProof(**proof).verify() for proof in proofs):
+            raise AssertionError("proof verification failed")
+
+    rl_events = events[:args.rl_pages * args.rl_page_size]
+    with StandinExplorerServer(rl_events, limit=args.rl_limit, window=1.0) as server:
+        limiter = RateLimiter(limit=args.rl_limit, window=1.0)
+        limited = ExplorerClient("bench-key", server.endpoint, page_size=args.rl_page_size,
+                                 prefetch=4, rate_limiter=limiter)
+        started = time.perf_counter()
+        pulled = sum(1 for _ in limited.iter_events())
+        elapsed = time.perf_counter() - started
+        bucket_429 = server.stats.snapshot()["throttled"]
+        results.append(BenchResult("explorer.pull_rate_limited_bucket", pulled, [elapsed],
+                                   params={"limit_per_s": args.rl_limit}, extra={"http_429": bucket_429}))
+
+        time.sleep(1.0)  # Fresh window
+        started = time.perf_counter()
+        naive_429 = naive_pull(server.endpoint, args.rl_page_size, len(rl_events))
+        results.append(BenchResult("explorer.pull_rate_limited_naive", len(rl_events),
+                                   [time.perf_counter() - started],
+                                   params={"limit_per_s": args.rl_limit}, extra={"http_429": naive_429}))
+
+    shutil.rmtree(cache_dir, ignore_errors=True)
+    print_results(results)
+    print(f"\nwall time for {n:,} events:")
+    for result in results:
+        extra = f"  (429s: {result.extra['http_429']})" if "http_429" in result.extra else ""
+        print(f"  {result.name:<36} {min(result.runs):8.2f} s{extra}")
+    print(f"warm-cache requests to server: {warm_requests}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+VCP Hash Algorithm Benchmark
+VeritasChain Standards Organization (VSO)
+
+1. Raw digest throughput of every registered hash_algo across payload
+   sizes (64 B to 64 KiB).
+2. compute_event_hash per event (canonical JSON + digest) for a typical
+   execution event and for a signal event with a large VCP-GOV payload.
+3. Mixed-algorithm chain: a factory switching hash_algo every N events,
+   checked with EventCorrelator (recompute=True), Merkle anchors and
+   inclusion proofs, plus a tampered event that must fail. Exits non-zero
+   if any check fails.
+
+Usage:
+    python benchmarks/python/bench_hash.py [--chain 9000] [--switch-every 1000]
+"""
+
+import argparse
+import os
+
+from vcp_bench import measure, print_results
+from vcp_merkle_v1_0 import MerkleAnchorer, verify_event
+from vcp_sidecar_core_v1_0 import (
+    HASH_ALGORITHMS, EventCorrelator, EventTypeCode, Tier, UUIDv7Generator, VCPEventFactory,
+    compute_event_hash
+)
+
+SIZES = (64, 256, 1024, 4096, 65536)
+
+
+def digest_throughput(quick: bool):
+    results = []
+    for algo, constructor in HASH_ALGORITHMS.items():
+        for size in SIZES:
+            data = os.urandom(size)
+            n = max(200, (2_000_000 if not quick else 200_000) // size)
+
+            def run():
+                for _ in range(n):
+                    constructor(data).digest()
+            result = measure(f"hash.{algo}.{size}B", run, n, repeat=5, params={"bytes": size})
+            seconds = min(result.runs) / n
+            result.extra["MB/s"] = round(size / seconds / 1e6, 1)
+            results.append(result)
+    return results
+
+
+def event_hashing(quick: bool):
+    n = 2000 if quick else 20000
+    results = []
+    for algo in HASH_ALGORITHMS:
+        factory = VCPEventFactory("BENCH_VENUE", Tier.SILVER, hash_algo=algo)
+        small = factory.create_execution_event(
+            "XAUUSD", "bench_account", UUIDv7Generator.generate(), "ORD_001", "EXE_001",
+            "2650.55", "1.00", "0.05", "2.50"
+        )
+        large = factory.create_signal_event(
+            "XAUUSD", "bench_account", "ALGO", "1.0.0", confidence="0.85",
+            decision_factors=[{"name": f"feature_{i}", "weight": "0.01", "value": f"{i * 1.5:.4f}"}
+                              for i in range(60)]
+        )
+        for label, event in (("exe", small), ("sig_large", large)):
+            def run():
+                for _ in range(n):
+                    compute_event_hash(event)
+            results.append(measure(f"event_hash.{algo}.{label}", run, n, repeat=5))
+    return results
+
+
+def _mixed_events(factory: VCPEventFactory, length: int, switch_every: int, trace_id: str, on_event=None):
+    algos = list(HASH_ALGORITHMS)
+    events = []
+    for i in range(length):
+        factory.hash_algo = algos[(i // switch_every) % len(algos)]
+        event = factory.create_event(EventTypeCode.EXE, "EURUSD", "100001",
+                                     {"trade_data": {"order_id": str(i), "price": "1.08550"}}, trace_id=trace_id)
+        events.append(event)
+        if on_event:
+            on_event(event)
+    return events
+
+
+def mixed_chain(length: int, switch_every: int) -> list:
+    """Failures of the mixed-algorithm checks (empty when all pass)"""
+    failures = []
+    trace_id = UUIDv7Generator.generate()
+
+    # Chain verification: one trace, algorithm switched every switch_every events
+    events = _mixed_events(VCPEventFactory("BENCH_VENUE", Tier.SILVER), length, switch_every, trace_id)
+    correlator = EventCorrelator()
+    for event in events:
+        correlator.add_event(event)
+    result = correlator.verify_chain_integrity(trace_id, recompute=True)
+    if not result["valid"] or result["events"] != length:
+        failures.append(f"mixed chain did not verify: {result}")
+    used = {event.header.hash_algo for event in events}
+    if used != set(HASH_ALGORITHMS):
+        failures.append(f"chain used {sorted(used)}, expected {list(HASH_ALGORITHMS)}")
+
+    tampered = events[length // 2]
+    tampered.payload["trade_data"]["price"] = "9.99999"
+    tamper_detected = not correlator.verify_chain_integrity(trace_id, recompute=True)["valid"]
+    if not tamper_detected:
+        failures.append("tampered event was not detected")
+
+    # Merkle anchors: each window's tree uses the algorithm current when it is anchored
+    factory = VCPEventFactory("BENCH_VENUE", Tier.SILVER)
+    anchorer = MerkleAnchorer(factory, every_events=switch_every, every_seconds=1e9,
+                              keep_trees=length // switch_every + 2)
+    anchors, sequences = [], []
+
+    def on_event(event):
+        sequences.append(factory.sequence)
+        if anchorer.due(event):
+            anchors.append(anchorer.emit())
+    events = _mixed_events(factory, length, switch_every, trace_id, on_event)
+    proofs = 0
+    for i in range(0, length, max(1, length // 60)):
+        proof = anchorer.proof(sequences[i])
+        proofs += 1
+        if proof is None or not verify_event(events[i], proof, anchors[proof.anchor_index:]):
+            failures.append(f"inclusion proof failed for event {i} ({events[i].header.hash_algo})")
+    tree_algs = sorted({anchor.payload["vcp_anchor"]["tree_alg"] for anchor in anchors})
+
+    print(f"\nmixed chain: {length:,} events over {sorted(used)}: "
+          f"{'verified' if result['valid'] else 'FAILED'}, tamper detected: {'yes' if tamper_detected else 'NO'}")
+    print(f"anchors: {len(anchors)} ({', '.join(tree_algs)}), {proofs} inclusion proofs checked")
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare hash algorithms for the event chain")
+    parser.add_argument("--chain", type=int, default=9000)
+    parser.add_argument("--switch-every", type=int, default=1000)
+    parser.add_argument("--quick", action="store_true")
+    args = parser.parse_args()
+
+    results = digest_throughput(args.quick)
+    print_results(results)
+    print(f"\n{'MB/s':<14}" + "".join(f"{size:>10}B" for size in SIZES))
+    for algo in HASH_ALGORITHMS:
+        row = [r.extra["MB/s"] for r in results if r.name.startswith(f"hash.{algo}.")]
+        print(f"{algo:<14}" + "".join(f"{value:>11,.0f}" for value in row))
+
+    print_results(event_hashing(args.quick))
+
+    failures = mixed_chain(args.chain, args.switch_every)
+    for failure in failures:
+        print(f"FAILED: {failure}")
+    if failures:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+VCP Heartbeat Scheduler Benchmark
+VeritasChain Standards Organization (VSO)
+
+1. Simulated trading day (virtual clock): heartbeats emitted by the
+   idle-gap scheduler against a fixed 60 s heartbeat loop, for entities
+   with a trading session and silent hours around it. Liveness check:
+   the longest silence (no event of any kind) per entity.
+2. Scale: 10k entities on one scheduler thread in real time, ~30% of
+   them with live traffic. Reports heartbeats/s, tick processing time and
+   the longest silence seen.
+
+Usage:
+    python benchmarks/python/bench_heartbeat.py [--entities 500] [--scale-entities 10000]
+"""
+
+import argparse
+import random
+import statistics
+import time
+from threading import Event, Thread
+
+from vcp_bench import measure, print_results
+from vcp_heartbeat_v1_0 import HeartbeatScheduler
+from vcp_sidecar_adapter_v1_0 import Tier, VCPEventFactory
+
+DAY = 86_400
+
+
+def trading_day(rng: random.Random):
+    """(session start, end, event times) of one entity: a 4-10 h session with Poisson arrivals"""
+    start = rng.uniform(0, DAY - 4 * 3600)
+    end = min(DAY, start + rng.uniform(4, 10) * 3600)
+    mean_interval = rng.choice((5, 15, 30, 90, 180))
+    times, t = [], start
+    while True:
+        t += rng.expovariate(1 / mean_interval)
+        if t >= end:
+            return start, end, times
+        times.append(t)
+
+
+def simulate_day(entities: int, idle_gap: float, tick: float, seed: int = 7):
+    rng = random.Random(seed)
+    traffic = [trading_day(rng) for _ in range(entities)]
+    now = [0.0]
+    scheduler = HeartbeatScheduler(idle_gap=idle_gap, tick=tick, clock=lambda: now[0])
+    activity = [[0.0] for _ in range(entities)]   # Every event time, real or heartbeat
+    for key in range(entities):
+        scheduler.register(key, lambda key=key: activity[key].append(now[0]))
+
+    pending = sorted((t, key) for key, (_, _, times) in enumerate(traffic) for t in times)
+    real = [set(times) for _, _, times in traffic]
+    cursor = 0
+    started = time.perf_counter()
+    steps = int(DAY / tick)
+    for step in range(1, steps + 1):
+        now[0] = step * tick
+        while cursor < len(pending) and pending[cursor][0] <= now[0]:
+            t, key = pending[cursor]
+            scheduler.touch(key, t)
+            activity[key].append(t)
+            cursor += 1
+        scheduler.poll()
+    elapsed = time.perf_counter() - started
+
+    heartbeats = sum(len(a) for a in activity) - entities - len(pending)
+    in_session = sum(1 for key, (start, end, _) in enumerate(traffic)
+                     for t in activity[key][1:] if start <= t < end and t not in real[key])
+    session_seconds = sum(end - start for start, end, _ in traffic)
+    max_gap = max(max(b - a for a, b in zip(sorted(times), sorted(times)[1:]))
+                  for times in (a + [DAY] for a in activity))
+    return {
+        "real_events": len(pending),
+        "heartbeats": heartbeats,
+        "fixed_heartbeats": entities * int(DAY / 60),
+        "in_session": in_session,
+        "fixed_in_session": int(session_seconds / 60),
+        "max_gap": max_gap,
+        "sim_seconds": elapsed,
+    }
+
+
+def run_scale(entities: int, idle_gap: float, tick: float, duration: float, active_share: float):
+    factory = VCPEventFactory("BENCH_VENUE", Tier.SILVER)
+    last_seen = {}
+    gaps = []
+    # Full jitter spreads the first heartbeats of 10k entities over one idle gap
+    scheduler = HeartbeatScheduler(idle_gap=idle_gap, tick=tick, jitter=1.0)
+    durations = []
+    poll = scheduler.poll
+
+    def timed_poll(now=None):
+        started = time.perf_counter()
+        emitted = poll(now)
+        durations.append(time.perf_counter() - started)
+        return emitted
+    scheduler.poll = timed_poll
+
+    def emit(key):
+        factory.create_heartbeat_event()
+        now = time.time()
+        gaps.append(now - last_seen.get(key, now))
+        last_seen[key] = now
+
+    registered = time.time()
+    for key in range(entities):
+        last_seen[key] = registered
+        scheduler.register(key, lambda key=key: emit(key))
+    active = list(range(int(entities * active_share)))
+    stop = Event()
+
+    def traffic():
+        rng = random.Random(3)
+        while not stop.is_set():
+            key = rng.choice(active)
+            now = time.time()
+            scheduler.touch(key, now)
+            last_seen[key] = now
+            time.sleep(0.0002)
+
+    traffic_thread = Thread(target=traffic, daemon=True)
+    scheduler.start()
+    traffic_thread.start()
+    time.sleep(duration)
+    stop.set()
+    scheduler.stop()
+    traffic_thread.join()
+    busy = [d for d in durations if d > 0]
+    return {
+        "heartbeats": len(gaps),
+        "per_second": len(gaps) / duration,
+        "tick_p50_ms": statistics.median(busy) * 1e3 if busy else 0.0,
+        "tick_max_ms": max(busy) * 1e3 if busy else 0.0,
+        "max_gap": max(gaps) if gaps else 0.0,
+        "idle_entities": entities - len(active),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure the traffic-aware heartbeat scheduler")
+    parser.add_argument("--entities", type=int, default=500)
+    parser.add_argument("--idle-gap", type=float, default=60.0)
+    parser.add_argument("--scale-entities", type=int, default=10_000)
+    parser.add_argument("--scale-idle-gap", type=float, default=3.0)
+    parser.add_argument("--scale-tick", type=float, default=0.1)
+    parser.add_argument("--scale-duration", type=float, default=10.0)
+    args = parser.parse_args()
+
+    scheduler = HeartbeatScheduler()
+    for key in range(1000):
+        scheduler.register(key, lambda: None)
+    results = [measure("heartbeat.touch", lambda: [scheduler.touch(k) for k in range(1000)], 1000)]
+    print_results(results)
+
+    day = simulate_day(args.entities, args.idle_gap, 1.0)
+    fixed_total = day["real_events"] + day["fixed_heartbeats"]
+    sched_total = day["real_events"] + day["heartbeats"]
+    print(f"\nsimulated day, {args.entities} entities, idle gap {args.idle_gap:.0f} s "
+          f"(simulated in {day['sim_seconds']:.1f} s):")
+    print(f"  real events:                  {day['real_events']:>10,}")
+    print(f"  heartbeats, fixed 60 s loop:  {day['fixed_heartbeats']:>10,}  (longest silence 60 s)")
+    print(f"  heartbeats, idle-gap:         {day['heartbeats']:>10,}  (longest silence {day['max_gap']:.1f} s)")
+    print(f"  during trading sessions:      {day['fixed_in_session']:>10,} -> {day['in_session']:,} "
+          f"({100 * (1 - day['in_session'] / day['fixed_in_session']):.0f}% fewer)")
+    print(f"  outside sessions:             {day['fixed_heartbeats'] - day['fixed_in_session']:>10,} -> "
+          f"{day['heartbeats'] - day['in_session']:,} (liveness needs one per idle gap)")
+    print(f"  events + hashes per day:      {fixed_total:>10,} -> {sched_total:,} "
+          f"({100 * (1 - sched_total / fixed_total):.0f}% fewer)")
+
+    scale = run_scale(args.scale_entities, args.scale_idle_gap, args.scale_tick,
+                      args.scale_duration, active_share=0.3)
+    print(f"\nscale, {args.scale_entities:,} entities on one thread, idle gap {args.scale_idle_gap} s, "
+          f"tick {args.scale_tick} s:")
+    print(f"  heartbeats emitted:     {scale['heartbeats']:,} ({scale['per_second']:,.0f}/s, "
+          f"{scale['idle_entities']:,} idle entities)")
+    print(f"  tick processing:        p50 {scale['tick_p50_ms']:.2f} ms, max {scale['tick_max_ms']:.2f} ms")
+    print(f"  longest silence:        {scale['max_gap']:.2f} s "
+          f"(bound {args.scale_idle_gap + args.scale_tick:.2f} s + processing)")
+
+
+if __name__ == "__main__":
+    main()
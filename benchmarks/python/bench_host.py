@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""
+VCP Sidecar Host Benchmark
+VeritasChain Standards Organization (VSO)
+
+Runs N venues (1, 10, 100 by default) two ways, each in a fresh process,
+against one local stand-in VCC:
+- adapters: one started VCPManagerAdapter per venue (own worker and
+            drain threads, own sessions), as with one sidecar per venue
+- host:     one SidecarHost with a shared upload pool
+
+For each run it reports:
+- threads and resident memory added by the venues
+- CPU burned while idle
+- delivery latency (queue_event to the stand-in receiving the event)
+  under a skewed load, where one hot venue sends half of all events and
+  the rest is spread over the quiet venues
+
+Exits non-zero if the host loses an event, if its thread count grows
+with the venue count, or if it needs more memory than the adapters.
+
+Usage:
+    python benchmarks/python/bench_host.py [--venues 1,10,100] [--rate 2000] [--duration 5] [--workers 4]
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+from vcp_bench import SRC_DIR  # noqa: F401  (puts the sidecar modules on sys.path)
+from vcc_standin import StandinVCCServer
+
+MODES = ("adapters", "host")
+
+
+def rss_kb() -> int:
+    with open("/proc/self/status") as f:
+        for line in f:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1])
+    return 0
+
+
+# =============================================================================
+# Child: one mode at one venue count
+# =============================================================================
+def child(mode: str, venues: int, args) -> dict:
+    import gc
+    import logging
+    from vcp_host_v1_0 import SidecarHost
+    from vcp_sidecar_adapter_v1_0 import EventTypeCode, VCPManagerAdapter
+
+    logging.getLogger("vcp_adapter").setLevel(logging.CRITICAL)
+    names = [f"VENUE_{i:03d}" for i in range(venues)]
+    gc.collect()
+    base_rss, base_threads = rss_kb(), threading.active_count()
+
+    host = None
+    if mode == "host":
+        host = SidecarHost(args.endpoint, "bench", upload_workers=args.workers)
+        adapters = [host.add_venue(name, batch_size=args.batch_size) for name in names]
+        host.start()
+    else:
+        adapters = [VCPManagerAdapter(name, args.endpoint, "bench", batch_size=args.batch_size) for name in names]
+        for adapter in adapters:
+            adapter.start()
+    time.sleep(0.5)
+    gc.collect()
+    threads, memory = threading.active_count() - base_threads, rss_kb() - base_rss
+
+    cpu = time.process_time()
+    time.sleep(args.idle)
+    idle_cpu = (time.process_time() - cpu) / args.idle
+
+    # Skewed load: every other event goes to the hot venue, the rest round-robin over the quiet ones
+    sent = []
+    started = time.perf_counter()
+    index = 0
+    while True:
+        elapsed = time.perf_counter() - started
+        if elapsed >= args.duration:
+            break
+        due = index / args.rate
+        if due > elapsed:
+            time.sleep(min(due - elapsed, 0.002))
+            continue
+        venue = 0 if venues == 1 or index % 2 == 0 else 1 + (index // 2) % (venues - 1)
+        event = adapters[venue].factory.create_event(
+            EventTypeCode.EXE, "EURUSD", "100001", {"trade_data": {"order_id": str(index), "price": "1.08550"}}
+        )
+        sent.append((venue, event.header.event_id, time.monotonic()))
+        adapters[venue].queue_event(event)
+        index += 1
+
+    deadline = time.perf_counter() + args.settle
+    while time.perf_counter() < deadline and any(not a.event_queue.empty() for a in adapters):
+        time.sleep(0.05)
+    time.sleep(1.5)
+    if host:
+        host.stop()
+    else:
+        for adapter in adapters:
+            adapter.stop()
+    return {"threads": threads, "rss_kb": memory, "idle_cpu": idle_cpu, "sent": sent}
+
+
+# =============================================================================
+# Parent
+# =============================================================================
+def percentile(values, q: float) -> float:
+    if not values:
+        return float("nan")
+    values = sorted(values)
+    return values[min(len(values) - 1, int(q * len(values)))]
+
+
+def run(mode: str, venues: int, endpoint: str, received: dict, args) -> dict:
+    with tempfile.NamedTemporaryFile("r", suffix=".json") as out:
+        subprocess.run([
+            sys.executable, os.path.abspath(__file__), "--child", mode, str(venues), out.name,
+            "--endpoint", endpoint, "--rate", str(args.rate), "--duration", str(args.duration),
+            "--workers", str(args.workers), "--batch-size", str(args.batch_size), "--idle", str(args.idle),
+        ], check=True)
+        result = json.load(out)
+    hot, quiet, lost = [], [], 0
+    for venue, event_id, emitted in result.pop("sent"):
+        arrived = received.get(event_id)
+        if arrived is None:
+            lost += 1
+            continue
+        (hot if venue == 0 else quiet).append(arrived - emitted)
+    result.update(events=len(hot) + len(quiet) + lost, lost=lost, hot=hot, quiet=quiet)
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare per-venue adapters with a shared sidecar host")
+    parser.add_argument("--venues", default="1,10,100")
+    parser.add_argument("--rate", type=float, default=2000.0, help="Events per second over all venues")
+    parser.add_argument("--duration", type=float, default=5.0)
+    parser.add_argument("--idle", type=float, default=2.0, help="Seconds of idle CPU measurement")
+    parser.add_argument("--workers", type=int, default=4, help="Host upload workers")
+    parser.add_argument("--batch-size", type=int, default=100)
+    parser.add_argument("--settle", type=float, default=30.0)
+    parser.add_argument("--endpoint")
+    parser.add_argument("--child", nargs=3, metavar=("MODE", "VENUES", "OUT"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        mode, venues, out = args.child
+        result = child(mode, int(venues), args)
+        with open(out, "w") as f:
+            json.dump(result, f)
+        return
+
+    received = {}
+
+    def observe(event):
+        received.setdefault(event["header"]["event_id"], time.monotonic())
+        return None
+
+    counts = [int(n) for n in args.venues.split(",")]
+    results = {}
+    with StandinVCCServer(reject_fn=observe, keep_ids=False) as server:
+        for venues in counts:
+            for mode in MODES:
+                results[mode, venues] = run(mode, venues, server.endpoint, received, args)
+
+    print(f"{'mode':<9} {'venues':>6} {'threads':>8} {'RSS MB':>7} {'idle CPU':>9} {'events':>7} {'lost':>5} "
+          f"{'hot p50 ms':>11} {'hot p99 ms':>11} {'quiet p50 ms':>13} {'quiet p99 ms':>13}")
+    for (mode, venues), r in results.items():
+        print(f"{mode:<9} {venues:>6} {r['threads']:>8} {r['rss_kb'] / 1024:>7.1f} {r['idle_cpu']:>9.1%} "
+              f"{r['events']:>7} {r['lost']:>5} "
+              f"{percentile(r['hot'], 0.5) * 1000:>11.1f} {percentile(r['hot'], 0.99) * 1000:>11.1f} "
+              f"{percentile(r['quiet'], 0.5) * 1000:>13.1f} {percentile(r['quiet'], 0.99) * 1000:>13.1f}")
+
+    failures = []
+    hosted = [results["host", n] for n in counts]
+    for n, r in zip(counts, hosted):
+        if r["lost"]:
+            failures.append(f"host lost {r['lost']} of {r['events']} events at {n} venues")
+    if len({r["threads"] for r in hosted}) != 1:
+        failures.append(f"host threads vary with venue count: {[r['threads'] for r in hosted]}")
+    largest = max(counts)
+    if results["host", largest]["rss_kb"] > results["adapters", largest]["rss_kb"]:
+        failures.append(f"host uses more memory than separate adapters at {largest} venues")
+    if len(counts) > 1:
+        smallest = min(counts)
+        per_venue = {
+            mode: (results[mode, largest]["rss_kb"] - results[mode, smallest]["rss_kb"]) / (largest - smallest)
+            for mode in MODES
+        }
+        print(f"\nmemory per added venue: adapters {per_venue['adapters']:.0f} KB, host {per_venue['host']:.0f} KB")
+    for failure in failures:
+        print(f"FAILED: {failure}")
+    if failures:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
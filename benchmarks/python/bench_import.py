@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+VCP Import-Time Benchmark
+VeritasChain Standards Organization (VSO)
+
+Cold-start cost of the sidecar modules, each measured in a fresh
+interpreter with `python -X importtime`, which gives the cumulative import
+time of the module and everything it pulls in. Sources are byte-compiled
+first, as in an installed package. Reported per target (median of --runs):
+- import time of the module (importtime, cumulative)
+- wall time of the whole process, minus an empty interpreter
+
+The event core must stay within --budget-ms, load no `requests` and
+configure no logging; the script exits non-zero otherwise.
+
+Usage:
+    python benchmarks/python/bench_import.py [--runs 9] [--budget-ms 40]
+"""
+
+import argparse
+import compileall
+import statistics
+import subprocess
+import sys
+import time
+
+from vcp_bench import SRC_DIR
+
+CORE = "vcp_sidecar_core_v1_0"
+
+TARGETS = {
+    "core": f"import {CORE}",
+    "core + one event": (
+        f"from {CORE} import Tier, VCPEventFactory, VCPEventSerializer\n"
+        "VCPEventSerializer.to_json(VCPEventFactory('V', Tier.SILVER).create_heartbeat_event())"
+    ),
+    "adapter": "import vcp_sidecar_adapter_v1_0",
+    "adapter + VCCClient": (
+        "from vcp_sidecar_adapter_v1_0 import VCCClient\n"
+        "VCCClient('http://127.0.0.1:1', 'key')"
+    ),
+    "requests alone": "import requests",
+}
+
+baseline_modules = set()  # Imported by every interpreter at startup
+
+CHECK_CORE = (
+    f"import logging, sys\nimport {CORE}\n"
+    "assert 'requests' not in sys.modules, 'core imported requests'\n"
+    "assert not logging.getLogger().handlers, 'core configured logging'"
+)
+
+
+def run_python(code: str, importtime: bool = False) -> subprocess.CompletedProcess:
+    args = [sys.executable] + (["-X", "importtime"] if importtime else []) + ["-c", code]
+    return subprocess.run(args, cwd=SRC_DIR, capture_output=True, text=True, check=True)
+
+
+def import_ms(code: str) -> float:
+    """Summed cumulative importtime of the top-level imports the snippet triggers"""
+    stderr = run_python(code, importtime=True).stderr
+    total = 0
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        if not name.startswith("  ") and name.strip() not in baseline_modules:
+            total += int(cumulative)
+    return total / 1000
+
+
+def wall_ms(code: str) -> float:
+    started = time.perf_counter()
+    run_python(code)
+    return (time.perf_counter() - started) * 1000
+
+
+def main():
+    global baseline_modules
+    parser = argparse.ArgumentParser(description="Measure sidecar module import times")
+    parser.add_argument("--runs", type=int, default=9)
+    parser.add_argument("--budget-ms", type=float, default=40.0, help="Cold-start budget for the event core")
+    args = parser.parse_args()
+
+    compileall.compile_dir(SRC_DIR, quiet=1)
+    # Modules the interpreter imports at startup (site etc.) are not charged to a target
+    startup = run_python("pass", importtime=True).stderr
+    baseline_modules = {line.split("|")[2].strip() for line in startup.splitlines()
+                        if line.startswith("import time:") and "cumulative" not in line}
+    empty = statistics.median(wall_ms("pass") for _ in range(args.runs))
+
+    print(f"{'target':<22} {'import ms':>10} {'process ms':>11}   (empty interpreter {empty:.1f} ms)")
+    results = {}
+    for name, code in TARGETS.items():
+        try:
+            imported = statistics.median(import_ms(code) for _ in range(args.runs))
+            process = statistics.median(wall_ms(code) for _ in range(args.runs)) - empty
+        except subprocess.CalledProcessError as e:
+            print(f"{name:<22} failed: {e.stderr.strip().splitlines()[-1]}")
+            continue
+        results[name] = imported
+        print(f"{name:<22} {imported:>10.1f} {process:>11.1f}")
+
+    failures = []
+    try:
+        run_python(CHECK_CORE)
+    except subprocess.CalledProcessError as e:
+        failures.append(e.stderr.strip().splitlines()[-1])
+    if results.get("core", 0.0) > args.budget_ms:
+        failures.append(f"core import {results['core']:.1f} ms over the {args.budget_ms:.0f} ms budget")
+    for failure in failures:
+        print(f"FAILED: {failure}")
+    if failures:
+        raise SystemExit(1)
+    print(f"core within the {args.budget_ms:.0f} ms cold-start budget, no requests, no logging setup")
+
+
+if __name__ == "__main__":
+    main()
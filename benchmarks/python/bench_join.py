@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+VCP Cross-Layer Join Benchmark
+VeritasChain Standards Organization (VSO)
+
+Throughput of TraceJoinEngine: indexing EA order tickets, O(1) lookups
+from the Manager adapter, and joining deal batches (mostly linked, some
+late, some orphaned) compared with plain VCPManagerAdapter.process_deals.
+
+Usage:
+    python benchmarks/python/bench_join.py [--orders 100000]
+"""
+
+import argparse
+
+from vcp_bench import measure, print_results
+from vcp_join_v1_0 import TraceIndex, TraceJoinEngine
+from vcp_sidecar_adapter_v1_0 import UUIDv7Generator, VCPManagerAdapter
+
+
+def make_deals(orders: int, start: int = 0):
+    return [
+        {"ticket": 50_000_000 + i, "order": 10_000_000 + i, "time": 1_700_000_000 + i,
+         "symbol": "EURUSD", "price": 1.0855, "volume": 1.0, "commission": -3.5}
+        for i in range(start, start + orders)
+    ]
+
+
+def new_adapter() -> VCPManagerAdapter:
+    return VCPManagerAdapter("BENCH_VENUE", "http://127.0.0.1:9", "bench")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure cross-layer join throughput")
+    parser.add_argument("--orders", type=int, default=100_000)
+    parser.add_argument("--deals", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    tickets = [str(10_000_000 + i) for i in range(args.orders)]
+    trace_ids = [UUIDv7Generator.generate() for _ in range(args.orders)]
+    results = []
+
+    # Index: bounded to half the orders, so every second put evicts
+    index = TraceIndex(max_entries=args.orders // 2)
+
+    def put_all():
+        for ticket, trace_id in zip(tickets, trace_ids):
+            index.put(ticket, trace_id)
+    results.append(measure("join.index_put", put_all, args.orders, args.repeat,
+                           params={"max_entries": args.orders // 2}))
+
+    full = TraceIndex(max_entries=args.orders)
+    for ticket, trace_id in zip(tickets, trace_ids):
+        full.put(ticket, trace_id)
+    misses = [str(90_000_000 + i) for i in range(args.orders)]
+    results.append(measure("join.lookup_hit", lambda: [full.get(t) for t in tickets],
+                           args.orders, args.repeat))
+    results.append(measure("join.lookup_miss", lambda: [full.get(t) for t in misses],
+                           args.orders, args.repeat))
+
+    # Deal batches: 90% linked up front, 5% linked late, 5% orphaned
+    n = args.deals
+    deals = make_deals(n)
+    state = {}
+
+    def setup_baseline():
+        state["adapter"] = new_adapter()
+
+    def run_baseline():
+        state["adapter"].process_deals(deals, "100001")
+
+    def setup_join():
+        clock = [0.0]
+        adapter = new_adapter()
+        engine = TraceJoinEngine(adapter, late_grace=1.0, clock=lambda: clock[0])
+        for i in range(int(n * 0.9)):
+            engine.record_trace(tickets[i], trace_ids[i])
+        state.update(adapter=adapter, engine=engine, clock=clock)
+
+    def run_join():
+        engine, clock = state["engine"], state["clock"]
+        for start in range(0, n, 100):
+            engine.process_deals(deals[start:start + 100], "100001")
+        for i in range(int(n * 0.9), int(n * 0.95)):
+            engine.record_trace(tickets[i], trace_ids[i])
+        engine.release()
+        clock[0] += 2.0
+        engine.release()
+
+    results.append(measure("join.process_deals_baseline", run_baseline, n, args.repeat,
+                           setup=setup_baseline))
+    result = measure("join.process_deals_joined", run_join, n, args.repeat, setup=setup_join)
+    result.extra = dict(state["engine"].stats)
+    results.append(result)
+
+    print_results(results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+VCP Macrobenchmarks
+VeritasChain Standards Organization (VSO)
+
+Throughput of VCPManagerAdapter.process_deals on synthetic MT5 deal streams.
+"""
+
+from typing import Dict, List
+
+from vcp_bench import BenchResult, measure
+from vcp_loadgen_v1_0 import DealStreamGenerator, LoadProfile
+from vcp_sidecar_adapter_v1_0 import VCPManagerAdapter, Tier
+
+
+def synthetic_deals(count: int, seed: int = 42) -> List[Dict]:
+    """MT5-shaped deal dicts from the load generator's default profile"""
+    return DealStreamGenerator(LoadProfile(accounts=1), seed=seed).deals(count)
+
+
+def run(quick: bool = False) -> List[BenchResult]:
+    n = 2000 if quick else 20000
+    repeat = 3 if quick else 5
+    deals = synthetic_deals(n)
+    state = {}
+    results = []
+
+    def fresh_adapter():
+        state["adapter"] = VCPManagerAdapter(
+            venue_id="BENCH_VENUE",
+            vcc_endpoint="http://127.0.0.1:9",
+            vcc_api_key="bench",
+            tier=Tier.SILVER
+        )
+
+    def process_new():
+        state["adapter"].process_deals(deals, "100001")
+    results.append(measure(
+        "macro.process_deals_new", process_new, n, repeat,
+        params={"deals": n}, setup=fresh_adapter
+    ))
+
+    def primed_adapter():
+        fresh_adapter()
+        state["adapter"].process_deals(deals, "100001")
+
+    def process_replay():
+        state["adapter"].process_deals(deals, "100001")
+    results.append(measure(
+        "macro.process_deals_replay", process_replay, n, repeat,
+        params={"deals": n}, setup=primed_adapter
+    ))
+
+    return results
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+VCP Merkle Anchor Benchmark
+VeritasChain Standards Organization (VSO)
+
+Cost of verifying one random event in a long history (default 100M events)
+with Merkle anchors every N events: recompute the event hash, check its
+inclusion proof (log N) and walk the anchor chain from its anchor to the
+head (history / N anchors at most). Compared with walking the prev_hash
+chain from genesis, extrapolated from a sample of real events.
+
+Only the anchor chain and one window are materialized. Every synthetic
+anchor carries the root of that window, so any anchor can be the target.
+
+Usage:
+    python benchmarks/python/bench_merkle.py [--history 100000000] [--cadences 1000,10000,100000]
+"""
+
+import argparse
+import os
+import random
+import time
+
+from vcp_bench import measure, print_results
+from vcp_merkle_v1_0 import GENESIS, TREE_ALG, InclusionProof, MerkleTree, verify_event
+from vcp_sidecar_adapter_v1_0 import EventTypeCode, Tier, VCPEventFactory, compute_event_hash
+
+PAYLOAD = {"trade_data": {"order_id": "10000001", "execution_price": "1.08550", "executed_qty": "1.00"}}
+
+
+def anchor_chain(factory: VCPEventFactory, count: int, root: str, size: int):
+    anchors, prev = [], GENESIS
+    for i in range(count):
+        anchor = factory.create_event(EventTypeCode.AUD, "", "", {"vcp_anchor": {
+            "merkle_root": root, "tree_size": size, "first_sequence": i * size + 1,
+            "anchor_index": i, "prev_anchor_hash": prev, "tree_alg": TREE_ALG,
+        }})
+        anchors.append(anchor)
+        prev = anchor.security.event_hash
+    return anchors
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure anchored verification cost")
+    parser.add_argument("--history", type=int, default=100_000_000)
+    parser.add_argument("--cadences", default="1000,10000,100000")
+    parser.add_argument("--samples", type=int, default=50)
+    parser.add_argument("--chain-sample", type=int, default=20_000)
+    args = parser.parse_args()
+    rng = random.Random(42)
+    results, summary = [], []
+
+    # Baseline: walking the prev_hash chain costs one canonical hash per event
+    factory = VCPEventFactory("BENCH_VENUE", Tier.GOLD)
+    chain = [factory.create_event(EventTypeCode.EXE, "EURUSD", "100001", PAYLOAD)
+             for _ in range(args.chain_sample)]
+
+    def walk():
+        prev = GENESIS
+        for event in chain:
+            if event.security.prev_hash != prev or compute_event_hash(event) != event.security.event_hash:
+                raise AssertionError("chain broken")
+            prev = event.security.event_hash
+    walk_result = measure("merkle.linear_walk_per_event", walk, len(chain), repeat=3)
+    results.append(walk_result)
+    per_event = min(walk_result.runs) / len(chain)
+    linear_seconds = per_event * args.history
+
+    for cadence in (int(c) for c in args.cadences.split(",")):
+        anchors_count = max(1, args.history // cadence)
+        leaves = [os.urandom(32) for _ in range(cadence)]
+        target = chain[rng.randrange(len(chain))]
+        index = rng.randrange(cadence)
+        leaves[index] = bytes.fromhex(target.security.event_hash)
+
+        tree_result = measure(f"merkle.tree_build_n{cadence}", lambda: MerkleTree(leaves), cadence, repeat=3)
+        results.append(tree_result)
+        tree = MerkleTree(leaves)
+        proof = InclusionProof(
+            sequence=index + 1, event_hash=target.security.event_hash, leaf_index=index,
+            tree_size=cadence, path=[p.hex() for p in tree.proof(index)],
+            merkle_root=tree.root.hex(), anchor_index=0, anchor_event_id="",
+        )
+
+        started = time.perf_counter()
+        anchors = anchor_chain(VCPEventFactory("BENCH_VENUE", Tier.GOLD), anchors_count,
+                               tree.root.hex(), cadence)
+        build_seconds = time.perf_counter() - started
+
+        starts = [rng.randrange(anchors_count) for _ in range(args.samples)]
+
+        def verify_random():
+            for k in starts:
+                if not verify_event(target, proof, anchors[k:]):
+                    raise AssertionError("verification failed")
+        result = measure(f"merkle.verify_random_n{cadence}", verify_random, args.samples, repeat=3,
+                         params={"anchors": anchors_count})
+        results.append(result)
+        verify_seconds = min(result.runs) / args.samples
+        summary.append((cadence, anchors_count, len(proof.path), min(tree_result.runs) / cadence,
+                        verify_seconds, build_seconds))
+
+    print_results(results)
+    print(f"\nhistory: {args.history:,} events; linear walk from genesis ~{linear_seconds:,.0f} s "
+          f"(extrapolated from {per_event * 1e6:.1f} us/event)")
+    print(f"{'every N':>10} {'anchors':>10} {'proof len':>10} {'tree us/ev':>11} "
+          f"{'verify ms':>10} {'speedup':>10}")
+    for cadence, anchors_count, proof_len, tree_per_event, verify_seconds, _ in summary:
+        print(f"{cadence:>10,} {anchors_count:>10,} {proof_len:>10} {tree_per_event * 1e6:>11.2f} "
+              f"{verify_seconds * 1e3:>10.2f} {linear_seconds / verify_seconds:>10,.0f}x")
+
+
+if __name__ == "__main__":
+    main()
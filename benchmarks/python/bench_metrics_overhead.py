@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+VCP Metrics Overhead Benchmark
+VeritasChain Standards Organization (VSO)
+
+Measures the cost of the built-in instrumentation on the event hot path
+(factory + hash + serialize) by running the same workload with metrics
+bound to the default registry and with metrics disabled.
+
+Usage:
+    python benchmarks/python/bench_metrics_overhead.py [--events N] [--rounds R]
+"""
+
+import argparse
+import gc
+import os
+import sys
+import time
+
+# Add source directory to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src', 'python'))
+
+import vcp_sidecar_adapter_v1_0 as adapter_module
+from vcp_sidecar_adapter_v1_0 import VCPEventFactory, VCPEventSerializer, Tier
+from vcp_metrics_v1_0 import REGISTRY
+
+
+def run_workload(events: int) -> float:
+    """Create, hash and serialize EXE events; return seconds elapsed"""
+    factory = VCPEventFactory(venue_id="BENCH_VENUE", tier=Tier.SILVER)
+    started = time.perf_counter()
+    for i in range(events):
+        event = factory.create_execution_event(
+            symbol="EURUSD",
+            account_id="bench_account",
+            trace_id="019b591b-ea7e-7f6f-b130-ede86931b9d4",
+            order_id=str(i),
+            exchange_order_id=str(i),
+            execution_price="1.08552",
+            executed_qty="1.00"
+        )
+        VCPEventSerializer.to_json(event)
+    return time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure metrics overhead on the hot path")
+    parser.add_argument("--events", type=int, default=20000)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    run_workload(1000)  # Warm-up
+
+    # Interleave rounds (alternating which mode goes first) so drift affects
+    # both modes equally; keep the best round of each
+    enabled, disabled = [], []
+    gc.disable()
+    try:
+        for round_no in range(args.rounds):
+            for metrics_on in ((True, False) if round_no % 2 == 0 else (False, True)):
+                adapter_module.bind_metrics(REGISTRY if metrics_on else None)
+                gc.collect()
+                (enabled if metrics_on else disabled).append(run_workload(args.events))
+    finally:
+        gc.enable()
+        adapter_module.bind_metrics(REGISTRY)
+
+    best_on, best_off = min(enabled), min(disabled)
+    overhead = (best_on - best_off) / best_off * 100
+
+    print(f"Events per round:      {args.events}")
+    print(f"Metrics disabled:      {best_off / args.events * 1e6:8.2f} us/event")
+    print(f"Metrics enabled:       {best_on / args.events * 1e6:8.2f} us/event")
+    print(f"Instrumentation cost:  {overhead:+.2f}%")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+VCP Microbenchmarks
+VeritasChain Standards Organization (VSO)
+
+Per-call cost of the building blocks on the event hot path.
+"""
+
+from typing import List
+
+from vcp_bench import BenchResult, measure
+from vcp_sidecar_adapter_v1_0 import (
+    VCPEventFactory,
+    VCPEventSerializer,
+    UUIDv7Generator,
+    Tier,
+)
+
+
+def _sample_event(factory: VCPEventFactory):
+    return factory.create_execution_event(
+        symbol="XAUUSD",
+        account_id="bench_account",
+        trace_id=UUIDv7Generator.generate(),
+        order_id="ORD_001",
+        exchange_order_id="EXE_001",
+        execution_price="2650.55",
+        executed_qty="1.00",
+        slippage="0.05",
+        commission="2.50"
+    )
+
+
+def run(quick: bool = False) -> List[BenchResult]:
+    n = 2000 if quick else 20000
+    repeat = 3 if quick else 7
+    factory = VCPEventFactory(venue_id="BENCH_VENUE", tier=Tier.SILVER)
+    event = _sample_event(factory)
+    results = []
+
+    def uuid7():
+        generate = UUIDv7Generator.generate
+        for _ in range(n):
+            generate()
+    results.append(measure("micro.uuid7_generate", uuid7, n, repeat))
+
+    def timestamps():
+        get = factory._get_timestamps
+        for _ in range(n):
+            get()
+    results.append(measure("micro.get_timestamps", timestamps, n, repeat))
+
+    def event_hash():
+        compute = factory._compute_event_hash
+        for _ in range(n):
+            compute(event)
+    results.append(measure("micro.compute_event_hash", event_hash, n, repeat))
+
+    def pseudonymize():
+        pseudo = factory._pseudonymize_account
+        for i in range(n):
+            pseudo(str(100000 + (i & 1023)))
+    results.append(measure("micro.pseudonymize_account", pseudonymize, n, repeat))
+
+    def to_json():
+        dump = VCPEventSerializer.to_json
+        for _ in range(n):
+            dump(event)
+    results.append(measure("micro.serializer_to_json", to_json, n, repeat))
+
+    def create_execution():
+        for _ in range(n):
+            _sample_event(factory)
+    results.append(measure("micro.create_execution_event", create_execution, n, repeat))
+
+    return results
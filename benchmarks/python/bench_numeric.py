@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+"""
+VCP Numeric Formatting Benchmark
+VeritasChain Standards Organization (VSO)
+
+1. Edge values: repr artifacts (2650.5500000000002), halfway cases,
+   negative zero, large and tiny magnitudes, JPY/index digits, volume
+   steps, str/Decimal input, NaN and infinities.
+2. Cross-check of format_decimal and format_deals against Decimal
+   quantize (ROUND_HALF_EVEN on the exact binary value) for random prices
+   built the way MT5 doubles are (tick count times tick size).
+3. Throughput per deal: str() as before, per-field format_decimal, and
+   format_deals over whole batches; then process_deals end to end.
+
+Exits non-zero if any value disagrees.
+
+Usage:
+    python benchmarks/python/bench_numeric.py [--deals 20000] [--random 200000]
+"""
+
+import argparse
+import random
+from decimal import ROUND_HALF_EVEN, Decimal
+
+from vcp_bench import measure, print_results
+from vcp_loadgen_v1_0 import DEFAULT_SYMBOLS, DealStreamGenerator, LoadProfile
+from vcp_numeric_v1_0 import DigitsTable, format_column, format_decimal, format_deals, step_digits
+from vcp_sidecar_adapter_v1_0 import VCPManagerAdapter
+
+EDGE_CASES = [
+    # (value, digits, expected)
+    (2650.5500000000002, 2, "2650.55"),
+    (0.1 + 0.2, 5, "0.30000"),
+    (1.0855 * 3, 5, "3.25650"),
+    (151.2505, 3, "151.250"),      # Exact binary value is below the half
+    (0.125, 2, "0.12"),            # Exact half: ties to even
+    (0.375, 2, "0.38"),
+    (2.5, 0, "2"),
+    (-0.0, 2, "0.00"),
+    (-0.004, 2, "0.00"),
+    (-1e-12, 5, "0.00000"),
+    (-3.5 * 0.07, 2, "-0.25"),     # -0.24500000000000002
+    (1e15, 2, "1000000000000000.00"),
+    (39000.0, 1, "39000.0"),
+    (65000, 2, "65000.00"),
+    (0, 2, "0.00"),
+    (None, 2, "0.00"),
+    ("1.08555", 4, "1.0856"),      # Strings round from their decimal value
+    ("  2650.5  ", 2, "2650.50"),
+    (Decimal("0.125"), 2, "0.12"),
+    (1.1 * 3, None, "3.3"),        # Unknown digits: 8 places, zeros dropped
+    (2650.0, None, "2650"),
+    (-0.0, None, "0"),
+    (1e-9, None, "0"),
+    (0.123456789, None, "0.12345679"),
+]
+
+INVALID = [float("nan"), float("inf"), float("-inf"), "nan", "Infinity", "abc", ""]
+
+STEPS = [(0.01, 2), (0.1, 1), (1.0, 0), (1, 0), (0.001, 3), ("0.50", 1), (100.0, 0), (1e-5, 5)]
+
+
+def edge_checks() -> list:
+    failures = []
+    for value, digits, expected in EDGE_CASES:
+        for label, got in (("format_decimal", lambda: format_decimal(value, digits)),
+                           ("format_column", lambda: format_column([value], digits)[0])):
+            result = got()
+            if result != expected:
+                failures.append(f"{label}({value!r}, {digits}) = {result!r}, expected {expected!r}")
+    for value in INVALID:
+        for label, call in (("format_decimal", lambda: format_decimal(value, 2)),
+                            ("format_column", lambda: format_column([1.0, value], 2))):
+            try:
+                result = call()
+                failures.append(f"{label}({value!r}) returned {result!r} instead of raising ValueError")
+            except ValueError:
+                pass
+    for step, expected in STEPS:
+        if step_digits(step) != expected:
+            failures.append(f"step_digits({step!r}) = {step_digits(step)}, expected {expected}")
+
+    table = DigitsTable(lookup=lambda symbol: {"digits": 3, "volume_step": 0.1} if symbol == "USDJPY" else None)
+    checks = [
+        (table.price("USDJPY", 151.2500000001), "151.250"),
+        (table.volume("USDJPY", 0.30000000000000004), "0.3"),
+        (table.price("UNKNOWN", 1.1 * 3), "3.3"),
+        (table.volume("UNKNOWN", 0.07), "0.07"),
+        (table.money(-0.24499999999999997), "-0.24"),
+        (table.money(-0.001), "0.00"),
+    ]
+    for got, expected in checks:
+        if got != expected:
+            failures.append(f"DigitsTable gave {got!r}, expected {expected!r}")
+    return failures
+
+
+def _reference(value: float, digits: int) -> str:
+    text = format(Decimal(value).quantize(Decimal(1).scaleb(-digits), rounding=ROUND_HALF_EVEN), "f")
+    return text[1:] if text.startswith("-") and not text.strip("-0.") else text
+
+
+def random_checks(count: int, seed: int) -> list:
+    """format_decimal and format_deals against Decimal on MT5-like doubles"""
+    rng = random.Random(seed)
+    failures = []
+    symbols = {name: spec.digits for name, spec in DEFAULT_SYMBOLS.items()}
+    table = DigitsTable()
+    for name, digits in symbols.items():
+        table.set(name, digits)
+    names = list(symbols)
+
+    deals, expected = [], []
+    for _ in range(count):
+        symbol = rng.choice(names)
+        digits = symbols[symbol]
+        ticks = rng.randrange(1, 10 ** (digits + 5))
+        price = ticks * 10.0 ** -digits + rng.choice((0.0, 1e-12, -1e-12, 0.5 * 10.0 ** -digits))
+        volume = rng.randrange(1, 10000) * 0.01
+        commission = -3.5 * volume if rng.random() < 0.9 else -0.0
+        deals.append({"symbol": symbol, "price": price, "volume": volume, "commission": commission})
+        expected.append((_reference(price, digits), _reference(volume, 2), _reference(commission, 2)))
+
+    for deal, want in zip(deals[:count // 10], expected):
+        got = (table.price(deal["symbol"], deal["price"]), table.volume(deal["symbol"], deal["volume"]),
+               table.money(deal["commission"]))
+        if got != want:
+            failures.append(f"format_decimal {deal} -> {got}, expected {want}")
+            break
+    batch = format_deals(deals, table)
+    mismatches = sum(1 for got, want in zip(batch, expected) if got != want)
+    if mismatches:
+        first = next(i for i, (got, want) in enumerate(zip(batch, expected)) if got != want)
+        failures.append(f"format_deals: {mismatches} mismatches, first {deals[first]} -> "
+                        f"{batch[first]}, expected {expected[first]}")
+    artifacts = sum(1 for deal in deals if len(str(deal["price"]).partition(".")[2]) > symbols[deal["symbol"]])
+    print(f"\nrandom cross-check: {count:,} deals, {mismatches} mismatches "
+          f"(str() would have emitted {artifacts:,} prices with excess digits)")
+    return failures
+
+
+def throughput(n: int, batch_size: int):
+    deals = DealStreamGenerator(LoadProfile(), seed=7).deals(n)
+    for deal in deals:  # Raw doubles as MT5 reports them, not loadgen's rounded floats
+        digits = DEFAULT_SYMBOLS[deal["symbol"]].digits
+        deal["price"] = round(deal["price"] * 10 ** digits) * 10.0 ** -digits
+    table = DigitsTable()
+    for name, spec in DEFAULT_SYMBOLS.items():
+        table.set(name, spec.digits)
+    batches = [deals[i:i + batch_size] for i in range(0, n, batch_size)]
+
+    def with_str():
+        for deal in deals:
+            (str(deal.get('price', '0')), str(deal.get('volume', '0')), str(deal.get('commission', '0')))
+
+    def per_field():
+        for deal in deals:
+            symbol = deal.get('symbol', '')
+            (table.price(symbol, deal.get('price', 0)), table.volume(symbol, deal.get('volume', 0)),
+             table.money(deal.get('commission', 0)))
+
+    def single_deal_batches():
+        for deal in deals:
+            format_deals([deal], table)
+
+    def whole_batches():
+        for batch in batches:
+            format_deals(batch, table)
+
+    results = [
+        measure("fields.str", with_str, n),
+        measure("fields.format_decimal", per_field, n),
+        measure("fields.format_deals.1", single_deal_batches, n),
+        measure(f"fields.format_deals.{batch_size}", whole_batches, n, params={"batch": batch_size}),
+    ]
+
+    state = {}
+
+    def setup():
+        state["adapter"] = VCPManagerAdapter("BENCH_VENUE", "http://127.0.0.1:9", "bench")
+        state["adapter"].digits = table
+
+    def process():
+        adapter = state["adapter"]
+        for batch in batches:
+            adapter.process_deals(batch, "100001")
+    results.append(measure(f"process_deals.{batch_size}", process, n, repeat=3, setup=setup,
+                           params={"batch": batch_size}))
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check and time deal field formatting")
+    parser.add_argument("--deals", type=int, default=20000)
+    parser.add_argument("--batch", type=int, default=500)
+    parser.add_argument("--random", type=int, default=200000)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    failures = edge_checks()
+    print(f"edge cases: {len(EDGE_CASES)} values, {len(INVALID)} invalid, {len(STEPS)} steps, "
+          f"{len(failures)} failures")
+    failures += random_checks(args.random, args.seed)
+    print_results(throughput(args.deals, args.batch))
+
+    for failure in failures:
+        print(f"FAILED: {failure}")
+    if failures:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
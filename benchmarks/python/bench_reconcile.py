@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+VCP Range Reconciliation Benchmark
+VeritasChain Standards Organization (VSO)
+
+Reconciles a local archive (default 1M events over one day) with a local
+stand-in Explorer serving the VCC side, for a growing number of injected
+differences: events VCC never got, events whose hash differs, and events
+only VCC has, scattered or as one contiguous outage. For each case it
+reports the requests, fingerprints and entries exchanged, against the
+page requests a full scan through /events would need.
+
+Exits non-zero if a reported difference set is not exactly the injected
+one, or if an in-sync archive costs more than one request.
+
+Usage:
+    python benchmarks/python/bench_reconcile.py [--events 1000000] [--diffs 0,1,10,100,1000]
+"""
+
+import argparse
+import hashlib
+import math
+import random
+import time
+
+from vcp_bench import SRC_DIR  # noqa: F401  (puts the sidecar modules on sys.path)
+from explorer_standin import StandinExplorerServer
+from vcp_explorer_v1_0 import MAX_PAGE_SIZE, ExplorerClient, RateLimiter
+from vcp_reconcile_v1_0 import ExplorerDigestSource, RangeIndex, Reconciler
+
+DAY_NS = 86_400 * 1_000_000_000
+START_NS = 1_733_011_200 * 1_000_000_000  # 2024-12-01T00:00:00Z
+
+
+def make_entries(count: int, seed: int = 3):
+    rng = random.Random(seed)
+    return [
+        (START_NS + rng.randrange(DAY_NS), f"{i:08x}-0193-7000-8000-{i:012x}",
+         hashlib.sha256(i.to_bytes(8, "big")).hexdigest())
+        for i in range(count)
+    ]
+
+
+def inject(entries, diffs: int, contiguous: bool, seed: int = 5):
+    """Remote copy of entries with diffs differences; returns (remote, missing, divergent, extra)"""
+    rng = random.Random(seed + diffs)
+    n = len(entries)
+    missing_n, divergent_n = diffs - diffs // 2, diffs // 4
+    extra_n = diffs - missing_n - divergent_n
+    if contiguous:  # Only lost events, all in a row
+        missing_n, divergent_n, extra_n = diffs, 0, 0
+        ordered = sorted(range(n), key=lambda i: entries[i][0])
+        first = rng.randrange(n - missing_n)
+        missing = set(ordered[first:first + missing_n])
+    else:
+        missing = set(rng.sample(range(n), missing_n))
+    divergent = set(rng.sample([i for i in range(n) if i not in missing][:max(1, divergent_n * 10)], divergent_n))
+    remote = []
+    for i, (ts, event_id, event_hash) in enumerate(entries):
+        if i in missing:
+            continue
+        if i in divergent:
+            event_hash = hashlib.sha256(event_hash.encode()).hexdigest()
+        remote.append((ts, event_id, event_hash))
+    extra = []
+    for k in range(extra_n):
+        entry = (START_NS + rng.randrange(DAY_NS), f"ffffffff-0193-7000-8000-{k:012x}", "ab" * 32)
+        remote.append(entry)
+        extra.append(entry[1])
+    return (remote, {entries[i][1] for i in missing}, {entries[i][1] for i in divergent}, set(extra))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Range reconciliation cost against injected differences")
+    parser.add_argument("--events", type=int, default=1_000_000)
+    parser.add_argument("--diffs", default="0,1,10,100,1000")
+    parser.add_argument("--outage", type=int, default=10_000, help="Events lost in one contiguous outage")
+    parser.add_argument("--block-size", type=int, default=256)
+    parser.add_argument("--leaf-size", type=int, default=32)
+    parser.add_argument("--latency-ms", type=float, default=20.0)
+    args = parser.parse_args()
+
+    entries = make_entries(args.events)
+    started = time.perf_counter()
+    local = RangeIndex(entries)
+    print(f"local index: {len(local):,} events in {time.perf_counter() - started:.2f}s")
+    scan_pages = math.ceil(args.events / MAX_PAGE_SIZE)
+
+    cases = [(int(d), False) for d in args.diffs.split(",")] + [(args.outage, True)]
+    failures = []
+    print(f"\n{'differences':>12} {'layout':>10} {'requests':>9} {'ranges':>8} {'entries':>8} {'seconds':>8} "
+          f"{'found':>6} {'vs scan':>8}")
+    for diffs, contiguous in cases:
+        remote, missing, divergent, extra = inject(entries, diffs, contiguous)
+        with StandinExplorerServer([], latency_ms=args.latency_ms, limit=1_000_000,
+                                   range_index=RangeIndex(remote)) as server:
+            client = ExplorerClient("bench-key", server.endpoint, rate_limiter=RateLimiter(limit=1_000_000))
+            report = Reconciler(local, ExplorerDigestSource(client), block_size=args.block_size,
+                                leaf_size=args.leaf_size).run()
+        found = len(report.missing_remote) + len(report.divergent) + len(report.missing_local)
+        layout = "outage" if contiguous else "scattered"
+        print(f"{diffs:>12,} {layout:>10} {report.requests:>9} {report.ranges:>8,} {report.entries:>8,} "
+              f"{report.seconds:>8.2f} {found:>6,} {scan_pages / report.requests:>7.0f}x")
+        if set(report.missing_remote) != missing:
+            failures.append(f"{diffs} {layout}: missing_remote differs from the {len(missing)} events removed")
+        if {d[0] for d in report.divergent} != divergent:
+            failures.append(f"{diffs} {layout}: divergent differs from the {len(divergent)} events altered")
+        if set(report.missing_local) != extra:
+            failures.append(f"{diffs} {layout}: missing_local differs from the {len(extra)} events added")
+        if diffs == 0 and report.requests != 1:
+            failures.append(f"in-sync archive took {report.requests} requests")
+
+    print(f"\nfull scan through /events: {scan_pages:,} page requests, "
+          f"{scan_pages / 100:.0f} min at the SILVER limit of 100 requests/min")
+    for failure in failures:
+        print(f"FAILED: {failure}")
+    if failures:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
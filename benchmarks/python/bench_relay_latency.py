@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+VCP Relay Latency Benchmark
+VeritasChain Standards Organization (VSO)
+
+Compares the cost of one EA log call in the MQL5 bridge's transports:
+- direct:  one HTTP POST per event (what WebRequest does in OnTimer)
+- socket:  one NDJSON line written to the relay's localhost socket
+- spool:   one NDJSON line appended to the EA's spool file
+
+Then measures how long the relay takes to hash, chain and batch-upload
+everything it received to a local stand-in VCC server.
+
+Usage:
+    python benchmarks/python/bench_relay_latency.py [--events N] [--latency-ms 20]
+"""
+
+import argparse
+import json
+import os
+import socket
+import statistics
+import sys
+import tempfile
+import time
+
+# Add source directory to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src', 'python'))
+
+from vcc_standin import StandinVCCServer
+from vcp_relay_v1_0 import EventRelay, RelaySocketServer
+from vcp_sidecar_adapter_v1_0 import (
+    UUIDv7Generator, VCCClient, VCPEventFactory, VCPManagerAdapter, Tier
+)
+from vcp_spool_v1_0 import SpoolTailer
+
+
+def make_records(count: int):
+    """ORD records as the bridge's EventToRecordJSON writes them"""
+    trace_id = UUIDv7Generator.generate()
+    lines = []
+    for i in range(count):
+        lines.append(json.dumps({
+            "header": {
+                "event_id": UUIDv7Generator.generate(),
+                "trace_id": trace_id,
+                "timestamp_int": str(time.time_ns()),
+                "event_type_code": 2,
+                "symbol": "EURUSD",
+                "account_id": "100001",
+            },
+            "payload": {
+                "trade_data": {
+                    "order_id": str(1000 + i), "side": "BUY", "order_type": "MARKET",
+                    "price": "1.08550", "quantity": "1.00"
+                },
+                "vcp_risk": {"circuit_breaker": "NORMAL"},
+            },
+        }, separators=(',', ':')) + "\n")
+    return lines
+
+
+def percentiles(samples_ns):
+    samples = sorted(samples_ns)
+    return {
+        "median": statistics.median(samples) / 1000,
+        "p99": samples[int(len(samples) * 0.99) - 1] / 1000,
+    }
+
+
+def bench_direct(server: StandinVCCServer, count: int):
+    factory = VCPEventFactory(venue_id="BENCH_VENUE", tier=Tier.SILVER)
+    client = VCCClient(server.endpoint, "bench")
+    samples = []
+    for i in range(count):
+        event = factory.create_order_event(
+            "EURUSD", "100001", "trace", str(i), "BUY", "MARKET", "1.08550", "1.00"
+        )
+        started = time.perf_counter_ns()
+        client.send_event(event)
+        samples.append(time.perf_counter_ns() - started)
+    return percentiles(samples)
+
+
+def wait_until_received(server: StandinVCCServer, expected: int, started: float,
+                        timeout: float = 120.0) -> float:
+    """Seconds from started until the stand-in holds expected unique events"""
+    while server.stats.snapshot()["unique_events"] < expected:
+        if time.perf_counter() - started > timeout:
+            break
+        time.sleep(0.002)
+    return time.perf_counter() - started
+
+
+def bench_socket(server: StandinVCCServer, lines):
+    adapter = VCPManagerAdapter("BENCH_VENUE", server.endpoint, "bench", batch_size=500)
+    relay = EventRelay(adapter)
+    relay_server = RelaySocketServer(relay, port=0).start()
+    adapter.start()
+
+    before = server.stats.snapshot()["unique_events"]
+    conn = socket.create_connection(relay_server.address)
+    conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    payloads = [line.encode("utf-8") for line in lines]
+    samples = []
+    started = time.perf_counter()
+    for payload in payloads:
+        t0 = time.perf_counter_ns()
+        conn.sendall(payload)
+        samples.append(time.perf_counter_ns() - t0)
+    conn.close()
+    drain = wait_until_received(server, before + len(lines), started)
+
+    relay_server.stop()
+    adapter.stop()
+    return percentiles(samples), drain
+
+
+def bench_spool(server: StandinVCCServer, lines):
+    adapter = VCPManagerAdapter("BENCH_VENUE", server.endpoint, "bench", batch_size=500)
+    relay = EventRelay(adapter)
+
+    with tempfile.TemporaryDirectory() as spool_dir:
+        tailer = SpoolTailer(relay, spool_dir, poll_interval=0.05).start()
+        adapter.start()
+        before = server.stats.snapshot()["unique_events"]
+
+        # One EA appending to its spool file, flushed every 1000 lines (≈ one OnTimer tick)
+        spool = open(os.path.join(spool_dir, "100001_1_20250101.ndjson"), "w")
+        samples = []
+        started = time.perf_counter()
+        for i, line in enumerate(lines, 1):
+            t0 = time.perf_counter_ns()
+            spool.write(line)
+            samples.append(time.perf_counter_ns() - t0)
+            if i % 1000 == 0:
+                spool.flush()
+        spool.close()
+        drain = wait_until_received(server, before + len(lines), started)
+
+        tailer.stop()
+        adapter.stop()
+    return percentiles(samples), drain
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure EA log-call latency per transport")
+    parser.add_argument("--events", type=int, default=5000,
+                        help="Records per relay run (keep below the adapter queue size)")
+    parser.add_argument("--direct-events", type=int, default=500)
+    parser.add_argument("--latency-ms", type=float, default=0.0,
+                        help="Stand-in VCC latency (simulated internet round-trip)")
+    args = parser.parse_args()
+
+    with StandinVCCServer(latency_ms=args.latency_ms) as server:
+        direct = bench_direct(server, args.direct_events)
+        # Fresh records per run: the stand-in counts unique event_ids
+        socket_lat, socket_drain = bench_socket(server, make_records(args.events))
+        spool_lat, spool_drain = bench_spool(server, make_records(args.events))
+        stats = server.stats.snapshot()
+
+    print(f"Per log call (stand-in VCC latency {args.latency_ms:.0f} ms):")
+    print(f"  direct HTTP POST   median {direct['median']:10.1f} us   p99 {direct['p99']:10.1f} us")
+    print(f"  relay socket       median {socket_lat['median']:10.1f} us   p99 {socket_lat['p99']:10.1f} us")
+    print(f"  relay spool file   median {spool_lat['median']:10.1f} us   p99 {spool_lat['p99']:10.1f} us")
+    print(f"\nRelay hash + chain + upload of {args.events} records:")
+    print(f"  socket  {socket_drain:7.2f} s  ({args.events / socket_drain:10,.0f} events/s)")
+    print(f"  spool   {spool_drain:7.2f} s  ({args.events / spool_drain:10,.0f} events/s)")
+    print(f"\nStand-in received {stats['unique_events']} unique events in {stats['requests']} requests")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+"""
+VCP Retention Benchmark
+VeritasChain Standards Organization (VSO)
+
+Compaction: appends --events events (default 1M) spread over --days UTC
+days to active segments, then seals them into daily archives and reports
+append and compaction throughput and the compression ratio. Checks:
+- the catalog counts every event, every archive verifies, and the
+  streamed Merkle root equals MerkleTree over the same event hashes
+- reading the whole catalog back returns every line in order; a one-hour
+  query returns exactly the matching lines and reads only the blocks of
+  one or two archives
+- a late event for a sealed day becomes the next part of that day, also
+  across a restart
+- size and age policies drop the oldest archives first
+
+Ingestion latency: queue_event latency of a live adapter at --rate
+events/s, with no archive, with an archive and idle compaction, and
+while a background compaction of --backlog-events seals earlier days,
+unthrottled at normal priority and then throttled at lower priority.
+
+Exits non-zero on any failed check.
+
+Usage:
+    python benchmarks/python/bench_retention.py [--events 1000000] [--days 4] [--rate 2000] [--seconds 5]
+"""
+
+import argparse
+import hashlib
+import logging
+import os
+import shutil
+import tempfile
+import time
+
+from vcp_bench import SRC_DIR  # noqa: F401  (puts the sidecar modules on sys.path)
+from vcp_merkle_v1_0 import MerkleTree
+from vcp_retention_v1_0 import DAY_NS, RetentionManager, RetentionPolicy, day_start
+from vcp_sidecar_adapter_v1_0 import VCPManagerAdapter
+from vcp_sidecar_core_v1_0 import VCPEventFactory, VCPEventSerializer
+
+VENUE = "BENCH_VENUE"
+START_NS = 1_733_011_200 * 1_000_000_000  # 2024-12-01T00:00:00Z
+
+
+def make_lines(count: int, days: int, start_ns: int = START_NS):
+    """(timestamp_int, line) of EXE events spread evenly over days"""
+    factory = VCPEventFactory(VENUE)
+    event = factory.create_execution_event("EURUSD", "ACCOUNT", "TRACE", "ORDER", "EXCH", "1.08550", "1.00")
+    event.header.event_id, event.header.timestamp_int = "@EVENT@", "@STAMP@"
+    event.security.event_hash = "@HASH@"
+    head, rest = VCPEventSerializer.to_json(event).split("@EVENT@")
+    middle, rest = rest.split("@STAMP@")
+    middle2, tail = rest.split("@HASH@")
+    step = days * DAY_NS // count
+    rows = []
+    for i in range(count):
+        stamp = start_ns + i * step
+        event_hash = hashlib.sha256(i.to_bytes(8, "big")).hexdigest()
+        rows.append((stamp, f"{head}{i:08x}-0193-7000-8000-{i:012x}{middle}{stamp}{middle2}{event_hash}{tail}"))
+    return rows
+
+
+def fill(directory: str, rows, **kwargs) -> RetentionManager:
+    manager = RetentionManager(directory, VENUE, clock=lambda: 0, **kwargs)
+    for stamp, line in rows:
+        manager.append_line(line, stamp)
+    manager.roll()
+    return manager
+
+
+def compaction_run(args, failures: list):
+    directory = tempfile.mkdtemp(prefix="vcp-retention-")
+    try:
+        started = time.perf_counter()
+        rows = make_lines(args.events, args.days)
+        raw = sum(len(line) + 1 for _, line in rows)
+        print(f"generated {len(rows):,} events ({raw / 1e6:.0f} MB) in {time.perf_counter() - started:.1f}s")
+
+        started = time.perf_counter()
+        manager = fill(directory, rows, io_bytes_per_second=None, segment_bytes=args.segment_mb << 20)
+        seconds = time.perf_counter() - started
+        print(f"append: {len(rows) / seconds:,.0f} events/s ({raw / seconds / 1e6:.0f} MB/s)")
+
+        started = time.perf_counter()
+        sealed = manager.compact()
+        due = time.perf_counter() - started
+        pending = manager.status()["pending_days"]
+        if len(sealed) != args.days - 1 or len(pending) != 1:
+            failures.append(f"compact: sealed {len(sealed)} days with {pending} pending, "
+                            f"expected {args.days - 1} and the newest day")
+        started = time.perf_counter()
+        sealed += manager.compact(force=True)
+        seconds = due + time.perf_counter() - started
+        archived = manager.catalog.total_bytes
+        print(f"compaction: {len(sealed)} archives in {seconds:.1f}s ({len(rows) / seconds:,.0f} events/s, "
+              f"{raw / seconds / 1e6:.0f} MB/s), {raw / 1e6:.0f} -> {archived / 1e6:.1f} MB "
+              f"({raw / archived:.1f}x), catalog {os.path.getsize(manager.catalog.path):,} bytes")
+
+        catalog = manager.catalog
+        if sum(e.events for e in catalog.entries) != len(rows):
+            failures.append(f"catalog: {sum(e.events for e in catalog.entries)} events, wrote {len(rows)}")
+        started = time.perf_counter()
+        bad = [e.file for e in catalog.entries if not manager.verify(e)]
+        print(f"verify: {len(catalog)} archives in {time.perf_counter() - started:.1f}s")
+        if bad:
+            failures.append(f"verify: {bad} do not match the catalog")
+        first = catalog.entries[0]
+        leaves = [bytes.fromhex(hashlib.sha256(i.to_bytes(8, "big")).hexdigest()) for i in range(first.events)]
+        if MerkleTree(leaves).root.hex() != first.merkle_root:
+            failures.append("merkle: streamed root differs from MerkleTree")
+
+        if list(manager.read()) != [line for _, line in rows]:
+            failures.append("read: archives do not return every line in order")
+        start = START_NS + DAY_NS + 13 * 3_600_000_000_000 + 1_234_567
+        end = start + 3_600_000_000_000
+        expected = [line for stamp, line in rows if start <= stamp < end]
+        started = time.perf_counter()
+        found = list(manager.read(start, end))
+        seconds = time.perf_counter() - started
+        touched = catalog.select(start, end)
+        blocks = sum(1 for e in touched for b in manager.blocks(e) if b[1] >= start and b[0] < end)
+        print(f"one-hour query: {len(found):,} events from {len(touched)} of {len(catalog)} archives, "
+              f"{blocks} of {sum(e.blocks for e in catalog.entries)} blocks in {seconds * 1000:.0f} ms")
+        if found != expected:
+            failures.append(f"query: {len(found)} lines, expected {len(expected)}")
+        if len(touched) > 2:
+            failures.append(f"query: read {len(touched)} archives for one hour")
+
+        late_stamp, late_line = rows[0][0] + 1, rows[0][1].replace(str(rows[0][0]), str(rows[0][0] + 1), 1)
+        manager.append_line(late_line, late_stamp)
+        manager.roll()
+        late = manager.compact(force=True)
+        if [(e.day, e.part, e.events) for e in late] != [(catalog.entries[0].day, 1, 1)]:
+            failures.append(f"late event: sealed {[(e.day, e.part, e.events) for e in late]}")
+        # Restart, another late event, restart: its segment must not be taken for a sealed one
+        manager = RetentionManager(directory, VENUE, clock=lambda: 0, io_bytes_per_second=None)
+        manager.append_line(late_line, late_stamp)
+        manager.roll()
+        manager = RetentionManager(directory, VENUE, clock=lambda: 0, io_bytes_per_second=None)
+        catalog = manager.catalog
+        late = manager.compact(force=True)
+        if [(e.day, e.part, e.events) for e in late] != [(catalog.entries[0].day, 2, 1)]:
+            failures.append(f"late event after a restart: sealed {[(e.day, e.part, e.events) for e in late]}")
+
+        # A quiet venue: the open segment is rolled once its day and the grace have passed
+        quiet = os.path.join(directory, "quiet")
+        now = [START_NS]
+        quiet_manager = RetentionManager(quiet, VENUE, clock=lambda: now[0], io_bytes_per_second=None)
+        for stamp, line in rows[:5]:
+            quiet_manager.append_line(line, stamp)
+        pending = quiet_manager.compact()
+        now[0] += 3 * DAY_NS
+        sealed = quiet_manager.compact()
+        if pending or [e.events for e in sealed] != [5]:
+            failures.append(f"quiet venue: sealed {[e.events for e in pending]} then {[e.events for e in sealed]}")
+
+        # Retention: size keeps the newest archives that fit, age drops whole days
+        total, oldest = catalog.total_bytes, catalog.entries[0].day
+        newest = max(catalog.entries, key=lambda e: e.max_ts)
+        manager.policy = RetentionPolicy(max_bytes=total - 1)
+        dropped = manager.enforce(newest.max_ts)
+        if not dropped or dropped[0].day != oldest or catalog.total_bytes > total - 1:
+            failures.append(f"size policy dropped {[e.file for e in dropped]}")
+        manager.policy = RetentionPolicy(max_age_days=1)
+        dropped = manager.enforce(newest.max_ts)
+        left = sorted({e.day for e in catalog.entries})
+        if any(day_start(day) + DAY_NS <= newest.max_ts - DAY_NS for day in left):
+            failures.append(f"age policy kept {left}")
+        remaining = sorted(os.listdir(manager.archive_dir))
+        if len(remaining) != 2 * len(catalog):
+            failures.append(f"retention left {len(remaining)} files for {len(catalog)} archives")
+        print(f"retention: size policy then a 1-day age policy, {len(catalog)} archives kept ({left})")
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+def percentile(values, q: float) -> float:
+    values = sorted(values)
+    return values[min(len(values) - 1, int(q * len(values)))]
+
+
+def ingest(adapter: VCPManagerAdapter, rate: float, seconds: float):
+    """queue_event latencies (seconds) of paced live events"""
+    factory = adapter.factory
+    latencies = []
+    interval = 1.0 / rate
+    started = next_at = time.perf_counter()
+    n = 0
+    while next_at - started < seconds:
+        now = time.perf_counter()
+        if now < next_at:
+            time.sleep(next_at - now)
+        begin = time.perf_counter()
+        event = factory.create_execution_event("EURUSD", "ACCOUNT", f"T{n}", str(n), "EXCH", "1.08550", "1.00")
+        adapter.queue_event(event)
+        latencies.append(time.perf_counter() - begin)
+        n += 1
+        next_at += interval
+    return latencies
+
+
+def latency_run(args, failures: list):
+    backlog = make_lines(args.backlog_events, 2)
+    phases = (
+        ("no archive", None),
+        ("archive, idle", {}),
+        ("compacting, unthrottled", {"io_bytes_per_second": None, "nice": 0}),
+        ("compacting, throttled", {"io_bytes_per_second": args.io_mbps * 1e6, "nice": 10}),
+    )
+    print(f"\nqueue_event latency at {args.rate:,} events/s for {args.seconds:.0f}s, "
+          f"background compaction of {len(backlog):,} events:")
+    print(f"{'phase':<26} {'p50 us':>8} {'p99 us':>8} {'max ms':>8} {'compacted':>10} {'seconds':>8}")
+    for name, options in phases:
+        directory = tempfile.mkdtemp(prefix="vcp-retention-")
+        try:
+            adapter = VCPManagerAdapter(VENUE, "http://127.0.0.1:9", "bench", max_queue=10_000_000)
+            manager = None
+            if options is not None:
+                if options:
+                    fill(directory, backlog)
+                began = time.time()
+                manager = RetentionManager(directory, VENUE, interval=0.05, **options).start()
+                adapter.archive = manager
+            latencies = ingest(adapter, args.rate, args.seconds)
+            compacted, busy = 0, 0.0
+            if manager:
+                manager.stop()
+                compacted = sum(e.events for e in manager.catalog.entries)
+                busy = max((e.sealed_at - began for e in manager.catalog.entries), default=0.0)
+                if options and not compacted:
+                    failures.append(f"{name}: nothing compacted while ingesting")
+            print(f"{name:<26} {percentile(latencies, 0.5) * 1e6:>8.0f} {percentile(latencies, 0.99) * 1e6:>8.0f} "
+                  f"{max(latencies) * 1e3:>8.1f} {compacted:>10,} {busy:>8.1f}")
+        finally:
+            shutil.rmtree(directory, ignore_errors=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Archive compaction throughput and its cost to live ingestion")
+    parser.add_argument("--events", type=int, default=1_000_000)
+    parser.add_argument("--days", type=int, default=4)
+    parser.add_argument("--segment-mb", type=int, default=64)
+    parser.add_argument("--rate", type=int, default=2000, help="Live events per second")
+    parser.add_argument("--seconds", type=float, default=5.0, help="Duration of each latency phase")
+    parser.add_argument("--backlog-events", type=int, default=200_000)
+    parser.add_argument("--io-mbps", type=float, default=32.0, help="Throttled compaction I/O in MB/s")
+    args = parser.parse_args()
+    logging.getLogger("vcp_adapter").setLevel(logging.CRITICAL)
+
+    failures: list = []
+    compaction_run(args, failures)
+    latency_run(args, failures)
+    for failure in failures:
+        print(f"FAILED: {failure}")
+    if failures:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+VCP Ed25519 Signing Benchmark
+VeritasChain Standards Organization (VSO)
+
+Signatures/sec and verifications/sec for vcp_signing_v1_0, and end-to-end
+event throughput of the factory without signing, with naive inline signing
+in the factory thread, and with the pipelined SigningStage (software key in
+a process pool, HSM stand-in over pipes). Requires `cryptography`.
+
+Usage:
+    python benchmarks/python/bench_signing.py [--events 20000] [--workers 2]
+"""
+
+import argparse
+import os
+import shutil
+import tempfile
+import time
+from threading import Event
+
+from vcp_bench import BenchResult, measure, print_results
+from vcp_sidecar_adapter_v1_0 import EventTypeCode, Tier, VCPEventFactory
+from vcp_signing_v1_0 import (
+    BatchVerifier, HSMStandinSigner, SigningStage, SoftwareSigner, generate_key_file
+)
+
+PAYLOAD = {"trade_data": {"order_id": "10000001", "side": "BUY", "price": "1.08550", "quantity": "1.00"}}
+
+
+def create_events(factory: VCPEventFactory, n: int, sink=None):
+    events = []
+    for i in range(n):
+        event = factory.create_event(EventTypeCode.ORD, "EURUSD", "100001", PAYLOAD)
+        if sink:
+            sink(event)
+        else:
+            events.append(event)
+    return events
+
+
+class CountingSink:
+    """Stands in for the adapter upload queue"""
+
+    def __init__(self, expected: int):
+        self.expected = expected
+        self.count = 0
+        self.done = Event()
+
+    def __call__(self, event) -> bool:
+        self.count += 1
+        if self.count >= self.expected:
+            self.done.set()
+        return True
+
+
+def run_stage(stage: SigningStage, n: int) -> float:
+    """Seconds from the first event created until the last one is signed and handed on"""
+    sink = CountingSink(n)
+    stage.sink = sink
+    stage.start()
+    factory = VCPEventFactory("BENCH_VENUE", Tier.GOLD)
+    started = time.perf_counter()
+    create_events(factory, n, stage.submit)
+    sink.done.wait(300)
+    elapsed = time.perf_counter() - started
+    stage.stop()
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure Ed25519 signing and verification throughput")
+    parser.add_argument("--events", type=int, default=20_000)
+    parser.add_argument("--workers", type=int, default=max(2, os.cpu_count() or 1))
+    parser.add_argument("--hsm-latency", type=float, default=0.0005)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    n = args.events
+
+    workdir = tempfile.mkdtemp(prefix="vcp-sign-")
+    key_path = os.path.join(workdir, "venue.pem")
+    generate_key_file(key_path)
+    signer = SoftwareSigner.from_file(key_path)
+    results = []
+
+    events = create_events(VCPEventFactory("BENCH_VENUE", Tier.GOLD), n)
+    digests = [bytes.fromhex(e.security.event_hash) for e in events]
+
+    # Raw primitives
+    results.append(measure("signing.sign", lambda: signer.sign_many(digests), n, args.repeat))
+    signed = SigningStage(signer).sign_events(events)
+    verifier = BatchVerifier(signer.public_key())
+    results.append(measure("signing.verify_inline", lambda: verifier.verify(signed), n, args.repeat))
+    pool_verifier = BatchVerifier(signer.public_key(), workers=args.workers)
+    pool_verifier.verify(signed[:args.workers * 512])  # Start the pool
+    results.append(measure("signing.verify_batch_pool", lambda: pool_verifier.verify(signed), n,
+                           args.repeat, params={"workers": args.workers}))
+    pool_verifier.close()
+
+    # End to end: factory alone, naive inline signing, pipelined stage
+    results.append(measure(
+        "signing.factory_unsigned",
+        lambda: create_events(VCPEventFactory("BENCH_VENUE", Tier.GOLD), n), n, args.repeat
+    ))
+
+    def naive():
+        stage = SigningStage(signer)
+        create_events(VCPEventFactory("BENCH_VENUE", Tier.GOLD), n,
+                      lambda event: stage.sign_events([event]))
+    results.append(measure("signing.factory_inline_sign", naive, n, args.repeat))
+
+    elapsed = run_stage(SigningStage(signer, workers=args.workers, processes=True), n)
+    results.append(BenchResult("signing.factory_stage_processes", n, [elapsed],
+                               params={"workers": args.workers}))
+    elapsed = run_stage(SigningStage(signer, workers=args.workers, processes=False), n)
+    results.append(BenchResult("signing.factory_stage_threads", n, [elapsed],
+                               params={"workers": args.workers}))
+
+    hsm = HSMStandinSigner(key_path, sessions=args.workers, latency=args.hsm_latency)
+    try:
+        elapsed = run_stage(SigningStage(hsm, workers=args.workers), n)
+        results.append(BenchResult("signing.factory_stage_hsm", n, [elapsed],
+                                   params={"sessions": args.workers, "latency": args.hsm_latency}))
+    finally:
+        hsm.close()
+
+    # Tampered events must be reported
+    signed[3].security.event_hash = "00" * 32
+    signed[7].security.signature = None
+    failed = verifier.verify(signed[:10])
+    print_results(results)
+    print(f"\ncpus: {os.cpu_count()}  tamper check: {'OK' if failed == [3, 7] else f'FAILED {failed}'}")
+    shutil.rmtree(workdir, ignore_errors=True)
+    if failed != [3, 7]:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+VCP Spool Ingestion Benchmark
+VeritasChain Standards Organization (VSO)
+
+Measures how many spool lines per second SpoolTailer ingests from many
+terminals on one host:
+- backlog: N terminals' spool files already written, drained from offset 0
+- live:    N writer threads appending at a fixed rate while being tailed
+
+Two sinks are measured: "parse" (JSON parsing only) and "relay" (full
+EventRelay pipeline: pseudonymize, hash, chain, queue).
+
+Usage:
+    python benchmarks/python/bench_spool_ingest.py [--terminals 60] [--lines 5000] [--backend polling]
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+from queue import Empty
+
+# Add source directory to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src', 'python'))
+
+from vcp_relay_v1_0 import EventRelay
+from vcp_sidecar_adapter_v1_0 import UUIDv7Generator, VCPManagerAdapter, Tier
+from vcp_spool_v1_0 import SpoolTailer
+
+
+class ParseSink:
+    """Stand-in for EventRelay that only parses lines"""
+
+    def __init__(self):
+        self.records = 0
+        self._lock = threading.Lock()
+
+    def submit_lines(self, lines, source="api") -> int:
+        parsed = [json.loads(line) for line in lines if line.strip()]
+        with self._lock:
+            self.records += len(parsed)
+        return len(parsed)
+
+
+class RelaySink:
+    """EventRelay on an adapter whose queue is drained locally"""
+
+    def __init__(self):
+        self.adapter = VCPManagerAdapter("BENCH_VENUE", "http://127.0.0.1:9", "bench", tier=Tier.SILVER)
+        self.relay = EventRelay(self.adapter)
+        self.records = 0
+        self._running = True
+        self._drainer = threading.Thread(target=self._drain, daemon=True)
+        self._drainer.start()
+
+    def _drain(self):
+        queue = self.adapter.event_queue
+        while self._running:
+            try:
+                event = queue.get(timeout=0.1)
+                self.adapter._done([event.header.event_id])  # Stands in for the upload's acknowledgement
+                self.records += 1
+            except Empty:
+                pass
+
+    def submit_lines(self, lines, source="api", collect=None) -> int:
+        return self.relay.submit_lines(lines, source, collect)
+
+    def close(self):
+        self._running = False
+        self._drainer.join(timeout=5)
+
+
+def record_line(terminal: int, seq: int) -> str:
+    return json.dumps({
+        "header": {
+            "event_id": UUIDv7Generator.generate(),
+            "trace_id": UUIDv7Generator.generate(),
+            "timestamp_int": str(time.time_ns()),
+            "event_type_code": 2,
+            "symbol": "EURUSD",
+            "account_id": str(100000 + terminal),
+        },
+        "payload": {"trade_data": {
+            "order_id": str(seq), "side": "BUY", "order_type": "MARKET",
+            "price": "1.08550", "quantity": "1.00"
+        }},
+    }, separators=(',', ':')) + "\n"
+
+
+def wait_records(sink, expected: int, timeout: float = 300.0):
+    deadline = time.perf_counter() + timeout
+    while sink.records < expected and time.perf_counter() < deadline:
+        time.sleep(0.005)
+
+
+def bench_backlog(sink, terminals: int, lines: int, backend: str) -> float:
+    with tempfile.TemporaryDirectory() as spool_dir:
+        block = "".join(record_line(0, i) for i in range(lines))
+        for t in range(terminals):
+            with open(os.path.join(spool_dir, f"{100000 + t}_1_20250101.ndjson"), "w") as f:
+                f.write(block)
+
+        started = time.perf_counter()
+        tailer = SpoolTailer(sink, spool_dir, backend=backend, poll_interval=0.02).start()
+        wait_records(sink, terminals * lines)
+        elapsed = time.perf_counter() - started
+        tailer.stop()
+    return terminals * lines / elapsed
+
+
+def bench_live(sink, terminals: int, rate: float, duration: float, backend: str):
+    """Returns (lines written, seconds to catch up after writers stopped)"""
+    with tempfile.TemporaryDirectory() as spool_dir:
+        tailer = SpoolTailer(sink, spool_dir, backend=backend, poll_interval=0.02).start()
+        written = [0] * terminals
+        stop_at = time.perf_counter() + duration
+
+        def writer(t: int):
+            interval = 0.05  # Flush every 50 ms, like an EA timer
+            per_flush = max(1, int(rate * interval))
+            with open(os.path.join(spool_dir, f"{100000 + t}_1_20250101.ndjson"), "w") as f:
+                while time.perf_counter() < stop_at:
+                    f.write("".join(record_line(t, written[t] + i) for i in range(per_flush)))
+                    f.flush()
+                    written[t] += per_flush
+                    time.sleep(interval)
+
+        threads = [threading.Thread(target=writer, args=(t,)) for t in range(terminals)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        stopped = time.perf_counter()
+        wait_records(sink, sum(written))
+        catch_up = time.perf_counter() - stopped
+        tailer.stop()
+    return sum(written), catch_up
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure spool ingestion lines/sec")
+    parser.add_argument("--terminals", type=int, default=60)
+    parser.add_argument("--lines", type=int, default=2000, help="Backlog lines per terminal")
+    parser.add_argument("--rate", type=float, default=20.0, help="Live lines/sec per terminal")
+    parser.add_argument("--duration", type=float, default=5.0)
+    parser.add_argument("--backend", choices=("auto", "inotify", "polling"), default="auto")
+    args = parser.parse_args()
+
+    print(f"{args.terminals} terminals, backend={args.backend}")
+    parse_rate = bench_backlog(ParseSink(), args.terminals, args.lines, args.backend)
+    print(f"  backlog, parse only:     {parse_rate:12,.0f} lines/s")
+
+    sink = RelaySink()
+    relay_rate = bench_backlog(sink, args.terminals, args.lines, args.backend)
+    sink.close()
+    print(f"  backlog, full relay:     {relay_rate:12,.0f} lines/s")
+
+    sink = RelaySink()
+    written, catch_up = bench_live(sink, args.terminals, args.rate, args.duration, args.backend)
+    sink.close()
+    offered = args.terminals * args.rate
+    print(f"  live, {offered:,.0f} lines/s offered: {written:,} lines, "
+          f"caught up {catch_up * 1000:.0f} ms after writers stopped")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+VCP Tracing Overhead Benchmark
+VeritasChain Standards Organization (VSO)
+
+Measures the hot-path cost of the tracing hooks when tracing is disabled,
+enabled with sampling, and enabled for every operation, and optionally
+writes the captured spans as a Chrome trace or speedscope profile.
+
+Usage:
+    python benchmarks/python/bench_tracing_overhead.py [--events N] [--dump trace.json]
+"""
+
+import argparse
+import gc
+import os
+import sys
+import time
+
+# Add source directory to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src', 'python'))
+
+import vcp_tracing_v1_0 as tracing
+from vcp_sidecar_adapter_v1_0 import VCPEventFactory, VCPEventSerializer, Tier
+
+
+def run_workload(events: int) -> float:
+    """Create, hash and serialize EXE events; return seconds elapsed"""
+    factory = VCPEventFactory(venue_id="BENCH_VENUE", tier=Tier.SILVER)
+    started = time.perf_counter()
+    for i in range(events):
+        event = factory.create_execution_event(
+            symbol="EURUSD",
+            account_id="bench_account",
+            trace_id="019b591b-ea7e-7f6f-b130-ede86931b9d4",
+            order_id=str(i),
+            exchange_order_id=str(i),
+            execution_price="1.08552",
+            executed_qty="1.00"
+        )
+        VCPEventSerializer.to_json(event)
+    return time.perf_counter() - started
+
+
+def best_of(rounds: int, events: int, tracer=None) -> float:
+    results = []
+    for _ in range(rounds):
+        if tracer is not None:
+            tracing.enable(tracer)
+        gc.collect()
+        try:
+            results.append(run_workload(events))
+        finally:
+            tracing.disable()
+    return min(results) / events * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure tracing hook overhead")
+    parser.add_argument("--events", type=int, default=20000)
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--dump", help="Write the full-sampling run to this file")
+    parser.add_argument("--format", choices=("chrome", "speedscope"), default="chrome")
+    args = parser.parse_args()
+
+    run_workload(1000)  # Warm-up
+
+    sampled = tracing.Tracer(sample_rate=0.01)
+    tracing.RingBufferRecorder().attach(sampled)
+    full = tracing.Tracer(sample_rate=1.0)
+    recorder = tracing.RingBufferRecorder(capacity=args.events * 10).attach(full)
+
+    disabled_us = best_of(args.rounds, args.events)
+    sampled_us = best_of(args.rounds, args.events, sampled)
+    recorder.clear()
+    full_us = best_of(1, args.events, full)
+
+    print(f"Tracing disabled:      {disabled_us:8.2f} us/event")
+    print(f"Tracing 1% sampled:    {sampled_us:8.2f} us/event ({(sampled_us / disabled_us - 1) * 100:+.1f}%)")
+    print(f"Tracing 100% sampled:  {full_us:8.2f} us/event ({(full_us / disabled_us - 1) * 100:+.1f}%)")
+    print("\nStage breakdown (100% sampled run):")
+    for name, stats in recorder.summary().items():
+        print(f"  {name:28} {stats['count']:8d} spans {stats['mean_us']:9.2f} us mean")
+
+    if args.dump:
+        recorder.dump(args.dump, args.format)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+VCP Bulk Sequence Validator Benchmark
+VeritasChain Standards Organization (VSO)
+
+Checks that vcp_validate_v1_0 gives the same result as
+EventCorrelator.add_event for every event of a generated archive with
+interleaved traces and injected violations (duplicate IDs within and
+across traces, timestamp regressions, disallowed transitions, unknown
+type codes), on both backends. Then measures throughput:
+- add_event, one event at a time
+- the pure-Python pass
+- the numpy passes on string IDs and on integer-coded columns (10M events)
+
+Exits non-zero on any disagreement.
+
+Usage:
+    python benchmarks/python/bench_validate.py [--check-events 200000] [--events 10000000]
+"""
+
+import argparse
+import random
+import time
+
+from vcp_bench import SRC_DIR  # noqa: F401  (puts the sidecar modules on sys.path)
+from vcp_sidecar_core_v1_0 import EventCorrelator, VCPEvent, VCPHeader, VCPSecurity
+from vcp_validate_v1_0 import np, validate_columns, validate_events
+
+# Trace shapes, as type codes; 98 (HBT) and 22 (AUD) have no EXPECTED_SEQUENCE entry
+TEMPLATES = ((1, 2, 3, 4), (1, 2, 6), (1, 2, 3, 5, 4), (2, 3, 7), (1, 6), (2, 3, 5, 7), (98,), (22, 1, 2, 3, 4))
+UNKNOWN_CODES = (0, 10, 55, 102, 300, -1)
+
+
+def generate(count: int, rate: float, seed: int = 7):
+    """(trace_id, event_id, type code, timestamp) rows of interleaved traces with violations"""
+    rng = random.Random(seed)
+    rows, trace = [], 0
+    while len(rows) < count:
+        start = rng.randrange(10 ** 12)
+        for k, code in enumerate(rng.choice(TEMPLATES)):
+            rows.append([f"T{trace}", f"E{len(rows)}", code, 1_700_000_000_000_000_000 + start + k * 1000])
+        trace += 1
+    rows = rows[:count]
+    rows.sort(key=lambda row: row[3])  # Interleave traces, each in its own order
+
+    for i, row in enumerate(rows):
+        if rng.random() >= rate:
+            continue
+        kind = rng.randrange(6)
+        other = rows[rng.randrange(max(1, i))]
+        if kind == 0:    # Same ID again, usually within the trace
+            row[1] = other[1] if rng.random() < 0.3 else rows[i - 1][1]
+        elif kind == 1:  # Clock went backwards
+            row[3] -= rng.randrange(1, 10 ** 6)
+        elif kind == 2:  # Disallowed or unknown type
+            row[2] = rng.choice((1, 4, 7, 9, 100) + UNKNOWN_CODES)
+        elif kind == 3:  # Event moved into another trace
+            row[0] = other[0]
+        elif kind == 4:  # Equal timestamp (allowed)
+            row[3] = other[3]
+        else:            # Same event repeated verbatim
+            row[:] = list(rows[i - 1])
+    return rows
+
+
+def correlator_results(events):
+    correlator = EventCorrelator()
+    results = []
+    for event in events:
+        try:
+            results.append(correlator.add_event(event))
+        except ValueError as e:
+            results.append({"status": "error", "message": str(e), "event_id": event.header.event_id})
+    return results
+
+
+def check_agreement(count: int, rate: float) -> list:
+    rows = generate(count, rate)
+    events = [
+        VCPEvent(
+            header=VCPHeader(event_id, trace_id, str(stamp), "", "", code, "MILLISECOND", "BEST_EFFORT",
+                             "SHA256", "BENCH", "EURUSD", "1"),
+            payload={},
+            security=VCPSecurity(),
+        )
+        for trace_id, event_id, code, stamp in rows
+    ]
+    started = time.perf_counter()
+    expected = correlator_results(events)
+    seconds = time.perf_counter() - started
+    print(f"add_event:   {count:>11,} events in {seconds:6.2f}s ({count / seconds:>12,.0f} events/s)")
+
+    failures = []
+    for use_numpy in (False, True) if np is not None else (False,):
+        report = validate_events(events, use_numpy=use_numpy)
+        actual = [{"status": "ok", "event_id": event.header.event_id} for event in events]
+        for index, result in report.results():
+            actual[index] = result
+        mismatches = [i for i in range(count) if actual[i] != expected[i]]
+        print(f"{report.backend + ':':<12} {count:>11,} events in {report.seconds:6.2f}s "
+              f"({count / report.seconds:>12,.0f} events/s), {len(report):,} violations {report.counts()}")
+        if mismatches:
+            i = mismatches[0]
+            failures.append(f"{report.backend}: {len(mismatches)} events disagree with add_event, "
+                            f"first #{i}: {actual[i]} != {expected[i]}")
+    if not any(result["status"] != "ok" for result in expected):
+        failures.append("no violations generated")
+    return failures
+
+
+def integer_columns(count: int, rate: float, seed: int = 7):
+    """Integer-coded columns of interleaved traces, built with numpy"""
+    rng = np.random.default_rng(seed)
+    shapes = [np.array(t) for t in TEMPLATES]
+    choice = rng.integers(0, len(shapes), size=count // 2 + 1)
+    lengths = np.array([len(s) for s in shapes])[choice]
+    ends = np.cumsum(lengths)
+    traces_used = int(np.searchsorted(ends, count)) + 1
+    choice, lengths, ends = choice[:traces_used], lengths[:traces_used], ends[:traces_used]
+    types = np.concatenate([shapes[c] for c in choice])[:count]
+    trace = np.repeat(np.arange(traces_used), lengths)[:count]
+    step = np.arange(count) - np.repeat(ends - lengths, lengths)[:count]
+    stamps = 1_700_000_000_000_000_000 + rng.integers(0, 10 ** 12, size=traces_used)[trace] + step * 1000
+    order = np.argsort(stamps, kind="stable")
+    trace, types, stamps = trace[order], types[order], stamps[order]
+    ids = np.arange(count, dtype=np.int64)
+
+    hit = np.flatnonzero(rng.random(count) < rate)
+    kinds = rng.integers(0, 3, size=len(hit))
+    ids[hit[kinds == 0]] = ids[np.maximum(hit[kinds == 0] - 1, 0)]
+    stamps[hit[kinds == 1]] -= 10 ** 6
+    types[hit[kinds == 2]] = rng.choice(np.array([1, 4, 7, 9, 55]), size=int((kinds == 2).sum()))
+    return trace, ids, types, stamps
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bulk sequence validator agreement and throughput")
+    parser.add_argument("--check-events", type=int, default=200_000)
+    parser.add_argument("--events", type=int, default=10_000_000, help="Events of the integer-column run")
+    parser.add_argument("--python-events", type=int, default=1_000_000)
+    parser.add_argument("--rate", type=float, default=0.01, help="Share of events with an injected violation")
+    args = parser.parse_args()
+
+    failures = check_agreement(args.check_events, args.rate)
+
+    rows = generate(args.python_events, args.rate / 10, seed=11)
+    columns = [list(column) for column in zip(*rows)]
+    for use_numpy in (False, True) if np is not None else (False,):
+        report = validate_columns(*columns, use_numpy=use_numpy)
+        print(f"{report.backend + ' str:':<12} {report.events:>11,} events in {report.seconds:6.2f}s "
+              f"({report.events / report.seconds:>12,.0f} events/s), {len(report):,} violations")
+
+    if np is None:
+        print("numpy not installed: skipping the integer-column run")
+    else:
+        columns = integer_columns(args.events, args.rate / 10)
+        report = validate_columns(*columns)
+        print(f"{'numpy int:':<12} {report.events:>11,} events in {report.seconds:6.2f}s "
+              f"({report.events / report.seconds:>12,.0f} events/s), {report.traces:,} traces, "
+              f"{len(report):,} violations {report.counts()}")
+
+    for failure in failures:
+        print(f"FAILED: {failure}")
+    if failures:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,356 @@
+#!/usr/bin/env python3
+"""
+Local Stand-in VCP Explorer Server
+VeritasChain Standards Organization (VSO)
+
+Minimal HTTP server implementing the Explorer read endpoints of guide
+section 7 over an in-memory event set, for benchmarks and offline
+experiments:
+- GET /events (filters, limit/offset, sort), /events/{event_id}
+- GET /traces/{trace_id}
+- GET /merkle/proof/{event_id} (RFC 6962 proofs over fixed windows)
+- POST /reconcile/digests, /reconcile/events (range fingerprints and
+  entries, see vcp_reconcile_v1_0)
+
+Every response carries X-RateLimit-* headers from a fixed-window limit;
+requests over the limit get 429 with Retry-After.
+
+Usage:
+    python benchmarks/python/explorer_standin.py --port 8081 --events 10000 --limit 100 --window 60
+"""
+
+import argparse
+import json
+import math
+import os
+import sys
+import threading
+import time
+from collections import defaultdict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, unquote, urlsplit
+
+# Add source directory to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src', 'python'))
+
+from vcp_merkle_v1_0 import InclusionProof, MerkleTree
+from vcp_reconcile_v1_0 import RangeIndex, decode_range
+from vcp_sidecar_adapter_v1_0 import (
+    EventTypeCode, Tier, VCPEvent, VCPEventFactory, VCPEventSerializer
+)
+
+PROOF_WINDOW = 10_000
+
+
+def generate_events(count: int, symbols=("EURUSD", "USDJPY", "XAUUSD")) -> List[VCPEvent]:
+    """ORD/EXE pairs sharing a trace_id, spread over a few symbols"""
+    factory = VCPEventFactory("STANDIN_VENUE", Tier.SILVER)
+    events = []
+    for i in range(count):
+        symbol = symbols[(i // 2) % len(symbols)]
+        event_type = EventTypeCode.ORD if i % 2 == 0 else EventTypeCode.EXE
+        trace_id = events[-1].header.trace_id if i % 2 else None
+        events.append(factory.create_event(
+            event_type, symbol, str(100000 + i % 50),
+            {"trade_data": {"order_id": str(1000 + i // 2), "price": "1.08550", "quantity": "1.00"}},
+            trace_id=trace_id
+        ))
+    return events
+
+
+class ExplorerStats:
+    """Counters shared across request handler threads"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.requests = 0
+        self.throttled = 0
+        self.bytes_sent = 0
+        self.paths: Dict[str, int] = defaultdict(int)
+
+    def snapshot(self) -> Dict:
+        with self.lock:
+            return {
+                "requests": self.requests,
+                "throttled": self.throttled,
+                "bytes_sent": self.bytes_sent,
+                "paths": dict(self.paths),
+            }
+
+
+class _FixedWindow:
+    """Fixed-window request limit, as reported in X-RateLimit-* headers"""
+
+    def __init__(self, limit: int, window: float):
+        self.limit = limit
+        self.window = window
+        self.lock = threading.Lock()
+        self.window_end = 0.0
+        self.used = 0
+
+    def take(self) -> Tuple[bool, int, int]:
+        """(allowed, remaining, reset as Unix seconds)"""
+        with self.lock:
+            now = time.time()
+            if now >= self.window_end:
+                self.window_end = math.ceil(now / self.window) * self.window
+                if self.window_end <= now:
+                    self.window_end += self.window
+                self.used = 0
+            allowed = self.used < self.limit
+            if allowed:
+                self.used += 1
+            return allowed, self.limit - self.used, math.ceil(self.window_end)
+
+
+class _ExplorerHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    server_ref: "StandinExplorerServer"
+
+    def _admit(self) -> Tuple[Optional[List[str]], str, Dict[str, str]]:
+        """Count and rate-limit a request; (path parts or None if refused, query, headers)"""
+        server = self.server_ref
+        url = urlsplit(self.path)
+        path = url.path
+        if path.startswith(server.prefix):
+            path = path[len(server.prefix):]
+        stats = server.stats
+        with stats.lock:
+            stats.requests += 1
+            stats.paths["/" + path.strip("/").split("/")[0]] += 1
+
+        allowed, remaining, reset = server.limiter.take()
+        headers = {
+            "X-RateLimit-Limit": str(server.limiter.limit),
+            "X-RateLimit-Remaining": str(max(0, remaining)),
+            "X-RateLimit-Reset": str(reset),
+        }
+        if not allowed:
+            with stats.lock:
+                stats.throttled += 1
+            headers["Retry-After"] = str(max(1, reset - int(time.time())))
+            self._reply(429, b'{"error": "rate limit exceeded"}', headers)
+            return None, url.query, headers
+        if server.latency:
+            time.sleep(server.latency)
+        return [unquote(p) for p in path.strip("/").split("/")], url.query, headers
+
+    def do_POST(self):
+        request = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        parts, _, headers = self._admit()
+        if parts is None:
+            return
+        server = self.server_ref
+        body: Optional[bytes] = None
+        if parts == ["reconcile", "digests"]:
+            body = server.range_digests(json.loads(request)["ranges"])
+        elif parts == ["reconcile", "events"]:
+            body = server.range_events(json.loads(request)["ranges"])
+        if body is None:
+            self._reply(404, b'{"error": "not found"}', headers)
+        else:
+            self._reply(200, body, headers)
+
+    def do_GET(self):
+        parts, query, headers = self._admit()
+        if parts is None:
+            return
+        server = self.server_ref
+        stats = server.stats
+        body: Optional[bytes] = None
+        if parts == ["events"]:
+            body = server.query({k: v[0] for k, v in parse_qs(query).items()})
+        elif len(parts) == 2 and parts[0] == "events":
+            body = server.encoded.get(parts[1])
+        elif len(parts) == 2 and parts[0] == "traces":
+            body = server.trace(parts[1])
+        elif len(parts) == 3 and parts[:2] == ["merkle", "proof"]:
+            body = server.proof(parts[2])
+        elif parts == ["health"]:
+            body = json.dumps({"status": "ok", **stats.snapshot()}).encode("utf-8")
+        if body is None:
+            self._reply(404, b'{"error": "not found"}', headers)
+        else:
+            self._reply(200, body, headers)
+
+    def _reply(self, status: int, body: bytes, headers: Dict[str, str]):
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+        with self.server_ref.stats.lock:
+            self.server_ref.stats.bytes_sent += len(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class StandinExplorerServer:
+    """Stand-in Explorer API running on a background thread"""
+
+    def __init__(
+        self,
+        events: List[VCPEvent],
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency_ms: float = 0.0,
+        limit: int = 100,
+        window: float = 60.0,
+        report_total: bool = True,
+        prefix: str = "/api/v1",
+        range_index: Optional[RangeIndex] = None
+    ):
+        self.events = events
+        self.latency = latency_ms / 1000.0
+        self.limiter = _FixedWindow(limit, window)
+        self.report_total = report_total
+        self.prefix = prefix
+        self.stats = ExplorerStats()
+        # Pre-encoded events so the server is not the bottleneck
+        self.encoded: Dict[str, bytes] = {}
+        self._rows: List[Tuple[VCPEvent, bytes]] = []
+        self._traces: Dict[str, List[bytes]] = defaultdict(list)
+        self._index: Dict[str, int] = {}
+        for i, event in enumerate(events):
+            data = json.dumps(VCPEventSerializer.to_dict(event), separators=(',', ':')).encode("utf-8")
+            self.encoded[event.header.event_id] = data
+            self._rows.append((event, data))
+            self._traces[event.header.trace_id].append(data)
+            self._index[event.header.event_id] = i
+        self._trees: Dict[int, MerkleTree] = {}
+        self._tree_lock = threading.Lock()
+        # Reconciliation index; built from events on first use unless given
+        self.range_index = range_index
+
+        handler = type("ExplorerHandler", (_ExplorerHandler,), {"server_ref": self})
+        self._server = ThreadingHTTPServer((host, port), handler)
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    # -------------------------------------------------------------------------
+    def query(self, params: Dict[str, str]) -> bytes:
+        rows = self._rows
+        filters = []
+        for field in ("trace_id", "symbol", "venue_id", "account_id"):
+            if field in params:
+                filters.append((field, params[field]))
+        if "event_type_code" in params:
+            filters.append(("event_type_code", int(params["event_type_code"])))
+        start = int(params["start_time"]) * 1_000_000 if "start_time" in params else None
+        end = int(params["end_time"]) * 1_000_000 if "end_time" in params else None
+        if filters or start is not None or end is not None:
+            rows = [
+                (event, data) for event, data in rows
+                if all(getattr(event.header, field) == value for field, value in filters)
+                and (start is None or int(event.header.timestamp_int) >= start)
+                and (end is None or int(event.header.timestamp_int) <= end)
+            ]
+        if params.get("sort") == "desc":
+            rows = rows[::-1]
+        limit = max(1, min(int(params.get("limit", 100)), 1000))
+        offset = int(params.get("offset", 0))
+        page = b",".join(data for _, data in rows[offset:offset + limit])
+        meta = f',"limit":{limit},"offset":{offset}'
+        if self.report_total:
+            meta += f',"total":{len(rows)}'
+        return b'{"events":[' + page + b']' + meta.encode("ascii") + b'}'
+
+    def trace(self, trace_id: str) -> Optional[bytes]:
+        events = self._traces.get(trace_id)
+        if not events:
+            return None
+        return (f'{{"trace_id":"{trace_id}","events":['.encode("utf-8") + b",".join(events) + b']}')
+
+    def proof(self, event_id: str) -> Optional[bytes]:
+        index = self._index.get(event_id)
+        if index is None:
+            return None
+        window, leaf = divmod(index, PROOF_WINDOW)
+        with self._tree_lock:
+            tree = self._trees.get(window)
+            if tree is None:
+                chunk = self.events[window * PROOF_WINDOW:(window + 1) * PROOF_WINDOW]
+                tree = MerkleTree([bytes.fromhex(e.security.event_hash) for e in chunk])
+                self._trees[window] = tree
+        proof = InclusionProof(
+            sequence=index + 1, event_hash=tree.leaves[leaf].hex(), leaf_index=leaf,
+            tree_size=tree.size, path=[p.hex() for p in tree.proof(leaf)],
+            merkle_root=tree.root.hex(), anchor_index=window, anchor_event_id="",
+        )
+        return json.dumps(proof.to_dict()).encode("utf-8")
+
+    def _ranges(self, ranges: List) -> Tuple[RangeIndex, List]:
+        with self._tree_lock:
+            if self.range_index is None:
+                self.range_index = RangeIndex.from_events(self.events)
+        return self.range_index, [decode_range(r) for r in ranges]
+
+    def range_digests(self, ranges: List) -> bytes:
+        index, ranges = self._ranges(ranges)
+        return json.dumps({"digests": index.digests(ranges)}).encode("utf-8")
+
+    def range_events(self, ranges: List) -> bytes:
+        index, ranges = self._ranges(ranges)
+        events = [[[str(ts), event_id, event_hash] for ts, event_id, event_hash in entries]
+                  for entries in index.entries(ranges)]
+        return json.dumps({"events": events}, separators=(',', ':')).encode("utf-8")
+
+    # -------------------------------------------------------------------------
+    @property
+    def address(self) -> Tuple[str, int]:
+        return self._server.server_address[:2]
+
+    @property
+    def endpoint(self) -> str:
+        host, port = self.address
+        return f"http://{host}:{port}{self.prefix}"
+
+    def start(self) -> "StandinExplorerServer":
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread:
+            self._thread.join(timeout=5)
+
+    def __enter__(self) -> "StandinExplorerServer":
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+        return False
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run a local stand-in VCP Explorer server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8081)
+    parser.add_argument("--events", type=int, default=10_000)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--limit", type=int, default=100, help="Requests per window")
+    parser.add_argument("--window", type=float, default=60.0, help="Rate limit window in seconds")
+    args = parser.parse_args()
+
+    server = StandinExplorerServer(
+        generate_events(args.events), args.host, args.port, args.latency_ms, args.limit, args.window
+    )
+    server.start()
+    print(f"Stand-in Explorer listening on {server.endpoint} (Ctrl+C to stop)")
+    try:
+        while True:
+            time.sleep(5)
+            print(server.stats.snapshot())
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
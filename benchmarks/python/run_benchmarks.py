@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+VCP Benchmark Runner
+VeritasChain Standards Organization (VSO)
+
+Runs the benchmark suites and writes JSON results. With --compare, the
+run is checked against a baseline report and exits non-zero when any
+benchmark's median time per op regresses beyond --threshold percent.
+
+Usage:
+    python benchmarks/python/run_benchmarks.py --output baseline.json
+    python benchmarks/python/run_benchmarks.py --output current.json --compare baseline.json
+    python benchmarks/python/run_benchmarks.py --suite micro --quick
+    python benchmarks/python/run_benchmarks.py --diff baseline.json current.json
+"""
+
+import argparse
+import json
+import logging
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import vcp_bench  # noqa: E402  (sets up src/python on sys.path)
+
+SUITES = ("micro", "macro", "e2e")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run VCP sidecar benchmarks")
+    parser.add_argument("--suite", choices=SUITES + ("all",), default="all")
+    parser.add_argument("--quick", action="store_true", help="Smaller sizes for smoke runs")
+    parser.add_argument("--output", help="Write JSON results to this file")
+    parser.add_argument("--compare", metavar="BASELINE", help="Compare against a baseline report")
+    parser.add_argument("--diff", nargs=2, metavar=("BASELINE", "CURRENT"),
+                        help="Compare two existing reports without running")
+    parser.add_argument("--threshold", type=float, default=10.0,
+                        help="Regression threshold in percent (default: 10)")
+    args = parser.parse_args()
+
+    # Keep adapter INFO logs (one line per batch) out of the timings
+    logging.getLogger().setLevel(logging.WARNING)
+    logging.getLogger("vcp_adapter").setLevel(logging.WARNING)
+
+    if args.diff:
+        with open(args.diff[0]) as f:
+            baseline = json.load(f)
+        with open(args.diff[1]) as f:
+            current = json.load(f)
+        regressions = vcp_bench.compare(baseline, current, args.threshold)
+        sys.exit(1 if regressions else 0)
+
+    suites = SUITES if args.suite == "all" else (args.suite,)
+    results = []
+    for suite in suites:
+        module = __import__(f"bench_{suite}")
+        print(f"Running {suite} suite...", flush=True)
+        results.extend(module.run(quick=args.quick))
+
+    vcp_bench.print_results(results)
+    if args.output:
+        report = vcp_bench.write_results(args.output, results)
+        print(f"\nResults written to {args.output}")
+    else:
+        report = {"results": {r.name: r.to_dict() for r in results}}
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        regressions = vcp_bench.compare(baseline, report, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} benchmark(s) regressed more than {args.threshold:g}%")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
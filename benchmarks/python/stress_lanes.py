@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+VCP Priority Lane Stress Test
+VeritasChain Standards Organization (VSO)
+
+Drives a mixed event stream (trade-critical EXE/PRT/REJ/CXL/CLS, SIG/ORD,
+and a heartbeat every 50 ms) through VCPManagerAdapter into a local
+stand-in VCC. The stand-in fails every request for the middle of the run.
+Three queue setups are compared:
+- fifo:        one bounded FIFO that drops when full (the old behaviour)
+- lanes:       priority lanes with a critical reserve, no spill
+- lanes+spill: priority lanes spilling overflow to disk
+
+Reports events lost per lane, heartbeats coalesced, peak lane depth and
+age, and how long after the outage each lane's backlog took to clear. Exits non-zero
+if lanes+spill loses any trade-critical event.
+
+Usage:
+    python benchmarks/python/stress_lanes.py [--rate 2000] [--duration 12] [--outage 2:8]
+"""
+
+import argparse
+import logging
+import os
+import shutil
+import sys
+import tempfile
+import time
+from collections import Counter
+
+# Add source directory to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src', 'python'))
+
+from vcc_standin import StandinVCCServer
+from vcp_sidecar_adapter_v1_0 import (
+    LANE_CRITICAL, LANES, EventTypeCode, LaneQueue, Tier, VCPManagerAdapter, event_lane
+)
+
+MIX = [EventTypeCode.EXE, EventTypeCode.ORD, EventTypeCode.SIG, EventTypeCode.REJ, EventTypeCode.ORD,
+       EventTypeCode.PRT, EventTypeCode.ACK, EventTypeCode.CXL, EventTypeCode.ORD, EventTypeCode.CLS]
+
+
+def run(mode: str, args) -> dict:
+    spill_dir = tempfile.mkdtemp(prefix="vcp-spill-") if mode == "lanes+spill" else None
+    outage_start, outage_end = (float(t) for t in args.outage.split(":"))
+    with StandinVCCServer(latency_ms=args.latency_ms) as server:
+        adapter = VCPManagerAdapter(
+            "STRESS_VENUE", server.endpoint, "stress", tier=Tier.SILVER,
+            batch_size=args.batch_size, max_queue=args.max_queue, spill_dir=spill_dir,
+            failure_threshold=10 ** 9  # Lanes alone: offline mode is covered by stress_offline.py
+        )
+        if mode == "fifo":
+            adapter.event_queue = LaneQueue(args.max_queue, venue_id="STRESS_VENUE",
+                                            critical_reserve=0.0, backlog_threshold=args.max_queue + 1)
+        adapter.start()
+        queue = adapter.event_queue
+        offered, lost = Counter(), Counter()
+        ids = []
+        peak_depth, peak_age = Counter(), Counter()
+        heartbeats_sent = heartbeats_coalesced = 0
+
+        started = time.perf_counter()
+        next_heartbeat = 0.0
+        index = 0
+        in_outage = False
+        outage_ended_at = None
+        cleared = {}  # lane -> seconds after the outage until its backlog cleared
+
+        def sample():
+            for lane in LANES:
+                depth = queue.depth(lane)
+                peak_depth[lane] = max(peak_depth[lane], depth)
+                peak_age[lane] = max(peak_age[lane], queue.age(lane))
+                if outage_ended_at is not None and lane not in cleared and depth <= args.batch_size // 10:
+                    cleared[lane] = time.perf_counter() - outage_ended_at
+
+        while True:
+            elapsed = time.perf_counter() - started
+            if elapsed >= args.duration:
+                break
+            if not in_outage and outage_start <= elapsed < outage_end:
+                server.set_error_rate(1.0)
+                in_outage = True
+            elif in_outage and elapsed >= outage_end:
+                server.set_error_rate(0.0)
+                in_outage = False
+                outage_ended_at = time.perf_counter()
+
+            if elapsed >= next_heartbeat:
+                sequence = adapter.factory.sequence
+                adapter.send_heartbeat()
+                if adapter.factory.sequence != sequence:
+                    heartbeats_sent += 1
+                else:
+                    heartbeats_coalesced += 1
+                next_heartbeat += 0.05
+                sample()
+
+            due = index / args.rate
+            if due > elapsed:
+                time.sleep(min(due - elapsed, 0.005))
+                continue
+            event_type = MIX[index % len(MIX)]
+            event = adapter.factory.create_event(
+                event_type, "EURUSD", "100001", {"trade_data": {"order_id": str(index), "price": "1.08550"}}
+            )
+            lane = event_lane(event)
+            offered[lane] += 1
+            if adapter.queue_event(event):
+                ids.append((lane, event.header.event_id))
+            else:
+                lost[lane] += 1
+            index += 1
+
+        if outage_ended_at is None:
+            server.set_error_rate(0.0)
+            outage_ended_at = time.perf_counter()
+        deadline = time.perf_counter() + args.drain_timeout
+        received = server.stats.event_ids
+        while time.perf_counter() < deadline:
+            sample()
+            if queue.empty() and all(event_id in received for _, event_id in ids[-50:]):
+                break
+            time.sleep(0.05)
+        adapter.stop()
+
+        for lane, event_id in ids:
+            if event_id not in received:
+                lost[lane] += 1
+    if spill_dir:
+        shutil.rmtree(spill_dir, ignore_errors=True)
+    return {
+        "offered": offered, "lost": lost, "peak_depth": peak_depth, "peak_age": peak_age,
+        "heartbeats_sent": heartbeats_sent, "heartbeats_coalesced": heartbeats_coalesced,
+        "cleared": cleared,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Stress the adapter queue through a simulated outage")
+    parser.add_argument("--rate", type=float, default=2000.0, help="Events per second")
+    parser.add_argument("--duration", type=float, default=12.0)
+    parser.add_argument("--outage", default="2:8", help="Outage window start:end in seconds")
+    parser.add_argument("--max-queue", type=int, default=5000)
+    parser.add_argument("--batch-size", type=int, default=500)
+    parser.add_argument("--latency-ms", type=float, default=5.0)
+    parser.add_argument("--drain-timeout", type=float, default=120.0)
+    parser.add_argument("--modes", default="fifo,lanes,lanes+spill")
+    args = parser.parse_args()
+    logging.getLogger("vcp_adapter").setLevel(logging.CRITICAL)
+
+    results = {mode: run(mode, args) for mode in args.modes.split(",")}
+
+    print(f"{'mode':<12} {'lane':<10} {'offered':>8} {'lost':>7} {'peak depth':>11} "
+          f"{'peak age s':>11} {'drained s':>10}")
+    for mode, result in results.items():
+        for lane in LANES:
+            if lane == "heartbeat":
+                offered = result["heartbeats_sent"]
+            else:
+                offered = result["offered"][lane]
+            drained = result["cleared"].get(lane)
+            print(f"{mode:<12} {lane:<10} {offered:>8} {result['lost'][lane]:>7} "
+                  f"{result['peak_depth'][lane]:>11} {result['peak_age'][lane]:>11.2f} "
+                  f"{drained if drained is not None else float('nan'):>10.2f}")
+        print(f"{mode:<12} heartbeats coalesced: {result['heartbeats_coalesced']}")
+
+    spill = results.get("lanes+spill")
+    if spill is not None and spill["lost"][LANE_CRITICAL]:
+        print(f"FAILED: lanes+spill lost {spill['lost'][LANE_CRITICAL]} trade-critical events")
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,301 @@
+#!/usr/bin/env python3
+"""
+VCP Offline Mode Stress Test
+VeritasChain Standards Organization (VSO)
+
+1. Outage: a live event stream through VCPManagerAdapter into a local
+   stand-in VCC that fails every request for the middle of the run. The
+   circuit breaker must open, events must be recorded to the offline
+   backlog, and on reconnect exactly one REC event must arrive naming the
+   last event VCC acknowledged before the break. No event may be lost, and
+   live events must keep flowing while the backlog drains.
+2. Time to drain: a sidecar restarted during an outage with a large
+   backlog on disk (1M events by default) reconnects and replays it in
+   gzip-compressed batches while a live stream continues; reports events
+   per second, bytes on the wire and the peak age of the live lanes.
+3. Batch encoding: drain rate and bytes on the wire per compression level.
+
+Exits non-zero if a check fails.
+
+Usage:
+    python benchmarks/python/stress_offline.py [--backlog 1000000] [--rate 500] [--outage 2:6]
+"""
+
+import argparse
+import logging
+from collections import deque
+import os
+import shutil
+import tempfile
+import time
+
+from vcp_bench import SRC_DIR  # noqa: F401  (puts the sidecar modules on sys.path)
+from vcc_standin import StandinVCCServer
+from vcp_sidecar_adapter_v1_0 import EventTypeCode, Tier, VCPManagerAdapter
+
+VENUE = "STRESS_VENUE"
+MIX = [EventTypeCode.ORD, EventTypeCode.ACK, EventTypeCode.EXE, EventTypeCode.ORD, EventTypeCode.CLS]
+
+
+class RecoveryWatch:
+    """Observes batches at the stand-in (as its reject function) and keeps the REC events"""
+
+    def __init__(self):
+        self.recoveries = []
+
+    def __call__(self, event):
+        if event["header"]["event_type_code"] == EventTypeCode.REC:
+            self.recoveries.append(event)
+        return None
+
+
+class LiveLatency:
+    """Worst time from queueing a live event to the stand-in receiving it, sampled"""
+
+    def __init__(self, server):
+        self.received = server.stats.event_ids
+        self.waiting = deque()
+        self.worst = 0.0
+
+    def sent(self, event):
+        self.waiting.append((time.perf_counter(), event.header.event_id))
+
+    def sample(self):
+        now = time.perf_counter()
+        while self.waiting and self.waiting[0][1] in self.received:
+            self.worst = max(self.worst, now - self.waiting.popleft()[0])
+        if self.waiting:
+            self.worst = max(self.worst, now - self.waiting[0][0])
+
+
+def make_adapter(endpoint: str, spill_dir: str, args, **kwargs) -> VCPManagerAdapter:
+    adapter = VCPManagerAdapter(
+        VENUE, endpoint, "stress", tier=Tier.SILVER, batch_size=args.batch_size,
+        spill_dir=spill_dir, failure_threshold=3, drain_batch_size=args.drain_batch, **kwargs
+    )
+    adapter.breaker.probe_interval = 0.25
+    adapter.breaker.max_probe_interval = 1.0
+    for client in (adapter.client, adapter.drain_client):
+        client.retry_count = 1
+    return adapter
+
+
+def emit(adapter: VCPManagerAdapter, index: int):
+    event = adapter.factory.create_event(
+        MIX[index % len(MIX)], "EURUSD", "100001",
+        {"trade_data": {"order_id": str(index), "price": "1.08550", "quantity": "1.00"}}
+    )
+    adapter.queue_event(event)
+    return event
+
+
+def wait_delivered(server, ids, timeout: float, on_wait=None) -> bool:
+    deadline = time.perf_counter() + timeout
+    received = server.stats.event_ids
+    while time.perf_counter() < deadline:
+        if on_wait:
+            on_wait()
+        if all(event_id in received for event_id in ids[-200:]) and all(event_id in received for event_id in ids):
+            return True
+        time.sleep(0.05)
+    return False
+
+
+def outage_run(args) -> list:
+    failures = []
+    spill_dir = tempfile.mkdtemp(prefix="vcp-offline-")
+    outage_start, outage_end = (float(t) for t in args.outage.split(":"))
+    watch = RecoveryWatch()
+    try:
+        with StandinVCCServer(latency_ms=args.latency_ms, reject_fn=watch) as server:
+            adapter = make_adapter(server.endpoint, spill_dir, args)
+            adapter.start()
+            ids, acked_before = [], set()
+            opened_at = closed_at = None
+            peak_backlog = 0
+            live = LiveLatency(server)
+            started = time.perf_counter()
+            index = 0
+            in_outage = False
+            while True:
+                elapsed = time.perf_counter() - started
+                if elapsed >= args.duration:
+                    break
+                if not in_outage and outage_start <= elapsed < outage_end:
+                    acked_before = set(server.stats.event_ids)
+                    server.set_error_rate(1.0)
+                    in_outage = True
+                elif in_outage and elapsed >= outage_end:
+                    server.set_error_rate(0.0)
+                    in_outage = False
+                if adapter.breaker.is_open and opened_at is None:
+                    opened_at = elapsed
+                if opened_at is not None and closed_at is None and not adapter.breaker.is_open:
+                    closed_at = elapsed
+                peak_backlog = max(peak_backlog, len(adapter.backlog))
+                live.sample()
+
+                due = index / args.rate
+                if due > elapsed:
+                    time.sleep(min(due - elapsed, 0.005))
+                    continue
+                online = not adapter.breaker.is_open
+                event = emit(adapter, index)
+                ids.append(event.header.event_id)
+                if online and closed_at is not None and len(adapter.backlog):
+                    live.sent(event)
+                index += 1
+
+            delivered = wait_delivered(server, ids, args.drain_timeout)
+            adapter.stop()
+            received = server.stats.event_ids
+            lost = sum(1 for event_id in ids if event_id not in received)
+
+        print(f"outage {outage_start:g}-{outage_end:g}s at {args.rate:g} events/s: breaker opened at "
+              f"{opened_at if opened_at is not None else float('nan'):.2f}s, closed at "
+              f"{closed_at if closed_at is not None else float('nan'):.2f}s, peak backlog {peak_backlog:,}, "
+              f"{len(ids):,} events, {lost} lost, live events sent while draining acknowledged within {live.worst:.2f}s")
+        if opened_at is None or closed_at is None:
+            failures.append("circuit breaker did not open and close around the outage")
+        if not peak_backlog:
+            failures.append("no events were recorded to the offline backlog")
+        if lost or not delivered:
+            failures.append(f"{lost} events lost across the outage")
+        if len(watch.recoveries) != 1:
+            failures.append(f"{len(watch.recoveries)} REC events received, expected 1")
+        else:
+            recovery = watch.recoveries[0]["payload"]["recovery_data"]
+            point = recovery["break_point"]
+            print(f"REC: last valid event {point['last_valid_event_id']}, reason {point['break_reason']}, "
+                  f"{recovery['recovery_action']['recovered_events']:,} events recovered")
+            if point["last_valid_event_id"] not in acked_before:
+                failures.append("REC break point is not an event VCC acknowledged before the outage")
+            if recovery["recovery_action"]["recovered_events"] < 1:
+                failures.append("REC reports no recovered events")
+    finally:
+        shutil.rmtree(spill_dir, ignore_errors=True)
+    return failures
+
+
+def fill_backlog(spill_dir: str, count: int, args, report: bool = True) -> list:
+    """A sidecar that goes offline and records count events, then stops"""
+    with StandinVCCServer(error_rate=1.0) as server:
+        adapter = make_adapter(server.endpoint, spill_dir, args)
+        adapter.start()
+        index = 0
+        ids = []  # Events queued before the breaker opened stay in memory and go with the process
+        while not adapter.breaker.is_open:
+            emit(adapter, index)
+            index += 1
+            time.sleep(0.01)
+        started = time.perf_counter()
+        while index < count:
+            ids.append(emit(adapter, index).header.event_id)
+            index += 1
+        elapsed = time.perf_counter() - started
+        adapter.stop()
+    if report:
+        print(f"\nbacklog: {len(ids):,} events recorded offline in {elapsed:.1f}s "
+              f"({len(ids) / elapsed:,.0f} events/s), "
+              f"{os.path.getsize(os.path.join(spill_dir, 'offline.backlog')) / 1e6:.0f} MB on disk")
+    return ids
+
+
+def drain_run(spill_dir: str, ids: list, level, args, live: bool) -> dict:
+    """Restart on the recorded backlog against a healthy VCC; time until all of it is acknowledged"""
+    watch = RecoveryWatch()
+    with StandinVCCServer(latency_ms=args.latency_ms, reject_fn=watch) as server:
+        adapter = make_adapter(server.endpoint, spill_dir, args, drain_compresslevel=level)
+        restored = adapter.breaker.is_open
+        backlog = len(adapter.backlog)
+        live_ids = []
+        latency = LiveLatency(server)
+        started = time.perf_counter()
+        adapter.start()
+        received = server.stats.event_ids
+        index = len(ids)
+        while len(adapter.backlog) or not all(event_id in received for event_id in ids[-100:]):
+            elapsed = time.perf_counter() - started
+            if elapsed > args.drain_timeout:
+                break
+            if live and index - len(ids) < elapsed * args.rate:
+                online = not adapter.breaker.is_open  # Until the first probe succeeds, events are backlogged
+                event = emit(adapter, index)
+                live_ids.append(event.header.event_id)
+                if online:
+                    latency.sent(event)
+                index += 1
+            else:
+                time.sleep(0.002)
+            latency.sample()
+        drained = time.perf_counter() - started
+        complete = wait_delivered(server, ids + live_ids, args.drain_timeout)
+        adapter.stop()
+        stats = server.stats.snapshot()
+        missing = sum(1 for event_id in ids + live_ids if event_id not in received)
+    return {
+        "restored": restored, "backlog": backlog, "seconds": drained, "missing": missing if complete else -1,
+        "live": len(live_ids), "live_latency": latency.worst, "recoveries": len(watch.recoveries),
+        "wire_bytes": stats["bytes_received"], "json_bytes": stats["bytes_decoded"],
+    }
+
+
+def drain_benchmark(args) -> list:
+    failures = []
+    work_dir = tempfile.mkdtemp(prefix="vcp-offline-drain-")
+    try:
+        spill_dir = os.path.join(work_dir, "main")
+        ids = fill_backlog(spill_dir, args.backlog, args)
+        result = drain_run(spill_dir, ids, args.compresslevel, args, live=True)
+        print(f"time to drain: {result['backlog']:,} backlogged events in {result['seconds']:.1f}s "
+              f"({result['backlog'] / result['seconds']:,.0f} events/s), "
+              f"{result['wire_bytes'] / 1e6:.0f} MB on the wire for {result['json_bytes'] / 1e6:.0f} MB of JSON; "
+              f"{result['live']:,} live events meanwhile, acknowledged within {result['live_latency']:.2f}s")
+        if not result["restored"]:
+            failures.append("restarted adapter did not resume offline mode from its break point")
+        if result["recoveries"] != 1:
+            failures.append(f"{result['recoveries']} REC events after the restart, expected 1")
+        if result["missing"]:
+            failures.append(f"{result['missing']} backlogged or live events not delivered after the drain")
+        if os.path.exists(os.path.join(spill_dir, "offline.json")):
+            failures.append("break point file left behind after reconnecting")
+
+        print(f"\n{'compression':<12} {'events/s':>10} {'wire MB':>9} {'ratio':>7}")
+        for level in (None, 1, 6):
+            level_dir = os.path.join(work_dir, f"level-{level}")
+            result = drain_run(level_dir, fill_backlog(level_dir, args.compare, args, report=False), level, args, live=False)
+            label = "none" if level is None else f"gzip {level}"
+            print(f"{label:<12} {result['backlog'] / result['seconds']:>10,.0f} {result['wire_bytes'] / 1e6:>9.1f} "
+                  f"{result['json_bytes'] / max(1, result['wire_bytes']):>7.1f}")
+            if result["missing"]:
+                failures.append(f"{label}: {result['missing']} events not delivered")
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Stress offline mode, REC emission and backlog drain")
+    parser.add_argument("--rate", type=float, default=500.0, help="Live events per second")
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--outage", default="2:6", help="Outage window start:end in seconds")
+    parser.add_argument("--backlog", type=int, default=1_000_000, help="Events backlogged for the drain timing")
+    parser.add_argument("--compare", type=int, default=100_000, help="Events per compression level comparison")
+    parser.add_argument("--compresslevel", type=int, default=1)
+    parser.add_argument("--batch-size", type=int, default=500)
+    parser.add_argument("--drain-batch", type=int, default=5000)
+    parser.add_argument("--latency-ms", type=float, default=2.0)
+    parser.add_argument("--drain-timeout", type=float, default=600.0)
+    args = parser.parse_args()
+    logging.getLogger("vcp_adapter").setLevel(logging.CRITICAL)
+
+    failures = outage_run(args)
+    failures += drain_benchmark(args)
+    for failure in failures:
+        print(f"FAILED: {failure}")
+    if failures:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
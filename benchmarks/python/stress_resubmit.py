@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+VCP Partial-Failure Resubmission Stress Test
+VeritasChain Standards Organization (VSO)
+
+Streams events through VCPManagerAdapter into a local stand-in VCC that
+always refuses a few "poison" events and refuses a few "flaky" ones the
+first time only. Three setups are compared:
+- whole-batch: a batch is done only when VCC accepts all of it (the
+               previous worker loop), against a VCC that refuses the
+               whole batch with a 400
+- resend:      same VCC; the events the 400 names count an attempt and
+               the rest of the batch is sent again
+- per-event:   VCC lists refused events in a 207 reply; only those are
+               resubmitted
+
+Reports healthy events delivered, bytes received by VCC and the share
+wasted on refused or duplicate events, and poison events dead-lettered.
+Exits non-zero if per-event mode loses a healthy event or fails to
+dead-letter a poison one.
+
+Usage:
+    python benchmarks/python/stress_resubmit.py [--rate 1000] [--duration 8] [--poison-every 2000]
+"""
+
+import argparse
+import logging
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+# Add source directory to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src', 'python'))
+
+from vcc_standin import StandinVCCServer
+from vcp_sidecar_adapter_v1_0 import EventTypeCode, Tier, VCPManagerAdapter
+
+
+class WholeBatchAdapter(VCPManagerAdapter):
+    """The previous worker behaviour: a batch is done only when VCC accepts all of it"""
+
+    def _send_batch(self, batch):
+        return self.client.send_batch(batch)["status"] == "ok"
+
+
+def run(mode: str, args) -> dict:
+    poison, flaky, flaky_seen = set(), set(), set()
+
+    def reject(event):
+        event_id = event["header"]["event_id"]
+        if event_id in poison:
+            return "schema violation: price out of range"
+        if event_id in flaky and event_id not in flaky_seen:
+            flaky_seen.add(event_id)
+            return "temporarily unavailable"
+        return None
+
+    work_dir = tempfile.mkdtemp(prefix="vcp-resubmit-")
+    dead_letter_path = os.path.join(work_dir, "dead_letter.ndjson")
+    adapter_class = WholeBatchAdapter if mode == "whole-batch" else VCPManagerAdapter
+    with StandinVCCServer(latency_ms=args.latency_ms, reject_fn=reject,
+                          per_event_results=(mode == "per-event")) as server:
+        adapter = adapter_class(
+            "STRESS_VENUE", server.endpoint, "stress", tier=Tier.SILVER, batch_size=args.batch_size,
+            max_attempts=args.max_attempts, dead_letter_path=dead_letter_path
+        )
+        adapter.resubmit.base_delay = args.base_delay
+        adapter.start()
+        healthy = []
+        started = time.perf_counter()
+        index = 0
+        while True:
+            elapsed = time.perf_counter() - started
+            if elapsed >= args.duration:
+                break
+            due = index / args.rate
+            if due > elapsed:
+                time.sleep(min(due - elapsed, 0.005))
+                continue
+            event = adapter.factory.create_event(
+                EventTypeCode.ORD, "EURUSD", "100001", {"trade_data": {"order_id": str(index), "price": "1.08550"}}
+            )
+            event_id = event.header.event_id
+            if index % args.poison_every == args.poison_every // 2:
+                poison.add(event_id)
+            elif index % args.flaky_every == args.flaky_every // 2:
+                flaky.add(event_id)
+                healthy.append(event_id)
+            else:
+                healthy.append(event_id)
+            adapter.queue_event(event)
+            index += 1
+
+        produced_at = time.perf_counter()
+        received = server.stats.event_ids
+        deadline = produced_at + args.drain_timeout
+        while time.perf_counter() < deadline:
+            if all(event_id in received for event_id in healthy) and adapter.resubmit.dead_lettered >= len(poison):
+                break
+            time.sleep(0.05)
+        drained = time.perf_counter() - produced_at
+        adapter.stop()
+        stats = server.stats.snapshot()
+
+    dead_lettered = 0
+    if os.path.exists(dead_letter_path):
+        with open(dead_letter_path, encoding="utf-8") as f:
+            dead_lettered = sum(1 for _ in f)
+    shutil.rmtree(work_dir, ignore_errors=True)
+    return {
+        "healthy": len(healthy),
+        "delivered": sum(1 for event_id in healthy if event_id in received),
+        "poison": len(poison),
+        "dead_lettered": dead_lettered,
+        "bytes_received": stats["bytes_received"],
+        "bytes_wasted": stats["bytes_wasted"],
+        "duplicates": stats["duplicates"],
+        "requests": stats["requests"],
+        "drained": drained,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Stress per-event resubmission with poison events")
+    parser.add_argument("--rate", type=float, default=1000.0, help="Events per second")
+    parser.add_argument("--duration", type=float, default=8.0)
+    parser.add_argument("--poison-every", type=int, default=2000)
+    parser.add_argument("--flaky-every", type=int, default=500)
+    parser.add_argument("--batch-size", type=int, default=100)
+    parser.add_argument("--max-attempts", type=int, default=3)
+    parser.add_argument("--base-delay", type=float, default=0.2)
+    parser.add_argument("--latency-ms", type=float, default=5.0)
+    parser.add_argument("--drain-timeout", type=float, default=15.0)
+    parser.add_argument("--modes", default="whole-batch,resend,per-event")
+    args = parser.parse_args()
+    logging.getLogger("vcp_adapter").setLevel(logging.CRITICAL)
+
+    results = {mode: run(mode, args) for mode in args.modes.split(",")}
+
+    print(f"{'mode':<12} {'healthy':>8} {'delivered':>10} {'poison':>7} {'dead-lettered':>14} "
+          f"{'requests':>9} {'MB received':>12} {'wasted':>8} {'drained s':>10}")
+    for mode, r in results.items():
+        wasted = r["bytes_wasted"] / r["bytes_received"] if r["bytes_received"] else 0.0
+        print(f"{mode:<12} {r['healthy']:>8} {r['delivered']:>10} {r['poison']:>7} {r['dead_lettered']:>14} "
+              f"{r['requests']:>9} {r['bytes_received'] / 1e6:>12.2f} {wasted:>8.1%} {r['drained']:>10.2f}")
+
+    per_event = results.get("per-event")
+    if per_event is not None and (per_event["delivered"] < per_event["healthy"]
+                                  or per_event["dead_lettered"] < per_event["poison"]):
+        print("FAILED: per-event mode lost healthy events or kept a poison event")
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+"""
+Local Stand-in VCC Server
+VeritasChain Standards Organization (VSO)
+
+Minimal HTTP server implementing the VCC ingestion endpoints used by
+VCCClient, for benchmarks and offline experiments:
+- POST /v1/events
+- POST /v1/events/batch (plain or Content-Encoding: gzip)
+
+Latency and error rate are configurable so retry and back-pressure
+behaviour can be exercised without a real VCC deployment. A reject
+function refuses chosen events: listed per event in an HTTP 207 reply,
+or, with per_event_results=False, as a 400 for the whole batch that
+still names the refused events. Bytes spent on refused and duplicate events
+are counted as wasted.
+
+Usage:
+    python benchmarks/python/vcc_standin.py --port 8080 --latency-ms 20 --error-rate 0.01
+"""
+
+import argparse
+import gzip
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, Optional, Tuple
+
+
+class StandinStats:
+    """Counters shared across request handler threads"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.requests = 0
+        self.errors_injected = 0
+        self.events_received = 0
+        self.bytes_received = 0
+        self.bytes_decoded = 0
+        self.bytes_wasted = 0
+        self.events_rejected = 0
+        self.duplicates = 0
+        self.event_ids = set()
+
+    def snapshot(self) -> Dict:
+        with self.lock:
+            return {
+                "requests": self.requests,
+                "errors_injected": self.errors_injected,
+                "events_received": self.events_received,
+                "unique_events": len(self.event_ids),
+                "bytes_received": self.bytes_received,
+                "bytes_decoded": self.bytes_decoded,
+                "bytes_wasted": self.bytes_wasted,
+                "events_rejected": self.events_rejected,
+                "duplicates": self.duplicates,
+            }
+
+
+class _StandinHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Headers and body go out in separate writes; avoid Nagle/delayed-ACK stalls
+    disable_nagle_algorithm = True
+    stats: StandinStats
+    latency: float = 0.0
+    error_rate: float = 0.0
+    keep_ids: bool = True
+    reject_fn: Optional[Callable[[Dict], Optional[str]]] = None
+    per_event_results: bool = True
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        body = self.rfile.read(length)
+        if self.headers.get("Content-Encoding") == "gzip":
+            try:
+                body = gzip.decompress(body)
+            except (OSError, EOFError):
+                self._reply(400, {"error": "invalid gzip body"})
+                return
+
+        if self.latency:
+            time.sleep(self.latency)
+
+        with self.stats.lock:
+            self.stats.requests += 1
+            self.stats.bytes_received += length
+            self.stats.bytes_decoded += len(body)
+
+        if self.error_rate and random.random() < self.error_rate:
+            with self.stats.lock:
+                self.stats.errors_injected += 1
+            self._reply(503, {"error": "injected failure"})
+            return
+
+        path = self.path.split("?", 1)[0]
+        try:
+            data = json.loads(body)
+        except ValueError:
+            self._reply(400, {"error": "invalid JSON"})
+            return
+
+        if path == "/v1/events/batch":
+            events = data.get("events", [])
+        elif path == "/v1/events":
+            events = [data]
+        else:
+            self._reply(404, {"error": "not found"})
+            return
+
+        rejected = []
+        if self.reject_fn:
+            rejected = [{"event_id": event["header"]["event_id"], "error": error}
+                        for event in events for error in (self.reject_fn(event),) if error]
+        if rejected and (path == "/v1/events" or not self.per_event_results):
+            with self.stats.lock:
+                self.stats.events_rejected += len(rejected)
+                self.stats.bytes_wasted += length
+            self._reply(422 if path == "/v1/events" else 400, {"error": rejected[0]["error"], "rejected": rejected})
+            return
+
+        refused = {item["event_id"] for item in rejected}
+        with self.stats.lock:
+            self.stats.events_received += len(events) - len(refused)
+            self.stats.events_rejected += len(refused)
+            for event in events:
+                event_id = event["header"]["event_id"]
+                if event_id in refused:
+                    self.stats.bytes_wasted += len(json.dumps(event))
+                elif self.keep_ids:
+                    if event_id in self.stats.event_ids:
+                        self.stats.duplicates += 1
+                        self.stats.bytes_wasted += len(json.dumps(event))
+                    self.stats.event_ids.add(event_id)
+        if rejected:
+            self._reply(207, {"status": "partial", "accepted": len(events) - len(refused), "rejected": rejected})
+        else:
+            self._reply(201, {"status": "ok", "accepted": len(events)})
+
+    def do_GET(self):
+        if self.path.split("?", 1)[0] == "/health":
+            self._reply(200, {"status": "ok", **self.stats.snapshot()})
+        else:
+            self._reply(404, {"error": "not found"})
+
+    def _reply(self, status: int, payload: Dict):
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class StandinVCCServer:
+    """Stand-in VCC ingestion server running on a background thread"""
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency_ms: float = 0.0,
+        error_rate: float = 0.0,
+        keep_ids: bool = True,
+        reject_fn: Optional[Callable[[Dict], Optional[str]]] = None,
+        per_event_results: bool = True
+    ):
+        self.stats = StandinStats()
+        handler = type("StandinHandler", (_StandinHandler,), {
+            "stats": self.stats,
+            "latency": latency_ms / 1000.0,
+            "error_rate": error_rate,
+            "keep_ids": keep_ids,
+            "reject_fn": staticmethod(reject_fn) if reject_fn else None,
+            "per_event_results": per_event_results,
+        })
+        self._server = ThreadingHTTPServer((host, port), handler)
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    def set_error_rate(self, error_rate: float):
+        """Change the injected failure rate at runtime (1.0 simulates an outage)"""
+        self._server.RequestHandlerClass.error_rate = error_rate
+
+    @property
+    def address(self) -> Tuple[str, int]:
+        return self._server.server_address[:2]
+
+    @property
+    def endpoint(self) -> str:
+        host, port = self.address
+        return f"http://{host}:{port}"
+
+    def start(self) -> "StandinVCCServer":
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread:
+            self._thread.join(timeout=5)
+
+    def __enter__(self) -> "StandinVCCServer":
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+        return False
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run a local stand-in VCC server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    args = parser.parse_args()
+
+    server = StandinVCCServer(args.host, args.port, args.latency_ms, args.error_rate)
+    server.start()
+    print(f"Stand-in VCC listening on {server.endpoint} (Ctrl+C to stop)")
+    try:
+        while True:
+            time.sleep(5)
+            print(server.stats.snapshot())
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+VCP Benchmark Harness
+VeritasChain Standards Organization (VSO)
+
+Shared timing, result and comparison helpers for the benchmark suites.
+Results are plain JSON so runs can be archived and compared:
+
+    {
+      "meta": {"python": "...", "platform": "...", "commit": "...", ...},
+      "results": {
+        "micro.uuid7_generate": {"ops": 10000, "us_per_op": {...}, ...},
+        ...
+      }
+    }
+"""
+
+import gc
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+SRC_DIR = os.path.join(REPO_ROOT, 'src', 'python')
+
+# Make the sidecar modules importable for every suite
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
+
+
+@dataclass
+class BenchResult:
+    """Timings for one benchmark (seconds per run, ops per run)"""
+    name: str
+    ops: int
+    runs: List[float]
+    params: Dict[str, Any] = field(default_factory=dict)
+    extra: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def us_per_op(self) -> List[float]:
+        return [run / self.ops * 1e6 for run in self.runs]
+
+    def to_dict(self) -> Dict:
+        per_op = self.us_per_op
+        median = statistics.median(per_op)
+        return {
+            "ops": self.ops,
+            "repeat": len(self.runs),
+            "params": self.params,
+            "us_per_op": {
+                "min": min(per_op),
+                "median": median,
+                "mean": statistics.fmean(per_op),
+                "stdev": statistics.stdev(per_op) if len(per_op) > 1 else 0.0,
+            },
+            "ops_per_sec": 1e6 / median if median else float("inf"),
+            **({"extra": self.extra} if self.extra else {}),
+        }
+
+
+def measure(
+    name: str,
+    fn: Callable[[], Any],
+    ops: int,
+    repeat: int = 5,
+    warmup: int = 1,
+    params: Optional[Dict[str, Any]] = None,
+    setup: Optional[Callable[[], Any]] = None
+) -> BenchResult:
+    """
+    Time fn() `repeat` times. fn performs `ops` operations per call.
+    setup(), if given, runs untimed before each call.
+    GC is collected before and disabled during each timed run.
+    """
+    for _ in range(warmup):
+        if setup:
+            setup()
+        fn()
+
+    runs = []
+    for _ in range(repeat):
+        if setup:
+            setup()
+        gc.collect()
+        gc.disable()
+        try:
+            started = time.perf_counter()
+            fn()
+            runs.append(time.perf_counter() - started)
+        finally:
+            gc.enable()
+    return BenchResult(name, ops, runs, params or {})
+
+
+def environment() -> Dict[str, Any]:
+    """Metadata identifying where and on what code a run happened"""
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=REPO_ROOT, capture_output=True, text=True, timeout=10
+        ).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        commit = None
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "processor": platform.processor() or platform.machine(),
+        "cpu_count": os.cpu_count(),
+        "commit": commit,
+        "timestamp": int(time.time()),
+    }
+
+
+def write_results(path: str, results: List[BenchResult]) -> Dict:
+    report = {
+        "meta": environment(),
+        "results": {r.name: r.to_dict() for r in results},
+    }
+    with open(path, "w") as f:
+        json.dump(report, f, indent=2, sort_keys=True)
+    return report
+
+
+def print_results(results: List[BenchResult]):
+    print(f"\n{'benchmark':44} {'median us/op':>14} {'min us/op':>12} {'ops/sec':>14}")
+    print("-" * 88)
+    for result in results:
+        data = result.to_dict()
+        print(
+            f"{result.name:44} {data['us_per_op']['median']:14.3f} "
+            f"{data['us_per_op']['min']:12.3f} {data['ops_per_sec']:14,.0f}"
+        )
+        for key, value in result.extra.items():
+            print(f"    {key}: {value}")
+
+
+def compare(baseline: Dict, current: Dict, threshold: float = 10.0) -> List[str]:
+    """
+    Compare median us/op between two reports.
+    Returns names of benchmarks that regressed by more than threshold percent.
+    """
+    regressions = []
+    print(f"\n{'benchmark':44} {'baseline':>12} {'current':>12} {'change':>9}")
+    print("-" * 80)
+    for name in sorted(set(baseline["results"]) | set(current["results"])):
+        old = baseline["results"].get(name)
+        new = current["results"].get(name)
+        if old is None or new is None:
+            print(f"{name:44} {'-' if old is None else 'present':>12} "
+                  f"{'-' if new is None else 'present':>12} {'n/a':>9}")
+            continue
+        old_us = old["us_per_op"]["median"]
+        new_us = new["us_per_op"]["median"]
+        change = (new_us - old_us) / old_us * 100 if old_us else 0.0
+        marker = ""
+        if change > threshold:
+            marker = "  REGRESSION"
+            regressions.append(name)
+        elif change < -threshold:
+            marker = "  improved"
+        print(f"{name:44} {old_us:12.3f} {new_us:12.3f} {change:+8.1f}%{marker}")
+    return regressions
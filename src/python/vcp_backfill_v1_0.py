@@ -0,0 +1,638 @@
+#!/usr/bin/env python3
+"""
+VCP Historical Backfill v1.0 - Deal History Exports to Archived VCP Chains
+Document ID: VSO-SDK-PY-016
+License: CC BY 4.0 International
+Maintainer: VeritasChain Standards Organization (VSO)
+
+This module turns months of MT5 deal history into one hash-chained EXE
+event per deal, written straight to archive segments:
+- Streaming readers for MT5 deal exports (CSV, JSON arrays, NDJSON)
+- External merge sort by (time_msc, ticket) in bounded memory, with
+  duplicate deals from overlapping exports dropped
+- A process pool for the data-parallel work: field formatting,
+  pseudonymization and canonical encoding up to prev_hash
+- A sequential linker that fills in prev_hash and the event hash
+- Gzip NDJSON segments written atomically, with a state file after every
+  segment so an interrupted backfill resumes where it stopped
+
+Event and trace IDs are derived from the deal and order tickets, so a
+resumed or repeated backfill produces the same events and the same chain.
+
+Usage:
+    python vcp_backfill_v1_0.py --venue MY_BROKER --out /var/lib/vcp/backfill \\
+        --symbols symbols.json deals_2024*.csv
+"""
+
+import argparse
+import csv
+import gzip
+import hashlib
+import heapq
+import json
+import logging
+import marshal
+import multiprocessing
+import os
+import shutil
+import tempfile
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from operator import itemgetter
+from threading import Event, Semaphore
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from vcp_metrics_v1_0 import REGISTRY
+from vcp_numeric_v1_0 import DigitsTable, format_deals
+from vcp_sidecar_core_v1_0 import (
+    DEFAULT_HASH_ALGO, EVENT_TYPE_NAMES, EventTypeCode, Tier, VCPEventFactory, get_hash_algo
+)
+
+logger = logging.getLogger("vcp_backfill")
+
+STATE_FILE = "backfill.state.json"
+SEGMENT_SUFFIX = ".ndjson.gz"
+_SORT_PREFIX = ".backfill-sort-"
+
+# Sorted deal rows: (time_msc, ticket, order, login, symbol, price, volume, commission)
+DealRow = Tuple[int, int, int, int, str, float, float, float]
+
+# Export column names mapped to deal dict keys
+_ALIASES = {"deal": "ticket", "timemsc": "time_msc", "account": "login", "lots": "volume"}
+_TIME_FORMATS = ("%Y.%m.%d %H:%M:%S", "%Y.%m.%d %H:%M", "%Y-%m-%d %H:%M:%S")
+
+_events_written = REGISTRY.counter("vcp_backfill_events_total", "Events written by backfill")
+_segments_written = REGISTRY.counter("vcp_backfill_segments_total", "Archive segments written by backfill")
+
+
+class BackfillError(Exception):
+    """Raised when a backfill cannot start or resume"""
+
+
+# =============================================================================
+# Export Readers
+# =============================================================================
+def _parse_time_ms(value) -> int:
+    """Deal time in ms from epoch seconds or an MT5/ISO timestamp (UTC)"""
+    text = str(value).strip()
+    try:
+        return int(float(text) * 1000)
+    except ValueError:
+        pass
+    for fmt in _TIME_FORMATS:
+        try:
+            return int(datetime.strptime(text, fmt).replace(tzinfo=timezone.utc).timestamp() * 1000)
+        except ValueError:
+            continue
+    parsed = datetime.fromisoformat(text.replace("Z", "+00:00"))
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return int(parsed.timestamp() * 1000)
+
+
+def _field_name(column: str) -> str:
+    name = column.strip().lower().replace(" ", "_")
+    return _ALIASES.get(name.replace("_", ""), name)
+
+
+class _RowReader:
+    """Builds DealRows from value lists with one fixed column layout"""
+
+    FIELDS = ("time_msc", "ticket", "order", "login", "symbol", "price", "volume", "commission", "time")
+
+    def __init__(self, columns: Iterable[str], login: int = 0):
+        positions: Dict[str, int] = {}
+        for position, column in enumerate(columns):
+            positions.setdefault(_field_name(column), position)
+        if "ticket" not in positions or not ({"time_msc", "time"} & set(positions)):
+            raise ValueError(f"Deal export needs ticket/deal and time columns, got {list(columns)}")
+        # Missing fields read the empty value appended to every row
+        self._get = itemgetter(*(positions.get(name, -1) for name in self.FIELDS))
+        self.login = login
+        self._last_time = (None, 0)
+
+    def _time_ms(self, value) -> int:
+        if value != self._last_time[0]:
+            self._last_time = (value, _parse_time_ms(value))
+        return self._last_time[1]
+
+    def __call__(self, values: List) -> DealRow:
+        values.append("")
+        time_msc, ticket, order, login, symbol, price, volume, commission, time_ = self._get(values)
+        return (
+            int(time_msc) if time_msc not in ("", None) else self._time_ms(time_),
+            int(ticket),
+            int(order or 0),
+            int(login or self.login),
+            str(symbol),
+            float(price or 0),
+            float(volume or 0),
+            float(commission or 0),
+        )
+
+
+def deal_row(record: Dict, login: int = 0) -> DealRow:
+    """Normalize one exported deal (any key case, MT5 column aliases)"""
+    return _RowReader(record, login)(list(record.values()))
+
+
+def _iter_json_array(f, block_size: int = 1 << 20) -> Iterator[Dict]:
+    """Objects of a top-level JSON array, decoded incrementally"""
+    decoder = json.JSONDecoder()
+    buffer = f.read(block_size).lstrip()
+    if not buffer.startswith("["):
+        raise ValueError("Expected a JSON array of deals")
+    buffer = buffer[1:]
+    eof = False
+    while True:
+        buffer = buffer.lstrip().lstrip(",").lstrip()
+        if buffer.startswith("]"):
+            return
+        try:
+            record, end = decoder.raw_decode(buffer)
+        except ValueError:
+            if eof:
+                raise
+            chunk = f.read(block_size)
+            eof = not chunk
+            buffer += chunk
+            continue
+        yield record
+        buffer = buffer[end:]
+        if len(buffer) < 4096 and not eof:
+            chunk = f.read(block_size)
+            eof = not chunk
+            buffer += chunk
+
+
+def read_deals(path: str, login: int = 0) -> Iterator[DealRow]:
+    """Stream deal rows from a CSV, JSON array or NDJSON export"""
+    with open(path, "r", encoding="utf-8-sig", newline="") as f:
+        if path.endswith(".csv"):
+            rows = csv.reader(f)
+            reader = _RowReader(next(rows, []), login)
+            for values in rows:
+                if values:
+                    yield reader(values)
+            return
+        head = f.read(1)
+        while head.isspace():
+            head = f.read(1)
+        f.seek(0)
+        if head == "[":
+            records = _iter_json_array(f)
+        else:
+            records = (json.loads(line) for line in f if line.strip())
+        readers: Dict[Tuple, _RowReader] = {}
+        for record in records:
+            columns = tuple(record)
+            reader = readers.get(columns)
+            if reader is None:
+                reader = readers[columns] = _RowReader(columns, login)
+            yield reader(list(record.values()))
+
+
+# =============================================================================
+# External Merge Sort
+# =============================================================================
+def _write_run(rows: List[DealRow], directory: str, block: int = 10000) -> str:
+    fd, path = tempfile.mkstemp(prefix="run-", suffix=".marshal", dir=directory)
+    with os.fdopen(fd, "wb") as f:
+        for start in range(0, len(rows), block):
+            marshal.dump(rows[start:start + block], f)
+    return path
+
+
+def _read_run(path: str) -> Iterator[DealRow]:
+    with open(path, "rb") as f:
+        while True:
+            try:
+                rows = marshal.load(f)
+            except EOFError:
+                return
+            yield from rows
+
+
+def sorted_deals(paths: Iterable[str], run_size: int = 500_000, tmp_dir: Optional[str] = None,
+                 login: int = 0) -> Iterator[DealRow]:
+    """
+    Deal rows of all exports ordered by (time_msc, ticket), duplicates dropped
+
+    Up to run_size rows are sorted in memory; larger inputs are sorted in
+    runs spilled to tmp_dir and merged.
+    """
+    directory = tempfile.mkdtemp(prefix=_SORT_PREFIX, dir=tmp_dir)
+    try:
+        runs: List[str] = []
+        rows: List[DealRow] = []
+        for path in paths:
+            for row in read_deals(path, login):
+                rows.append(row)
+                if len(rows) >= run_size:
+                    rows.sort()
+                    runs.append(_write_run(rows, directory))
+                    rows = []
+        rows.sort()
+        if runs:
+            runs.append(_write_run(rows, directory))
+            merged = heapq.merge(*(_read_run(run) for run in runs))
+        else:
+            merged = iter(rows)
+        last = None
+        for row in merged:
+            key = row[:2]
+            if key != last:
+                last = key
+                yield row
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+# =============================================================================
+# Workers (event encoding up to the hashes)
+# =============================================================================
+_RAND_62 = (1 << 62) - 1
+
+
+def deal_uuid7(timestamp_ms: int, name: str) -> str:
+    """UUID v7 with the given timestamp and random bits derived from name"""
+    rand = int.from_bytes(hashlib.sha256(name.encode()).digest()[:10], "big")
+    value = (timestamp_ms << 80) | (7 << 76) | ((rand >> 64) & 0x0FFF) << 64 | (0b10 << 62) | (rand & _RAND_62)
+    hex_str = f"{value:032x}"
+    return f"{hex_str[0:8]}-{hex_str[8:12]}-{hex_str[12:16]}-{hex_str[16:20]}-{hex_str[20:32]}"
+
+
+_worker: Dict = {}
+
+# Line of an event, split around the hashes: HEAD + event_hash + _MID + prev_hash + _TAIL
+_MID = '", "prev_hash": "'
+_TAIL = '"}}'
+_CANONICAL_TAIL = b'"}'
+
+_EXE = int(EventTypeCode.EXE)
+_json_value = json.JSONEncoder(ensure_ascii=False).encode
+
+
+def _line_hash(line: str) -> str:
+    end = len(line) - len(_TAIL) - 64 - len(_MID)
+    return line[end - 64:end]
+
+
+def _init_worker(venue_id: str, tier: str, hash_algo: str, digits: DigitsTable):
+    factory = VCPEventFactory(venue_id, tier, hash_algo)
+    _worker.update(factory=factory, digits=digits, trace_ids={}, accounts={}, symbols={}, seconds={})
+    # Header fields between timestamp_iso and symbol, as VCPEventSerializer.to_json writes them
+    _worker["header_fields"] = (
+        f'"event_type": "{EVENT_TYPE_NAMES[EventTypeCode.EXE]}", "event_type_code": {_EXE}, '
+        f'"timestamp_precision": {_json_value(factory.timestamp_precision)}, '
+        f'"clock_sync_status": {_json_value(factory.clock_sync_status)}, '
+        f'"hash_algo": {_json_value(hash_algo)}, "venue_id": {_json_value(venue_id)}, "symbol": '
+    )
+
+
+def _cached(cache: Dict, key, make):
+    value = cache.get(key)
+    if value is None:
+        if len(cache) >= 100_000:
+            cache.clear()
+        value = cache[key] = make()
+    return value
+
+
+def _encode_batch(rows: List[Tuple]) -> Tuple[bytes, str]:
+    """
+    Canonical JSON prefixes (up to the prev_hash value) and NDJSON line heads
+    (up to the event_hash value) of a batch of (DealRow, trace_ms) rows,
+    each joined with newlines
+
+    Both are rendered from templates: every value is either a formatted
+    number, an ID or hash in hex, or JSON-encoded once per symbol/account.
+    The result equals compute_event_hash's canonical JSON and
+    VCPEventSerializer.to_json byte for byte (benchmarks/python/bench_backfill.py).
+    """
+    factory: VCPEventFactory = _worker["factory"]
+    venue_id = factory.venue_id
+    trace_ids, accounts, symbols, seconds = (
+        _worker["trace_ids"], _worker["accounts"], _worker["symbols"], _worker["seconds"]
+    )
+    header_fields = _worker["header_fields"]
+    fields = format_deals([{"symbol": row[4], "price": row[5], "volume": row[6], "commission": row[7]}
+                           for row, _ in rows], _worker["digits"])
+    canonicals, heads = [], []
+    for (row, trace_ms), (price, volume, commission) in zip(rows, fields):
+        time_msc, ticket, order, login, symbol = row[:5]
+        event_id = deal_uuid7(time_msc, f"{venue_id}:deal:{ticket}")
+        trace_id = _cached(trace_ids, (order, trace_ms),
+                           lambda: deal_uuid7(trace_ms, f"{venue_id}:order:{order}"))
+        second, millis = divmod(time_msc, 1000)
+        # "YYYY-MM-DDTHH:MM:SS." as VCPEventFactory._get_timestamps formats it
+        iso = _cached(seconds, second, lambda: factory._get_timestamps(second * 1_000_000_000)[1][:-4])
+        account = _cached(accounts, login, lambda: _json_value(factory._pseudonymize_account(str(login))))
+        symbol_json = _cached(symbols, symbol, lambda: _json_value(symbol))
+        timestamp_int = time_msc * 1_000_000
+        # Sorted keys; "prev_hash" sorts last, so the canonical JSON ends with its value
+        canonicals.append(
+            f'{{"header":{{"event_id":"{event_id}","event_type_code":{_EXE},"timestamp_int":"{timestamp_int}",'
+            f'"trace_id":"{trace_id}"}},"payload":{{"trade_data":{{"commission":"{commission}",'
+            f'"exchange_order_id":"{ticket}","executed_qty":"{volume}","execution_price":"{price}",'
+            f'"order_id":"{order}","slippage":"0"}}}},"prev_hash":"'
+        )
+        # Same payload fields and order as VCPManagerAdapter.transform_deal_to_event
+        heads.append(
+            f'{{"header": {{"event_id": "{event_id}", "trace_id": "{trace_id}", '
+            f'"timestamp_int": "{timestamp_int}", "timestamp_iso": "{iso}{millis:03d}Z", '
+            f'{header_fields}{symbol_json}, "account_id": {account}}}, '
+            f'"payload": {{"trade_data": {{"order_id": "{order}", "exchange_order_id": "{ticket}", '
+            f'"execution_price": "{price}", "executed_qty": "{volume}", "commission": "{commission}", '
+            f'"slippage": "0"}}}}, "security": {{"event_hash": "'
+        )
+    return "\n".join(canonicals).encode("utf-8"), "\n".join(heads)
+
+
+# =============================================================================
+# Archive Segments and State
+# =============================================================================
+@dataclass
+class BackfillState:
+    """Progress of a backfill, saved after every archive segment"""
+    venue_id: str
+    hash_algo: str
+    inputs: List[List] = field(default_factory=list)   # [path, size, mtime_ns]
+    events: int = 0
+    prev_hash: str = "0" * 64
+    segments: List[Dict] = field(default_factory=list)
+    completed: bool = False
+
+    def save(self, path: str):
+        directory = os.path.dirname(os.path.abspath(path))
+        fd, tmp_path = tempfile.mkstemp(prefix=".backfill-state-", dir=directory)
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(asdict(self), f, separators=(',', ':'))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, path)
+        except OSError:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+
+    @classmethod
+    def load(cls, path: str) -> Optional["BackfillState"]:
+        if not os.path.exists(path):
+            return None
+        with open(path, "r") as f:
+            return cls(**json.load(f))
+
+    def apply(self, factory: VCPEventFactory):
+        """Continue the backfilled chain in a live factory"""
+        factory.prev_hash = self.prev_hash
+        factory.sequence = self.events
+
+
+def _input_signature(paths: List[str]) -> List[List]:
+    signature = []
+    for path in paths:
+        stat = os.stat(path)
+        signature.append([os.path.abspath(path), stat.st_size, stat.st_mtime_ns])
+    return signature
+
+
+def _write_segment(path: str, data: bytes, compresslevel: int):
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(gzip.compress(data, compresslevel=compresslevel, mtime=0))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+def read_archive(directory: str) -> Iterator[Dict]:
+    """Events of a backfill archive in chain order"""
+    state = BackfillState.load(os.path.join(directory, STATE_FILE))
+    if state is None:
+        raise BackfillError(f"No backfill state in {directory}")
+    for segment in state.segments:
+        with gzip.open(os.path.join(directory, segment["file"]), "rt", encoding="utf-8") as f:
+            for line in f:
+                yield json.loads(line)
+
+
+# =============================================================================
+# Backfill
+# =============================================================================
+class Backfill:
+    """
+    Build the VCP chain of exported deal history into archive segments
+
+    Worker processes encode batches of sorted deals; the calling process
+    reads and sorts the exports, links the chain and hands finished
+    segments to a writer thread. workers=0 encodes in-process.
+    """
+
+    def __init__(
+        self,
+        venue_id: str,
+        output_dir: str,
+        tier: str = Tier.SILVER,
+        hash_algo: str = DEFAULT_HASH_ALGO,
+        digits: Optional[DigitsTable] = None,
+        workers: Optional[int] = None,
+        batch_size: int = 2000,
+        segment_events: int = 100_000,
+        run_size: int = 500_000,
+        compresslevel: int = 6,
+        max_open_orders: int = 1_000_000,
+        login: int = 0
+    ):
+        get_hash_algo(hash_algo)
+        self.venue_id = venue_id
+        self.output_dir = output_dir
+        self.tier = tier
+        self.hash_algo = hash_algo
+        self.digits = digits or DigitsTable()
+        self.workers = (os.cpu_count() or 1) if workers is None else workers
+        self.batch_size = batch_size
+        self.segment_events = segment_events
+        self.run_size = run_size
+        self.compresslevel = compresslevel
+        self.max_open_orders = max_open_orders
+        self.login = login
+        self.state_path = os.path.join(output_dir, STATE_FILE)
+
+    def _open_state(self, paths: List[str]) -> BackfillState:
+        os.makedirs(self.output_dir, exist_ok=True)
+        inputs = _input_signature(paths)
+        state = BackfillState.load(self.state_path)
+        if state is None:
+            return BackfillState(self.venue_id, self.hash_algo, inputs)
+        if (state.venue_id, state.hash_algo, state.inputs) != (self.venue_id, self.hash_algo, inputs):
+            raise BackfillError(
+                f"{self.output_dir} holds a backfill of other inputs or settings; use a new output directory"
+            )
+        return state
+
+    def _batches(self, paths: List[str], skip: int, window: Semaphore, stop: Event) -> Iterator[List[Tuple]]:
+        """Sorted (DealRow, trace_ms) batches after the first `skip` deals"""
+        # First deal time of each order: the trace_id timestamp of all its deals
+        order_times: "OrderedDict[int, int]" = OrderedDict()
+        batch = []
+        for index, row in enumerate(sorted_deals(paths, self.run_size, self.output_dir, self.login)):
+            order = row[2]
+            trace_ms = order_times.get(order)
+            if trace_ms is None:
+                trace_ms = order_times[order] = row[0]
+                if len(order_times) > self.max_open_orders:
+                    order_times.popitem(last=False)
+            if index < skip:
+                continue
+            batch.append((row, trace_ms))
+            if len(batch) >= self.batch_size:
+                window.acquire()
+                if stop.is_set():
+                    return
+                yield batch
+                batch = []
+        if batch:
+            window.acquire()
+            if not stop.is_set():
+                yield batch
+
+    def run(self, paths: List[str]) -> BackfillState:
+        """Backfill paths, resuming a previous interrupted run of the same inputs"""
+        state = self._open_state(paths)
+        if state.completed:
+            logger.info(f"Backfill of {len(paths)} exports already complete ({state.events} events)")
+            return state
+        # Leftovers of an interrupted run: a half-written segment and sort runs
+        for name in os.listdir(self.output_dir):
+            if name.endswith(".tmp"):
+                os.unlink(os.path.join(self.output_dir, name))
+            elif name.startswith(_SORT_PREFIX):
+                shutil.rmtree(os.path.join(self.output_dir, name), ignore_errors=True)
+        if state.events:
+            logger.info(f"Resuming backfill after {state.events} events ({len(state.segments)} segments)")
+
+        started = time.perf_counter()
+        resumed_at = state.events
+        in_flight = max(2, self.workers) * 4  # Batches read ahead of the linker
+        window, stop = Semaphore(in_flight), Event()
+        batches = self._batches(paths, state.events, window, stop)
+        init_args = (self.venue_id, self.tier, self.hash_algo, self.digits)
+        pool = None
+        if self.workers > 0:
+            pool = multiprocessing.Pool(self.workers, initializer=_init_worker, initargs=init_args)
+            encoded = pool.imap(_encode_batch, batches)
+        else:
+            _init_worker(*init_args)
+            encoded = map(_encode_batch, batches)
+
+        writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="vcp-backfill-writer")
+        pending: List[Future] = []
+        try:
+            self._link(state, encoded, window, writer, pending)
+            for future in pending:
+                future.result()
+            state.completed = True
+            state.save(self.state_path)
+        finally:
+            # Unblock the reader (the pool's task feeder) so the pool can shut down
+            stop.set()
+            window.release(in_flight)
+            writer.shutdown(wait=True)
+            if pool:
+                pool.terminate()
+                pool.join()
+
+        elapsed = time.perf_counter() - started
+        written = state.events - resumed_at
+        logger.info(f"Backfill complete: {written} events in {elapsed:.1f}s "
+                    f"({written / elapsed * 60 if elapsed else 0:,.0f} per minute), {len(state.segments)} segments")
+        return state
+
+    def _link(self, state: BackfillState, encoded: Iterator[Tuple[bytes, str]], window: Semaphore,
+              writer: ThreadPoolExecutor, pending: List[Future]):
+        """Chain encoded batches in order and cut them into segments"""
+        digest = get_hash_algo(self.hash_algo)
+        prev_hash = state.prev_hash
+        lines: List[str] = []
+        first_sequence = state.events + 1
+        for canonicals, heads in encoded:
+            window.release()
+            for canonical, head in zip(canonicals.split(b"\n"), heads.split("\n")):
+                event_hash = digest(canonical + prev_hash.encode() + _CANONICAL_TAIL).hexdigest()
+                lines.append(head + event_hash + _MID + prev_hash + _TAIL)
+                prev_hash = event_hash
+            while len(lines) >= self.segment_events:
+                self._commit(state, lines[:self.segment_events], first_sequence, writer, pending)
+                first_sequence += self.segment_events
+                lines = lines[self.segment_events:]
+        if lines:
+            self._commit(state, lines, first_sequence, writer, pending)
+
+    def _commit(self, state: BackfillState, lines: List[str], first_sequence: int,
+                writer: ThreadPoolExecutor, pending: List[Future]):
+        """Hand a finished segment to the writer; state is saved once it is on disk"""
+        last_hash = _line_hash(lines[-1])
+        name = f"{self.venue_id}-{first_sequence:012d}{SEGMENT_SUFFIX}"
+        state.segments.append({"file": name, "first_sequence": first_sequence, "events": len(lines),
+                               "last_hash": last_hash})
+        state.events = first_sequence - 1 + len(lines)
+        state.prev_hash = last_hash
+        snapshot = BackfillState(**json.loads(json.dumps(asdict(state))))
+        data = ("\n".join(lines) + "\n").encode("utf-8")
+
+        def write():
+            _write_segment(os.path.join(self.output_dir, name), data, self.compresslevel)
+            snapshot.save(self.state_path)
+            _events_written.inc(snapshot.segments[-1]["events"])
+            _segments_written.inc()
+            logger.info(f"Wrote {name} ({len(lines)} events, {len(data) / 1e6:.1f} MB raw)")
+
+        for future in [f for f in pending if f.done()]:
+            future.result()
+            pending.remove(future)
+        pending.append(writer.submit(write))
+
+
+# =============================================================================
+# Command Line
+# =============================================================================
+def main():
+    parser = argparse.ArgumentParser(description="Backfill a VCP chain from MT5 deal history exports")
+    parser.add_argument("exports", nargs="+", help="CSV, JSON or NDJSON deal exports")
+    parser.add_argument("--venue", required=True, help="VCP venue_id")
+    parser.add_argument("--out", required=True, help="Archive directory; rerun with the same arguments to resume")
+    parser.add_argument("--tier", default=Tier.SILVER, choices=[Tier.PLATINUM, Tier.GOLD, Tier.SILVER])
+    parser.add_argument("--hash-algo", default=DEFAULT_HASH_ALGO)
+    parser.add_argument("--symbols", help="JSON list of MT5 symbol infos (name, digits, volume_step)")
+    parser.add_argument("--login", type=int, default=0, help="Account of exports without a login column")
+    parser.add_argument("--workers", type=int, default=None, help="Encoding processes (default: CPUs; 0: in-process)")
+    parser.add_argument("--batch-size", type=int, default=2000)
+    parser.add_argument("--segment-events", type=int, default=100_000)
+    parser.add_argument("--compresslevel", type=int, default=6)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+
+    digits = DigitsTable()
+    if args.symbols:
+        with open(args.symbols, "r") as f:
+            digits.load(json.load(f))
+    backfill = Backfill(
+        args.venue, args.out, tier=args.tier, hash_algo=args.hash_algo, digits=digits,
+        workers=args.workers, batch_size=args.batch_size, segment_events=args.segment_events,
+        compresslevel=args.compresslevel, login=args.login
+    )
+    try:
+        state = backfill.run(args.exports)
+    except BackfillError as e:
+        raise SystemExit(f"error: {e}")
+    print(json.dumps({"events": state.events, "segments": len(state.segments), "prev_hash": state.prev_hash}))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,739 @@
+#!/usr/bin/env python3
+"""
+VCP Sidecar Checkpoints v1.0 - Fast Restart from Binary State Snapshots
+Document ID: VSO-SDK-PY-009
+License: CC BY 4.0 International
+Maintainer: VeritasChain Standards Organization (VSO)
+
+This module snapshots everything a sidecar needs to continue after a restart:
+- Chain head (prev_hash) and sequence number of VCPEventFactory
+- Dedup watermark (VCPManagerAdapter.processed_deals)
+- Open traces (trace_id_map and EventCorrelator chains)
+- WAL offsets of the ingestion source (e.g. SpoolTailer)
+- Merkle anchor chain and open window (vcp_merkle_v1_0.MerkleAnchorer)
+- Events queued but not yet acknowledged by VCC, re-queued on restore
+- Poll cursors of a ManagerPoller (vcp_poller_v1_0.CursorStore)
+
+File format (little endian):
+    magic "VCPCKPT\\x01" | u16 version | u16 sections | u64 created_ns
+    per section: 4-byte tag | u8 flags | u32 crc32 | u64 length | payload
+
+Every section carries a CRC32 of its stored bytes; large sections are
+zlib-compressed. Writes go to a temporary file that is fsynced and renamed
+over the previous snapshot, which is kept as <path>.prev as a fallback.
+
+Integer deal keys, numeric tickets and UUID trace_ids are stored as sorted
+binary arrays and restored as-is: lookups bisect the arrays and new entries
+go to a small overlay, so restore time does not grow with the number of
+entries. Correlator chains likewise stay packed until a trace is touched.
+"""
+
+import itertools
+import json
+import logging
+import os
+import struct
+import tempfile
+import time
+import zlib
+from array import array
+from bisect import bisect_left
+from collections.abc import MutableMapping, MutableSet
+from dataclasses import dataclass, field
+from threading import Event, Thread
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from vcp_metrics_v1_0 import REGISTRY
+from vcp_sidecar_core_v1_0 import (
+    EVENT_TYPE_NAMES, EventCorrelator, VCPEvent, VCPEventSerializer, VCPHeader, VCPSecurity
+)
+
+logger = logging.getLogger("vcp_checkpoint")
+
+MAGIC = b"VCPCKPT\x01"
+VERSION = 1
+
+_FILE_HEADER = struct.Struct("<8sHHQ")
+_SECTION_HEADER = struct.Struct("<4sBIQ")
+_FLAG_ZLIB = 0x01
+_COMPRESS_MIN = 64 * 1024
+
+# Section encodings
+_PACKED = b"\x01"
+_JSON = b"\x02"
+
+_save_seconds = REGISTRY.histogram("vcp_checkpoint_save_seconds", "Checkpoint write time")
+_restore_seconds = REGISTRY.histogram("vcp_checkpoint_restore_seconds", "Checkpoint restore time")
+_bytes_written = REGISTRY.gauge("vcp_checkpoint_bytes", "Size of the last checkpoint written")
+
+
+class CheckpointError(Exception):
+    """Raised for a missing, truncated or corrupt checkpoint"""
+
+
+# =============================================================================
+# Packed Containers
+# =============================================================================
+def _int_array(data: bytes) -> array:
+    values = array("q")
+    values.frombytes(data)
+    return values
+
+
+def _format_uuid(raw: bytes) -> str:
+    h = raw.hex()
+    return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
+
+
+class PackedDealSet(MutableSet):
+    """
+    processed_deals restored from a checkpoint
+
+    Restored (ticket, time) keys live in two sorted int64 arrays; deals
+    added after the restart go to an ordinary set.
+    """
+
+    def __init__(self, tickets: array, times: array):
+        self._tickets = tickets
+        self._times = times
+        self._live: set = set()
+        self._removed: set = set()
+
+    def _packed(self, key) -> bool:
+        try:
+            ticket, deal_time = key
+            i = bisect_left(self._tickets, ticket)
+        except (TypeError, ValueError):
+            return False
+        tickets, times = self._tickets, self._times
+        while i < len(tickets) and tickets[i] == ticket:
+            if times[i] == deal_time:
+                return True
+            i += 1
+        return False
+
+    def __contains__(self, key) -> bool:
+        if key in self._live:
+            return True
+        return key not in self._removed and self._packed(key)
+
+    def add(self, key):
+        if key not in self._live and not self._packed(key):
+            self._live.add(key)
+        self._removed.discard(key)
+
+    def discard(self, key):
+        self._live.discard(key)
+        if self._packed(key):
+            self._removed.add(key)
+
+    def __len__(self) -> int:
+        return len(self._tickets) - len(self._removed) + len(self._live)
+
+    def __iter__(self) -> Iterator[Tuple[int, int]]:
+        removed = self._removed
+        for key in zip(self._tickets, self._times):
+            if key not in removed:
+                yield key
+        yield from self._live
+
+    def copy(self) -> "PackedDealSet":
+        clone = PackedDealSet(self._tickets, self._times)
+        clone._live = set(self._live)
+        clone._removed = set(self._removed)
+        return clone
+
+    @property
+    def unchanged(self) -> bool:
+        return not self._live and not self._removed
+
+
+class PackedTraceMap(MutableMapping):
+    """
+    trace_id_map restored from a checkpoint
+
+    Restored numeric tickets live in a sorted int64 array with their
+    trace_ids as 16 raw bytes each; later assignments go to a dict.
+    """
+
+    def __init__(self, tickets: array, trace_ids: bytes):
+        self._tickets = tickets
+        self._trace_ids = trace_ids
+        self._live: Dict[str, str] = {}
+        self._removed: set = set()
+
+    def _index(self, key) -> int:
+        """Position of key in the packed arrays, or -1"""
+        if not isinstance(key, str) or not key.isascii() or not key.isdigit():
+            return -1
+        ticket = int(key)
+        if str(ticket) != key or key in self._removed:
+            return -1
+        i = bisect_left(self._tickets, ticket)
+        return i if i < len(self._tickets) and self._tickets[i] == ticket else -1
+
+    def __getitem__(self, key) -> str:
+        value = self._live.get(key)
+        if value is not None:
+            return value
+        i = self._index(key)
+        if i < 0:
+            raise KeyError(key)
+        return _format_uuid(self._trace_ids[i * 16:i * 16 + 16])
+
+    def __contains__(self, key) -> bool:
+        return key in self._live or self._index(key) >= 0
+
+    def __setitem__(self, key, value):
+        if key not in self._live and self._index(key) >= 0:
+            self._removed.add(key)  # Overridden: live and packed stay disjoint
+        self._live[key] = value
+
+    def __delitem__(self, key):
+        if key in self._live:
+            del self._live[key]
+        elif self._index(key) >= 0:
+            self._removed.add(key)
+        else:
+            raise KeyError(key)
+
+    def __len__(self) -> int:
+        return len(self._tickets) - len(self._removed) + len(self._live)
+
+    def __iter__(self) -> Iterator[str]:
+        removed = self._removed
+        for ticket in self._tickets:
+            key = str(ticket)
+            if key not in removed:
+                yield key
+        yield from self._live
+
+    def copy(self) -> "PackedTraceMap":
+        clone = PackedTraceMap(self._tickets, self._trace_ids)
+        clone._live = dict(self._live)
+        clone._removed = set(self._removed)
+        return clone
+
+    @property
+    def unchanged(self) -> bool:
+        return not self._live and not self._removed
+
+
+class PackedChains:
+    """
+    Correlator chains restored from a checkpoint, kept as columns
+
+    EventCorrelator materializes a trace on first access (pop). Restored
+    events carry only what sequence and integrity checks need: ids, type,
+    timestamp and hashes.
+    """
+
+    def __init__(self, traces: Dict[str, Tuple[int, int]], event_ids: List[str],
+                 timestamps: List[str], codes: array, hashes: bytes, prev_hashes: bytes):
+        self._traces = traces
+        self._event_ids = event_ids
+        self._timestamps = timestamps
+        self._codes = codes
+        self._hashes = hashes
+        self._prev_hashes = prev_hashes
+
+    def __contains__(self, trace_id: str) -> bool:
+        return trace_id in self._traces
+
+    def __len__(self) -> int:
+        return len(self._traces)
+
+    def trace_ids(self) -> List[str]:
+        return list(self._traces)
+
+    def rows(self, trace_id: str):
+        """(event_id, timestamp_int, code, event_hash_raw, prev_hash_raw) per event"""
+        start, count = self._traces[trace_id]
+        for i in range(start, start + count):
+            yield (self._event_ids[i], self._timestamps[i], self._codes[i],
+                   self._hashes[i * 32:i * 32 + 32], self._prev_hashes[i * 32:i * 32 + 32])
+
+    def pop(self, trace_id: str) -> List[VCPEvent]:
+        events = []
+        for event_id, timestamp_int, code, event_hash, prev_hash in self.rows(trace_id):
+            header = VCPHeader(
+                event_id=event_id, trace_id=trace_id,
+                timestamp_int=timestamp_int, timestamp_iso="",
+                event_type=EVENT_TYPE_NAMES.get(code, ""), event_type_code=code,
+                timestamp_precision="", clock_sync_status="", hash_algo="",
+                venue_id="", symbol="", account_id=""
+            )
+            events.append(VCPEvent(
+                header=header,
+                security=VCPSecurity(event_hash=event_hash.hex(), prev_hash=prev_hash.hex())
+            ))
+        del self._traces[trace_id]
+        return events
+
+    def copy(self) -> "PackedChains":
+        return PackedChains(dict(self._traces), self._event_ids, self._timestamps,
+                            self._codes, self._hashes, self._prev_hashes)
+
+
+# =============================================================================
+# Sidecar State
+# =============================================================================
+@dataclass
+class SidecarState:
+    """Everything restored from one checkpoint"""
+    prev_hash: str = "0" * 64
+    sequence: int = 0
+    venue_id: str = ""
+    created_ns: int = 0
+    processed_deals: MutableSet = field(default_factory=set)
+    trace_id_map: MutableMapping = field(default_factory=dict)
+    chains: Optional[PackedChains] = None
+    wal_offsets: Dict = field(default_factory=dict)
+    anchor: Optional[Tuple] = None
+    pending: List[VCPEvent] = field(default_factory=list)
+    cursors: Dict = field(default_factory=dict)
+
+    def apply(self, adapter, correlator: Optional[EventCorrelator] = None, wal=None, cursors=None):
+        """Install the state into a freshly constructed adapter (and helpers)"""
+        adapter.factory.prev_hash = self.prev_hash
+        adapter.factory.sequence = self.sequence
+        adapter.processed_deals = self.processed_deals
+        adapter.trace_id_map = self.trace_id_map
+        if correlator is not None and self.chains is not None:
+            correlator.event_chains = {}
+            correlator.packed_chains = self.chains
+        if adapter.factory.anchorer is not None and self.anchor is not None:
+            adapter.factory.anchorer.restore_state(*self.anchor)
+        if wal is not None and self.wal_offsets:
+            wal.restore_offsets({name: tuple(value) for name, value in self.wal_offsets.items()})
+        if cursors is not None and self.cursors:
+            cursors.restore(self.cursors)
+        # Covered by the restored head and dedup state but never acknowledged: send again
+        for event in self.pending:
+            adapter.queue_event(event)
+
+
+# =============================================================================
+# Encoding
+# =============================================================================
+def _join(strings) -> bytes:
+    return "\n".join(strings).encode("utf-8")
+
+
+def _split(blob: bytes, count: int) -> List[str]:
+    return blob.decode("utf-8").split("\n") if count else []
+
+
+def _raw_hash(value: str) -> bytes:
+    return bytes.fromhex(value) if value else bytes(32)
+
+
+def _encode_head(prev_hash: str, sequence: int, venue_id: str) -> bytes:
+    venue = venue_id.encode("utf-8")
+    return _raw_hash(prev_hash) + struct.pack("<QH", sequence, len(venue)) + venue
+
+
+def _encode_anchor(anchor_index: int, prev_anchor_hash: str, first_sequence: int,
+                   leaves: List[bytes]) -> bytes:
+    return (struct.pack("<QQ", anchor_index, first_sequence) +
+            _raw_hash(prev_anchor_hash) + b"".join(leaves))
+
+
+def _decode_anchor(data: bytes) -> Tuple:
+    anchor_index, first_sequence = struct.unpack_from("<QQ", data)
+    leaves = [data[i:i + 32] for i in range(48, len(data), 32)]
+    return anchor_index, data[16:48].hex(), first_sequence, leaves
+
+
+def _encode_pending(events: List[VCPEvent]) -> bytes:
+    to_dict = VCPEventSerializer.to_dict
+    return _join(json.dumps(to_dict(e), ensure_ascii=False, separators=(',', ':')) for e in events)
+
+
+def _decode_pending(data: bytes) -> List[VCPEvent]:
+    return [VCPEventSerializer.from_dict(json.loads(line)) for line in data.decode("utf-8").split("\n") if line]
+
+
+def _encode_dedup(deals) -> bytes:
+    if isinstance(deals, PackedDealSet) and deals.unchanged:
+        return _PACKED + deals._tickets.tobytes() + deals._times.tobytes()
+    try:
+        flat = array("q", itertools.chain.from_iterable(sorted(deals)))
+        if len(flat) == 2 * len(deals):
+            return _PACKED + flat[0::2].tobytes() + flat[1::2].tobytes()
+    except (TypeError, OverflowError):
+        pass
+    # Non-integer keys: JSON fallback, restored as a plain set
+    return _JSON + json.dumps(list(deals), separators=(',', ':')).encode("utf-8")
+
+
+def _decode_dedup(data: bytes) -> MutableSet:
+    if data[:1] == _PACKED:
+        half = (len(data) - 1) // 2
+        return PackedDealSet(_int_array(data[1:1 + half]), _int_array(data[1 + half:]))
+    return {tuple(key) for key in json.loads(data[1:])}
+
+
+def _pack_trace_map(trace_id_map) -> Optional[bytes]:
+    """Numeric tickets and canonical UUIDs as sorted arrays, else None"""
+    if not trace_id_map:
+        return None
+    keys, values = list(trace_id_map.keys()), list(trace_id_map.values())
+    try:
+        numbers = list(map(int, keys))
+    except (TypeError, ValueError):
+        return None
+    order = sorted(numbers)
+    if order != numbers:
+        # Tickets are normally inserted in ascending order; sort otherwise
+        pairs = sorted(zip(numbers, keys, values))
+        numbers, keys, values = order, [p[1] for p in pairs], [p[2] for p in pairs]
+    n = len(numbers)
+    if numbers[0] < 0 or "\n".join(keys) != "\n".join(map(str, numbers)):
+        return None  # Signs, leading zeros etc. would not round-trip
+    joined = "".join(values)
+    if len(joined) != 36 * n or any(joined[i::36] != "-" * n for i in (8, 13, 18, 23)):
+        return None
+    digits = joined.replace("-", "")
+    try:
+        raw = bytes.fromhex(digits)
+        tickets = array("q", numbers)
+    except (ValueError, OverflowError):
+        return None
+    if raw.hex() != digits:
+        return None  # Upper case would not round-trip
+    return _PACKED + struct.pack("<Q", n) + tickets.tobytes() + raw
+
+
+def _encode_trace_map(trace_id_map) -> bytes:
+    if isinstance(trace_id_map, PackedTraceMap) and trace_id_map.unchanged:
+        tickets = trace_id_map._tickets
+        return _PACKED + struct.pack("<Q", len(tickets)) + tickets.tobytes() + trace_id_map._trace_ids
+    packed = _pack_trace_map(trace_id_map)
+    if packed is not None:
+        return packed
+    return _JSON + json.dumps(dict(trace_id_map), separators=(',', ':')).encode("utf-8")
+
+
+def _decode_trace_map(data: bytes) -> MutableMapping:
+    if data[:1] == _PACKED:
+        (n,) = struct.unpack_from("<Q", data, 1)
+        return PackedTraceMap(_int_array(data[9:9 + 8 * n]), data[9 + 8 * n:])
+    return json.loads(data[1:])
+
+
+def _encode_chains(chains: Dict[str, List[VCPEvent]], packed: Optional[PackedChains]) -> bytes:
+    trace_ids, counts = [], array("I")
+    event_ids, timestamps, codes = [], [], array("H")
+    hashes, prev_hashes = [], []
+    genesis = "0" * 64
+
+    for trace_id, chain in chains.items():
+        trace_ids.append(trace_id)
+        counts.append(len(chain))
+        for event in chain:
+            event_ids.append(event.header.event_id)
+            timestamps.append(event.header.timestamp_int)
+            codes.append(event.header.event_type_code)
+            hashes.append(event.security.event_hash or genesis)
+            prev_hashes.append(event.security.prev_hash or genesis)
+    hashes = [bytes.fromhex("".join(hashes))]
+    prev_hashes = [bytes.fromhex("".join(prev_hashes))]
+
+    if packed is not None:
+        # Untouched restored traces are copied through without materializing
+        for trace_id in packed.trace_ids():
+            rows = list(packed.rows(trace_id))
+            trace_ids.append(trace_id)
+            counts.append(len(rows))
+            for event_id, timestamp_int, code, event_hash, prev_hash in rows:
+                event_ids.append(event_id)
+                timestamps.append(timestamp_int)
+                codes.append(code)
+                hashes.append(event_hash)
+                prev_hashes.append(prev_hash)
+
+    blobs = [_join(trace_ids), counts.tobytes(), _join(event_ids), _join(timestamps),
+             codes.tobytes(), b"".join(hashes), b"".join(prev_hashes)]
+    header = struct.pack("<II", len(trace_ids), len(event_ids))
+    lengths = struct.pack("<7Q", *(len(b) for b in blobs))
+    return header + lengths + b"".join(blobs)
+
+
+def _decode_chains(data: bytes) -> PackedChains:
+    trace_count, event_count = struct.unpack_from("<II", data)
+    lengths = struct.unpack_from("<7Q", data, 8)
+    offset = 8 + 7 * 8
+    blobs = []
+    for length in lengths:
+        blobs.append(data[offset:offset + length])
+        offset += length
+
+    trace_ids = _split(blobs[0], trace_count)
+    counts = array("I")
+    counts.frombytes(blobs[1])
+    codes = array("H")
+    codes.frombytes(blobs[4])
+    starts = itertools.accumulate(itertools.chain((0,), counts))
+    traces = {trace_id: (start, count) for trace_id, start, count in zip(trace_ids, starts, counts)}
+    return PackedChains(
+        traces,
+        _split(blobs[2], event_count),
+        _split(blobs[3], event_count),
+        codes,
+        blobs[5],
+        blobs[6],
+    )
+
+
+def _decode_state(created_ns: int, sections: Dict[bytes, bytes]) -> SidecarState:
+    head = sections.get(b"HEAD")
+    if head is None:
+        raise CheckpointError("Checkpoint has no HEAD section")
+    sequence, venue_len = struct.unpack_from("<QH", head, 32)
+    state = SidecarState(
+        prev_hash=head[:32].hex(),
+        sequence=sequence,
+        venue_id=head[42:42 + venue_len].decode("utf-8"),
+        created_ns=created_ns,
+    )
+    if b"DEDP" in sections:
+        state.processed_deals = _decode_dedup(sections[b"DEDP"])
+    if b"TRCM" in sections:
+        state.trace_id_map = _decode_trace_map(sections[b"TRCM"])
+    if b"CORR" in sections:
+        state.chains = _decode_chains(sections[b"CORR"])
+    if b"WALO" in sections:
+        state.wal_offsets = json.loads(sections[b"WALO"])
+    if b"ANCH" in sections:
+        state.anchor = _decode_anchor(sections[b"ANCH"])
+    if b"PEND" in sections:
+        state.pending = _decode_pending(sections[b"PEND"])
+    if b"CURS" in sections:
+        state.cursors = {account_id: tuple(c) for account_id, c in json.loads(sections[b"CURS"]).items()}
+    return state
+
+
+# =============================================================================
+# Checkpoint File
+# =============================================================================
+class CheckpointStore:
+    """Reads and writes checkpoint files (atomic replace, CRC per section)"""
+
+    def __init__(self, path: str, compress: bool = True):
+        self.path = path
+        self.compress = compress
+
+    def write(self, sections: List[Tuple[bytes, bytes]]) -> int:
+        """Write (tag, payload) sections; returns bytes written"""
+        parts = [_FILE_HEADER.pack(MAGIC, VERSION, len(sections), time.time_ns())]
+        for tag, payload in sections:
+            flags = 0
+            if self.compress and len(payload) >= _COMPRESS_MIN:
+                payload = zlib.compress(payload, 1)
+                flags |= _FLAG_ZLIB
+            parts.append(_SECTION_HEADER.pack(tag, flags, zlib.crc32(payload), len(payload)))
+            parts.append(payload)
+
+        directory = os.path.dirname(os.path.abspath(self.path))
+        fd, tmp_path = tempfile.mkstemp(prefix=".checkpoint-", dir=directory)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                for part in parts:
+                    f.write(part)
+                f.flush()
+                os.fsync(f.fileno())
+                size = f.tell()
+            if os.path.exists(self.path):
+                os.replace(self.path, self.path + ".prev")
+            os.replace(tmp_path, self.path)
+        except OSError:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+        return size
+
+    def read(self, path: Optional[str] = None) -> Tuple[int, Dict[bytes, bytes]]:
+        """Returns (created_ns, {tag: payload}); raises CheckpointError"""
+        path = path or self.path
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+        except OSError as e:
+            raise CheckpointError(f"Cannot read checkpoint {path}: {e}") from e
+
+        if len(data) < _FILE_HEADER.size:
+            raise CheckpointError(f"Truncated checkpoint {path}")
+        magic, version, count, created_ns = _FILE_HEADER.unpack_from(data)
+        if magic != MAGIC or version != VERSION:
+            raise CheckpointError(f"Not a v{VERSION} checkpoint: {path}")
+
+        sections = {}
+        offset = _FILE_HEADER.size
+        for _ in range(count):
+            if offset + _SECTION_HEADER.size > len(data):
+                raise CheckpointError(f"Truncated checkpoint {path}")
+            tag, flags, crc, length = _SECTION_HEADER.unpack_from(data, offset)
+            offset += _SECTION_HEADER.size
+            payload = data[offset:offset + length]
+            offset += length
+            if len(payload) != length or zlib.crc32(payload) != crc:
+                raise CheckpointError(f"Checksum mismatch in section {tag!r} of {path}")
+            if flags & _FLAG_ZLIB:
+                payload = zlib.decompress(payload)
+            sections[tag] = payload
+        return created_ns, sections
+
+
+# =============================================================================
+# Checkpointer
+# =============================================================================
+class SidecarCheckpointer:
+    """
+    Periodic snapshots of adapter (and optional correlator / WAL) state
+
+    Only shallow copies are taken while holding `lock` (by default the
+    adapter's factory_lock, which every event producer holds while it
+    creates and queues events), so the chain head and the dedup set in a
+    snapshot agree exactly; encoding and the file write happen after it
+    is released.
+
+    The adapter tracks the events it has queued until VCC acknowledges
+    them (adapter.outstanding). A snapshot holds them next to the head,
+    and restore() queues them again, so events still in the queue, the
+    signing stage or a request at the time of a crash are resent rather
+    than lost. With `cursors`, the poll cursors are snapshotted under the
+    same lock and restored with the dedup state they match.
+    """
+
+    def __init__(
+        self,
+        adapter,
+        path: str,
+        correlator: Optional[EventCorrelator] = None,
+        wal=None,
+        interval: float = 30.0,
+        lock=None,
+        compress: bool = True,
+        cursors=None
+    ):
+        self.adapter = adapter
+        self.store = CheckpointStore(path, compress)
+        self.correlator = correlator
+        self.wal = wal
+        self.cursors = cursors
+        if adapter.outstanding is None:
+            adapter.outstanding = {}
+        self.interval = interval
+        self.lock = lock if lock is not None else adapter.factory_lock
+        self._stop = Event()
+        self._thread: Optional[Thread] = None
+
+    def _snapshot(self) -> Dict:
+        adapter = self.adapter
+        snapshot = {
+            "head": (adapter.factory.prev_hash, adapter.factory.sequence, adapter.factory.venue_id),
+            "deals": adapter.processed_deals.copy(),
+            "traces": adapter.trace_id_map.copy(),
+            "pending": list(adapter.outstanding.copy().values()),
+        }
+        if self.correlator is not None:
+            packed = self.correlator.packed_chains
+            snapshot["chains"] = (
+                {trace_id: list(chain) for trace_id, chain in self.correlator.event_chains.items()},
+                packed.copy() if packed is not None else None,
+            )
+        if self.wal is not None:
+            snapshot["wal"] = self.wal.offsets()
+        if adapter.factory.anchorer is not None:
+            snapshot["anchor"] = adapter.factory.anchorer.state()
+        if self.cursors is not None:
+            snapshot["cursors"] = self.cursors.snapshot()
+        return snapshot
+
+    def save(self) -> int:
+        """Write a checkpoint now; returns its size in bytes"""
+        started = time.perf_counter()
+        if self.lock is not None:
+            with self.lock:
+                snapshot = self._snapshot()
+        else:
+            snapshot = self._snapshot()
+
+        sections = [
+            (b"HEAD", _encode_head(*snapshot["head"])),
+            (b"DEDP", _encode_dedup(snapshot["deals"])),
+            (b"TRCM", _encode_trace_map(snapshot["traces"])),
+            (b"PEND", _encode_pending(snapshot["pending"])),
+        ]
+        if "chains" in snapshot:
+            sections.append((b"CORR", _encode_chains(*snapshot["chains"])))
+        if "wal" in snapshot:
+            sections.append((b"WALO", json.dumps(snapshot["wal"]).encode("utf-8")))
+        if "anchor" in snapshot:
+            sections.append((b"ANCH", _encode_anchor(*snapshot["anchor"])))
+        if "cursors" in snapshot:
+            sections.append((b"CURS", json.dumps(snapshot["cursors"]).encode("utf-8")))
+        size = self.store.write(sections)
+
+        elapsed = time.perf_counter() - started
+        _save_seconds.observe(elapsed)
+        _bytes_written.set(size)
+        logger.debug(f"Checkpoint written: {size} bytes in {elapsed * 1000:.1f} ms")
+        return size
+
+    def load(self) -> Optional[SidecarState]:
+        """Read the newest valid checkpoint (falls back to <path>.prev)"""
+        for path in (self.store.path, self.store.path + ".prev"):
+            if not os.path.exists(path):
+                continue
+            try:
+                created_ns, sections = self.store.read(path)
+                return _decode_state(created_ns, sections)
+            except (CheckpointError, ValueError, struct.error, zlib.error) as e:
+                logger.error(f"Ignoring checkpoint {path}: {e}")
+        return None
+
+    def restore(self) -> bool:
+        """Load and apply the newest checkpoint; returns False if none was usable"""
+        started = time.perf_counter()
+        state = self.load()
+        if state is None:
+            return False
+        if state.venue_id != self.adapter.factory.venue_id:
+            logger.error(
+                f"Checkpoint is for venue {state.venue_id}, not {self.adapter.factory.venue_id}"
+            )
+            return False
+        state.apply(self.adapter, self.correlator, self.wal, self.cursors)
+        elapsed = time.perf_counter() - started
+        _restore_seconds.observe(elapsed)
+        logger.info(
+            f"Restored checkpoint: sequence {state.sequence}, "
+            f"{len(state.processed_deals)} deals, {len(state.trace_id_map)} traces, "
+            f"{len(state.pending)} events re-queued "
+            f"in {elapsed * 1000:.0f} ms"
+        )
+        return True
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            try:
+                self.save()
+            except Exception as e:
+                logger.error(f"Checkpoint failed: {e}")
+
+    def start(self) -> "SidecarCheckpointer":
+        """Write a checkpoint every `interval` seconds in a background thread"""
+        self._stop.clear()
+        self._thread = Thread(target=self._run, name="vcp-checkpoint", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self, final: bool = True):
+        """Stop periodic snapshots and (by default) write a final one"""
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=30)
+        if final:
+            self.save()
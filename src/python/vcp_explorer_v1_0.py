@@ -0,0 +1,424 @@
+#!/usr/bin/env python3
+"""
+VCP Explorer Client v1.0 - Rate-limit-aware, Caching Explorer API Client
+Document ID: VSO-SDK-PY-012
+License: CC BY 4.0 International
+Maintainer: VeritasChain Standards Organization (VSO)
+
+This module provides a client for the Explorer API of guide section 7:
+- Token bucket sized from the tier table and driven by the
+  X-RateLimit-Limit / -Remaining / -Reset headers (section 7.5)
+- Streaming iteration over /events with concurrent prefetch of the next
+  offset pages
+- On-disk response cache keyed by query; events and Merkle proofs are
+  immutable and cached forever, queries and traces expire after a TTL
+
+Usage:
+    client = ExplorerClient(api_key, tier=Tier.GOLD, cache_dir="~/.cache/vcp-explorer")
+    for event in client.iter_events(symbol="EURUSD", event_type_code=4):
+        ...
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+from urllib.parse import quote, urlencode
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from vcp_metrics_v1_0 import REGISTRY
+from vcp_sidecar_core_v1_0 import Tier
+
+logger = logging.getLogger("vcp_explorer")
+
+DEFAULT_ENDPOINT = "https://explorer.veritaschain.org/api/v1"
+MAX_PAGE_SIZE = 1000
+
+# Tier -> (requests per minute, burst requests per minute), guide section 7.5
+TIER_LIMITS: Dict[str, Tuple[int, int]] = {
+    Tier.SILVER: (100, 200),
+    Tier.GOLD: (500, 1000),
+    Tier.PLATINUM: (2000, 5000),
+}
+
+_requests = REGISTRY.counter("vcp_explorer_requests_total", "Explorer API requests sent", ("status",))
+_cache_hits = REGISTRY.counter("vcp_explorer_cache_hits_total", "Explorer responses served from the disk cache")
+_throttled = REGISTRY.counter("vcp_explorer_throttled_total", "Explorer requests answered with 429")
+_throttle_seconds = REGISTRY.histogram(
+    "vcp_explorer_throttle_seconds", "Time spent waiting for the rate limiter",
+    buckets=(0.001, 0.01, 0.1, 0.5, 1.0, 5.0, 30.0, 60.0)
+)
+_request_seconds = REGISTRY.histogram("vcp_explorer_request_seconds", "Explorer API request latency")
+
+
+class ExplorerError(Exception):
+    """Raised for Explorer API requests that fail after retries"""
+
+    def __init__(self, message: str, status: Optional[int] = None):
+        super().__init__(message)
+        self.status = status
+
+
+# =============================================================================
+# Rate Limiter
+# =============================================================================
+class RateLimiter:
+    """
+    Token bucket refilled at limit / window requests per second
+
+    `burst` is the bucket depth. Response headers only ever lower the
+    local view: X-RateLimit-Remaining, less the requests still in flight,
+    caps the tokens, and when nothing remains callers block until
+    X-RateLimit-Reset (Unix seconds, or seconds from now for small
+    values). A 429 blocks for Retry-After. Every acquire() is paired with
+    one complete() once the response (or error) is in.
+    """
+
+    def __init__(
+        self,
+        limit: int = 100,
+        window: float = 60.0,
+        burst: Optional[int] = None,
+        clock: Callable[[], float] = time.monotonic,
+        wall_clock: Callable[[], float] = time.time,
+        sleep: Callable[[float], None] = time.sleep
+    ):
+        self.window = window
+        self.limit = limit
+        self.rate = limit / window
+        self.capacity = float(max(1, burst if burst is not None else limit))
+        self._clock = clock
+        self._wall_clock = wall_clock
+        self._sleep = sleep
+        self._tokens = self.capacity
+        self._updated = clock()
+        self._blocked_until = 0.0  # Wall clock
+        self._in_flight = 0
+        self._lock = Lock()
+
+    @classmethod
+    def for_tier(cls, tier: str, **kwargs) -> "RateLimiter":
+        """Sustained tier rate; the burst allowance above it is the bucket depth"""
+        limit, burst = TIER_LIMITS.get(tier, TIER_LIMITS[Tier.SILVER])
+        return cls(limit, window=60.0, burst=burst - limit, **kwargs)
+
+    def _refill(self):
+        now = self._clock()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self) -> float:
+        """Take one token, sleeping as needed; returns seconds waited"""
+        waited = 0.0
+        while True:
+            with self._lock:
+                self._refill()
+                wait = self._blocked_until - self._wall_clock()
+                if wait <= 0:
+                    if self._tokens >= 1:
+                        self._tokens -= 1
+                        self._in_flight += 1
+                        break
+                    wait = (1 - self._tokens) / self.rate
+            self._sleep(wait)
+            waited += wait
+        if waited:
+            _throttle_seconds.observe(waited)
+        return waited
+
+    def complete(self, headers=None) -> None:
+        """Finish an acquired request; align with its X-RateLimit-* headers"""
+        with self._lock:
+            self._in_flight = max(0, self._in_flight - 1)
+            if headers is None:
+                return
+            limit = _int_header(headers, "X-RateLimit-Limit")
+            remaining = _int_header(headers, "X-RateLimit-Remaining")
+            reset = _int_header(headers, "X-RateLimit-Reset")
+            self._refill()
+            if limit and limit != self.limit:
+                self.limit = limit
+                self.rate = limit / self.window
+            if remaining is not None:
+                # Requests still in flight will most likely count against it too
+                remaining -= self._in_flight
+                self._tokens = min(self._tokens, float(remaining))
+                if remaining <= 0 and reset is not None:
+                    now = self._wall_clock()
+                    until = reset if reset > 1_000_000_000 else now + reset
+                    self._blocked_until = max(self._blocked_until, float(until))
+
+    def penalize(self, retry_after: float) -> None:
+        """Block all callers after a 429"""
+        with self._lock:
+            self._tokens = 0.0
+            self._updated = self._clock()
+            self._blocked_until = max(self._blocked_until, self._wall_clock() + retry_after)
+
+
+def _int_header(headers, name: str) -> Optional[int]:
+    value = headers.get(name)
+    try:
+        return int(float(value)) if value is not None else None
+    except ValueError:
+        return None
+
+
+# =============================================================================
+# Response Cache
+# =============================================================================
+class ResponseCache:
+    """
+    On-disk cache of response bodies keyed by request path and query
+
+    One file per entry: a JSON metadata line followed by the raw body.
+    Immutable entries never expire; others expire after `ttl` seconds.
+    """
+
+    def __init__(self, directory: str, ttl: float = 30.0):
+        self.directory = os.path.expanduser(directory)
+        self.ttl = ttl
+        os.makedirs(self.directory, exist_ok=True)
+
+    @staticmethod
+    def key(path: str, params: Optional[Dict] = None) -> str:
+        query = urlencode(sorted((params or {}).items()))
+        return hashlib.sha256(f"{path}?{query}".encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key[:2], key)
+
+    def get(self, key: str) -> Optional[bytes]:
+        try:
+            with open(self._path(key), "rb") as f:
+                meta = json.loads(f.readline())
+                if meta["expires"] is not None and meta["expires"] < time.time():
+                    return None
+                return f.read()
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def put(self, key: str, body: bytes, immutable: bool = False):
+        if not immutable and self.ttl <= 0:
+            return
+        path = self._path(key)
+        directory = os.path.dirname(path)
+        os.makedirs(directory, exist_ok=True)
+        meta = {"expires": None if immutable else time.time() + self.ttl}
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(json.dumps(meta).encode("utf-8") + b"\n")
+                f.write(body)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Could not cache Explorer response: {e}")
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+
+
+# =============================================================================
+# Explorer Client
+# =============================================================================
+class ExplorerClient:
+    """
+    VCP Explorer API client
+
+    Every request goes through the shared RateLimiter, so prefetch threads
+    and other callers never exceed the tier limit together. iter_events
+    pages with `sort=asc` by default so offsets stay stable while new
+    events are appended.
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        endpoint: str = DEFAULT_ENDPOINT,
+        tier: str = Tier.SILVER,
+        cache_dir: Optional[str] = None,
+        cache_ttl: float = 30.0,
+        page_size: int = MAX_PAGE_SIZE,
+        prefetch: int = 2,
+        timeout: int = 10,
+        retry_count: int = 3,
+        rate_limiter: Optional[RateLimiter] = None
+    ):
+        self.endpoint = endpoint.rstrip('/')
+        self.timeout = timeout
+        self.retry_count = retry_count
+        self.page_size = max(1, min(page_size, MAX_PAGE_SIZE))
+        self.prefetch = prefetch
+        self.limiter = rate_limiter or RateLimiter.for_tier(tier)
+        self.cache = ResponseCache(cache_dir, cache_ttl) if cache_dir else None
+        self._session = requests.Session()
+        # Prefetch threads share the session; keep one pooled connection each
+        adapter = HTTPAdapter(pool_maxsize=max(10, prefetch + 1))
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+        self._session.headers.update({
+            "Authorization": f"Bearer {api_key}",
+            "Accept": "application/json",
+            "User-Agent": "VCP-Python-SDK/1.0.0"
+        })
+
+    # -------------------------------------------------------------------------
+    def _request(self, method: str, path: str, params: Optional[Dict] = None,
+                 body: Optional[Dict] = None) -> Optional[requests.Response]:
+        """Rate-limited request with retries; None for 404"""
+        url = f"{self.endpoint}{path}"
+        last_error = ""
+        for attempt in range(self.retry_count):
+            self.limiter.acquire()
+            started = time.perf_counter()
+            try:
+                response = self._session.request(
+                    method, url, params=params, json=body, timeout=self.timeout
+                )
+            except requests.RequestException as e:
+                self.limiter.complete()
+                _requests.labels("error").inc()
+                last_error = str(e)
+                logger.warning(f"Explorer request failed (attempt {attempt + 1}): {e}")
+                if attempt < self.retry_count - 1:
+                    time.sleep(2 ** attempt)
+                continue
+            _request_seconds.observe(time.perf_counter() - started)
+            _requests.labels(str(response.status_code)).inc()
+            self.limiter.complete(response.headers)
+
+            if response.status_code == 200:
+                return response
+            if response.status_code == 404:
+                return None
+            if response.status_code == 429:
+                _throttled.inc()
+                retry_after = _int_header(response.headers, "Retry-After")
+                self.limiter.penalize(retry_after if retry_after is not None else 2 ** attempt)
+                last_error = "rate limited"
+                continue
+            last_error = f"HTTP {response.status_code}: {response.text[:200]}"
+            if response.status_code < 500:
+                raise ExplorerError(f"Explorer {method} {path} failed: {last_error}", response.status_code)
+            if attempt < self.retry_count - 1:
+                time.sleep(2 ** attempt)
+        raise ExplorerError(f"Explorer {method} {path} failed after {self.retry_count} attempts: {last_error}")
+
+    def _get(self, path: str, params: Optional[Dict] = None, immutable: bool = False) -> Optional[Any]:
+        """GET through the disk cache"""
+        key = None
+        if self.cache:
+            key = ResponseCache.key(f"{self.endpoint}{path}", params)
+            cached = self.cache.get(key)
+            if cached is not None:
+                _cache_hits.inc()
+                return json.loads(cached)
+        response = self._request("GET", path, params)
+        if response is None:
+            return None
+        if key:
+            self.cache.put(key, response.content, immutable)
+        return response.json()
+
+    # -------------------------------------------------------------------------
+    def get_event(self, event_id: str) -> Optional[Dict]:
+        """One event; cached forever"""
+        return self._get(f"/events/{quote(event_id, safe='')}", immutable=True)
+
+    def get_trace(self, trace_id: str) -> Optional[Dict]:
+        """Event chain of a TraceID; cached for the TTL as traces still grow"""
+        return self._get(f"/traces/{quote(trace_id, safe='')}")
+
+    def get_merkle_proof(self, event_id: str) -> Optional[Dict]:
+        """Merkle proof of an event; None until it is anchored, then cached forever"""
+        return self._get(f"/merkle/proof/{quote(event_id, safe='')}", immutable=True)
+
+    def verify_merkle_proof(self, proof: Dict) -> Dict:
+        response = self._request("POST", "/merkle/verify", body=proof)
+        if response is None:
+            raise ExplorerError("Explorer /merkle/verify not found", 404)
+        return response.json()
+
+    def range_digests(self, ranges: List[List]) -> List[List]:
+        """[count, fingerprint] of each key range (see vcp_reconcile_v1_0); never cached"""
+        response = self._request("POST", "/reconcile/digests", body={"ranges": ranges})
+        if response is None:
+            raise ExplorerError("Explorer /reconcile/digests not found", 404)
+        return response.json()["digests"]
+
+    def range_events(self, ranges: List[List]) -> List[List]:
+        """[timestamp_int, event_id, event_hash] entries of each key range"""
+        response = self._request("POST", "/reconcile/events", body={"ranges": ranges})
+        if response is None:
+            raise ExplorerError("Explorer /reconcile/events not found", 404)
+        return response.json()["events"]
+
+    def health(self) -> Dict:
+        response = self._request("GET", "/health")
+        return response.json() if response is not None else {}
+
+    def stats(self) -> Dict:
+        response = self._request("GET", "/stats")
+        return response.json() if response is not None else {}
+
+    def query_events(self, limit: Optional[int] = None, offset: int = 0, **filters) -> Dict:
+        """One page of /events (filters as in guide section 7.3)"""
+        params = {k: v for k, v in filters.items() if v is not None}
+        params["limit"] = min(limit or self.page_size, MAX_PAGE_SIZE)
+        params["offset"] = offset
+        return self._get("/events", params) or {"events": []}
+
+    def iter_events(self, page_size: Optional[int] = None, sort: str = "asc", **filters) -> Iterator[Dict]:
+        """
+        Stream every matching event, page by page
+
+        The first page is fetched alone; when it reports `total`, only the
+        pages that exist are prefetched, otherwise fetching runs up to
+        `prefetch` pages ahead and stops at the first short page.
+        """
+        limit = min(page_size or self.page_size, MAX_PAGE_SIZE)
+        offset = filters.pop("offset", 0)
+        filters["sort"] = sort
+        page = self.query_events(limit, offset, **filters)
+        events = page.get("events", [])
+        yield from events
+        if len(events) < limit:
+            return
+        total = page.get("total")
+        next_offset = offset + limit
+
+        if not self.prefetch:
+            while total is None or next_offset < total:
+                events = self.query_events(limit, next_offset, **filters).get("events", [])
+                yield from events
+                if len(events) < limit:
+                    return
+                next_offset += limit
+            return
+
+        pool = ThreadPoolExecutor(self.prefetch, thread_name_prefix="vcp-explorer")
+        pending = deque()
+        try:
+            while True:
+                while len(pending) < self.prefetch and (total is None or next_offset < total):
+                    pending.append(pool.submit(self.query_events, limit, next_offset, **filters))
+                    next_offset += limit
+                if not pending:
+                    return
+                events = pending.popleft().result().get("events", [])
+                yield from events
+                if len(events) < limit:
+                    return
+        finally:
+            for future in pending:
+                future.cancel()
+            pool.shutdown(wait=True)
@@ -0,0 +1,256 @@
+#!/usr/bin/env python3
+"""
+VCP Heartbeat Scheduler v1.0 - Traffic-aware Heartbeats on a Timer Wheel
+Document ID: VSO-SDK-PY-013
+License: CC BY 4.0 International
+Maintainer: VeritasChain Standards Organization (VSO)
+
+This module replaces the fixed-interval heartbeat loop of guide section 8.1:
+- An HBT is emitted only after `idle_gap` seconds without any event, so a
+  busy venue or account sends none and an idle one sends one per gap
+- Liveness is unchanged: no entity is silent for longer than
+  idle_gap + tick, the same bound a fixed heartbeat_interval gives
+- One hashed timer wheel and one thread serve any number of adapters or
+  accounts; recording activity is a single attribute write and timers
+  are re-armed lazily when they fire
+
+Usage:
+    scheduler = HeartbeatScheduler(idle_gap=60.0)
+    scheduler.attach(adapter)          # Activity read from adapter.last_event_time
+    scheduler.register(("acct", "12345"), emit_fn)
+    scheduler.touch(("acct", "12345"))  # On every real event of the account
+    scheduler.start()
+"""
+
+import logging
+import math
+import random
+import time
+from dataclasses import dataclass
+from threading import Event, Lock, Thread
+from typing import Any, Callable, Dict, Hashable, List, Optional
+
+from vcp_metrics_v1_0 import REGISTRY
+
+logger = logging.getLogger("vcp_heartbeat")
+
+_emitted = REGISTRY.counter("vcp_heartbeat_emitted_total", "Heartbeats emitted after an idle gap")
+_suppressed = REGISTRY.counter(
+    "vcp_heartbeat_suppressed_total", "Heartbeat timers that found newer activity and were re-armed"
+)
+_emit_errors = REGISTRY.counter("vcp_heartbeat_emit_errors_total", "Heartbeat emit functions that raised")
+_entities = REGISTRY.gauge("vcp_heartbeat_entities", "Entities scheduled for heartbeats")
+_tick_seconds = REGISTRY.histogram(
+    "vcp_heartbeat_tick_seconds", "Time to process one scheduler tick",
+    buckets=(0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5)
+)
+
+
+# =============================================================================
+# Timer Wheel
+# =============================================================================
+class TimerWheel:
+    """
+    Hashed timing wheel: O(1) schedule and cancel, expiry found per tick
+
+    A deadline fires at the first tick boundary at or after it. Deadlines
+    more than one revolution ahead share a slot with nearer ones and are
+    skipped until their tick comes round.
+    """
+
+    def __init__(self, tick: float = 1.0, slots: int = 1024, start: float = 0.0):
+        self.tick = tick
+        self._slots: List[Dict[Hashable, int]] = [{} for _ in range(slots)]
+        self._where: Dict[Hashable, int] = {}   # key -> slot index
+        self._current = int(start // tick)      # Next tick to process
+
+    def __len__(self) -> int:
+        return len(self._where)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._where
+
+    def schedule(self, key: Hashable, deadline: float):
+        """(Re)arm the timer of key"""
+        self.cancel(key)
+        expiry = max(self._current, math.ceil(deadline / self.tick))
+        index = expiry % len(self._slots)
+        self._slots[index][key] = expiry
+        self._where[key] = index
+
+    def cancel(self, key: Hashable):
+        index = self._where.pop(key, None)
+        if index is not None:
+            del self._slots[index][key]
+
+    def advance(self, now: float) -> List[Hashable]:
+        """Keys whose deadline passed by `now`, removed from the wheel"""
+        target = int(now // self.tick)
+        expired: List[Hashable] = []
+        if target - self._current >= len(self._slots):
+            # Fell a whole revolution behind (clock jump): one pass over every slot
+            ticks = [(index, target) for index in range(len(self._slots))]
+            self._current = target + 1
+        else:
+            ticks = [(t % len(self._slots), t) for t in range(self._current, target + 1)]
+            self._current = max(self._current, target + 1)
+        for index, tick in ticks:
+            slot = self._slots[index]
+            if not slot:
+                continue
+            due = [key for key, expiry in slot.items() if expiry <= tick]
+            for key in due:
+                del slot[key]
+                del self._where[key]
+            expired.extend(due)
+        return expired
+
+
+# =============================================================================
+# Heartbeat Scheduler
+# =============================================================================
+@dataclass
+class _Entity:
+    emit: Callable[[], Any]
+    activity: Optional[Callable[[], Optional[float]]]
+    idle_gap: float
+    last_activity: float
+
+
+class HeartbeatScheduler:
+    """
+    Emits a heartbeat for each registered entity after `idle_gap` seconds
+    without activity
+
+    Activity comes from touch(key) or from the entity's `activity`
+    function (e.g. lambda: adapter.last_event_time), read only when its
+    timer fires. The first deadline is pulled in by up to `jitter` x
+    idle_gap at random so entities registered together do not all fire in
+    one tick. Times are wall-clock seconds (time.time), like
+    adapter.last_event_time.
+    """
+
+    def __init__(
+        self,
+        idle_gap: float = 60.0,
+        tick: float = 1.0,
+        slots: int = 1024,
+        jitter: float = 0.1,
+        clock: Callable[[], float] = time.time
+    ):
+        self.idle_gap = idle_gap
+        self.tick = tick
+        self.jitter = jitter
+        self._clock = clock
+        self._wheel = TimerWheel(tick, slots, start=clock())
+        self._entities: Dict[Hashable, _Entity] = {}
+        self._lock = Lock()
+        self._stop = Event()
+        self._thread: Optional[Thread] = None
+        self._random = random.Random()
+        _entities.set_function(lambda: len(self._entities))
+
+    # -------------------------------------------------------------------------
+    def register(
+        self,
+        key: Hashable,
+        emit: Callable[[], Any],
+        activity: Optional[Callable[[], Optional[float]]] = None,
+        idle_gap: Optional[float] = None
+    ):
+        """Schedule heartbeats for key; emit() sends one HBT"""
+        idle_gap = idle_gap or self.idle_gap
+        # Backdate the initial activity, so the lazy re-arm keeps the jitter
+        since = self._clock() - idle_gap * self.jitter * self._random.random()
+        entity = _Entity(emit, activity, idle_gap, since)
+        with self._lock:
+            self._entities[key] = entity
+            self._wheel.schedule(key, since + idle_gap)
+
+    def attach(self, adapter, lock=None, idle_gap: Optional[float] = None) -> Hashable:
+        """
+        Schedule a VCPManagerAdapter by venue_id. send_heartbeat holds the
+        adapter's factory_lock; pass a lock only for producers using another.
+        """
+        if lock is None:
+            emit = adapter.send_heartbeat
+        else:
+            def emit_locked():
+                with lock:
+                    adapter.send_heartbeat()
+            emit = emit_locked
+        self.register(adapter.venue_id, emit, lambda: adapter.last_event_time, idle_gap)
+        return adapter.venue_id
+
+    def unregister(self, key: Hashable):
+        with self._lock:
+            self._entities.pop(key, None)
+            self._wheel.cancel(key)
+
+    def touch(self, key: Hashable, at: Optional[float] = None):
+        """Record activity for key (hot path: no lock, no timer change)"""
+        entity = self._entities.get(key)
+        if entity is not None:
+            entity.last_activity = at if at is not None else self._clock()
+
+    def __len__(self) -> int:
+        return len(self._entities)
+
+    # -------------------------------------------------------------------------
+    def poll(self, now: Optional[float] = None) -> int:
+        """Process due timers; returns the number of heartbeats emitted"""
+        started = time.perf_counter()
+        now = self._clock() if now is None else now
+        with self._lock:
+            due = [(key, self._entities.get(key)) for key in self._wheel.advance(now)]
+        emitted = 0
+        rearm = []
+        for key, entity in due:
+            if entity is None:
+                continue
+            if entity.activity is not None:
+                last = entity.activity()
+                if last is not None and last > entity.last_activity:
+                    entity.last_activity = last
+            deadline = entity.last_activity + entity.idle_gap
+            if deadline > now:
+                _suppressed.inc()
+                rearm.append((key, entity, deadline))
+                continue
+            try:
+                entity.emit()
+                emitted += 1
+            except Exception as e:
+                _emit_errors.inc()
+                logger.error(f"Heartbeat for {key!r} failed: {e}")
+            entity.last_activity = now
+            rearm.append((key, entity, now + entity.idle_gap))
+        with self._lock:
+            for key, entity, deadline in rearm:
+                if self._entities.get(key) is entity:
+                    self._wheel.schedule(key, deadline)
+        if emitted:
+            _emitted.inc(emitted)
+        if due:
+            _tick_seconds.observe(time.perf_counter() - started)
+        return emitted
+
+    def _run(self):
+        while not self._stop.wait(self.tick - self._clock() % self.tick):
+            try:
+                self.poll()
+            except Exception as e:
+                logger.error(f"Heartbeat scheduler error: {e}")
+
+    def start(self) -> "HeartbeatScheduler":
+        self._stop.clear()
+        self._thread = Thread(target=self._run, name="vcp-heartbeat", daemon=True)
+        self._thread.start()
+        logger.info(f"Heartbeat scheduler started: {len(self)} entities, idle gap {self.idle_gap}s")
+        return self
+
+    def stop(self):
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=5)
+            self._thread = None
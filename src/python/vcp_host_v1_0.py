@@ -0,0 +1,298 @@
+#!/usr/bin/env python3
+"""
+VCP Sidecar Host v1.0 - Many Venue Adapters in One Process
+Document ID: VSO-SDK-PY-017
+License: CC BY 4.0 International
+Maintainer: VeritasChain Standards Organization (VSO)
+
+This module runs many VCPManagerAdapter instances side by side:
+- Each venue keeps its own factory (hash chain), dedup state, lanes,
+  resubmit buffer, circuit breaker and offline backlog
+- One upload pool of a few threads, each with its own VCC session,
+  serves every venue
+- One scheduler hands out turns round-robin over venues with pending
+  work, one adapter batch per venue per turn, so a flooding venue cannot
+  starve quiet ones; batches of several venues share one request
+- One metrics exporter and /health endpoint for the whole host
+
+Threads and connection pools are set by the pool size, not by the venue
+count.
+
+Usage:
+    host = SidecarHost(VCC_ENDPOINT, VCC_API_KEY, upload_workers=4, metrics_port=9464)
+    adapter = host.add_venue("VENUE_A", tier=Tier.SILVER, spill_dir="/var/lib/vcp/A")
+    host.start()
+    adapter.queue_event(event)   # Pollers and relays bind to the adapter as before
+    host.stop()
+"""
+
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from threading import Condition, Thread
+from typing import Callable, Dict, List, Optional
+
+from vcp_metrics_v1_0 import REGISTRY, MetricsServer
+from vcp_sidecar_adapter_v1_0 import Tier, VCCClient, VCPEvent, VCPManagerAdapter
+
+logger = logging.getLogger("vcp_host")
+
+_venues = REGISTRY.gauge("vcp_host_venues", "Venue adapters running in the host")
+_turns = REGISTRY.counter("vcp_host_turns_total", "Upload turns given to venues", ("kind",))
+_ready = REGISTRY.gauge("vcp_host_ready_venues", "Venues waiting for an upload turn")
+_errors = REGISTRY.counter("vcp_host_errors_total", "Unexpected errors while serving a venue")
+
+
+@dataclass
+class _Venue:
+    adapter: VCPManagerAdapter
+    batch: List[VCPEvent] = field(default_factory=list)  # Live batch kept for a retry
+    lines: List[str] = field(default_factory=list)       # Backlog batch kept for a retry
+    retry_at: float = 0.0
+    scheduled: bool = False  # In the ready ring or being served
+
+
+class SidecarHost:
+    """
+    Runs venue adapters without per-venue threads or sessions
+
+    add_venue() builds a VCPManagerAdapter that shares the host's first
+    VCC client and is started with workers=False. Queueing an event marks
+    its venue ready. Each upload worker takes venues from the head of the
+    ready ring and collects one live batch from each (up to the adapter's
+    batch_size) until the request holds batch_size events. It sends them
+    with its own client, and each venue applies its share of the result.
+    If the first venue has no live events, the turn sends one batch of its
+    offline backlog instead. Venues with work left go back to the tail.
+    At most one batch per venue is in flight, so each venue's events keep
+    their order. A venue whose send failed rests for retry_delay. A rescan
+    every rescan_interval picks up resubmissions that came due and venues
+    back from a rest.
+    """
+
+    def __init__(
+        self,
+        vcc_endpoint: str,
+        vcc_api_key: str,
+        upload_workers: int = 4,
+        batch_size: int = 500,
+        metrics_port: Optional[int] = None,
+        retry_delay: float = 1.0,
+        rescan_interval: float = 0.25,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self.vcc_endpoint = vcc_endpoint
+        self.vcc_api_key = vcc_api_key
+        self.batch_size = batch_size
+        self.retry_delay = retry_delay
+        self.rescan_interval = rescan_interval
+        self.metrics_port = metrics_port
+        self.clients = [VCCClient(vcc_endpoint, vcc_api_key) for _ in range(max(1, upload_workers))]
+        self._clock = clock
+        self._venues: Dict[str, _Venue] = {}
+        self._ready: deque = deque()
+        self._cond = Condition()
+        self._next_rescan = 0.0
+        self._running = False
+        self._threads: List[Thread] = []
+        self._metrics_server: Optional[MetricsServer] = None
+        _venues.set_function(lambda: len(self._venues))
+        _ready.set_function(lambda: len(self._ready))
+
+    def add_venue(self, venue_id: str, tier: str = Tier.SILVER, **kwargs) -> VCPManagerAdapter:
+        """Create the adapter of a venue (keyword arguments as for VCPManagerAdapter)"""
+        if venue_id in self._venues:
+            raise ValueError(f"Venue {venue_id!r} is already hosted")
+        adapter = VCPManagerAdapter(
+            venue_id, self.vcc_endpoint, self.vcc_api_key, tier, client=self.clients[0], **kwargs
+        )
+        venue = _Venue(adapter)
+        adapter.on_queued = lambda: self._wake(venue)
+        with self._cond:
+            self._venues[venue_id] = venue
+        if self._running:
+            adapter.start(workers=False)
+            self._wake(venue)
+        return adapter
+
+    def adapter(self, venue_id: str) -> VCPManagerAdapter:
+        return self._venues[venue_id].adapter
+
+    def __len__(self) -> int:
+        return len(self._venues)
+
+    # -------------------------------------------------------------------------
+    def _wake(self, venue: _Venue):
+        """Put venue in the ready ring unless it is there already (hot path: one read)"""
+        if venue.scheduled:
+            return
+        with self._cond:
+            if not venue.scheduled:
+                venue.scheduled = True
+                self._ready.append(venue)
+                self._cond.notify()
+
+    @staticmethod
+    def _has_work(venue: _Venue) -> bool:
+        adapter = venue.adapter
+        return bool(venue.batch or venue.lines or not adapter.event_queue.empty() or adapter.backlog.pending)
+
+    def _rescan(self, now: float):
+        """Wake venues with due resubmissions or back from a rest (called under _cond)"""
+        self._next_rescan = now + self.rescan_interval
+        for venue in self._venues.values():
+            if not venue.scheduled and now >= venue.retry_at and (
+                self._has_work(venue) or len(venue.adapter.resubmit)
+            ):
+                venue.scheduled = True
+                self._ready.append(venue)
+        if self._ready:
+            self._cond.notify_all()
+
+    def _run(self, client: VCCClient):
+        while self._running:
+            with self._cond:
+                now = self._clock()
+                if now >= self._next_rescan:
+                    self._rescan(now)
+                if not self._ready:
+                    self._cond.wait(max(0.0, self._next_rescan - now))
+                    continue
+                venue = self._ready.popleft()
+            self._turn(venue, client)
+
+    def _pop_ready(self) -> Optional[_Venue]:
+        with self._cond:
+            return self._ready.popleft() if self._ready else None
+
+    def _turn(self, first: _Venue, client: VCCClient):
+        """
+        One request: live batches of first and of the next ready venues
+        until batch_size events, or else one backlog batch of first
+        """
+        now = self._clock()
+        served, parts = [first], []
+        total = 0
+        try:
+            venue: Optional[_Venue] = first
+            while venue is not None:
+                adapter = venue.adapter
+                if now >= venue.retry_at:
+                    adapter._collect_batch(venue.batch, timeout=0)
+                    if venue.batch:
+                        if adapter.breaker.allow():
+                            parts.append(venue)
+                            total += len(venue.batch)
+                        else:
+                            venue.retry_at = now + 0.1
+                # Bounded by the ring: venues handed back below go to its tail
+                venue = self._pop_ready() if total < self.batch_size and len(served) < len(self._venues) else None
+                if venue is not None:
+                    served.append(venue)
+
+            if parts:
+                self._send(parts, client, now)
+                _turns.labels("live").inc()
+            else:
+                _turns.labels("drain" if self._drain(first, client, now) else "idle").inc()
+        except Exception as e:
+            logger.error(f"Error serving venue {first.adapter.venue_id}: {e}")
+            _errors.inc()
+            for venue in served:
+                venue.retry_at = now + self.retry_delay
+        finally:
+            # Cleared before the check, so an event queued meanwhile wakes the venue itself
+            for venue in served:
+                venue.scheduled = False
+            after = self._clock()
+            for venue in served:
+                if after >= venue.retry_at and self._has_work(venue):
+                    self._wake(venue)
+
+    def _send(self, parts: List[_Venue], client: VCCClient, now: float):
+        """Send the venues' live batches as one request; each venue applies its share of the result"""
+        if len(parts) == 1:
+            events = parts[0].batch
+            results = [(parts[0], client.send_batch(events))]
+        else:
+            result = client.send_batch([event for venue in parts for event in venue.batch])
+            refused = result.get("rejected") or {}
+            results = []
+            for venue in parts:
+                share = result
+                if refused:
+                    mine = {event.header.event_id: refused[event.header.event_id]
+                            for event in venue.batch if event.header.event_id in refused}
+                    if result["status"] == "rejected":  # Nothing was accepted, resent apart from mine
+                        share = {"status": "rejected", "rejected": mine}
+                    else:
+                        share = {"status": "partial" if mine else "ok", "rejected": mine}
+                results.append((venue, share))
+        for venue, result in results:
+            if venue.adapter._batch_sent(venue.batch, result, client):
+                venue.batch = []
+            elif not venue.adapter.breaker.is_open:
+                venue.retry_at = now + self.retry_delay
+
+    def _drain(self, venue: _Venue, client: VCCClient, now: float) -> bool:
+        """Send one backlog batch of venue; False if it had none"""
+        adapter = venue.adapter
+        if now < venue.retry_at:
+            return False
+        if not venue.lines:
+            venue.lines = adapter.backlog.take(adapter.drain_batch_size)
+        if not venue.lines:
+            return False
+        if not adapter.breaker.allow():
+            venue.retry_at = now + 0.1
+        elif adapter._drain_batch(venue.lines, client):
+            venue.lines = []
+        elif not adapter.breaker.is_open:
+            venue.retry_at = now + self.retry_delay
+        return True
+
+    # -------------------------------------------------------------------------
+    def start(self) -> "SidecarHost":
+        self._running = True
+        for venue in self._venues.values():
+            venue.adapter.start(workers=False)
+        self._threads = [
+            Thread(target=self._run, args=(client,), name=f"vcp-host-upload-{i}", daemon=True)
+            for i, client in enumerate(self.clients)
+        ]
+        for thread in self._threads:
+            thread.start()
+        if self.metrics_port is not None and self._metrics_server is None:
+            self._metrics_server = MetricsServer(port=self.metrics_port, health_fn=self.health_status)
+            self._metrics_server.start()
+        logger.info(f"Sidecar host started: {len(self._venues)} venues, {len(self._threads)} upload workers")
+        return self
+
+    def stop(self):
+        self._running = False
+        with self._cond:
+            self._cond.notify_all()
+        for thread in self._threads:
+            thread.join(timeout=5)
+        self._threads = []
+        for venue in self._venues.values():
+            venue.adapter.stop()
+        if self._metrics_server:
+            self._metrics_server.stop()
+            self._metrics_server = None
+        logger.info("Sidecar host stopped")
+
+    def health_status(self) -> Dict:
+        """Host summary plus each venue's adapter health, for /health"""
+        workers = sum(1 for thread in self._threads if thread.is_alive())
+        venues = {venue_id: venue.adapter.health_status() for venue_id, venue in self._venues.items()}
+        degraded = (self._running and workers < len(self._threads)) or any(
+            status["status"] != "ok" for status in venues.values()
+        )
+        return {
+            "status": "degraded" if degraded else "ok",
+            "upload_workers": workers,
+            "ready_venues": len(self._ready),
+            "venues": venues,
+        }
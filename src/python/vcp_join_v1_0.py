@@ -0,0 +1,277 @@
+#!/usr/bin/env python3
+"""
+VCP Cross-Layer Join v1.0 - EA Trace IDs for Manager API Deals
+Document ID: VSO-SDK-PY-008
+License: CC BY 4.0 International
+Maintainer: VeritasChain Standards Organization (VSO)
+
+This module joins the two logging layers of guide section 6 on order ticket:
+- EA-side events (SIG/ORD via the MQL5 bridge and relay) register their
+  trace_id under the order ticket in a bounded, time-windowed index
+- The Manager API adapter looks tickets up in O(1) when building EXE events
+- Deals that arrive before their EA order are held for a short grace period
+- Linked / late-linked / orphaned EXE counts are exported as metrics
+"""
+
+import logging
+import time
+from collections import OrderedDict
+from threading import Lock
+from typing import Callable, Dict, List, Optional, Tuple
+
+from vcp_metrics_v1_0 import REGISTRY
+from vcp_sidecar_core_v1_0 import EventTypeCode, VCPEvent
+
+logger = logging.getLogger("vcp_join")
+
+_joined = REGISTRY.counter(
+    "vcp_join_exe_events_total", "Manager EXE events by join result", ("result",)
+)
+_index_size = REGISTRY.gauge("vcp_join_index_entries", "Order tickets in the EA trace index")
+_pending_size = REGISTRY.gauge("vcp_join_pending_deals", "Deals waiting for their EA order")
+
+# EA event types that carry the order ticket in trade_data.order_id
+_TICKET_EVENT_TYPES = {
+    int(EventTypeCode.ORD), int(EventTypeCode.ACK), int(EventTypeCode.REJ),
+    int(EventTypeCode.MOD), int(EventTypeCode.CXL),
+}
+
+
+def _position(deal: Dict) -> Tuple[int, int]:
+    """(time, ticket) of a deal, as ordered by the poller's cursors"""
+    return int(deal.get('time', 0)), int(deal.get('ticket', 0))
+
+
+# =============================================================================
+# Trace Index
+# =============================================================================
+class TraceIndex:
+    """
+    order ticket -> EA trace_id, bounded by age and entry count
+
+    Entries are kept in insertion order, so expiry and eviction pop from
+    the front in O(1) amortized time.
+    """
+
+    def __init__(
+        self,
+        window_seconds: float = 3600.0,
+        max_entries: int = 500_000,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self.window_seconds = window_seconds
+        self.max_entries = max_entries
+        self._clock = clock
+        self._entries: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()
+        self.evicted = 0
+
+    def put(self, ticket: str, trace_id: str):
+        entries = self._entries
+        if ticket in entries:
+            entries.move_to_end(ticket)
+        entries[ticket] = (trace_id, self._clock())
+        if len(entries) > self.max_entries:
+            entries.popitem(last=False)
+            self.evicted += 1
+
+    def get(self, ticket: str) -> Optional[str]:
+        entry = self._entries.get(ticket)
+        return entry[0] if entry else None
+
+    def expire(self) -> int:
+        """Drop entries older than the window; returns how many"""
+        cutoff = self._clock() - self.window_seconds
+        entries = self._entries
+        removed = 0
+        while entries:
+            ticket, (_, inserted) = next(iter(entries.items()))
+            if inserted >= cutoff:
+                break
+            entries.popitem(last=False)
+            removed += 1
+        self.evicted += removed
+        return removed
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# =============================================================================
+# Join Engine
+# =============================================================================
+class TraceJoinEngine:
+    """
+    Streaming join of Manager API deals onto EA trace_ids
+
+    EA side (any thread):   engine.observe(event) / engine.record_trace(ticket, trace_id)
+    Manager side (one thread, e.g. ManagerPoller):
+        events = engine.process_deals(deals, account_id)
+        events += engine.release()   # periodically: late links and orphans
+
+    Deals whose ticket is unknown wait up to late_grace seconds. If the EA
+    order shows up in time they are linked to its trace_id; otherwise they
+    are emitted as orphans with a fresh trace_id. Event creation always
+    happens on the Manager side, so the factory's hash chain keeps a single
+    writer.
+    """
+
+    def __init__(
+        self,
+        adapter,
+        window_seconds: float = 3600.0,
+        max_entries: int = 500_000,
+        late_grace: float = 2.0,
+        max_pending: int = 100_000,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self.adapter = adapter
+        self.index = TraceIndex(window_seconds, max_entries, clock)
+        self.late_grace = late_grace
+        self.max_pending = max_pending
+        self._clock = clock
+        self._lock = Lock()
+        # ticket -> [(deal, account_id)], oldest first; parked time per ticket
+        self._pending: "OrderedDict[str, Tuple[float, List[Tuple[Dict, str]]]]" = OrderedDict()
+        self._pending_count = 0
+        # account_id -> (time, ticket) of its parked deals (see oldest_parked)
+        self._parked: Dict[str, set] = {}
+        self._ready: List[str] = []
+        self.stats = {"linked": 0, "late_linked": 0, "orphaned": 0}
+        self._linked = _joined.labels("linked")
+        self._late_linked = _joined.labels("late_linked")
+        self._orphaned = _joined.labels("orphaned")
+
+        adapter.trace_lookup = self.lookup
+
+    # -------------------------------------------------------------------------
+    # EA side
+    # -------------------------------------------------------------------------
+    def record_trace(self, ticket: str, trace_id: str):
+        """Register the EA trace_id for an order ticket"""
+        with self._lock:
+            self.index.put(ticket, trace_id)
+            if ticket in self._pending:
+                self._ready.append(ticket)
+
+    def observe(self, event: VCPEvent):
+        """Index an EA-side event if it carries an order ticket"""
+        if event.header.event_type_code not in _TICKET_EVENT_TYPES:
+            return
+        order_id = (event.payload.get("trade_data") or {}).get("order_id")
+        if order_id:
+            self.record_trace(str(order_id), event.header.trace_id)
+
+    def lookup(self, ticket: str) -> Optional[str]:
+        """O(1) adapter hook: EA trace_id for ticket, if known"""
+        return self.index.get(ticket)
+
+    # -------------------------------------------------------------------------
+    # Manager side
+    # -------------------------------------------------------------------------
+    def process_deals(self, deals: List[Dict], account_id: str) -> List[VCPEvent]:
+        """Transform deals whose EA order is known; park the rest"""
+        events = self.release()
+        now = self._clock()
+        with self._lock:
+            known, unlinked, parked = [], [], 0
+            for deal in deals:
+                ticket = str(deal.get('order', ''))
+                if self.index.get(ticket) is not None:
+                    known.append(deal)
+                elif not ticket or ticket in self.adapter.trace_id_map:
+                    unlinked.append(deal)  # No order, or a later fill of an orphaned order
+                else:
+                    entry = self._pending.get(ticket)
+                    if entry is None:
+                        self._pending[ticket] = (now, [(deal, account_id)])
+                    else:
+                        entry[1].append((deal, account_id))
+                    self._parked.setdefault(account_id, set()).add(_position(deal))
+                    parked += 1
+            self._pending_count += parked
+            overflow = self._take_overflow()
+
+        linked = self.adapter.process_deals(known, account_id)
+        self._linked.inc(len(linked))
+        self.stats["linked"] += len(linked)
+        events.extend(linked)
+        events.extend(self._emit([[(d, account_id) for d in unlinked]], linked=False))
+        events.extend(self._emit(overflow, linked=False))
+        _pending_size.set(self._pending_count)
+        return events
+
+    def release(self) -> List[VCPEvent]:
+        """Emit deals whose EA order arrived (late links) or whose grace expired (orphans)"""
+        cutoff = self._clock() - self.late_grace
+        with self._lock:
+            ready = [self._pop_pending(t) for t in self._ready if t in self._pending]
+            self._ready.clear()
+            expired = []
+            while self._pending:
+                ticket, (parked_at, _) = next(iter(self._pending.items()))
+                if parked_at > cutoff:
+                    break
+                expired.append(self._pop_pending(ticket))
+            self.index.expire()
+            _index_size.set(len(self.index))
+
+        events = self._emit(ready, linked=True)
+        events.extend(self._emit(expired, linked=False))
+        _pending_size.set(self._pending_count)
+        return events
+
+    def flush(self) -> List[VCPEvent]:
+        """Emit every parked deal now (e.g. on shutdown)"""
+        with self._lock:
+            parked = [self._pop_pending(t) for t in list(self._pending)]
+            self._ready.clear()
+        return self._emit(parked, linked=False)
+
+    def holds(self, deal: Dict) -> bool:
+        """True if deal is parked waiting for its EA order"""
+        key = (deal.get('ticket'), deal.get('time'))
+        with self._lock:
+            entry = self._pending.get(str(deal.get('order', '')))
+            return entry is not None and any((d.get('ticket'), d.get('time')) == key for d, _ in entry[1])
+
+    def oldest_parked(self, account_id: str) -> Optional[Tuple[int, int]]:
+        """(time, ticket) of the account's earliest parked deal, if any"""
+        with self._lock:
+            parked = self._parked.get(account_id)
+            return min(parked) if parked else None
+
+    def _pop_pending(self, ticket: str) -> List[Tuple[Dict, str]]:
+        _, deals = self._pending.pop(ticket)
+        self._pending_count -= len(deals)
+        for deal, account_id in deals:
+            parked = self._parked[account_id]
+            parked.discard(_position(deal))
+            if not parked:
+                del self._parked[account_id]
+        return deals
+
+    def _take_overflow(self) -> List[List[Tuple[Dict, str]]]:
+        """Oldest parked tickets beyond max_pending (caller holds the lock)"""
+        overflow = []
+        while self._pending_count > self.max_pending and self._pending:
+            overflow.append(self._pop_pending(next(iter(self._pending))))
+        return overflow
+
+    def _emit(self, groups: List[List[Tuple[Dict, str]]], linked: bool) -> List[VCPEvent]:
+        events = []
+        for group in groups:
+            for deal, account_id in group:
+                events.extend(self.adapter.process_deals([deal], account_id))
+        if events:
+            if linked:
+                self._late_linked.inc(len(events))
+                self.stats["late_linked"] += len(events)
+            else:
+                self._orphaned.inc(len(events))
+                self.stats["orphaned"] += len(events)
+                logger.debug(f"{len(events)} EXE events without an EA order")
+        return events
+
+    @property
+    def pending(self) -> int:
+        return self._pending_count
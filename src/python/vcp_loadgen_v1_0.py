@@ -0,0 +1,488 @@
+#!/usr/bin/env python3
+"""
+VCP Load Generator v1.0 - Synthetic MT5 Deal Streams
+Document ID: VSO-SDK-PY-004
+License: CC BY 4.0 International
+Maintainer: VeritasChain Standards Organization (VSO)
+
+This module provides realistic synthetic load for sizing sidecars:
+- MT5-shaped deal dicts (ticket, order, time, symbol, price, volume, commission)
+- Configurable account counts, symbol mix and fills-per-order distribution
+- Burst patterns: news spikes and reconnect floods
+- A driver that pushes deals through VCPManagerAdapter at a target rate
+  (or as fast as possible) and reports sustained throughput and latency
+"""
+
+import argparse
+import itertools
+import json
+import logging
+import math
+import random
+import time
+from dataclasses import dataclass, field, asdict
+from queue import Empty
+from threading import Event, Thread
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger("vcp_loadgen")
+
+
+# =============================================================================
+# Symbol Specifications
+# =============================================================================
+@dataclass
+class SymbolSpec:
+    """Price model and trading conventions for a synthetic symbol"""
+    start_price: float
+    digits: int
+    volatility: float            # Relative std-dev of one price step
+    commission_per_lot: float    # Charged as a negative amount per lot
+    volumes: Tuple[float, ...] = (0.01, 0.05, 0.1, 0.5, 1.0, 2.0)
+
+
+DEFAULT_SYMBOLS: Dict[str, SymbolSpec] = {
+    "EURUSD": SymbolSpec(1.08550, 5, 0.00005, 3.5),
+    "GBPUSD": SymbolSpec(1.26420, 5, 0.00006, 3.5),
+    "USDJPY": SymbolSpec(151.250, 3, 0.00005, 3.5),
+    "XAUUSD": SymbolSpec(2650.55, 2, 0.00010, 5.0),
+    "BTCUSD": SymbolSpec(65000.00, 2, 0.00030, 10.0, (0.01, 0.05, 0.1, 0.5)),
+    "US30": SymbolSpec(39000.0, 1, 0.00010, 2.0, (0.1, 0.5, 1.0, 5.0)),
+}
+
+DEFAULT_SYMBOL_MIX: Dict[str, float] = {
+    "EURUSD": 0.35,
+    "GBPUSD": 0.15,
+    "USDJPY": 0.15,
+    "XAUUSD": 0.25,
+    "BTCUSD": 0.05,
+    "US30": 0.05,
+}
+
+
+# =============================================================================
+# Load Profile
+# =============================================================================
+@dataclass
+class Burst:
+    """
+    Load burst
+    - news_spike: order rate multiplied by `multiplier` for `duration` seconds,
+      concentrated on `symbols` if given
+    - reconnect_flood: at `at`, deliver `backlog_seconds` worth of deals at
+      once, with deal times spread over the preceding backlog window
+    """
+    kind: str
+    at: float
+    duration: float = 0.0
+    multiplier: float = 1.0
+    backlog_seconds: float = 0.0
+    symbols: Optional[List[str]] = None
+
+
+@dataclass
+class LoadProfile:
+    """Shape of the synthetic deal stream"""
+    accounts: int = 100
+    orders_per_second: float = 100.0
+    symbol_mix: Dict[str, float] = field(default_factory=lambda: dict(DEFAULT_SYMBOL_MIX))
+    fills_per_order: Dict[int, float] = field(default_factory=lambda: {1: 0.8, 2: 0.15, 3: 0.05})
+    account_skew: float = 1.1        # Zipf exponent; 0 = uniform activity
+    bursts: List[Burst] = field(default_factory=list)
+    start_time: int = 1_700_000_000  # Unix seconds of offset 0
+    first_ticket: int = 10_000_000
+    first_order: int = 5_000_000
+
+
+@dataclass
+class ScheduledDeal:
+    """A deal and when (seconds from stream start) it becomes visible"""
+    offset: float
+    account_id: str
+    deal: Dict
+
+
+# =============================================================================
+# Deal Stream Generator
+# =============================================================================
+class DealStreamGenerator:
+    """Deterministic (seeded) generator of MT5-shaped deal streams"""
+
+    def __init__(
+        self,
+        profile: Optional[LoadProfile] = None,
+        seed: int = 42,
+        symbols: Optional[Dict[str, SymbolSpec]] = None
+    ):
+        self.profile = profile or LoadProfile()
+        self.symbols = symbols or DEFAULT_SYMBOLS
+        self._rng = random.Random(seed)
+        self._tickets = itertools.count(self.profile.first_ticket)
+        self._orders = itertools.count(self.profile.first_order)
+        self._prices = {name: spec.start_price for name, spec in self.symbols.items()}
+
+        unknown = set(self.profile.symbol_mix) - set(self.symbols)
+        if unknown:
+            raise ValueError(f"No SymbolSpec for: {sorted(unknown)}")
+
+        self._symbol_names = list(self.profile.symbol_mix)
+        self._symbol_weights = list(itertools.accumulate(self.profile.symbol_mix.values()))
+        self._fill_counts = list(self.profile.fills_per_order)
+        self._fill_weights = list(itertools.accumulate(self.profile.fills_per_order.values()))
+        self._accounts = [str(100000 + i) for i in range(self.profile.accounts)]
+        skew = self.profile.account_skew
+        self._account_weights = list(itertools.accumulate(
+            1.0 / (rank + 1) ** skew for rank in range(self.profile.accounts)
+        ))
+
+    # -------------------------------------------------------------------------
+    def _rate_at(self, offset: float) -> Tuple[float, Optional[List[str]]]:
+        rate = self.profile.orders_per_second
+        focus = None
+        for burst in self.profile.bursts:
+            if burst.kind == "news_spike" and burst.at <= offset < burst.at + burst.duration:
+                rate *= burst.multiplier
+                focus = burst.symbols or focus
+        return rate, focus
+
+    def _next_price(self, symbol: str) -> float:
+        spec = self.symbols[symbol]
+        price = self._prices[symbol] * (1.0 + self._rng.gauss(0.0, spec.volatility))
+        self._prices[symbol] = price
+        return round(price, spec.digits)
+
+    def _order_deals(self, account_id: str, symbol: str, deal_time: float) -> List[Dict]:
+        spec = self.symbols[symbol]
+        order = next(self._orders)
+        fills = self._rng.choices(self._fill_counts, cum_weights=self._fill_weights)[0]
+        total = self._rng.choice(spec.volumes)
+        # Split the order volume across fills on the 0.01 lot grid
+        lots = max(fills, int(round(total * 100)))
+        cuts = sorted(self._rng.sample(range(1, lots), fills - 1)) if fills > 1 else []
+        sizes = [b - a for a, b in zip([0] + cuts, cuts + [lots])]
+
+        deals = []
+        for i, size in enumerate(sizes):
+            volume = round(size / 100.0, 2)
+            when = deal_time + i * 0.001
+            deals.append({
+                "ticket": next(self._tickets),
+                "order": order,
+                "time": int(when),
+                "time_msc": int(when * 1000),
+                "login": int(account_id),
+                "symbol": symbol,
+                "price": self._next_price(symbol),
+                "volume": volume,
+                "commission": round(-spec.commission_per_lot * volume, 2),
+            })
+        return deals
+
+    def _pick_symbol(self, focus: Optional[List[str]]) -> str:
+        if focus:
+            return self._rng.choice(focus)
+        return self._rng.choices(self._symbol_names, cum_weights=self._symbol_weights)[0]
+
+    def _pick_account(self) -> str:
+        return self._rng.choices(self._accounts, cum_weights=self._account_weights)[0]
+
+    # -------------------------------------------------------------------------
+    def generate(self, duration: float) -> Iterator[ScheduledDeal]:
+        """Yield ScheduledDeals in non-decreasing offset order"""
+        floods = sorted(
+            (b for b in self.profile.bursts if b.kind == "reconnect_flood"),
+            key=lambda b: b.at
+        )
+        start_time = self.profile.start_time
+        offset = 0.0
+
+        while True:
+            rate, focus = self._rate_at(offset)
+            offset += self._rng.expovariate(rate) if rate > 0 else duration
+
+            # Reconnect floods due before this order are delivered first
+            while floods and floods[0].at <= min(offset, duration):
+                yield from self._flood(floods.pop(0), start_time)
+
+            if offset >= duration:
+                return
+
+            account_id = self._pick_account()
+            symbol = self._pick_symbol(focus)
+            for deal in self._order_deals(account_id, symbol, start_time + offset):
+                yield ScheduledDeal(offset, account_id, deal)
+
+    def _flood(self, burst: Burst, start_time: int) -> Iterator[ScheduledDeal]:
+        orders = int(burst.backlog_seconds * self.profile.orders_per_second)
+        window_start = burst.at - burst.backlog_seconds
+        times = sorted(self._rng.uniform(window_start, burst.at) for _ in range(orders))
+        for when in times:
+            account_id = self._pick_account()
+            symbol = self._pick_symbol(burst.symbols)
+            for deal in self._order_deals(account_id, symbol, start_time + when):
+                yield ScheduledDeal(burst.at, account_id, deal)
+
+    def deals(self, count: int) -> List[Dict]:
+        """Convenience: the first `count` deals, ignoring schedule and account"""
+        stream = self.generate(duration=float("inf"))
+        return [item.deal for item in itertools.islice(stream, count)]
+
+
+# =============================================================================
+# Load Driver
+# =============================================================================
+@dataclass
+class LoadReport:
+    """Outcome of one driver run"""
+    target_rate: Optional[float]
+    deals_offered: int
+    events_queued: int
+    events_dropped: int
+    elapsed_seconds: float
+    events_per_second: float
+    latency_ms: Dict[str, float]
+    max_lag_seconds: float
+    max_queue_depth: int
+    backpressure_at_event: Optional[int]
+    sustained_events_per_second: float
+
+    @property
+    def healthy(self) -> bool:
+        return self.events_dropped == 0 and self.backpressure_at_event is None
+
+    def to_dict(self) -> Dict:
+        return {**asdict(self), "healthy": self.healthy}
+
+    def format(self) -> str:
+        rate = "max" if self.target_rate is None else f"{self.target_rate:,.0f}/s"
+        lat = self.latency_ms
+        status = "OK" if self.healthy else (
+            f"back-pressure after {self.backpressure_at_event} events"
+            if self.backpressure_at_event is not None else "drops"
+        )
+        return (
+            f"rate={rate:>10}  queued={self.events_queued:>8}  dropped={self.events_dropped:>6}  "
+            f"eps={self.events_per_second:>10,.0f}  sustained={self.sustained_events_per_second:>10,.0f}  "
+            f"p50={lat['p50']:.3f}ms p99={lat['p99']:.3f}ms max={lat['max']:.3f}ms  "
+            f"lag={self.max_lag_seconds:.3f}s  depth={self.max_queue_depth}  [{status}]"
+        )
+
+
+def _percentile(sorted_values: List[float], q: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, math.ceil(q * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+class LoadDriver:
+    """
+    Pushes deal streams through a VCPManagerAdapter
+
+    With drain_locally=True (default) a helper thread empties the adapter
+    queue without uploading, so the run measures event production capacity.
+    Start the adapter (adapter.start()) and pass drain_locally=False to
+    measure the full pipeline including VCC upload.
+    """
+
+    def __init__(self, adapter, drain_locally: bool = True, max_lag: float = 1.0):
+        self.adapter = adapter
+        self.drain_locally = drain_locally
+        self.max_lag = max_lag
+
+    def _drain(self, stop: Event):
+        queue = self.adapter.event_queue
+        while not stop.is_set() or not queue.empty():
+            try:
+                queue.get(timeout=0.05)
+            except Empty:
+                pass
+
+    def run(
+        self,
+        stream: Iterable[ScheduledDeal],
+        target_rate: Optional[float] = None,
+        follow_schedule: bool = False
+    ) -> LoadReport:
+        """
+        Drive the stream through the adapter.
+        - target_rate: deals per second (None = as fast as possible)
+        - follow_schedule: pace by the generator's own offsets (bursts included)
+        """
+        stop = Event()
+        drainer = None
+        if self.drain_locally:
+            drainer = Thread(target=self._drain, args=(stop,), daemon=True)
+            drainer.start()
+
+        queue = self.adapter.event_queue
+        latencies: List[float] = []
+        offered = queued = dropped = 0
+        max_lag = 0.0
+        max_depth = 0
+        backpressure_at = None
+        backpressure_elapsed = None
+
+        started = time.perf_counter()
+        try:
+            for index, item in enumerate(stream):
+                if follow_schedule:
+                    due = started + item.offset
+                elif target_rate:
+                    due = started + index / target_rate
+                else:
+                    due = time.perf_counter()
+
+                now = time.perf_counter()
+                if due > now:
+                    time.sleep(due - now)
+                lag = max(0.0, time.perf_counter() - due)
+
+                offered += 1
+                for event in self.adapter.process_deals([item.deal], item.account_id):
+                    if self.adapter.queue_event(event):
+                        queued += 1
+                    else:
+                        dropped += 1
+                done = time.perf_counter()
+                latencies.append(done - due)
+
+                max_lag = max(max_lag, lag)
+                depth = queue.qsize()
+                max_depth = max(max_depth, depth)
+                if backpressure_at is None and (dropped or lag > self.max_lag):
+                    backpressure_at = queued
+                    backpressure_elapsed = done - started
+        finally:
+            elapsed = time.perf_counter() - started
+            stop.set()
+            if drainer:
+                drainer.join(timeout=5)
+
+        latencies.sort()
+        to_ms = 1000.0
+        if backpressure_at is not None and backpressure_elapsed:
+            sustained = backpressure_at / backpressure_elapsed
+        else:
+            sustained = queued / elapsed if elapsed else 0.0
+        return LoadReport(
+            target_rate=target_rate,
+            deals_offered=offered,
+            events_queued=queued,
+            events_dropped=dropped,
+            elapsed_seconds=elapsed,
+            events_per_second=queued / elapsed if elapsed else 0.0,
+            latency_ms={
+                "p50": _percentile(latencies, 0.50) * to_ms,
+                "p95": _percentile(latencies, 0.95) * to_ms,
+                "p99": _percentile(latencies, 0.99) * to_ms,
+                "max": (latencies[-1] if latencies else 0.0) * to_ms,
+            },
+            max_lag_seconds=max_lag,
+            max_queue_depth=max_depth,
+            backpressure_at_event=backpressure_at,
+            sustained_events_per_second=sustained,
+        )
+
+
+def sweep(
+    adapter_factory,
+    profile: LoadProfile,
+    rates: List[float],
+    duration: float = 5.0,
+    seed: int = 42,
+    drain_locally: bool = True
+) -> List[LoadReport]:
+    """
+    Run the driver at increasing target rates (fresh adapter each step)
+    and stop after the first unhealthy step. The last healthy report's
+    rate is the sizing figure for this host.
+    """
+    reports = []
+    for rate in rates:
+        adapter = adapter_factory()
+        generator = DealStreamGenerator(profile, seed=seed)
+        stream = itertools.islice(generator.generate(float("inf")), int(rate * duration))
+        report = LoadDriver(adapter, drain_locally=drain_locally).run(stream, target_rate=rate)
+        if not drain_locally:
+            adapter.stop()
+        reports.append(report)
+        logger.info(report.format())
+        if not report.healthy:
+            break
+    return reports
+
+
+# =============================================================================
+# Command Line
+# =============================================================================
+def _parse_spike(text: str) -> Burst:
+    at, duration, multiplier = (float(x) for x in text.split(":"))
+    return Burst("news_spike", at=at, duration=duration, multiplier=multiplier)
+
+
+def _parse_flood(text: str) -> Burst:
+    at, backlog = (float(x) for x in text.split(":"))
+    return Burst("reconnect_flood", at=at, backlog_seconds=backlog)
+
+
+def main():
+    from vcp_sidecar_adapter_v1_0 import VCPManagerAdapter
+
+    parser = argparse.ArgumentParser(description="Drive synthetic MT5 deals through VCPManagerAdapter")
+    parser.add_argument("--accounts", type=int, default=100)
+    parser.add_argument("--orders-per-second", type=float, default=200.0,
+                        help="Base order arrival rate of the generated schedule")
+    parser.add_argument("--duration", type=float, default=10.0, help="Schedule length in seconds")
+    parser.add_argument("--rate", type=float, help="Target deals/sec (default: as fast as possible)")
+    parser.add_argument("--schedule", action="store_true",
+                        help="Pace by the generated schedule (bursts included)")
+    parser.add_argument("--sweep", type=str, help="Comma-separated rates to step through")
+    parser.add_argument("--news-spike", action="append", default=[], metavar="AT:DURATION:MULT")
+    parser.add_argument("--reconnect-flood", action="append", default=[], metavar="AT:BACKLOG_SECONDS")
+    parser.add_argument("--endpoint", help="Upload to this VCC endpoint instead of draining locally")
+    parser.add_argument("--api-key", default="loadgen")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--json", action="store_true", help="Print reports as JSON")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    logging.getLogger("vcp_adapter").setLevel(logging.ERROR)
+
+    profile = LoadProfile(
+        accounts=args.accounts,
+        orders_per_second=args.orders_per_second,
+        bursts=[_parse_spike(s) for s in args.news_spike]
+        + [_parse_flood(f) for f in args.reconnect_flood],
+    )
+
+    def make_adapter():
+        adapter = VCPManagerAdapter(
+            venue_id="LOADGEN",
+            vcc_endpoint=args.endpoint or "http://127.0.0.1:9",
+            vcc_api_key=args.api_key,
+        )
+        for symbol, spec in DEFAULT_SYMBOLS.items():
+            adapter.digits.set(symbol, spec.digits)
+        if args.endpoint:
+            adapter.start()
+        return adapter
+
+    if args.sweep:
+        rates = [float(r) for r in args.sweep.split(",")]
+        reports = sweep(make_adapter, profile, rates, args.duration, args.seed,
+                        drain_locally=not args.endpoint)
+    else:
+        adapter = make_adapter()
+        stream = DealStreamGenerator(profile, seed=args.seed).generate(args.duration)
+        driver = LoadDriver(adapter, drain_locally=not args.endpoint)
+        reports = [driver.run(stream, target_rate=args.rate, follow_schedule=args.schedule)]
+        if args.endpoint:
+            adapter.stop()
+
+    for report in reports:
+        print(json.dumps(report.to_dict()) if args.json else report.format())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,326 @@
+#!/usr/bin/env python3
+"""
+VCP Merkle Anchors v1.0 - Sublinear Verification of the Event Chain
+Document ID: VSO-SDK-PY-011
+License: CC BY 4.0 International
+Maintainer: VeritasChain Standards Organization (VSO)
+
+This module lets auditors verify one event without walking the whole
+prev_hash chain from genesis:
+- Every N events or T seconds the factory emits an anchor event (AUD)
+  carrying the RFC 6962 Merkle root of the event hashes since the last
+  anchor and the event_hash of the previous anchor
+- Inclusion proofs for events of recent windows (RFC 9162 audit paths)
+- Verification of an event = its hash + inclusion proof + the anchor chain
+  from its anchor to a trusted head: O(log N + anchors)
+- Trees hash with the factory's hash_algo (see HASH_ALGORITHMS in
+  vcp_sidecar_core_v1_0); each anchor names its algorithm in tree_alg
+
+Anchor payload:
+    {"vcp_anchor": {"merkle_root": "...", "tree_size": 10000,
+                    "first_sequence": 1, "anchor_index": 0,
+                    "prev_anchor_hash": "000...", "tree_alg": "RFC6962-SHA256"}}
+"""
+
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from typing import Callable, Dict, List, Optional, Sequence
+
+from vcp_metrics_v1_0 import REGISTRY
+from vcp_sidecar_core_v1_0 import (
+    DEFAULT_HASH_ALGO, EventTypeCode, VCPEvent, compute_event_hash, get_hash_algo
+)
+
+logger = logging.getLogger("vcp_merkle")
+
+TREE_ALG_PREFIX = "RFC6962-"
+TREE_ALG = TREE_ALG_PREFIX + DEFAULT_HASH_ALGO
+GENESIS = "0" * 64
+
+_anchors_emitted = REGISTRY.counter("vcp_merkle_anchors_total", "Merkle anchor events emitted")
+_anchor_leaves = REGISTRY.histogram(
+    "vcp_merkle_anchor_leaves", "Events covered per anchor",
+    buckets=(10, 100, 1000, 10000, 100000, 1000000)
+)
+_anchor_seconds = REGISTRY.histogram("vcp_merkle_anchor_seconds", "Time to build an anchor tree")
+
+
+# =============================================================================
+# RFC 6962 Merkle Tree
+# =============================================================================
+def tree_hash_algo(tree_alg: str) -> str:
+    """hash_algo of a tree_alg name ("RFC6962-SHA256" -> "SHA256")"""
+    if not tree_alg.startswith(TREE_ALG_PREFIX):
+        raise ValueError(f"Unsupported tree algorithm {tree_alg!r}")
+    return tree_alg[len(TREE_ALG_PREFIX):]
+
+
+def leaf_hash(data: bytes, hash_algo: str = DEFAULT_HASH_ALGO) -> bytes:
+    return get_hash_algo(hash_algo)(b"\x00" + data).digest()
+
+
+def node_hash(left: bytes, right: bytes, hash_algo: str = DEFAULT_HASH_ALGO) -> bytes:
+    return get_hash_algo(hash_algo)(b"\x01" + left + right).digest()
+
+
+class MerkleTree:
+    """
+    RFC 6962 tree over raw 32-byte event hashes
+
+    Built bottom-up; a lone last node is carried to the next level, which
+    gives the same root and audit paths as the recursive RFC definition.
+    """
+
+    def __init__(self, leaves: Sequence[bytes], hash_algo: str = DEFAULT_HASH_ALGO):
+        digest = self._hash = get_hash_algo(hash_algo)
+        self.hash_algo = hash_algo
+        self.leaves = leaves
+        level = [digest(b"\x00" + leaf).digest() for leaf in leaves]
+        self.size = len(level)
+        self.levels: List[List[bytes]] = [level]
+        while len(level) > 1:
+            parent = [digest(b"\x01" + level[i] + level[i + 1]).digest()
+                      for i in range(0, len(level) - 1, 2)]
+            if len(level) % 2:
+                parent.append(level[-1])
+            self.levels.append(parent)
+            level = parent
+
+    @property
+    def root(self) -> bytes:
+        return self.levels[-1][0] if self.size else self._hash(b"").digest()
+
+    def proof(self, index: int) -> List[bytes]:
+        """Audit path for the leaf at index, bottom-up"""
+        if not 0 <= index < self.size:
+            raise IndexError(f"leaf {index} outside tree of size {self.size}")
+        path = []
+        for level in self.levels[:-1]:
+            sibling = index ^ 1
+            if sibling < len(level):
+                path.append(level[sibling])
+            index //= 2
+        return path
+
+
+def verify_inclusion(
+    leaf: bytes, index: int, size: int, path: Sequence[bytes], root: bytes,
+    hash_algo: str = DEFAULT_HASH_ALGO
+) -> bool:
+    """RFC 9162 section 2.1.3.2 inclusion proof verification"""
+    if index >= size:
+        return False
+    fn, sn = index, size - 1
+    r = leaf_hash(leaf, hash_algo)
+    for p in path:
+        if sn == 0:
+            return False
+        if fn & 1 or fn == sn:
+            r = node_hash(p, r, hash_algo)
+            if not fn & 1:
+                while not fn & 1 and fn != 0:
+                    fn >>= 1
+                    sn >>= 1
+        else:
+            r = node_hash(r, p, hash_algo)
+        fn >>= 1
+        sn >>= 1
+    return sn == 0 and r == root
+
+
+# =============================================================================
+# Inclusion Proofs
+# =============================================================================
+@dataclass
+class InclusionProof:
+    """Proof that the event with `sequence` is covered by an anchor"""
+    sequence: int
+    event_hash: str
+    leaf_index: int
+    tree_size: int
+    path: List[str]
+    merkle_root: str
+    anchor_index: int
+    anchor_event_id: str
+    tree_alg: str = TREE_ALG
+
+    def to_dict(self) -> Dict:
+        return asdict(self)
+
+    def verify(self) -> bool:
+        return verify_inclusion(
+            bytes.fromhex(self.event_hash), self.leaf_index, self.tree_size,
+            [bytes.fromhex(p) for p in self.path], bytes.fromhex(self.merkle_root),
+            tree_hash_algo(self.tree_alg)
+        )
+
+
+def anchor_info(event: VCPEvent) -> Optional[Dict]:
+    """The vcp_anchor payload of an anchor event, else None"""
+    if event.header.event_type_code != int(EventTypeCode.AUD):
+        return None
+    return event.payload.get("vcp_anchor")
+
+
+def verify_anchor_chain(anchors: Sequence[VCPEvent]) -> bool:
+    """
+    Check anchors (oldest first): each hash recomputes and each links to
+    the previous one. The last anchor should match a trusted head.
+    """
+    prev = None
+    for anchor in anchors:
+        info = anchor_info(anchor)
+        if info is None or compute_event_hash(anchor) != anchor.security.event_hash:
+            return False
+        if prev is not None and info.get("prev_anchor_hash") != prev.security.event_hash:
+            return False
+        prev = anchor
+    return True
+
+
+def verify_event(event: VCPEvent, proof: InclusionProof, anchors: Sequence[VCPEvent]) -> bool:
+    """
+    Verify one event against the anchor chain
+
+    anchors runs from the anchor covering the event to a trusted head.
+    """
+    if not anchors or compute_event_hash(event) != event.security.event_hash:
+        return False
+    info = anchor_info(anchors[0])
+    if (info is None or proof.event_hash != event.security.event_hash or
+            info.get("merkle_root") != proof.merkle_root or
+            info.get("tree_size") != proof.tree_size or
+            info.get("tree_alg", TREE_ALG) != proof.tree_alg):
+        return False
+    return proof.verify() and verify_anchor_chain(anchors)
+
+
+# =============================================================================
+# Anchorer
+# =============================================================================
+class MerkleAnchorer:
+    """
+    Emits an anchor event every `every_events` events or `every_seconds`
+
+        anchorer = MerkleAnchorer(adapter.factory, every_events=10000, every_seconds=60)
+
+    The factory reports every chained event; VCPManagerAdapter.queue_event
+    emits the anchor once the event that made it due is queued. Without an
+    adapter, call `if anchorer.due(): events.append(anchorer.emit())` after
+    creating events. The trees of the last `keep_trees` anchors are kept to
+    serve inclusion proofs.
+    """
+
+    def __init__(
+        self,
+        factory,
+        every_events: int = 10000,
+        every_seconds: float = 60.0,
+        keep_trees: int = 16,
+        clock: Callable[[], float] = time.monotonic,
+        hash_algo: Optional[str] = None
+    ):
+        self.factory = factory
+        # Tree hash; None follows factory.hash_algo at each anchor
+        self.hash_algo = hash_algo
+        self.every_events = every_events
+        self.every_seconds = every_seconds
+        self.keep_trees = keep_trees
+        self._clock = clock
+        self.anchor_index = 0
+        self.prev_anchor_hash = GENESIS
+        self._leaves: List[bytes] = []
+        self._first_sequence = 0
+        self._window_started = clock()
+        self._emitting = False
+        # anchor_index -> (first_sequence, tree, anchor event_id)
+        self._trees: "OrderedDict[int, tuple]" = OrderedDict()
+        factory.anchorer = self
+
+    def observe(self, event: VCPEvent, sequence: int):
+        """Factory hook: add a chained event to the current window"""
+        if self._emitting:
+            return
+        if not self._leaves:
+            self._first_sequence = sequence
+        self._leaves.append(bytes.fromhex(event.security.event_hash))
+
+    def due(self, event: Optional[VCPEvent] = None) -> bool:
+        """Whether to anchor now; with `event`, only if it is the chain head"""
+        if not self._leaves:
+            return False
+        if event is not None and event.security.event_hash != self.factory.prev_hash:
+            return False  # More events were created after it; anchor after the last one
+        return (len(self._leaves) >= self.every_events or
+                self._clock() - self._window_started >= self.every_seconds)
+
+    def emit(self) -> VCPEvent:
+        """Create the anchor event for the current window"""
+        started = time.perf_counter()
+        hash_algo = self.hash_algo or self.factory.hash_algo
+        tree = MerkleTree(self._leaves, hash_algo)
+        payload = {"vcp_anchor": {
+            "merkle_root": tree.root.hex(),
+            "tree_size": tree.size,
+            "first_sequence": self._first_sequence,
+            "anchor_index": self.anchor_index,
+            "prev_anchor_hash": self.prev_anchor_hash,
+            "tree_alg": TREE_ALG_PREFIX + hash_algo,
+        }}
+        self._emitting = True
+        try:
+            anchor = self.factory.create_event(EventTypeCode.AUD, symbol="", account_id="", payload=payload)
+        finally:
+            self._emitting = False
+
+        if self.keep_trees:
+            self._trees[self.anchor_index] = (self._first_sequence, tree, anchor.header.event_id)
+            while len(self._trees) > self.keep_trees:
+                self._trees.popitem(last=False)
+        _anchors_emitted.inc()
+        _anchor_leaves.observe(tree.size)
+        _anchor_seconds.observe(time.perf_counter() - started)
+        logger.debug(f"Anchor {self.anchor_index}: {tree.size} events, root {tree.root.hex()[:16]}")
+
+        self.anchor_index += 1
+        self.prev_anchor_hash = anchor.security.event_hash
+        self._leaves = []
+        self._window_started = self._clock()
+        return anchor
+
+    def proof(self, sequence: int) -> Optional[InclusionProof]:
+        """Inclusion proof for a chained event of a retained window"""
+        for anchor_index, (first, tree, anchor_event_id) in self._trees.items():
+            index = sequence - first
+            if 0 <= index < tree.size:
+                return InclusionProof(
+                    sequence=sequence,
+                    event_hash=tree.leaves[index].hex(),
+                    leaf_index=index,
+                    tree_size=tree.size,
+                    path=[p.hex() for p in tree.proof(index)],
+                    merkle_root=tree.root.hex(),
+                    anchor_index=anchor_index,
+                    anchor_event_id=anchor_event_id,
+                    tree_alg=TREE_ALG_PREFIX + tree.hash_algo,
+                )
+        return None
+
+    def state(self) -> tuple:
+        """(anchor_index, prev_anchor_hash, first_sequence, leaves) for checkpoints"""
+        return self.anchor_index, self.prev_anchor_hash, self._first_sequence, list(self._leaves)
+
+    def restore_state(self, anchor_index: int, prev_anchor_hash: str, first_sequence: int,
+                      leaves: List[bytes]):
+        """Continue the anchor chain and open window after a restart"""
+        self.anchor_index = anchor_index
+        self.prev_anchor_hash = prev_anchor_hash
+        self._first_sequence = first_sequence
+        self._leaves = list(leaves)
+
+    @property
+    def pending(self) -> int:
+        return len(self._leaves)
+
@@ -0,0 +1,479 @@
+#!/usr/bin/env python3
+"""
+VCP Sidecar Metrics v1.0 - Prometheus-style Instrumentation
+Document ID: VSO-SDK-PY-002
+License: CC BY 4.0 International
+Maintainer: VeritasChain Standards Organization (VSO)
+
+This module provides a dependency-free metrics registry for the sidecar:
+- Counters, gauges and histograms with optional labels
+- Prometheus text exposition format (v0.0.4)
+- Optional local HTTP exporter with /metrics and /health endpoints
+"""
+
+import bisect
+import json
+import logging
+import time
+from threading import Lock, Thread
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger("vcp_metrics")
+
+
+# Default latency buckets (seconds) - tuned for sub-millisecond hot paths
+# up to multi-second network round-trips
+DEFAULT_BUCKETS = (
+    0.00001, 0.000025, 0.00005, 0.0001, 0.00025, 0.0005,
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05,
+    0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+)
+
+
+def _format_value(value: float) -> str:
+    """Format a sample value for the text exposition format"""
+    if value == float("inf"):
+        return "+Inf"
+    if value == float("-inf"):
+        return "-Inf"
+    if value != value:
+        return "NaN"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(
+        f'{name}="{_escape_label(str(value))}"' for name, value in zip(names, values)
+    )
+    return "{" + pairs + "}"
+
+
+# =============================================================================
+# Metric Types
+# =============================================================================
+class Counter:
+    """Monotonically increasing counter"""
+
+    __slots__ = ("_value", "_lock")
+
+    def __init__(self):
+        self._value = 0.0
+        self._lock = Lock()
+
+    def inc(self, amount: float = 1.0):
+        """Increment counter by amount (must be non-negative)"""
+        with self._lock:
+            self._value += amount
+
+    @property
+    def value(self) -> float:
+        return self._value
+
+    def _samples(self, name: str) -> List[Tuple[str, str, float]]:
+        return [(name, "", self._value)]
+
+
+class Gauge:
+    """Value that can go up and down, or be computed on scrape"""
+
+    __slots__ = ("_value", "_lock", "_function")
+
+    def __init__(self):
+        self._value = 0.0
+        self._lock = Lock()
+        self._function: Optional[Callable[[], float]] = None
+
+    def set(self, value: float):
+        self._value = value
+
+    def inc(self, amount: float = 1.0):
+        with self._lock:
+            self._value += amount
+
+    def dec(self, amount: float = 1.0):
+        with self._lock:
+            self._value -= amount
+
+    def set_function(self, function: Callable[[], float]):
+        """Compute the gauge value lazily at scrape time (e.g. queue.qsize)"""
+        self._function = function
+
+    @property
+    def value(self) -> float:
+        if self._function is not None:
+            try:
+                return float(self._function())
+            except Exception as e:
+                logger.debug(f"Gauge callback failed: {e}")
+                return float("nan")
+        return self._value
+
+    def _samples(self, name: str) -> List[Tuple[str, str, float]]:
+        return [(name, "", self.value)]
+
+
+class Histogram:
+    """Cumulative histogram with fixed upper bounds"""
+
+    __slots__ = ("_upper_bounds", "_counts", "_sum", "_count", "_lock")
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self._upper_bounds = sorted(float(b) for b in buckets)
+        self._counts = [0] * (len(self._upper_bounds) + 1)  # last = +Inf
+        self._sum = 0.0
+        self._count = 0
+        self._lock = Lock()
+
+    def observe(self, value: float):
+        """Record a single observation"""
+        index = bisect.bisect_left(self._upper_bounds, value)
+        with self._lock:
+            self._counts[index] += 1
+            self._sum += value
+            self._count += 1
+
+    def time(self) -> "_HistogramTimer":
+        """Context manager observing elapsed wall time in seconds"""
+        return _HistogramTimer(self)
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    @property
+    def sum(self) -> float:
+        return self._sum
+
+    def quantile(self, q: float) -> float:
+        """Estimate a quantile from bucket counts (upper bound of the bucket)"""
+        if self._count == 0:
+            return 0.0
+        target = q * self._count
+        cumulative = 0
+        for bound, count in zip(self._upper_bounds + [float("inf")], self._counts):
+            cumulative += count
+            if cumulative >= target:
+                return bound
+        return float("inf")
+
+    def _samples(self, name: str) -> List[Tuple[str, str, float]]:
+        samples = []
+        cumulative = 0
+        for bound, count in zip(self._upper_bounds, self._counts):
+            cumulative += count
+            samples.append((f"{name}_bucket", f'le="{_format_value(bound)}"', cumulative))
+        samples.append((f"{name}_bucket", 'le="+Inf"', self._count))
+        samples.append((f"{name}_sum", "", self._sum))
+        samples.append((f"{name}_count", "", self._count))
+        return samples
+
+
+class _HistogramTimer:
+    __slots__ = ("_histogram", "_start")
+
+    def __init__(self, histogram: Histogram):
+        self._histogram = histogram
+        self._start = 0.0
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self._histogram.observe(time.perf_counter() - self._start)
+        return False
+
+
+class _NullMetric:
+    """No-op stand-in used when metrics are disabled"""
+
+    __slots__ = ()
+
+    def inc(self, amount: float = 1.0):
+        pass
+
+    def dec(self, amount: float = 1.0):
+        pass
+
+    def set(self, value: float):
+        pass
+
+    def set_function(self, function: Callable[[], float]):
+        pass
+
+    def observe(self, value: float):
+        pass
+
+    def labels(self, *values: str) -> "_NullMetric":
+        return self
+
+    def remove(self, *values: str):
+        pass
+
+    def time(self) -> "_NullTimer":
+        return _NULL_TIMER
+
+    value = 0.0
+    count = 0
+    sum = 0.0
+
+
+class _NullTimer:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+NULL_METRIC = _NullMetric()
+_NULL_TIMER = _NullTimer()
+
+
+# =============================================================================
+# Metric Families (labelled metrics)
+# =============================================================================
+class MetricFamily:
+    """A named metric, optionally split into children by label values"""
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        metric_type: str,
+        factory: Callable[[], object],
+        labelnames: Sequence[str] = ()
+    ):
+        self.name = name
+        self.documentation = documentation
+        self.metric_type = metric_type
+        self.labelnames = tuple(labelnames)
+        self._factory = factory
+        self._children: Dict[Tuple[str, ...], object] = {}
+        self._lock = Lock()
+        if not self.labelnames:
+            self._children[()] = factory()
+
+    def labels(self, *values: str):
+        """Get (or create) the child metric for the given label values"""
+        child = self._children.get(values)
+        if child is None:
+            key = tuple(str(v) for v in values)
+            if len(key) != len(self.labelnames):
+                raise ValueError(
+                    f"{self.name} expects labels {self.labelnames}, got {values}"
+                )
+            with self._lock:
+                child = self._children.setdefault(key, self._factory())
+        return child
+
+    def remove(self, *values: str):
+        """Drop the child for the given label values"""
+        with self._lock:
+            self._children.pop(tuple(str(v) for v in values), None)
+
+    def _unlabelled(self):
+        if self.labelnames:
+            raise ValueError(f"{self.name} requires labels {self.labelnames}")
+        return self._children[()]
+
+    # Unlabelled families proxy straight to their single child
+    def inc(self, amount: float = 1.0):
+        self._unlabelled().inc(amount)
+
+    def dec(self, amount: float = 1.0):
+        self._unlabelled().dec(amount)
+
+    def set(self, value: float):
+        self._unlabelled().set(value)
+
+    def set_function(self, function: Callable[[], float]):
+        self._unlabelled().set_function(function)
+
+    def observe(self, value: float):
+        self._unlabelled().observe(value)
+
+    def time(self):
+        return self._unlabelled().time()
+
+    @property
+    def value(self) -> float:
+        return self._unlabelled().value
+
+    def collect(self) -> List[Tuple[str, str, float]]:
+        """Return (sample_name, label_string, value) tuples"""
+        samples = []
+        with self._lock:
+            children = list(self._children.items())
+        for label_values, child in children:
+            base = _format_labels(self.labelnames, label_values)[1:-1]
+            for sample_name, extra, value in child._samples(self.name):
+                labels = ",".join(part for part in (base, extra) if part)
+                samples.append((sample_name, labels, value))
+        return samples
+
+
+# =============================================================================
+# Metrics Registry
+# =============================================================================
+class MetricsRegistry:
+    """Registry of metric families with Prometheus text rendering"""
+
+    def __init__(self, enabled: bool = True):
+        self.enabled = enabled
+        self._families: Dict[str, MetricFamily] = {}
+        self._lock = Lock()
+
+    def _register(
+        self,
+        name: str,
+        documentation: str,
+        metric_type: str,
+        factory: Callable[[], object],
+        labelnames: Sequence[str]
+    ):
+        if not self.enabled:
+            return NULL_METRIC
+        with self._lock:
+            family = self._families.get(name)
+            if family is None:
+                family = MetricFamily(name, documentation, metric_type, factory, labelnames)
+                self._families[name] = family
+            elif family.metric_type != metric_type or family.labelnames != tuple(labelnames):
+                raise ValueError(f"Metric {name} already registered with a different shape")
+            return family
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        """Get or create a counter family"""
+        return self._register(name, documentation, "counter", Counter, labelnames)
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        """Get or create a gauge family"""
+        return self._register(name, documentation, "gauge", Gauge, labelnames)
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS
+    ):
+        """Get or create a histogram family"""
+        return self._register(
+            name, documentation, "histogram", lambda: Histogram(buckets), labelnames
+        )
+
+    def get(self, name: str) -> Optional[MetricFamily]:
+        return self._families.get(name)
+
+    def render(self) -> str:
+        """Render all metrics in Prometheus text exposition format"""
+        lines = []
+        with self._lock:
+            families = sorted(self._families.values(), key=lambda f: f.name)
+        for family in families:
+            lines.append(f"# HELP {family.name} {family.documentation}")
+            lines.append(f"# TYPE {family.name} {family.metric_type}")
+            for sample_name, labels, value in family.collect():
+                label_str = "{" + labels + "}" if labels else ""
+                lines.append(f"{sample_name}{label_str} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+    def snapshot(self) -> Dict[str, float]:
+        """Flat {sample{labels}: value} view, convenient for logs and benchmarks"""
+        result = {}
+        with self._lock:
+            families = list(self._families.values())
+        for family in families:
+            for sample_name, labels, value in family.collect():
+                key = f"{sample_name}{{{labels}}}" if labels else sample_name
+                result[key] = value
+        return result
+
+
+# Process-wide default registry
+REGISTRY = MetricsRegistry()
+
+
+# =============================================================================
+# HTTP Exporter (/metrics, /health)
+# =============================================================================
+class _MetricsHandler:
+    """Request handling, mixed into BaseHTTPRequestHandler by MetricsServer"""
+
+    registry: MetricsRegistry = REGISTRY
+    health_fn: Optional[Callable[[], Dict]] = None
+
+    def do_GET(self):
+        path = self.path.split("?", 1)[0]
+        if path == "/metrics":
+            body = self.registry.render().encode("utf-8")
+            self._reply(200, "text/plain; version=0.0.4; charset=utf-8", body)
+        elif path == "/health":
+            health = self.health_fn() if self.health_fn else {"status": "ok"}
+            status = 200 if health.get("status") == "ok" else 503
+            body = json.dumps(health).encode("utf-8")
+            self._reply(status, "application/json", body)
+        else:
+            self._reply(404, "text/plain", b"not found\n")
+
+    def _reply(self, status: int, content_type: str, body: bytes):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        logger.debug("metrics http: " + format % args)
+
+
+class MetricsServer:
+    """
+    Local HTTP exporter for Prometheus scraping and health checks
+    Binds to localhost by default - do not expose publicly.
+    """
+
+    def __init__(
+        self,
+        registry: MetricsRegistry = REGISTRY,
+        host: str = "127.0.0.1",
+        port: int = 9464,
+        health_fn: Optional[Callable[[], Dict]] = None
+    ):
+        # Imported here: http.server costs more to import than the rest of the SDK core
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+        handler = type(
+            "VCPMetricsHandler",
+            (_MetricsHandler, BaseHTTPRequestHandler),
+            {"registry": registry, "health_fn": staticmethod(health_fn) if health_fn else None}
+        )
+        self._server = ThreadingHTTPServer((host, port), handler)
+        self._server.daemon_threads = True
+        self._thread: Optional[Thread] = None
+
+    @property
+    def address(self) -> Tuple[str, int]:
+        return self._server.server_address[:2]
+
+    def start(self):
+        """Serve in a background daemon thread"""
+        self._thread = Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        logger.info(f"Metrics exporter listening on http://{self.address[0]}:{self.address[1]}")
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread:
+            self._thread.join(timeout=5)
@@ -0,0 +1,251 @@
+#!/usr/bin/env python3
+"""
+VCP Numeric Formatting v1.0 - Decimal Strings for Manager API Deal Fields
+Document ID: VSO-SDK-PY-015
+License: CC BY 4.0 International
+Maintainer: VeritasChain Standards Organization (VSO)
+
+This module renders MT4/MT5 floats as the decimal strings VCP requires
+for prices, quantities and amounts (guide section 9.3):
+- A per-symbol digits table (price digits, volume step), filled once per
+  symbol from Manager API symbol info and cached
+- Rounding from the exact binary value at the symbol's precision (ties
+  to even): no repr artifacts such as 2650.5500000000002, no "-0.00"
+- Batch formatting of whole deal lists: one pass per field, each value
+  with its symbol's format
+
+Usage:
+    table = DigitsTable(lookup=manager_symbol_info)  # symbol -> {"digits": 2, "volume_step": 0.01}
+    table.set("XAUUSD", price_digits=2, volume_digits=2)
+    table.price("XAUUSD", 2650.5500000000002)         # "2650.55"
+    format_deals(deals, table)                        # [(price, volume, commission), ...]
+"""
+
+import logging
+from dataclasses import dataclass
+from math import isfinite
+from operator import itemgetter, mod
+from decimal import ROUND_HALF_EVEN, Decimal, InvalidOperation
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger("vcp_numeric")
+
+# Places kept for a symbol with unknown digits; trailing zeros are dropped
+UNKNOWN_DIGITS = 8
+MAX_DIGITS = 12
+
+_FORMATS = [f"%.{digits}f" for digits in range(MAX_DIGITS + 1)]
+_FORMATTERS = [text.__mod__ for text in _FORMATS]
+_NEGATIVE_ZEROS = frozenset("-" + text % 0 for text in _FORMATS)
+
+
+# =============================================================================
+# Scalar Formatting
+# =============================================================================
+def _fix(text: str, digits: Optional[int]) -> str:
+    """Drop trailing zeros (digits unknown) and the sign of a rounded-off zero"""
+    if digits is None and "." in text:
+        text = text.rstrip("0").rstrip(".")
+    if text in _NEGATIVE_ZEROS:
+        text = text[1:]
+    return text
+
+
+def format_decimal(value: Any, digits: Optional[int] = None) -> str:
+    """
+    value as a decimal string with exactly `digits` places, or with up to
+    UNKNOWN_DIGITS places and no trailing zeros when digits is None
+
+    Floats and ints round from their exact binary value (ties to even);
+    str and Decimal input rounds from its decimal value. None counts as 0.
+    Raises ValueError for NaN, infinities and non-numeric strings.
+    """
+    if digits is not None and type(value) is float:  # The common case, without the checks below
+        text = _FORMATTERS[digits](value)
+        if text[-1] not in "nf" and text not in _NEGATIVE_ZEROS:
+            return text
+    places = UNKNOWN_DIGITS if digits is None else digits
+    if value is None:
+        value = 0
+    if isinstance(value, (str, Decimal)):
+        try:
+            number = Decimal(value.strip() if isinstance(value, str) else value)
+        except InvalidOperation:
+            raise ValueError(f"Not a decimal number: {value!r}") from None
+        if not number.is_finite():
+            raise ValueError(f"Cannot render {value!r} as a decimal string")
+        text = format(number.quantize(Decimal(1).scaleb(-places), rounding=ROUND_HALF_EVEN), "f")
+    else:
+        text = _FORMATTERS[places](value)
+        if text[-1] in "nf":  # nan, inf, -inf
+            raise ValueError(f"Cannot render {value!r} as a decimal string")
+    return _fix(text, digits)
+
+
+def _check_finite(texts: List[str], values: Sequence[Any]):
+    """Raise on NaN/infinities; a finite sum clears the whole column in one C-level pass"""
+    try:
+        if isfinite(sum(values)):
+            return
+    except (TypeError, ValueError, OverflowError):  # Mixed Decimal/float, sNaN or huge ints: scan
+        pass
+    for value, text in zip(values, texts):
+        if text[-1] in "nf":  # nan, inf, -inf
+            raise ValueError(f"Cannot render {value!r} as a decimal string")
+
+
+def _checked(texts: List[str], values: Sequence[Any], digits: Optional[int]) -> List[str]:
+    """Raise on NaN/infinities, drop the sign of rounded-off zeros"""
+    _check_finite(texts, values)
+    if digits is None:
+        return [_fix(text, None) for text in texts]
+    negative_zero = "-" + _FORMATS[digits] % 0
+    if negative_zero in texts:
+        return [text[1:] if text == negative_zero else text for text in texts]
+    return texts
+
+
+def format_column(values: Sequence[Any], digits: Optional[int] = None) -> List[str]:
+    """format_decimal over a whole column; floats and ints take a single C-level pass"""
+    try:
+        texts = list(map(_FORMATTERS[UNKNOWN_DIGITS if digits is None else digits], values))
+    except TypeError:  # None, str or Decimal values: per value
+        return [format_decimal(value, digits) for value in values]
+    return _checked(texts, values, digits)
+
+
+def step_digits(step: Any) -> int:
+    """Decimal places of a volume or tick step (0.01 -> 2, 1.0 -> 0)"""
+    exponent = Decimal(repr(step) if isinstance(step, float) else str(step)).normalize().as_tuple().exponent
+    return min(MAX_DIGITS, max(0, -exponent))
+
+
+# =============================================================================
+# Per-symbol Digits Table
+# =============================================================================
+@dataclass(frozen=True)
+class SymbolDigits:
+    """Decimal places of one symbol's prices and volumes (None: unknown)"""
+    price: Optional[int]
+    volume: Optional[int]
+
+
+class DigitsTable:
+    """
+    Cached price/volume digits per symbol
+
+    Unknown symbols are resolved once through `lookup(symbol)`, which
+    returns MT5 symbol info with "digits" and "volume_step" (e.g. from the
+    Manager API SymbolGet), or None. Without an answer, prices keep up to
+    UNKNOWN_DIGITS places and volumes use `volume_digits`. Amounts in the
+    account currency (commission) use `money_digits`.
+    """
+
+    def __init__(
+        self,
+        lookup: Optional[Callable[[str], Optional[Dict]]] = None,
+        volume_digits: int = 2,
+        money_digits: int = 2
+    ):
+        self.lookup = lookup
+        self.volume_digits = volume_digits
+        self.money_digits = money_digits
+        self._symbols: Dict[str, SymbolDigits] = {}
+
+    def set(self, symbol: str, price_digits: Optional[int], volume_digits: Optional[int] = None):
+        self._symbols[symbol] = SymbolDigits(
+            price_digits, self.volume_digits if volume_digits is None else volume_digits
+        )
+
+    def load(self, symbols: Iterable[Dict]):
+        """Fill from MT5 symbol infos ({"name", "digits", "volume_step"})"""
+        for info in symbols:
+            self._symbols[info["name"]] = self._from_info(info)
+
+    def _from_info(self, info: Dict) -> SymbolDigits:
+        step = info.get("volume_step")
+        return SymbolDigits(
+            min(MAX_DIGITS, int(info["digits"])) if info.get("digits") is not None else None,
+            step_digits(step) if step else self.volume_digits
+        )
+
+    def get(self, symbol: str) -> SymbolDigits:
+        digits = self._symbols.get(symbol)
+        if digits is None:
+            info = None
+            if self.lookup:
+                try:
+                    info = self.lookup(symbol)
+                except Exception as e:
+                    logger.warning(f"Symbol lookup failed for {symbol!r}: {e}")
+            digits = self._from_info(info) if info else SymbolDigits(None, self.volume_digits)
+            self._symbols[symbol] = digits
+        return digits
+
+    def price(self, symbol: str, value: Any) -> str:
+        return format_decimal(value, self.get(symbol).price)
+
+    def volume(self, symbol: str, value: Any) -> str:
+        return format_decimal(value, self.get(symbol).volume)
+
+    def money(self, value: Any) -> str:
+        return format_decimal(value, self.money_digits)
+
+    def __len__(self) -> int:
+        return len(self._symbols)
+
+
+# =============================================================================
+# Batch Formatting
+# =============================================================================
+_symbol = itemgetter('symbol')
+_price = itemgetter('price')
+_volume = itemgetter('volume')
+_commission = itemgetter('commission')
+
+
+def format_deals(deals: Sequence[Dict], table: DigitsTable) -> List[Tuple[str, str, str]]:
+    """
+    (price, volume, commission) strings for each deal, in order
+
+    Each field is formatted column-wise, every value with its symbol's
+    digits. Missing fields count as 0.
+    """
+    if len(deals) == 1:  # Deals joined one at a time (vcp_join_v1_0)
+        deal = deals[0]
+        digits = table.get(deal.get('symbol', ''))
+        return [(format_decimal(deal.get('price', 0), digits.price),
+                 format_decimal(deal.get('volume', 0), digits.volume),
+                 format_decimal(deal.get('commission', 0), table.money_digits))]
+
+    symbols = _values(deals, _symbol, 'symbol', '')
+    digits = {symbol: table.get(symbol) for symbol in set(symbols)}
+    return list(zip(
+        _by_symbol(_values(deals, _price, 'price'), symbols, {s: d.price for s, d in digits.items()}),
+        _by_symbol(_values(deals, _volume, 'volume'), symbols, {s: d.volume for s, d in digits.items()}),
+        format_column(_values(deals, _commission, 'commission'), table.money_digits)
+    ))
+
+
+def _values(deals: Sequence[Dict], getter: Callable, field: str, default: Any = 0) -> List[Any]:
+    try:
+        return list(map(getter, deals))
+    except KeyError:
+        return [deal.get(field, default) for deal in deals]
+
+
+def _by_symbol(values: List[Any], symbols: List[str], places: Dict[str, Optional[int]]) -> List[str]:
+    """format_column with each value at its own symbol's places"""
+    if len(set(places.values())) == 1:
+        return format_column(values, next(iter(places.values())))
+    formats = {symbol: _FORMATS[UNKNOWN_DIGITS if p is None else p] for symbol, p in places.items()}
+    try:
+        texts = list(map(mod, map(formats.__getitem__, symbols), values))
+    except TypeError:  # None, str or Decimal values: per value
+        return [format_decimal(value, places[symbol]) for value, symbol in zip(values, symbols)]
+    _check_finite(texts, values)
+    if None in places.values():
+        return [_fix(text, places[symbol]) for text, symbol in zip(texts, symbols)]
+    if not _NEGATIVE_ZEROS.isdisjoint(texts):
+        return [text[1:] if text in _NEGATIVE_ZEROS else text for text in texts]
+    return texts
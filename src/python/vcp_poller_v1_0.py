@@ -0,0 +1,462 @@
+#!/usr/bin/env python3
+"""
+VCP Manager API Poller v1.0 - Incremental, Cursor-based Deal Fetching
+Document ID: VSO-SDK-PY-005
+License: CC BY 4.0 International
+Maintainer: VeritasChain Standards Organization (VSO)
+
+This module provides the polling service of guide section 5.2:
+- Per-account high-watermark cursors (deal time, ticket), persisted locally
+- Adaptive per-account poll intervals driven by trading activity
+- Concurrent fetch fan-out across many accounts
+- Pluggable fetch function (real Manager API or a local fake)
+
+Fetching is parallel; transformation into VCP events stays on the poller
+thread so the factory's hash chain has a single writer.
+"""
+
+import heapq
+import json
+import logging
+import os
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor, Future
+from dataclasses import dataclass, field
+from threading import Event, Lock, Thread
+from typing import Callable, Dict, FrozenSet, List, Optional, Tuple
+
+from vcp_metrics_v1_0 import REGISTRY
+
+logger = logging.getLogger("vcp_poller")
+
+# fetch_fn(account_id, since_time) -> deals with deal['time'] >= since_time
+FetchFunction = Callable[[str, int], List[Dict]]
+
+
+_polls = REGISTRY.counter("vcp_poller_polls_total", "Manager API fetches performed")
+_fetch_errors = REGISTRY.counter("vcp_poller_fetch_errors_total", "Manager API fetches that raised")
+_transform_errors = REGISTRY.counter("vcp_poller_transform_errors_total", "Polls whose deals failed to transform")
+_deals_fetched = REGISTRY.counter("vcp_poller_deals_fetched_total", "Deals returned by fetches")
+_deals_new = REGISTRY.counter("vcp_poller_deals_new_total", "Deals beyond the cursor or late in the overlap (transformed)")
+_fetch_seconds = REGISTRY.histogram("vcp_poller_fetch_seconds", "Manager API fetch latency")
+
+
+def deal_position(deal: Dict) -> Tuple[int, int]:
+    """Ordering key of a deal: (time, ticket)"""
+    return int(deal.get('time', 0)), int(deal.get('ticket', 0))
+
+
+# =============================================================================
+# Cursors
+# =============================================================================
+@dataclass
+class DealCursor:
+    """
+    High-watermark of the last transformed deal for one account, plus the
+    positions of the deals transformed within the overlap window (and any
+    beyond a held cursor), so re-fetched deals are recognised after a restart
+    """
+    time: int = 0
+    ticket: int = 0
+    recent: FrozenSet[Tuple[int, int]] = field(default_factory=frozenset)
+
+    def is_new(self, deal: Dict) -> bool:
+        return deal_position(deal) > (self.time, self.ticket)
+
+    def seen(self, deal: Dict) -> bool:
+        return deal_position(deal) in self.recent
+
+
+class CursorStore:
+    """
+    Per-account cursors persisted as a small JSON file.
+    Writes are atomic (temp file + rename) and batched via flush().
+    """
+
+    def __init__(self, path: Optional[str] = None, start_time: int = 0):
+        self.path = path
+        self.start_time = start_time
+        self._cursors: Dict[str, DealCursor] = {}
+        self._dirty = False
+        self._lock = Lock()
+        if path and os.path.exists(path):
+            self._load()
+
+    def _load(self):
+        try:
+            with open(self.path, 'r') as f:
+                data = json.load(f)
+            for account_id, value in data.get("cursors", {}).items():
+                self._cursors[account_id] = DealCursor(
+                    int(value["time"]), int(value["ticket"]),
+                    frozenset((int(t), int(k)) for t, k in value.get("recent", ()))
+                )
+            logger.info(f"Loaded {len(self._cursors)} poll cursors from {self.path}")
+        except (OSError, ValueError, KeyError) as e:
+            logger.error(f"Failed to load cursors from {self.path}: {e}")
+
+    def get(self, account_id: str) -> DealCursor:
+        with self._lock:
+            cursor = self._cursors.get(account_id)
+            if cursor is None:
+                cursor = DealCursor(self.start_time, 0)
+                self._cursors[account_id] = cursor
+            return DealCursor(cursor.time, cursor.ticket, cursor.recent)
+
+    def advance(self, account_id: str, deal: Dict, recent: Optional[FrozenSet[Tuple[int, int]]] = None):
+        """Move the cursor to deal if it is beyond the current position; replace recent if given"""
+        time_, ticket = deal_position(deal)
+        with self._lock:
+            cursor = self._cursors.setdefault(account_id, DealCursor(self.start_time, 0))
+            if (time_, ticket) > (cursor.time, cursor.ticket):
+                cursor.time, cursor.ticket = time_, ticket
+                self._dirty = True
+            if recent is not None and recent != cursor.recent:
+                cursor.recent = recent
+                self._dirty = True
+
+    def snapshot(self) -> Dict[str, Tuple]:
+        """Copy of every cursor as (time, ticket, recent), e.g. for a sidecar checkpoint"""
+        with self._lock:
+            return {
+                account_id: (c.time, c.ticket, sorted(c.recent))
+                for account_id, c in self._cursors.items()
+            }
+
+    def restore(self, cursors: Dict[str, Tuple]):
+        """Replace the cursors (also moving them back), e.g. from a sidecar checkpoint"""
+        with self._lock:
+            self._cursors = {
+                account_id: DealCursor(
+                    int(value[0]), int(value[1]),
+                    frozenset((int(t), int(k)) for t, k in (value[2] if len(value) > 2 else ()))
+                )
+                for account_id, value in cursors.items()
+            }
+            self._dirty = True
+
+    def flush(self):
+        """Persist cursors if anything changed since the last flush"""
+        if not self.path:
+            return
+        with self._lock:
+            if not self._dirty:
+                return
+            data = {
+                "version": 1,
+                "cursors": {
+                    account_id: {"time": c.time, "ticket": c.ticket, "recent": sorted(c.recent)}
+                    for account_id, c in self._cursors.items()
+                },
+            }
+            self._dirty = False
+
+        directory = os.path.dirname(os.path.abspath(self.path))
+        fd, tmp_path = tempfile.mkstemp(prefix=".cursors-", dir=directory)
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump(data, f, separators=(',', ':'))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.path)
+        except OSError:
+            with self._lock:
+                self._dirty = True
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+
+
+# =============================================================================
+# Adaptive Schedule
+# =============================================================================
+@dataclass
+class _AccountState:
+    interval: float
+    next_due: float
+    consecutive_errors: int = 0
+    in_flight: bool = False
+
+
+class ManagerPoller:
+    """
+    Incremental Manager API poller for many accounts
+
+    Each account is polled on its own adaptive interval: back to
+    min_interval as soon as new deals appear, multiplied by backoff after
+    every empty poll up to max_interval. Fetch errors back off the same way.
+    """
+
+    def __init__(
+        self,
+        adapter,
+        fetch_fn: FetchFunction,
+        accounts: Optional[List[str]] = None,
+        cursor_store: Optional[CursorStore] = None,
+        min_interval: Optional[float] = None,
+        max_interval: float = 30.0,
+        backoff: float = 2.0,
+        max_workers: int = 8,
+        overlap_seconds: int = 1,
+        join=None
+    ):
+        self.adapter = adapter
+        self.fetch_fn = fetch_fn
+        self.cursors = cursor_store or CursorStore()
+        self.min_interval = min_interval if min_interval is not None else adapter.poll_interval
+        self.max_interval = max(max_interval, self.min_interval)
+        self.backoff = backoff
+        self.max_workers = max_workers
+        # Re-fetch this many seconds before the cursor to catch late deals; deals
+        # in that window pass on the adapter's dedup state, not the watermark
+        self.overlap_seconds = overlap_seconds
+        # Optional vcp_join_v1_0.TraceJoinEngine linking deals to EA trace_ids
+        self.join = join
+
+        self._accounts: Dict[str, _AccountState] = {}
+        self._heap: List[Tuple[float, str]] = []
+        self._lock = Lock()
+        self._stop = Event()
+        self._thread: Optional[Thread] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+        for account_id in accounts or []:
+            self.add_account(account_id)
+
+    # -------------------------------------------------------------------------
+    def add_account(self, account_id: str):
+        """Start polling an account (immediately due)"""
+        with self._lock:
+            if account_id in self._accounts:
+                return
+            now = time.monotonic()
+            self._accounts[account_id] = _AccountState(self.min_interval, now)
+            heapq.heappush(self._heap, (now, account_id))
+
+    def remove_account(self, account_id: str):
+        with self._lock:
+            self._accounts.pop(account_id, None)
+
+    def _due_accounts(self, now: float) -> List[str]:
+        due = []
+        with self._lock:
+            while self._heap and self._heap[0][0] <= now:
+                next_due, account_id = heapq.heappop(self._heap)
+                state = self._accounts.get(account_id)
+                if state is None or state.next_due != next_due or state.in_flight:
+                    continue  # Removed or stale heap entry
+                state.in_flight = True
+                due.append(account_id)
+        return due
+
+    def _reschedule(self, account_id: str, had_new: bool, failed: bool):
+        with self._lock:
+            state = self._accounts.get(account_id)
+            if state is None:
+                return
+            state.in_flight = False
+            if had_new:
+                state.interval = self.min_interval
+            else:
+                # Idle or failing: back off (from at least 100 ms) up to max_interval
+                state.interval = min(self.max_interval, max(state.interval, 0.1) * self.backoff)
+            state.consecutive_errors = state.consecutive_errors + 1 if failed else 0
+            state.next_due = time.monotonic() + state.interval
+            heapq.heappush(self._heap, (state.next_due, account_id))
+
+    def _fetch(self, account_id: str) -> List[Dict]:
+        cursor = self.cursors.get(account_id)
+        since = max(0, cursor.time - self.overlap_seconds) if cursor.time else 0
+        started = time.perf_counter()
+        try:
+            return self.fetch_fn(account_id, since)
+        finally:
+            _fetch_seconds.observe(time.perf_counter() - started)
+            _polls.inc()
+
+    def _transform(self, account_id: str, deals: List[Dict]) -> int:
+        """Transform deals beyond the cursor or late in the overlap, unless seen; returns the number of events queued"""
+        cursor = self.cursors.get(account_id)
+        since = cursor.time - self.overlap_seconds if cursor.time and self.overlap_seconds > 0 else None
+        new_deals = sorted(
+            (d for d in deals if (
+                cursor.is_new(d) or (since is not None and int(d.get('time', 0)) >= since)
+            ) and not self._seen(d, cursor)),
+            key=deal_position
+        )
+        _deals_fetched.inc(len(deals))
+        if not deals:
+            return 0
+        _deals_new.inc(len(new_deals))
+
+        # Create, queue and advance under the producers' lock, so a checkpoint
+        # never holds a dedup state or cursor beyond the events it covers
+        with self.adapter.factory_lock:
+            queued = 0
+            if new_deals:
+                if self.join:
+                    events = self.join.process_deals(new_deals, account_id)
+                else:
+                    events = self.adapter.process_deals(new_deals, account_id)
+                queued = self._queue(events)
+            self._advance(account_id, cursor, deals)
+        return queued
+
+    def _advance(self, account_id: str, cursor: DealCursor, deals: List[Dict]):
+        """
+        Move the cursor up to the last fetched deal, but short of the
+        account's oldest deal parked by the join: parked deals live only in
+        memory, so after a restart they are fetched again. The positions of
+        transformed deals from overlap_seconds before the new cursor on are
+        kept with it, so a restarted poller does not emit them again.
+        """
+        position = max(max(map(deal_position, deals)), (cursor.time, cursor.ticket))
+        parked = self.join.oldest_parked(account_id) if self.join else None
+        if parked is not None and parked <= position:
+            position = max((parked[0], parked[1] - 1), (cursor.time, cursor.ticket))
+        floor = position[0] - self.overlap_seconds
+        processed = self.adapter.processed_deals
+        recent = frozenset(
+            p for d, p in ((d, deal_position(d)) for d in deals)
+            if p[0] >= floor and (p in cursor.recent or (d.get('ticket'), d.get('time')) in processed)
+        )
+        self.cursors.advance(account_id, {'time': position[0], 'ticket': position[1]}, recent)
+
+    def _seen(self, deal: Dict, cursor: DealCursor) -> bool:
+        """Deal already transformed (in this run or, per the cursor, before a restart) or parked by the join"""
+        if cursor.seen(deal) or (deal.get('ticket'), deal.get('time')) in self.adapter.processed_deals:
+            return True
+        return bool(self.join and self.join.holds(deal))
+
+    def _release(self, take: Callable[[], List]) -> int:
+        """Create and queue the join's released deals under the producers' lock"""
+        with self.adapter.factory_lock:
+            return self._queue(take())
+
+    def _queue(self, events) -> int:
+        queued = 0
+        for event in events:
+            if self.adapter.queue_event(event):
+                queued += 1
+        return queued
+
+    # -------------------------------------------------------------------------
+    def poll_once(self, wait: bool = True) -> int:
+        """
+        Fetch all due accounts concurrently and transform new deals.
+        Returns the number of events queued.
+        """
+        due = self._due_accounts(time.monotonic())
+        released = self._release(self.join.release) if self.join else 0
+        if not due:
+            return released
+
+        executor = self._executor or ThreadPoolExecutor(max_workers=self.max_workers)
+        try:
+            futures: Dict[Future, str] = {
+                executor.submit(self._fetch, account_id): account_id for account_id in due
+            }
+            queued = released
+            # Results are transformed in submission order on this thread
+            for future, account_id in futures.items():
+                try:
+                    deals = future.result()
+                except Exception as e:
+                    _fetch_errors.inc()
+                    logger.error(f"Fetch failed for account {account_id}: {e}")
+                    self._reschedule(account_id, had_new=False, failed=True)
+                    continue
+                # A failing account is rescheduled (backed off) and the round goes on
+                count, failed = 0, True
+                try:
+                    count = self._transform(account_id, deals)
+                    failed = False
+                except Exception as e:
+                    _transform_errors.inc()
+                    logger.error(f"Transform failed for account {account_id}: {e}")
+                finally:
+                    queued += count
+                    self._reschedule(account_id, had_new=count > 0, failed=failed)
+        finally:
+            if executor is not self._executor:
+                executor.shutdown(wait=wait)
+
+        self.cursors.flush()
+        return queued
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                self.poll_once()
+            except Exception as e:
+                logger.error(f"Poller error: {e}")
+            with self._lock:
+                next_due = self._heap[0][0] if self._heap else time.monotonic() + self.max_interval
+            wait = min(next_due - time.monotonic(), self.max_interval)
+            if self.join:
+                wait = min(wait, self.join.late_grace)
+            self._stop.wait(max(0.0, wait))
+
+    def start(self):
+        """Start polling in a background thread"""
+        self._stop.clear()
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="vcp-poll"
+        )
+        self._thread = Thread(target=self._run, name="vcp-poller", daemon=True)
+        self._thread.start()
+        logger.info(f"Manager poller started ({len(self._accounts)} accounts)")
+
+    def stop(self):
+        """Stop polling and persist cursors"""
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=10)
+        if self.join:
+            self._release(self.join.flush)
+        if self._executor:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        self.cursors.flush()
+        logger.info("Manager poller stopped")
+
+    def stats(self) -> Dict[str, Dict]:
+        """Current interval and error count per account"""
+        with self._lock:
+            return {
+                account_id: {
+                    "interval": state.interval,
+                    "consecutive_errors": state.consecutive_errors,
+                    "cursor": {"time": cursor.time, "ticket": cursor.ticket},
+                }
+                for account_id, state in self._accounts.items()
+                for cursor in (self.cursors.get(account_id),)
+            }
+
+
+# =============================================================================
+# Local Fake Manager API
+# =============================================================================
+class InMemoryDealSource:
+    """
+    In-memory stand-in for the Manager API deal history.
+    Use .fetch as the poller's fetch_fn; optional latency simulates RTT.
+    """
+
+    def __init__(self, latency: float = 0.0):
+        self.latency = latency
+        self._deals: Dict[str, List[Dict]] = {}
+        self._lock = Lock()
+        self.fetches = 0
+
+    def add(self, account_id: str, deals: List[Dict]):
+        with self._lock:
+            self._deals.setdefault(account_id, []).extend(deals)
+
+    def fetch(self, account_id: str, since_time: int) -> List[Dict]:
+        if self.latency:
+            time.sleep(self.latency)
+        with self._lock:
+            self.fetches += 1
+            return [d for d in self._deals.get(account_id, []) if int(d.get('time', 0)) >= since_time]
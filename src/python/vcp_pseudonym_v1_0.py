@@ -0,0 +1,470 @@
+#!/usr/bin/env python3
+"""
+VCP Pseudonyms v1.0 - Keyed Account Pseudonyms, Vault and Archive Re-keying
+Document ID: VSO-SDK-PY-020
+License: CC BY 4.0 International
+Maintainer: VeritasChain Standards Organization (VSO)
+
+This module replaces the unkeyed, salted SHA-256 account pseudonyms with
+keyed ones and makes key rotation affordable on large archives:
+- Pseudonymizer: acc_ + 16 hex of HMAC-SHA256(key, account_id), same
+  shape as before; each distinct account is hashed once and
+  pseudonymize_column() dictionary-encodes a whole account column
+- PseudonymVault: optional local SQLite file (mode 0600) mapping
+  pseudonyms back to accounts per key_id; forget() erases an account's
+  mappings for GDPR erasure requests
+- Rekeyer: rewrites the account_id values of gzip NDJSON archive
+  segments in a process pool; every other byte of a line is copied, so
+  event hashes (which do not cover account_id) and the chain stay valid
+- A journal per new key makes an interrupted re-keying resumable
+
+Old pseudonyms are resolved to accounts through the vault. A pseudonym
+the vault does not know (never recorded, or forgotten) is re-keyed as
+HMAC(new key, old pseudonym), which keeps it stable and unlinkable.
+
+Usage:
+    vault = PseudonymVault("/var/lib/vcp/pseudonyms.db")
+    factory.pseudonymizer = Pseudonymizer(key, key_id="2025-01", vault=vault)
+    Rekeyer(Pseudonymizer(new_key, key_id="2025-07"), vault, old_key_id="2025-01").run(segment_paths)
+    python vcp_pseudonym_v1_0.py rekey --vault pseudonyms.db --old-key-id 2025-01 \\
+        --new-key-id 2025-07 --key-file new.key /var/lib/vcp/backfill/*.ndjson.gz
+"""
+
+import argparse
+import gzip
+import hashlib
+import hmac
+import logging
+import multiprocessing
+import os
+import secrets
+import sqlite3
+import time
+from array import array
+from itertools import count, islice
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from vcp_metrics_v1_0 import REGISTRY
+
+logger = logging.getLogger("vcp_pseudonym")
+
+PSEUDONYM_PREFIX = "acc_"
+ACCOUNT_MARKERS = (b'"account_id": "', b'"account_id":"')  # VCPEventSerializer.to_json, compact JSON
+LEGACY_KEY_ID = "legacy"
+JOURNAL_SUFFIX = ".journal"
+TMP_SUFFIX = ".rekey.tmp"
+
+_hashed = REGISTRY.counter("vcp_pseudonym_accounts_hashed_total", "Distinct accounts hashed into pseudonyms")
+_rekeyed_events = REGISTRY.counter("vcp_pseudonym_rekeyed_events_total", "Archive events re-keyed")
+_rekeyed_segments = REGISTRY.counter("vcp_pseudonym_rekeyed_segments_total", "Archive segments re-keyed")
+_unresolved = REGISTRY.counter(
+    "vcp_pseudonym_unresolved_total", "Old pseudonyms the vault could not resolve during re-keying"
+)
+
+
+# =============================================================================
+# Pseudonymizer
+# =============================================================================
+class Pseudonymizer:
+    """
+    Keyed account pseudonyms with a per-instance dictionary
+
+    Instances are callable, so one can be set as
+    VCPEventFactory.pseudonymizer. With a vault, every newly hashed
+    account is recorded under key_id.
+    """
+
+    def __init__(self, key: bytes, key_id: str = "default", length: int = 16,
+                 vault: Optional["PseudonymVault"] = None, max_cache: int = 2_000_000):
+        if len(key) < 16:
+            raise ValueError("Pseudonym keys must be at least 16 bytes")
+        self.key = key
+        self.key_id = key_id
+        self.length = length
+        self.vault = vault
+        self.max_cache = max_cache
+        self._mac = hmac.new(key, digestmod=hashlib.sha256)
+        self._cache: Dict[str, str] = {}
+
+    @staticmethod
+    def generate_key() -> bytes:
+        return secrets.token_bytes(32)
+
+    @classmethod
+    def from_file(cls, path: str, **kwargs) -> "Pseudonymizer":
+        """Key stored as hex in a file"""
+        with open(path, "r") as f:
+            return cls(bytes.fromhex(f.read().strip()), **kwargs)
+
+    def _hash(self, account_id: str) -> str:
+        mac = self._mac.copy()
+        mac.update(account_id.encode("utf-8"))
+        return PSEUDONYM_PREFIX + mac.hexdigest()[:self.length]
+
+    def pseudonymize(self, account_id: str) -> str:
+        pseudonym = self._cache.get(account_id)
+        if pseudonym is None:
+            self._remember(self._hash_many([account_id]))
+            pseudonym = self._cache[account_id]
+        return pseudonym
+
+    __call__ = pseudonymize
+
+    def _hash_many(self, accounts: Sequence[str]) -> List[Tuple[str, str]]:
+        pairs = [(account, self._hash(account)) for account in accounts]
+        _hashed.inc(len(pairs))
+        if self.vault is not None and pairs:
+            self.vault.record(self.key_id, [(pseudonym, account) for account, pseudonym in pairs])
+        return pairs
+
+    def _remember(self, pairs: List[Tuple[str, str]]):
+        if len(self._cache) + len(pairs) > self.max_cache:
+            self._cache.clear()
+        self._cache.update(pairs)
+
+    def pseudonymize_column(self, accounts: Iterable[str]) -> Tuple[array, List[str]]:
+        """
+        Dictionary-encode an account column: (codes, pseudonyms)
+
+        pseudonyms[codes[i]] is the pseudonym of the i-th account. Each
+        distinct account is hashed at most once (and not at all when it is
+        already cached).
+        """
+        index: Dict[str, int] = {}
+        codes = array("I")
+        accounts = iter(accounts)
+        while True:
+            chunk = list(islice(accounts, 1 << 20))
+            if not chunk:
+                break
+            fresh = dict.fromkeys(chunk).keys() - index.keys()
+            index.update(zip(fresh, count(len(index))))
+            codes.extend(map(index.__getitem__, chunk))
+        distinct = list(index)
+        cache = self._cache
+        missing = [account for account in distinct if account not in cache]
+        pairs = self._hash_many(missing)
+        if len(cache) + len(pairs) <= self.max_cache:
+            cache.update(pairs)
+        new = dict(pairs)
+        return codes, [cache.get(account) or new[account] for account in distinct]
+
+
+class LegacyPseudonymizer:
+    """The unkeyed VCPEventFactory pseudonyms (salt vcp_<venue_id>_), for filling a vault before re-keying"""
+
+    def __init__(self, venue_id: str, length: int = 16):
+        self.key_id = LEGACY_KEY_ID
+        self.salt = f"vcp_{venue_id}_"
+        self.length = length
+
+    def pseudonymize(self, account_id: str) -> str:
+        digest = hashlib.sha256(f"{self.salt}{account_id}".encode()).hexdigest()[:self.length]
+        return PSEUDONYM_PREFIX + digest
+
+    __call__ = pseudonymize
+
+
+# =============================================================================
+# Vault
+# =============================================================================
+class PseudonymVault:
+    """
+    Local reversible mapping of pseudonyms to accounts
+
+    One SQLite file, readable by its owner only. Pseudonyms are unique
+    per key_id. Keep the vault apart from the archives it can reverse.
+    """
+
+    def __init__(self, path: str, readonly: bool = False):
+        self.path = path
+        if readonly:
+            self._db = sqlite3.connect(f"file:{path}?mode=ro", uri=True, check_same_thread=False)
+            return
+        fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+        os.close(fd)
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS pseudonyms ("
+            " key_id TEXT NOT NULL, pseudonym TEXT NOT NULL, account TEXT NOT NULL,"
+            " PRIMARY KEY (key_id, pseudonym)) WITHOUT ROWID"
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS pseudonyms_account ON pseudonyms (account)")
+        self._db.commit()
+
+    def record(self, key_id: str, pairs: Iterable[Tuple[str, str]]):
+        """Store (pseudonym, account) pairs"""
+        with self._db:
+            self._db.executemany(
+                "INSERT OR IGNORE INTO pseudonyms (key_id, pseudonym, account) VALUES (?, ?, ?)",
+                ((key_id, pseudonym, account) for pseudonym, account in pairs)
+            )
+
+    def reveal(self, pseudonym: str, key_id: str) -> Optional[str]:
+        row = self._db.execute(
+            "SELECT account FROM pseudonyms WHERE key_id = ? AND pseudonym = ?", (key_id, pseudonym)
+        ).fetchone()
+        return row[0] if row else None
+
+    def reveal_many(self, pseudonyms: Sequence[str], key_id: str, chunk: int = 500) -> Dict[str, str]:
+        found: Dict[str, str] = {}
+        for i in range(0, len(pseudonyms), chunk):
+            part = pseudonyms[i:i + chunk]
+            rows = self._db.execute(
+                f"SELECT pseudonym, account FROM pseudonyms WHERE key_id = ? "
+                f"AND pseudonym IN ({','.join('?' * len(part))})", (key_id, *part)
+            )
+            found.update(rows)
+        return found
+
+    def mapping(self, key_id: str) -> Dict[str, str]:
+        """Every pseudonym -> account of one key"""
+        return dict(self._db.execute("SELECT pseudonym, account FROM pseudonyms WHERE key_id = ?", (key_id,)))
+
+    def pseudonyms(self, account: str) -> List[Tuple[str, str]]:
+        """(key_id, pseudonym) of an account under every key"""
+        return self._db.execute(
+            "SELECT key_id, pseudonym FROM pseudonyms WHERE account = ?", (account,)
+        ).fetchall()
+
+    def forget(self, account: str) -> int:
+        """Erase every mapping of an account; its pseudonyms can no longer be reversed"""
+        with self._db:
+            return self._db.execute("DELETE FROM pseudonyms WHERE account = ?", (account,)).rowcount
+
+    def __len__(self) -> int:
+        return self._db.execute("SELECT COUNT(*) FROM pseudonyms").fetchone()[0]
+
+    def close(self):
+        self._db.close()
+
+
+# =============================================================================
+# Re-keying
+# =============================================================================
+def rewrite_accounts(data: bytes, mapping: Dict[bytes, bytes]) -> Tuple[bytes, int]:
+    """Replace account_id values found in mapping; returns (data, values replaced)"""
+    replaced = 0
+    for marker in ACCOUNT_MARKERS:
+        if marker not in data:
+            continue
+        parts = data.split(marker)
+        for i in range(1, len(parts)):
+            part = parts[i]
+            end = part.find(b'"')
+            new = mapping.get(part[:end])
+            if new is not None:
+                parts[i] = new + part[end:]
+                replaced += 1
+        data = marker.join(parts)
+    return data, replaced
+
+
+def account_values(data: bytes) -> set:
+    """Distinct account_id values of NDJSON data"""
+    values = set()
+    for marker in ACCOUNT_MARKERS:
+        if marker in data:
+            parts = data.split(marker)
+            values.update(part[:part.find(b'"')] for part in parts[1:])
+    return values
+
+
+_worker: Dict = {}
+
+
+def _init_rekey_worker(key: bytes, length: int, vault_path: Optional[str], old_key_id: str, compresslevel: int):
+    _worker.update(
+        new=Pseudonymizer(key, length=length, max_cache=0),
+        vault_path=vault_path,
+        old_key_id=old_key_id,
+        compresslevel=compresslevel,
+        accounts=None,   # Old pseudonym -> account, loaded from the vault on the first segment
+        rekeyed={},      # Old pseudonym -> new pseudonym, for every segment of this worker
+    )
+
+
+def _rekey_segment(path: str) -> Dict:
+    """Write the re-keyed copy of one segment to path + TMP_SUFFIX"""
+    new: Pseudonymizer = _worker["new"]
+    rekeyed: Dict[bytes, bytes] = _worker["rekeyed"]
+    if _worker["accounts"] is None:
+        accounts = {}
+        if _worker["vault_path"]:
+            vault = PseudonymVault(_worker["vault_path"], readonly=True)
+            accounts = vault.mapping(_worker["old_key_id"])
+            vault.close()
+        _worker["accounts"] = accounts
+    accounts = _worker["accounts"]
+    with open(path, "rb") as f:
+        data = gzip.decompress(f.read())
+    values = account_values(data)
+    recorded, unresolved = [], 0
+    for value in values:
+        if value in rekeyed:
+            continue
+        pseudonym = value.decode("utf-8")
+        account = accounts.get(pseudonym)
+        if account is None:
+            unresolved += 1
+            rekeyed[value] = new._hash(pseudonym).encode("utf-8")
+        else:
+            new_pseudonym = new._hash(account)
+            rekeyed[value] = new_pseudonym.encode("utf-8")
+            recorded.append((new_pseudonym, account))
+    data, events = rewrite_accounts(data, rekeyed)
+    tmp_path = path + TMP_SUFFIX
+    with open(tmp_path, "wb") as f:
+        f.write(gzip.compress(data, compresslevel=_worker["compresslevel"], mtime=0))
+        f.flush()
+        os.fsync(f.fileno())
+    return {"path": path, "events": events, "accounts": len(values), "unresolved": unresolved,
+            "recorded": recorded}
+
+
+class Rekeyer:
+    """
+    Re-key archive segments from old_key_id to new's key
+
+    Each worker loads the old key's mappings from the vault (opened
+    read-only) once, hashes every distinct account it meets with the new
+    key once, and writes a re-keyed copy next to each segment. The calling process then
+    records the new pseudonyms in the vault, journals the segment and
+    moves the copy over it. A rerun finishes journaled moves, drops
+    unjournaled copies and skips journaled segments.
+    """
+
+    def __init__(
+        self,
+        new: Pseudonymizer,
+        vault: Optional[PseudonymVault] = None,
+        old_key_id: str = LEGACY_KEY_ID,
+        workers: Optional[int] = None,
+        compresslevel: int = 6,
+        journal_path: Optional[str] = None
+    ):
+        self.new = new
+        self.vault = vault
+        self.old_key_id = old_key_id
+        self.workers = (os.cpu_count() or 1) if workers is None else workers
+        self.compresslevel = compresslevel
+        self.journal_path = journal_path
+
+    def _journal(self, paths: Sequence[str]) -> str:
+        if self.journal_path:
+            return self.journal_path
+        directory = os.path.dirname(os.path.abspath(paths[0]))
+        return os.path.join(directory, f"rekey-{self.new.key_id}{JOURNAL_SUFFIX}")
+
+    def run(self, paths: Sequence[str]) -> Dict:
+        """Re-key segments; returns totals"""
+        if not paths:
+            return {"segments": 0, "events": 0, "accounts": 0, "unresolved": 0, "skipped": 0}
+        started = time.perf_counter()
+        journal_path = self._journal(paths)
+        done = set()
+        if os.path.exists(journal_path):
+            with open(journal_path, "r") as f:
+                done = {line.rstrip("\n") for line in f if line.strip()}
+        todo = []
+        for path in paths:
+            name = os.path.abspath(path)
+            tmp_path = path + TMP_SUFFIX
+            if name in done:
+                if os.path.exists(tmp_path):
+                    os.replace(tmp_path, path)  # Journaled before the move was done
+                continue
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            todo.append(path)
+
+        totals = {"segments": 0, "events": 0, "accounts": 0, "unresolved": 0, "skipped": len(paths) - len(todo)}
+        init_args = (self.new.key, self.new.length, self.vault.path if self.vault else None, self.old_key_id,
+                     self.compresslevel)
+        pool = None
+        if self.workers > 0:
+            pool = multiprocessing.Pool(self.workers, initializer=_init_rekey_worker, initargs=init_args)
+            results = pool.imap_unordered(_rekey_segment, todo)
+        else:
+            _init_rekey_worker(*init_args)
+            results = map(_rekey_segment, todo)
+        try:
+            with open(journal_path, "a") as journal:
+                for result in results:
+                    if self.vault is not None and result["recorded"]:
+                        self.vault.record(self.new.key_id, result["recorded"])
+                    journal.write(os.path.abspath(result["path"]) + "\n")
+                    journal.flush()
+                    os.fsync(journal.fileno())
+                    os.replace(result["path"] + TMP_SUFFIX, result["path"])
+                    for field in ("events", "accounts", "unresolved"):
+                        totals[field] += result[field]
+                    totals["segments"] += 1
+                    _rekeyed_segments.inc()
+                    _rekeyed_events.inc(result["events"])
+                    _unresolved.inc(result["unresolved"])
+        finally:
+            if pool:
+                pool.terminate()
+                pool.join()
+        totals["seconds"] = round(time.perf_counter() - started, 3)
+        logger.info(f"Re-keyed {totals['segments']} segments ({totals['events']} events, "
+                    f"{totals['accounts']} pseudonyms, {totals['unresolved']} unresolved) "
+                    f"to key {self.new.key_id} in {totals['seconds']}s")
+        return totals
+
+
+# =============================================================================
+# Command line
+# =============================================================================
+def main():
+    import json
+
+    parser = argparse.ArgumentParser(description="Pseudonym keys, vault and archive re-keying")
+    commands = parser.add_subparsers(dest="command", required=True)
+    keygen = commands.add_parser("keygen", help="Write a new random key (hex) to a file")
+    keygen.add_argument("key_file")
+    legacy = commands.add_parser("legacy", help="Record legacy pseudonyms of known accounts in the vault")
+    legacy.add_argument("--vault", required=True)
+    legacy.add_argument("--venue", required=True)
+    legacy.add_argument("accounts", help="File with one account ID per line")
+    rekey = commands.add_parser("rekey", help="Re-key archive segments")
+    rekey.add_argument("segments", nargs="+")
+    rekey.add_argument("--key-file", required=True)
+    rekey.add_argument("--new-key-id", required=True)
+    rekey.add_argument("--old-key-id", default=LEGACY_KEY_ID)
+    rekey.add_argument("--vault")
+    rekey.add_argument("--workers", type=int, default=None)
+    rekey.add_argument("--compresslevel", type=int, default=6)
+    forget = commands.add_parser("forget", help="Erase an account's mappings from the vault")
+    forget.add_argument("--vault", required=True)
+    forget.add_argument("account")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+
+    if args.command == "keygen":
+        fd = os.open(args.key_file, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        with os.fdopen(fd, "w") as f:
+            f.write(Pseudonymizer.generate_key().hex() + "\n")
+    elif args.command == "legacy":
+        vault = PseudonymVault(args.vault)
+        legacy_ids = LegacyPseudonymizer(args.venue)
+        with open(args.accounts, "r") as f:
+            accounts = [line.strip() for line in f if line.strip()]
+        vault.record(LEGACY_KEY_ID, ((legacy_ids(account), account) for account in accounts))
+        print(json.dumps({"recorded": len(accounts)}))
+    elif args.command == "rekey":
+        with open(args.key_file, "r") as f:
+            key = bytes.fromhex(f.read().strip())
+        vault = PseudonymVault(args.vault) if args.vault else None
+        rekeyer = Rekeyer(Pseudonymizer(key, key_id=args.new_key_id), vault, args.old_key_id,
+                          workers=args.workers, compresslevel=args.compresslevel)
+        print(json.dumps(rekeyer.run(args.segments)))
+    elif args.command == "forget":
+        print(json.dumps({"erased": PseudonymVault(args.vault).forget(args.account)}))
+
+
+if __name__ == "__main__":
+    main()
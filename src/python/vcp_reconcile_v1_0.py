@@ -0,0 +1,344 @@
+#!/usr/bin/env python3
+"""
+VCP Range Reconciliation v1.0 - Anti-entropy Between a Local Archive and VCC
+Document ID: VSO-SDK-PY-019
+License: CC BY 4.0 International
+Maintainer: VeritasChain Standards Organization (VSO)
+
+This module confirms that every event the sidecar produced landed at VCC
+without re-reading everything through the rate-limited Explorer API:
+- Events are keyed by (timestamp_int, event_id); a range fingerprint is
+  the event count and the sum mod 2^256 of one SHA-256 per event over its
+  event_id and event_hash, answered in O(log N) from prefix sums
+- Ranges are compared top-down: per hour, per minute, then per block of
+  block_size and of leaf_size local events; only mismatching ranges are
+  split further
+- A range holding at most leaf_size events on both sides is settled by
+  fetching its (timestamp_int, event_id, event_hash) entries; a range VCC
+  holds nothing of needs no fetch at all
+- Each level sends all its ranges in batched requests, so finding D
+  missing or divergent events costs O(D x log N) ranges in a handful of
+  requests instead of a full scan
+
+The remote side is any DigestSource: a RangeIndex (a local stand-in, or a
+second archive) or ExplorerDigestSource over the Explorer endpoints
+POST /reconcile/digests and POST /reconcile/events.
+
+Usage:
+    local = RangeIndex.from_archive("segment-000001.ndjson.gz", "segment-000002.ndjson.gz")
+    remote = ExplorerDigestSource(ExplorerClient(api_key, tier=Tier.GOLD))
+    report = Reconciler(local, remote).run()
+    print(report.missing_remote)   # event_ids VCC does not have
+"""
+
+import argparse
+import gzip
+import hashlib
+import json
+import logging
+import time
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+from vcp_metrics_v1_0 import REGISTRY
+from vcp_sidecar_core_v1_0 import Tier, VCPEvent
+
+logger = logging.getLogger("vcp_reconcile")
+
+MINUTE_NS = 60 * 1_000_000_000
+HOUR_NS = 60 * MINUTE_NS
+TIME_SPLITS = 16  # Parts of a range where the remote side holds many more events than the local one
+
+_MASK = (1 << 256) - 1
+
+Key = Tuple[int, str]            # (timestamp_int, event_id)
+Range = Tuple[Key, Key]          # [low, high)
+Entry = Tuple[int, str, str]     # (timestamp_int, event_id, event_hash)
+
+_requests = REGISTRY.counter("vcp_reconcile_requests_total", "Requests sent by range reconciliation", ("kind",))
+_differences = REGISTRY.counter(
+    "vcp_reconcile_differences_total", "Events found missing or divergent by reconciliation", ("kind",)
+)
+
+
+def _leaf(event_id: str, event_hash: str) -> int:
+    return int.from_bytes(hashlib.sha256(f"{event_id}:{event_hash}".encode("utf-8")).digest(), "big")
+
+
+def encode_range(r: Range) -> list:
+    """JSON form of a range; timestamps as strings, as in event headers"""
+    (low_ts, low_id), (high_ts, high_id) = r
+    return [str(low_ts), low_id, str(high_ts), high_id]
+
+
+def decode_range(data: Sequence) -> Range:
+    return (int(data[0]), data[1]), (int(data[2]), data[3])
+
+
+# =============================================================================
+# Range index
+# =============================================================================
+class DigestSource:
+    """One side of a reconciliation"""
+
+    def digests(self, ranges: Sequence[Range]) -> List[Tuple[int, str]]:
+        """(count, fingerprint) of each range"""
+        raise NotImplementedError
+
+    def entries(self, ranges: Sequence[Range]) -> List[List[Entry]]:
+        """Entries of each range, in key order"""
+        raise NotImplementedError
+
+
+class RangeIndex(DigestSource):
+    """
+    Sorted event keys with prefix sums of their leaf hashes
+
+    A fingerprint is two bisections and a subtraction. The index is built
+    once; rebuild it to take in newly archived events.
+    """
+
+    def __init__(self, entries: Iterable[Entry]):
+        rows = sorted((int(ts), event_id, event_hash) for ts, event_id, event_hash in entries)
+        self.keys: List[Key] = [(ts, event_id) for ts, event_id, _ in rows]
+        self.hashes: List[str] = [event_hash for _, _, event_hash in rows]
+        prefix = [0] * (len(rows) + 1)
+        total = 0
+        for i, (_, event_id, event_hash) in enumerate(rows, 1):
+            total = (total + _leaf(event_id, event_hash)) & _MASK
+            prefix[i] = total
+        self._prefix = prefix
+
+    @classmethod
+    def from_events(cls, events: Iterable[VCPEvent]) -> "RangeIndex":
+        return cls((e.header.timestamp_int, e.header.event_id, e.security.event_hash) for e in events)
+
+    @classmethod
+    def from_archive(cls, *paths: str) -> "RangeIndex":
+        """Index NDJSON event files (gzip when named *.gz)"""
+        def read():
+            for path in paths:
+                opener = gzip.open if path.endswith(".gz") else open
+                with opener(path, "rt", encoding="utf-8") as f:
+                    for line in f:
+                        if line.strip():
+                            event = json.loads(line)
+                            header = event["header"]
+                            yield header["timestamp_int"], header["event_id"], event["security"]["event_hash"]
+        return cls(read())
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def span(self) -> Optional[Tuple[int, int]]:
+        """First and last timestamp_int, or None when empty"""
+        return (self.keys[0][0], self.keys[-1][0]) if self.keys else None
+
+    def _bounds(self, r: Range) -> Tuple[int, int]:
+        return bisect_left(self.keys, r[0]), bisect_left(self.keys, r[1])
+
+    def count(self, r: Range) -> int:
+        low, high = self._bounds(r)
+        return max(0, high - low)
+
+    def fingerprint(self, r: Range) -> Tuple[int, str]:
+        low, high = self._bounds(r)
+        if high <= low:
+            return 0, "0" * 64
+        return high - low, f"{(self._prefix[high] - self._prefix[low]) & _MASK:064x}"
+
+    def digests(self, ranges: Sequence[Range]) -> List[Tuple[int, str]]:
+        return [self.fingerprint(r) for r in ranges]
+
+    def entries(self, ranges: Sequence[Range]) -> List[List[Entry]]:
+        result = []
+        for r in ranges:
+            low, high = self._bounds(r)
+            result.append([(ts, event_id, self.hashes[i])
+                           for i, (ts, event_id) in enumerate(self.keys[low:high], low)])
+        return result
+
+    def block_bounds(self, r: Range, block_size: int) -> List[Key]:
+        """Local keys that cut r into blocks of block_size events"""
+        low, high = self._bounds(r)
+        return [self.keys[i] for i in range(low + block_size, high, block_size)]
+
+
+class ExplorerDigestSource(DigestSource):
+    """Remote side served by the Explorer reconciliation endpoints"""
+
+    def __init__(self, client):
+        self.client = client
+
+    def digests(self, ranges: Sequence[Range]) -> List[Tuple[int, str]]:
+        return [(count, digest) for count, digest in self.client.range_digests([encode_range(r) for r in ranges])]
+
+    def entries(self, ranges: Sequence[Range]) -> List[List[Entry]]:
+        return [[(int(ts), event_id, event_hash) for ts, event_id, event_hash in entries]
+                for entries in self.client.range_events([encode_range(r) for r in ranges])]
+
+
+# =============================================================================
+# Reconciliation
+# =============================================================================
+@dataclass
+class ReconcileReport:
+    missing_remote: List[str] = field(default_factory=list)    # Local events VCC does not have
+    missing_local: List[str] = field(default_factory=list)     # VCC events not in the local archive
+    divergent: List[Tuple[str, str, str]] = field(default_factory=list)  # (event_id, local hash, remote hash)
+    ranges: int = 0      # Fingerprints compared
+    entries: int = 0     # Remote entries fetched
+    requests: int = 0
+    seconds: float = 0.0
+
+    @property
+    def in_sync(self) -> bool:
+        return not (self.missing_remote or self.missing_local or self.divergent)
+
+    def to_dict(self) -> dict:
+        return {
+            "in_sync": self.in_sync,
+            "missing_remote": self.missing_remote,
+            "missing_local": self.missing_local,
+            "divergent": [list(d) for d in self.divergent],
+            "ranges": self.ranges,
+            "entries": self.entries,
+            "requests": self.requests,
+            "seconds": round(self.seconds, 3),
+        }
+
+
+class Reconciler:
+    """
+    Top-down comparison of a local RangeIndex with a remote DigestSource
+
+    run() starts from the hours covering the local archive (or the given
+    span) and walks down one level at a time. A mismatching range that
+    is empty remotely lists its local events as missing. One with at most
+    leaf_size events on both sides is settled from its entries. Otherwise
+    it is cut into minutes while it is longer than a minute, then at every
+    block_size-th and then leaf_size-th local key. A range with few local
+    events but many remote ones is cut into TIME_SPLITS equal time parts.
+    Each request carries up to batch_ranges ranges.
+    """
+
+    def __init__(self, local: RangeIndex, remote: DigestSource, block_size: int = 256, leaf_size: int = 32,
+                 batch_ranges: int = 1000):
+        self.local = local
+        self.remote = remote
+        self.leaf_size = max(1, leaf_size)
+        self.block_size = max(self.leaf_size, block_size)
+        self.batch_ranges = max(1, batch_ranges)
+
+    def run(self, start_ns: Optional[int] = None, end_ns: Optional[int] = None) -> ReconcileReport:
+        started = time.perf_counter()
+        report = ReconcileReport()
+        span = self.local.span()
+        if start_ns is None or end_ns is None:
+            if span is None:
+                report.seconds = time.perf_counter() - started
+                return report
+            start_ns = span[0] if start_ns is None else start_ns
+            end_ns = span[1] + 1 if end_ns is None else end_ns
+        first_hour = start_ns - start_ns % HOUR_NS
+        frontier = [((t, ""), (t + HOUR_NS, "")) for t in range(first_hour, end_ns, HOUR_NS)]
+
+        while frontier:
+            remote = self._digests(frontier, report)
+            local = self.local.digests(frontier)
+            settle, children = [], []
+            for r, mine, theirs in zip(frontier, local, remote):
+                if mine == theirs:
+                    continue
+                if theirs[0] == 0:
+                    report.missing_remote.extend(event_id for _, event_id, _ in self.local.entries([r])[0])
+                    continue
+                parts = self._split(r, mine[0]) if max(mine[0], theirs[0]) > self.leaf_size else None
+                if parts:
+                    children.extend(parts)
+                else:
+                    settle.append(r)
+            if settle:
+                self._settle(settle, report)
+            frontier = children
+
+        report.seconds = time.perf_counter() - started
+        for kind, found in (("missing_remote", report.missing_remote), ("missing_local", report.missing_local),
+                            ("divergent", report.divergent)):
+            if found:
+                _differences.labels(kind).inc(len(found))
+        return report
+
+    def _split(self, r: Range, local_count: int) -> List[Range]:
+        """Children of a mismatching range; empty when it cannot be cut"""
+        (low_ts, _), (high_ts, _) = r
+        if high_ts - low_ts > MINUTE_NS:
+            first = low_ts - low_ts % MINUTE_NS
+            cuts = [(t, "") for t in range(first + MINUTE_NS, high_ts, MINUTE_NS)]
+        elif local_count > self.leaf_size:
+            cuts = self.local.block_bounds(r, self.block_size if local_count > self.block_size else self.leaf_size)
+        else:
+            step = max(1, (high_ts - low_ts) // TIME_SPLITS)
+            cuts = [(t, "") for t in range(low_ts + step, high_ts, step)]
+        bounds = [r[0]] + [cut for cut in cuts if r[0] < cut < r[1]] + [r[1]]
+        if len(bounds) == 2:
+            return []
+        return list(zip(bounds, bounds[1:]))
+
+    def _digests(self, ranges: List[Range], report: ReconcileReport) -> List[Tuple[int, str]]:
+        result = []
+        for i in range(0, len(ranges), self.batch_ranges):
+            result.extend(self.remote.digests(ranges[i:i + self.batch_ranges]))
+            report.requests += 1
+            _requests.labels("digests").inc()
+        report.ranges += len(ranges)
+        return [tuple(d) for d in result]
+
+    def _settle(self, ranges: List[Range], report: ReconcileReport):
+        """Compare the entries of small ranges event by event"""
+        local = self.local.entries(ranges)
+        for i in range(0, len(ranges), self.batch_ranges):
+            remote = self.remote.entries(ranges[i:i + self.batch_ranges])
+            report.requests += 1
+            _requests.labels("events").inc()
+            for mine, theirs in zip(local[i:i + self.batch_ranges], remote):
+                report.entries += len(theirs)
+                remote_hashes = {event_id: event_hash for _, event_id, event_hash in theirs}
+                local_hashes = {event_id: event_hash for _, event_id, event_hash in mine}
+                for event_id, event_hash in local_hashes.items():
+                    other = remote_hashes.get(event_id)
+                    if other is None:
+                        report.missing_remote.append(event_id)
+                    elif other != event_hash:
+                        report.divergent.append((event_id, event_hash, other))
+                report.missing_local.extend(event_id for event_id in remote_hashes if event_id not in local_hashes)
+
+
+# =============================================================================
+# Command line
+# =============================================================================
+def main():
+    from vcp_explorer_v1_0 import DEFAULT_ENDPOINT, ExplorerClient
+
+    parser = argparse.ArgumentParser(description="Reconcile a local VCP archive with VCC")
+    parser.add_argument("archives", nargs="+", help="NDJSON event files or gzip segments")
+    parser.add_argument("--api-key", required=True)
+    parser.add_argument("--endpoint", default=DEFAULT_ENDPOINT)
+    parser.add_argument("--tier", default=Tier.SILVER, choices=[Tier.PLATINUM, Tier.GOLD, Tier.SILVER])
+    parser.add_argument("--block-size", type=int, default=256)
+    parser.add_argument("--leaf-size", type=int, default=32)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+
+    local = RangeIndex.from_archive(*args.archives)
+    remote = ExplorerDigestSource(ExplorerClient(args.api_key, args.endpoint, tier=args.tier))
+    report = Reconciler(local, remote, block_size=args.block_size, leaf_size=args.leaf_size).run()
+    print(json.dumps(report.to_dict(), indent=2))
+    if not report.in_sync:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,292 @@
+#!/usr/bin/env python3
+"""
+VCP Relay Daemon v1.0 - Local Relay for the MQL5 Bridge
+Document ID: VSO-SDK-PY-006
+License: CC BY 4.0 International
+Maintainer: VeritasChain Standards Organization (VSO)
+
+This module takes event logging off the EA's terminal thread:
+- EAs hand unhashed event records to a localhost TCP socket or a spool file
+  (tailed by vcp_spool_v1_0.SpoolTailer)
+- Records arrive as NDJSON (one record per line) and are ingested in bulk
+- SHA-256 canonical hashing and chaining use VCPEventFactory
+- Events are batch-uploaded through VCPManagerAdapter / VCCClient
+
+Record format (written by vcp_mql_bridge_v1_0.mqh in relay mode):
+    {"header": {"event_id": "...", "trace_id": "...", "timestamp_int": "...",
+                "event_type_code": 2, "symbol": "EURUSD", "account_id": "12345"},
+     "payload": {"trade_data": {...}, "vcp_risk": {...}}}
+
+Usage:
+    python src/python/vcp_relay_v1_0.py --venue-id MY_PROP_FIRM --port 9740 --spool-dir /path/to/spool
+"""
+
+import argparse
+import json
+import logging
+import os
+import socketserver
+import time
+from threading import Thread
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+from vcp_checkpoint_v1_0 import SidecarCheckpointer
+from vcp_heartbeat_v1_0 import HeartbeatScheduler
+from vcp_merkle_v1_0 import MerkleAnchorer
+from vcp_metrics_v1_0 import REGISTRY
+from vcp_sidecar_adapter_v1_0 import EventTypeCode, VCPEvent, VCPManagerAdapter, Tier
+from vcp_signing_v1_0 import SigningStage, SoftwareSigner
+from vcp_spool_v1_0 import SpoolTailer
+
+logger = logging.getLogger("vcp_relay")
+
+DEFAULT_PORT = 9740
+
+_records = REGISTRY.counter("vcp_relay_records_total", "Relay records accepted", ("source",))
+_records_invalid = REGISTRY.counter("vcp_relay_records_invalid_total", "Relay records rejected as malformed")
+_records_dropped = REGISTRY.counter("vcp_relay_records_dropped_total", "Relay events dropped by a full queue")
+
+
+class RelayRecordError(ValueError):
+    """Raised for a relay record that cannot be turned into an event"""
+
+
+# =============================================================================
+# Event Relay
+# =============================================================================
+class EventRelay:
+    """
+    Builds hashed, chained VCP events from raw EA records and queues them
+    on a VCPManagerAdapter for batched upload.
+
+    All sources (socket connections, spool files) share one relay, so the
+    hash chain has a single writer and follows arrival order.
+    """
+
+    def __init__(
+        self,
+        adapter: VCPManagerAdapter,
+        on_event: Optional[Callable[[VCPEvent], None]] = None
+    ):
+        self.adapter = adapter
+        # Called with every built event, e.g. TraceJoinEngine.observe
+        self.on_event = on_event
+        # The adapter's factory lock, so REC, heartbeat and anchor events chain in turn with relayed ones
+        self._lock = adapter.factory_lock
+
+    def build_event(self, record: Dict) -> VCPEvent:
+        """Hash and chain one record (caller holds the relay lock)"""
+        try:
+            header = record["header"]
+            event_type = EventTypeCode(int(header["event_type_code"]))
+            timestamp_int = header.get("timestamp_int")
+            event = self.adapter.factory.create_event(
+                event_type,
+                symbol=header.get("symbol", ""),
+                account_id=str(header.get("account_id", "")),
+                payload=record.get("payload") or {},
+                trace_id=header.get("trace_id") or None,
+                event_id=header.get("event_id") or None,
+                timestamp_ns=int(timestamp_int) if timestamp_int else None
+            )
+        except (KeyError, TypeError, ValueError) as e:
+            raise RelayRecordError(f"Invalid relay record: {e}") from e
+        if event_type == EventTypeCode.HBT and not header.get("trace_id"):
+            event.header.trace_id = event.header.event_id
+        return event
+
+    def submit(self, records: Iterable[Dict], source: str = "api", collect: Optional[List[str]] = None) -> int:
+        """Hash, chain and queue records; returns the number queued (event IDs appended to collect)"""
+        queued = invalid = dropped = 0
+        with self._lock:
+            for record in records:
+                try:
+                    event = self.build_event(record)
+                except RelayRecordError as e:
+                    invalid += 1
+                    logger.warning(str(e))
+                    continue
+                if self.on_event:
+                    self.on_event(event)
+                if collect is not None:
+                    collect.append(event.header.event_id)
+                if self.adapter.queue_event(event):
+                    queued += 1
+                else:
+                    dropped += 1
+        _records.labels(source).inc(queued)
+        if invalid:
+            _records_invalid.inc(invalid)
+        if dropped:
+            _records_dropped.inc(dropped)
+        return queued
+
+    def submit_lines(
+        self, lines: Iterable[Union[str, bytes]], source: str = "api", collect: Optional[List[str]] = None
+    ) -> int:
+        """Parse NDJSON lines and submit them as one bulk"""
+        records = []
+        invalid = 0
+        for line in lines:
+            if not line.strip():
+                continue
+            try:
+                records.append(json.loads(line))
+            except ValueError:
+                invalid += 1
+        if invalid:
+            _records_invalid.inc(invalid)
+            logger.warning(f"Skipped {invalid} malformed relay lines from {source}")
+        return self.submit(records, source, collect) if records else 0
+
+
+# =============================================================================
+# Localhost Socket Source
+# =============================================================================
+class _RelayHandler(socketserver.BaseRequestHandler):
+    relay: EventRelay
+    chunk_size: int = 65536
+
+    def handle(self):
+        pending = b""
+        while True:
+            chunk = self.request.recv(self.chunk_size)
+            if not chunk:
+                break
+            pending += chunk
+            if b"\n" not in chunk:
+                continue
+            complete, _, pending = pending.rpartition(b"\n")
+            self.relay.submit_lines(complete.split(b"\n"), "socket")
+        if pending.strip():
+            self.relay.submit_lines([pending], "socket")
+
+
+class _RelayTCPServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+class RelaySocketServer:
+    """NDJSON over localhost TCP; one connection per EA, kept open"""
+
+    def __init__(self, relay: EventRelay, host: str = "127.0.0.1", port: int = DEFAULT_PORT):
+        handler = type("RelayHandler", (_RelayHandler,), {"relay": relay})
+        self._server = _RelayTCPServer((host, port), handler)
+        self._thread: Optional[Thread] = None
+
+    @property
+    def address(self) -> Tuple[str, int]:
+        return self._server.server_address[:2]
+
+    def start(self) -> "RelaySocketServer":
+        self._thread = Thread(target=self._server.serve_forever, name="vcp-relay-socket", daemon=True)
+        self._thread.start()
+        logger.info(f"Relay listening on {self.address[0]}:{self.address[1]}")
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread:
+            self._thread.join(timeout=5)
+
+
+# =============================================================================
+# Command Line
+# =============================================================================
+def main():
+    parser = argparse.ArgumentParser(description="Run the VCP relay daemon for MQL5 EAs")
+    parser.add_argument("--venue-id", required=True)
+    parser.add_argument("--endpoint", default="https://api.veritaschain.org")
+    parser.add_argument("--api-key", default=os.environ.get("VCC_API_KEY", ""))
+    parser.add_argument("--tier", default=Tier.SILVER, choices=(Tier.SILVER, Tier.GOLD, Tier.PLATINUM))
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help="0 disables the socket source")
+    parser.add_argument("--spool-dir", help="Directory of EA spool files (*.ndjson) to tail")
+    parser.add_argument("--spool-offsets",
+                        help="Offsets of acknowledged spool lines (default: <spool-dir>/.offsets.json)")
+    parser.add_argument("--checkpoint", help="Sidecar checkpoint file, restored on startup")
+    parser.add_argument("--checkpoint-interval", type=float, default=30.0)
+    parser.add_argument("--sign-key", help="Ed25519 private key file; signs every event (GOLD/PLATINUM)")
+    parser.add_argument("--sign-workers", type=int, default=2)
+    parser.add_argument("--anchor-every", type=int, default=0, help="Emit a Merkle anchor every N events (0 = off)")
+    parser.add_argument("--anchor-seconds", type=float, default=60.0)
+    parser.add_argument("--batch-size", type=int, default=100)
+    parser.add_argument("--spill-dir", help="Spill queue overflow here instead of dropping events")
+    parser.add_argument("--dead-letter", help="Append events VCC keeps refusing to this NDJSON file")
+    parser.add_argument("--max-attempts", type=int, default=5,
+                        help="Refusals before an event is dead-lettered")
+    parser.add_argument("--heartbeat-idle", type=float, default=0.0,
+                        help="Emit an HBT after this many seconds without events (0 = off)")
+    parser.add_argument("--metrics-port", type=int)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+
+    adapter = VCPManagerAdapter(
+        venue_id=args.venue_id,
+        vcc_endpoint=args.endpoint,
+        vcc_api_key=args.api_key,
+        tier=args.tier,
+        batch_size=args.batch_size,
+        metrics_port=args.metrics_port,
+        spill_dir=args.spill_dir,
+        max_attempts=args.max_attempts,
+        dead_letter_path=args.dead_letter
+    )
+    if args.sign_key:
+        SigningStage(SoftwareSigner.from_file(args.sign_key), workers=args.sign_workers).attach(adapter)
+    if args.anchor_every:
+        MerkleAnchorer(adapter.factory, every_events=args.anchor_every, every_seconds=args.anchor_seconds)
+    relay = EventRelay(adapter)
+    sources = []
+    tailer = None
+    if args.port:
+        sources.append(RelaySocketServer(relay, args.host, args.port))
+    if args.spool_dir:
+        tailer = SpoolTailer(
+            relay, args.spool_dir,
+            checkpoint_path=args.spool_offsets or os.path.join(args.spool_dir, ".offsets.json")
+        )
+        sources.append(tailer)
+    if not sources:
+        parser.error("enable at least one of --port or --spool-dir")
+
+    checkpointer = None
+    if args.checkpoint:
+        checkpointer = SidecarCheckpointer(
+            adapter, args.checkpoint, wal=tailer,
+            interval=args.checkpoint_interval, lock=relay._lock
+        )
+        checkpointer.restore()
+
+    heartbeats = None
+    if args.heartbeat_idle:
+        heartbeats = HeartbeatScheduler(idle_gap=args.heartbeat_idle)
+        heartbeats.attach(adapter, lock=relay._lock)
+
+    adapter.start()
+    for source in sources:
+        source.start()
+    if checkpointer:
+        checkpointer.start()
+    if heartbeats:
+        heartbeats.start()
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if heartbeats:
+            heartbeats.stop()
+        for source in sources:
+            source.stop()
+        if checkpointer:
+            checkpointer.stop()
+        adapter.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,693 @@
+#!/usr/bin/env python3
+"""
+VCP Retention v1.0 - Sealed Daily Archives, Catalog and Retention Policies
+Document ID: VSO-SDK-PY-021
+License: CC BY 4.0 International
+Maintainer: VeritasChain Standards Organization (VSO)
+
+This module manages the lifecycle of the events a sidecar emits locally:
+- Active segments: every event handed to append() (see
+  VCPManagerAdapter.archive) is written as one NDJSON line to a plain
+  segment of its UTC day, rolled by size
+- Compaction: once a day is over, its segments are rolled into one
+  sealed archive, gzip NDJSON in independent blocks of block_events
+  lines, with a block index next to it; the archive is made read-only
+  and the segments are removed
+- Catalog: one small JSON file with the events, size, min/max
+  timestamp_int and RFC 6962 Merkle root (over the event hashes, in
+  archive order) of every archive; queries read only the archives and
+  blocks whose timestamp range overlaps theirs
+- Retention: RetentionPolicy drops the oldest archives by age and by
+  total size
+- Compaction runs on a background thread at a lower OS priority, with
+  reads and writes throttled to io_bytes_per_second
+
+Layout:
+    <directory>/active/<YYYY-MM-DD>.<seq>.ndjson
+    <directory>/archive/<venue>-<YYYY-MM-DD>.<part>.ndjson.gz (+ .idx.json)
+    <directory>/catalog.json
+
+Usage:
+    manager = RetentionManager("/var/lib/vcp/retention", "MY_BROKER",
+                               policy=RetentionPolicy(max_age_days=400)).start()
+    adapter.archive = manager
+    lines = manager.read(start_ns, end_ns)
+    python vcp_retention_v1_0.py --dir /var/lib/vcp/retention --venue MY_BROKER list
+"""
+
+import argparse
+import calendar
+import gzip
+import json
+import logging
+import os
+import re
+import tempfile
+import time
+from dataclasses import asdict, dataclass, field
+from threading import Event, Lock, Thread, get_native_id
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from vcp_merkle_v1_0 import TREE_ALG_PREFIX, tree_hash_algo
+from vcp_metrics_v1_0 import REGISTRY
+from vcp_sidecar_core_v1_0 import DEFAULT_HASH_ALGO, VCPEvent, VCPEventSerializer, get_hash_algo
+
+logger = logging.getLogger("vcp_retention")
+
+DAY_NS = 86_400 * 1_000_000_000
+CATALOG_FILE = "catalog.json"
+ACTIVE_DIR = "active"
+ARCHIVE_DIR = "archive"
+ARCHIVE_SUFFIX = ".ndjson.gz"
+INDEX_SUFFIX = ".idx.json"
+_SEGMENT_NAME = re.compile(r"^(\d{4}-\d{2}-\d{2})\.(\d{6})\.ndjson$")
+# VCPEventSerializer.to_json and compact JSON
+_TS_MARKERS = (b'"timestamp_int": "', b'"timestamp_int":"')
+_HASH_MARKERS = (b'"event_hash": "', b'"event_hash":"')
+
+_events_appended = REGISTRY.counter("vcp_retention_events_appended_total", "Events written to active segments")
+_events_compacted = REGISTRY.counter("vcp_retention_events_compacted_total", "Events compacted into archives")
+_archives_sealed = REGISTRY.counter("vcp_retention_archives_sealed_total", "Daily archives sealed")
+_archives_dropped = REGISTRY.counter("vcp_retention_archives_dropped_total", "Archives dropped by retention")
+_lines_skipped = REGISTRY.counter("vcp_retention_lines_skipped_total", "Unreadable segment lines skipped")
+_compaction_seconds = REGISTRY.histogram("vcp_retention_compaction_seconds", "Time to seal one daily archive")
+
+
+class RetentionError(Exception):
+    """Raised when the catalog cannot be read"""
+
+
+def day_name(timestamp_ns: int) -> str:
+    """UTC day of a timestamp_int, as YYYY-MM-DD"""
+    return time.strftime("%Y-%m-%d", time.gmtime(timestamp_ns // 1_000_000_000))
+
+
+def day_start(name: str) -> int:
+    """timestamp_int of 00:00 UTC of a YYYY-MM-DD day"""
+    return calendar.timegm(time.strptime(name, "%Y-%m-%d")) * 1_000_000_000
+
+
+def _save_json(path: str, data, prefix: str):
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(prefix=prefix, dir=directory)
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump(data, f, separators=(',', ':'))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except OSError:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+
+def _field(line: bytes, markers: Tuple[bytes, bytes]) -> Optional[bytes]:
+    for marker in markers:
+        start = line.find(marker)
+        if start >= 0:
+            start += len(marker)
+            return line[start:line.index(b'"', start)]
+    return None
+
+
+def parse_line(line: bytes) -> Tuple[int, str]:
+    """(timestamp_int, event_hash) of one archived event line"""
+    stamp, event_hash = _field(line, _TS_MARKERS), _field(line, _HASH_MARKERS)
+    if stamp is not None and event_hash is not None:
+        return int(stamp), event_hash.decode("ascii")
+    event = json.loads(line)
+    return int(event["header"]["timestamp_int"]), event["security"]["event_hash"]
+
+
+# =============================================================================
+# Merkle Root
+# =============================================================================
+class StreamingMerkleRoot:
+    """
+    RFC 6962 root over event hashes added one at a time
+
+    Keeps one subtree root per set bit of the leaf count, so memory is
+    O(log n); the root equals MerkleTree(leaves).root.
+    """
+
+    def __init__(self, hash_algo: str = DEFAULT_HASH_ALGO):
+        self.hash_algo = hash_algo
+        self._hash = get_hash_algo(hash_algo)
+        self._stack: List[Tuple[int, bytes]] = []  # (leaves below, subtree root)
+        self.size = 0
+
+    def add(self, leaf: bytes):
+        digest = self._hash
+        node, count = digest(b"\x00" + leaf).digest(), 1
+        stack = self._stack
+        while stack and stack[-1][0] == count:
+            node = digest(b"\x01" + stack.pop()[1] + node).digest()
+            count *= 2
+        stack.append((count, node))
+        self.size += 1
+
+    @property
+    def root(self) -> bytes:
+        if not self._stack:
+            return self._hash(b"").digest()
+        node = self._stack[-1][1]
+        for _, left in reversed(self._stack[:-1]):
+            node = self._hash(b"\x01" + left + node).digest()
+        return node
+
+
+# =============================================================================
+# Catalog
+# =============================================================================
+@dataclass
+class ArchiveEntry:
+    """One sealed archive, as listed in the catalog"""
+    file: str
+    day: str
+    part: int
+    events: int
+    bytes: int
+    raw_bytes: int
+    min_ts: int
+    max_ts: int
+    merkle_root: str
+    tree_alg: str
+    blocks: int
+    sealed_at: float
+    sources: List[str] = field(default_factory=list)  # Active segments compacted into it
+
+    def overlaps(self, start_ns: Optional[int], end_ns: Optional[int]) -> bool:
+        return (start_ns is None or self.max_ts >= start_ns) and (end_ns is None or self.min_ts < end_ns)
+
+
+class Catalog:
+    """Archives of one retention directory, oldest day first"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.entries: List[ArchiveEntry] = []
+        self.next_segment = 0  # Above every segment number ever sealed, so names are never reused
+        if os.path.exists(path):
+            try:
+                with open(path, "r") as f:
+                    data = json.load(f)
+                self.entries = [ArchiveEntry(**entry) for entry in data["archives"]]
+                self.next_segment = data.get("next_segment", 0)
+            except (ValueError, KeyError, TypeError) as e:
+                raise RetentionError(f"Unreadable catalog {path}: {e}")
+        for entry in self.entries:
+            for source in entry.sources:
+                self.next_segment = max(self.next_segment, int(source[11:17]) + 1)
+
+    def save(self):
+        _save_json(self.path, {
+            "version": 1, "next_segment": self.next_segment, "archives": [asdict(e) for e in self.entries]
+        }, ".catalog-")
+
+    def add(self, entry: ArchiveEntry):
+        for source in entry.sources:
+            self.next_segment = max(self.next_segment, int(source[11:17]) + 1)
+        self.entries.append(entry)
+        self.entries.sort(key=lambda e: (e.day, e.part))
+        self.save()
+
+    def remove(self, entries: List[ArchiveEntry]):
+        dropped = {e.file for e in entries}
+        self.entries = [e for e in self.entries if e.file not in dropped]
+        self.save()
+
+    def select(self, start_ns: Optional[int] = None, end_ns: Optional[int] = None) -> List[ArchiveEntry]:
+        """Archives that may hold events with start_ns <= timestamp_int < end_ns"""
+        return [e for e in self.entries if e.overlaps(start_ns, end_ns)]
+
+    def next_part(self, day: str) -> int:
+        """Part number of the next archive of a day (above any part still kept)"""
+        return max((e.part + 1 for e in self.entries if e.day == day), default=0)
+
+    @property
+    def total_bytes(self) -> int:
+        return sum(e.bytes for e in self.entries)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+
+@dataclass
+class RetentionPolicy:
+    """Drop archives older than max_age_days, then the oldest until max_bytes fit"""
+    max_age_days: Optional[float] = None
+    max_bytes: Optional[int] = None
+
+    def expired(self, entries: List[ArchiveEntry], now_ns: int) -> List[ArchiveEntry]:
+        keep = list(entries)
+        dropped = []
+        if self.max_age_days is not None:
+            cutoff = now_ns - int(self.max_age_days * DAY_NS)
+            dropped = [e for e in keep if e.max_ts < cutoff]
+            keep = [e for e in keep if e.max_ts >= cutoff]
+        if self.max_bytes is not None:
+            keep.sort(key=lambda e: (e.max_ts, e.day, e.part))
+            total = sum(e.bytes for e in keep)
+            while keep and total > self.max_bytes:
+                entry = keep.pop(0)
+                total -= entry.bytes
+                dropped.append(entry)
+        return dropped
+
+
+# =============================================================================
+# I/O Throttle
+# =============================================================================
+class IOThrottle:
+    """Paces callers to bytes_per_second (None: unthrottled)"""
+
+    def __init__(
+        self,
+        bytes_per_second: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep
+    ):
+        self.bytes_per_second = bytes_per_second
+        self._clock = clock
+        self._sleep = sleep
+        self._next = 0.0
+
+    def consume(self, nbytes: int):
+        if not self.bytes_per_second:
+            return
+        now = self._clock()
+        self._next = max(self._next, now) + nbytes / self.bytes_per_second
+        if self._next > now:
+            self._sleep(self._next - now)
+
+
+# =============================================================================
+# Retention Manager
+# =============================================================================
+class RetentionManager:
+    """
+    Active segments, compaction into sealed daily archives and retention
+
+    A day is compacted once its end plus grace_seconds has passed, by the
+    clock or by the newest timestamp appended. Events that arrive for a
+    day already sealed go to a new segment and become the next part of
+    that day.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        venue_id: str,
+        policy: Optional[RetentionPolicy] = None,
+        hash_algo: str = DEFAULT_HASH_ALGO,
+        segment_bytes: int = 64 << 20,
+        block_events: int = 4096,
+        compresslevel: int = 6,
+        grace_seconds: float = 300.0,
+        interval: float = 30.0,
+        io_bytes_per_second: Optional[float] = 32 << 20,
+        nice: int = 10,
+        clock: Callable[[], int] = time.time_ns
+    ):
+        self.directory = directory
+        self.venue_id = venue_id
+        self.policy = policy or RetentionPolicy()
+        self.hash_algo = hash_algo
+        self.segment_bytes = segment_bytes
+        self.block_events = block_events
+        self.compresslevel = compresslevel
+        self.grace_ns = int(grace_seconds * 1_000_000_000)
+        self.interval = interval
+        self.throttle = IOThrottle(io_bytes_per_second)
+        self.nice = nice
+        self._clock = clock
+        self.active_dir = os.path.join(directory, ACTIVE_DIR)
+        self.archive_dir = os.path.join(directory, ARCHIVE_DIR)
+        os.makedirs(self.active_dir, exist_ok=True)
+        os.makedirs(self.archive_dir, exist_ok=True)
+        self.catalog = Catalog(os.path.join(directory, CATALOG_FILE))
+
+        # Active segment
+        self._lock = Lock()
+        self._file = None
+        self._segment: Optional[str] = None
+        self._day = (0, 0)            # [start, end) of the open segment's day
+        self._written = 0
+        self._watermark = 0           # Newest timestamp_int appended
+        self._seq = self._recover()
+
+        # Compaction
+        self._compact_lock = Lock()
+        self._stop = Event()
+        self._thread: Optional[Thread] = None
+
+    def _recover(self) -> int:
+        """Finish an interrupted compaction; returns the next segment number"""
+        compacted = {source for entry in self.catalog.entries for source in entry.sources}
+        seq = self.catalog.next_segment
+        for name in os.listdir(self.active_dir):
+            match = _SEGMENT_NAME.match(name)
+            if not match:
+                continue
+            if name in compacted:
+                os.unlink(os.path.join(self.active_dir, name))  # Sealed before the segment was removed
+                continue
+            seq = max(seq, int(match.group(2)) + 1)
+        for name in os.listdir(self.archive_dir):
+            if name.startswith(".archive-"):
+                os.unlink(os.path.join(self.archive_dir, name))
+        return seq
+
+    # -------------------------------------------------------------------------
+    # Active segments
+    # -------------------------------------------------------------------------
+    def append(self, event: VCPEvent):
+        """Write one event to the active segment of its day"""
+        self.append_line(VCPEventSerializer.to_json(event), int(event.header.timestamp_int))
+
+    def append_line(self, line: str, timestamp_ns: Optional[int] = None):
+        """Write one serialized event (VCPEventSerializer.to_json) to the active segment of its day"""
+        if timestamp_ns is None:
+            timestamp_ns = parse_line(line.encode("utf-8"))[0]
+        data = line + "\n"
+        with self._lock:
+            start, end = self._day
+            if not start <= timestamp_ns < end or self._written >= self.segment_bytes:
+                self._open(timestamp_ns)
+            self._file.write(data)
+            self._written += len(data)
+            if timestamp_ns > self._watermark:
+                self._watermark = timestamp_ns
+        _events_appended.inc()
+
+    def _open(self, timestamp_ns: int):
+        self._close()
+        start = timestamp_ns - timestamp_ns % DAY_NS
+        self._segment = f"{day_name(start)}.{self._seq:06d}.ndjson"
+        self._seq += 1
+        self._file = open(os.path.join(self.active_dir, self._segment), "a", encoding="utf-8")
+        self._day = (start, start + DAY_NS)
+        self._written = 0
+
+    def _close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+            self._segment = None
+            self._day = (0, 0)
+
+    def flush(self):
+        with self._lock:
+            if self._file is not None:
+                self._file.flush()
+
+    def roll(self):
+        """Close the open segment, so compaction can take it"""
+        with self._lock:
+            self._close()
+
+    def closed_segments(self) -> Dict[str, List[str]]:
+        """Active segments not open for writing, by day, oldest first"""
+        with self._lock:
+            names = sorted(
+                name for name in os.listdir(self.active_dir)
+                if _SEGMENT_NAME.match(name) and name != self._segment
+            )
+        days: Dict[str, List[str]] = {}
+        for name in names:
+            days.setdefault(name[:10], []).append(name)
+        for segments in days.values():
+            segments.sort(key=lambda name: name[11:17])
+        return days
+
+    # -------------------------------------------------------------------------
+    # Compaction
+    # -------------------------------------------------------------------------
+    def due_days(self, force: bool = False) -> Dict[str, List[str]]:
+        """Closed segments of days that are over (all closed segments with force)"""
+        now = max(self._watermark, self._clock())
+        with self._lock:
+            if self._file is not None and self._day[1] + self.grace_ns <= now:
+                self._close()         # Its day is over and no late event reopened it
+        return {
+            day: segments for day, segments in self.closed_segments().items()
+            if force or day_start(day) + DAY_NS + self.grace_ns <= now
+        }
+
+    def compact(self, force: bool = False) -> List[ArchiveEntry]:
+        """Seal every due day; returns the new catalog entries"""
+        sealed = []
+        with self._compact_lock:
+            for day, segments in sorted(self.due_days(force).items()):
+                entry = self._seal(day, segments)
+                if entry is not None:
+                    sealed.append(entry)
+        return sealed
+
+    def _seal(self, day: str, segments: List[str]) -> Optional[ArchiveEntry]:
+        started = time.perf_counter()
+        part = self.catalog.next_part(day)
+        name = f"{self.venue_id}-{day}.{part:03d}{ARCHIVE_SUFFIX}"
+        path = os.path.join(self.archive_dir, name)
+        merkle = StreamingMerkleRoot(self.hash_algo)
+        blocks: List[List[int]] = []      # [min_ts, max_ts, offset, length, events]
+        raw_bytes = offset = 0
+        throttle = self.throttle
+
+        fd, tmp_path = tempfile.mkstemp(prefix=".archive-", dir=self.archive_dir)
+        try:
+            with os.fdopen(fd, "wb") as out:
+                block: List[bytes] = []
+                block_min = block_max = 0
+
+                def write_block():
+                    nonlocal offset
+                    raw = b"".join(block)
+                    data = gzip.compress(raw, compresslevel=self.compresslevel, mtime=0)
+                    out.write(data)
+                    blocks.append([block_min, block_max, offset, len(data), len(block)])
+                    offset += len(data)
+                    throttle.consume(len(raw) + len(data))
+                    block.clear()
+
+                for segment in segments:
+                    with open(os.path.join(self.active_dir, segment), "rb") as f:
+                        for line in f:
+                            if not line.endswith(b"\n"):
+                                line += b"\n"
+                            try:
+                                stamp, event_hash = parse_line(line)
+                                leaf = bytes.fromhex(event_hash)
+                            except (ValueError, KeyError, TypeError):
+                                _lines_skipped.inc()
+                                logger.warning(f"Skipping unreadable line in {segment}")
+                                continue
+                            merkle.add(leaf)
+                            if not block:
+                                block_min = block_max = stamp
+                            elif stamp < block_min:
+                                block_min = stamp
+                            elif stamp > block_max:
+                                block_max = stamp
+                            block.append(line)
+                            raw_bytes += len(line)
+                            if len(block) >= self.block_events:
+                                write_block()
+                if block:
+                    write_block()
+                out.flush()
+                os.fsync(out.fileno())
+            if not blocks:
+                os.unlink(tmp_path)
+            else:
+                os.chmod(tmp_path, 0o444)
+                os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+
+        entry = None
+        events = merkle.size
+        if blocks:
+            min_ts = min(b[0] for b in blocks)
+            max_ts = max(b[1] for b in blocks)
+            _save_json(path[:-len(ARCHIVE_SUFFIX)] + INDEX_SUFFIX, {"file": name, "blocks": blocks}, ".archive-")
+            entry = ArchiveEntry(
+                file=name, day=day, part=part, events=events, bytes=offset, raw_bytes=raw_bytes,
+                min_ts=min_ts, max_ts=max_ts, merkle_root=merkle.root.hex(),
+                tree_alg=TREE_ALG_PREFIX + self.hash_algo, blocks=len(blocks), sealed_at=time.time(),
+                sources=list(segments)
+            )
+            self.catalog.add(entry)
+            _events_compacted.inc(events)
+            _archives_sealed.inc()
+        for segment in segments:
+            os.unlink(os.path.join(self.active_dir, segment))
+        seconds = time.perf_counter() - started
+        _compaction_seconds.observe(seconds)
+        if entry:
+            logger.info(f"Sealed {name}: {events} events, {raw_bytes} -> {offset} bytes in {seconds:.1f}s")
+        return entry
+
+    # -------------------------------------------------------------------------
+    # Retention and queries
+    # -------------------------------------------------------------------------
+    def enforce(self, now_ns: Optional[int] = None) -> List[ArchiveEntry]:
+        """Drop the archives the policy no longer keeps; returns them"""
+        now = now_ns if now_ns is not None else max(self._watermark, self._clock())
+        with self._compact_lock:
+            dropped = self.policy.expired(self.catalog.entries, now)
+            if not dropped:
+                return []
+            self.catalog.remove(dropped)
+            for entry in dropped:
+                path = os.path.join(self.archive_dir, entry.file)
+                for name in (path, path[:-len(ARCHIVE_SUFFIX)] + INDEX_SUFFIX):
+                    if os.path.exists(name):
+                        os.unlink(name)
+                logger.info(f"Dropped {entry.file} ({entry.day}, {entry.bytes} bytes)")
+            _archives_dropped.inc(len(dropped))
+        return dropped
+
+    def blocks(self, entry: ArchiveEntry) -> List[List[int]]:
+        path = os.path.join(self.archive_dir, entry.file)
+        with open(path[:-len(ARCHIVE_SUFFIX)] + INDEX_SUFFIX, "r") as f:
+            return json.load(f)["blocks"]
+
+    def read(self, start_ns: Optional[int] = None, end_ns: Optional[int] = None) -> Iterator[str]:
+        """Archived event lines with start_ns <= timestamp_int < end_ns, in archive order"""
+        for entry in self.catalog.select(start_ns, end_ns):
+            whole = (start_ns is None or entry.min_ts >= start_ns) and (end_ns is None or entry.max_ts < end_ns)
+            with open(os.path.join(self.archive_dir, entry.file), "rb") as f:
+                for block_min, block_max, offset, length, _ in self.blocks(entry):
+                    if (start_ns is not None and block_max < start_ns) or (end_ns is not None and block_min >= end_ns):
+                        continue
+                    f.seek(offset)
+                    lines = gzip.decompress(f.read(length)).decode("utf-8").splitlines()
+                    if whole or (
+                        (start_ns is None or block_min >= start_ns) and (end_ns is None or block_max < end_ns)
+                    ):
+                        yield from lines
+                        continue
+                    for line in lines:
+                        stamp = parse_line(line.encode("utf-8"))[0]
+                        if (start_ns is None or stamp >= start_ns) and (end_ns is None or stamp < end_ns):
+                            yield line
+
+    def verify(self, entry: ArchiveEntry) -> bool:
+        """Recompute an archive's Merkle root and event count against the catalog"""
+        merkle = StreamingMerkleRoot(tree_hash_algo(entry.tree_alg))
+        with gzip.open(os.path.join(self.archive_dir, entry.file), "rb") as f:
+            for line in f:
+                merkle.add(bytes.fromhex(parse_line(line)[1]))
+        return merkle.size == entry.events and merkle.root.hex() == entry.merkle_root
+
+    # -------------------------------------------------------------------------
+    # Background thread
+    # -------------------------------------------------------------------------
+    def _run(self):
+        if self.nice:
+            try:
+                # Linux schedules threads individually, so this lowers only the compactor
+                os.setpriority(os.PRIO_PROCESS, get_native_id(), self.nice)
+            except (AttributeError, OSError) as e:
+                logger.debug(f"Cannot lower the compaction thread's priority: {e}")
+        while not self._stop.wait(self.interval):
+            try:
+                self.flush()
+                self.compact()
+                self.enforce()
+            except Exception as e:
+                logger.error(f"Compaction failed: {e}")
+
+    def start(self) -> "RetentionManager":
+        self._stop.clear()
+        self._thread = Thread(target=self._run, name="vcp-retention", daemon=True)
+        self._thread.start()
+        logger.info(f"Retention manager started: {self.directory}, {len(self.catalog)} archives")
+        return self
+
+    def stop(self):
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=60)
+            self._thread = None
+        self.roll()
+
+    def status(self) -> Dict:
+        with self._lock:
+            open_segment, written = self._segment, self._written
+        return {
+            "archives": len(self.catalog),
+            "archive_bytes": self.catalog.total_bytes,
+            "archived_events": sum(e.events for e in self.catalog.entries),
+            "active_segment": open_segment,
+            "active_bytes": written,
+            "pending_days": sorted(self.closed_segments()),
+        }
+
+
+# =============================================================================
+# Command line
+# =============================================================================
+def _parse_time(value: str) -> int:
+    """timestamp_int from nanoseconds or an ISO 8601 time (UTC unless given)"""
+    if value.isdigit():
+        return int(value)
+    from datetime import datetime, timezone
+    moment = datetime.fromisoformat(value)
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return int(moment.timestamp()) * 1_000_000_000 + moment.microsecond * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Sealed daily archives, catalog and retention")
+    parser.add_argument("--dir", required=True, help="Retention directory")
+    parser.add_argument("--venue", required=True)
+    parser.add_argument("--io-mbps", type=float, default=None, help="Compaction I/O limit in MB/s (default: none)")
+    commands = parser.add_subparsers(dest="command", required=True)
+    compact = commands.add_parser("compact", help="Seal the segments of days that are over")
+    compact.add_argument("--all", action="store_true", help="Seal today's closed segments too")
+    prune = commands.add_parser("prune", help="Drop archives by age and total size")
+    prune.add_argument("--max-age-days", type=float)
+    prune.add_argument("--max-bytes", type=int)
+    commands.add_parser("list", help="Print the catalog")
+    commands.add_parser("verify", help="Recompute the Merkle root of every archive")
+    query = commands.add_parser("query", help="Print archived events in a time range")
+    query.add_argument("--start", help="ISO 8601 time or timestamp_int")
+    query.add_argument("--end", help="ISO 8601 time or timestamp_int")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+
+    manager = RetentionManager(
+        args.dir, args.venue, io_bytes_per_second=args.io_mbps * 1e6 if args.io_mbps else None, nice=0
+    )
+    if args.command == "compact":
+        sealed = manager.compact(force=args.all)
+        print(json.dumps([{"file": e.file, "events": e.events, "bytes": e.bytes} for e in sealed]))
+    elif args.command == "prune":
+        manager.policy = RetentionPolicy(args.max_age_days, args.max_bytes)
+        print(json.dumps([e.file for e in manager.enforce(time.time_ns())]))
+    elif args.command == "list":
+        for entry in manager.catalog.entries:
+            entry = asdict(entry)
+            entry.pop("sources")
+            print(json.dumps(entry))
+    elif args.command == "verify":
+        failed = [e.file for e in manager.catalog.entries if not manager.verify(e)]
+        print(json.dumps({"archives": len(manager.catalog), "failed": failed}))
+        if failed:
+            raise SystemExit(1)
+    else:
+        start = _parse_time(args.start) if args.start else None
+        end = _parse_time(args.end) if args.end else None
+        for line in manager.read(start, end):
+            print(line)
+
+
+if __name__ == "__main__":
+    main()
@@ -10,577 +10,78 @@ This module provides a VCP v1.0 compliant implementation for:
 - Event generation with proper 3-layer structure
 - UUID v7 generation (RFC 9562)
 - Hash chain construction
-- Async queue processing
+- Async queue processing with priority lanes and disk spill
+- Per-event batch results, resubmission of refused events, dead letters
+- Offline mode: circuit breaker, REC events, compressed backlog drain
+
+The event model, factory and serializer live in vcp_sidecar_core_v1_0
+(stdlib only) and are re-exported here. `requests` is imported on first
+use of VCCClient, and no logging is configured on import.
 """
 
 import time
-import uuid
+import gzip
+import itertools
 import hashlib
 import json
 import logging
 import os
-import secrets
-from datetime import datetime, timezone
-from typing import Dict, List, Optional, Any
-from dataclasses import dataclass, field, asdict
-from enum import IntEnum
-import requests
-from threading import Thread, Lock
-from queue import Queue
-import struct
-
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
-logger = logging.getLogger("vcp_adapter")
-
-
-# =============================================================================
-# Event Type Codes (IMMUTABLE - VCP v1.0 Specification)
-# =============================================================================
-class EventTypeCode(IntEnum):
-    """VCP Event Type Codes - These are IMMUTABLE for backward compatibility"""
-    SIG = 1    # Signal/Decision generated
-    ORD = 2    # Order sent
-    ACK = 3    # Order acknowledged
-    EXE = 4    # Full execution
-    PRT = 5    # Partial fill
-    REJ = 6    # Order rejected
-    CXL = 7    # Order cancelled
-    MOD = 8    # Order modified
-    CLS = 9    # Position closed
-    ALG = 20   # Algorithm update
-    RSK = 21   # Risk parameter change
-    AUD = 22   # Audit request
-    HBT = 98   # Heartbeat
-    ERR = 99   # Error
-    REC = 100  # Recovery
-    SNC = 101  # Clock sync status
-
-
-EVENT_TYPE_NAMES = {
-    EventTypeCode.SIG: "SIG",
-    EventTypeCode.ORD: "ORD",
-    EventTypeCode.ACK: "ACK",
-    EventTypeCode.EXE: "EXE",
-    EventTypeCode.PRT: "PRT",
-    EventTypeCode.REJ: "REJ",
-    EventTypeCode.CXL: "CXL",
-    EventTypeCode.MOD: "MOD",
-    EventTypeCode.CLS: "CLS",
-    EventTypeCode.ALG: "ALG",
-    EventTypeCode.RSK: "RSK",
-    EventTypeCode.AUD: "AUD",
-    EventTypeCode.HBT: "HBT",
-    EventTypeCode.ERR: "ERR",
-    EventTypeCode.REC: "REC",
-    EventTypeCode.SNC: "SNC",
-}
-
-
-class TimestampPrecision:
-    NANOSECOND = "NANOSECOND"
-    MICROSECOND = "MICROSECOND"
-    MILLISECOND = "MILLISECOND"
-
+import tempfile
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+from threading import Thread, Lock, Condition, RLock
+from queue import Full, Empty
+from collections import deque
+import heapq
 
-class ClockSyncStatus:
-    PTP_LOCKED = "PTP_LOCKED"
-    NTP_SYNCED = "NTP_SYNCED"
-    BEST_EFFORT = "BEST_EFFORT"
-    UNRELIABLE = "UNRELIABLE"
+from vcp_metrics_v1_0 import MetricsServer
+from vcp_numeric_v1_0 import DigitsTable, format_deals
+import vcp_tracing_v1_0 as _tracing
+# Event core, re-exported so existing imports from this module keep working
+from vcp_sidecar_core_v1_0 import (
+    _metrics, bind_metrics, EventTypeCode, EVENT_TYPE_NAMES, TimestampPrecision, ClockSyncStatus, Tier,
+    VCPHeader, VCPTradeData, VCPRiskData, VCPGovData, VCPSecurity, VCPEvent, UUIDv7Generator,
+    compute_event_hash, VCPEventFactory, VCPEventSerializer, EventCorrelator,
+    DEFAULT_HASH_ALGO, HASH_ALGORITHMS, get_hash_algo, register_hash_algo
+)
 
+logger = logging.getLogger("vcp_adapter")
 
-class Tier:
-    PLATINUM = "PLATINUM"
-    GOLD = "GOLD"
-    SILVER = "SILVER"
+# Imported on the first VCCClient: processes that only build events never load it
+requests = None
 
 
-# =============================================================================
-# VCP v1.0 Data Structures
-# =============================================================================
-@dataclass
-class VCPHeader:
-    """VCP-CORE Header Structure"""
-    event_id: str
-    trace_id: str
-    timestamp_int: str           # Nanoseconds as string
-    timestamp_iso: str           # ISO 8601
-    event_type: str              # String representation (SIG, ORD, etc.)
-    event_type_code: int         # Integer code (1, 2, etc.)
-    timestamp_precision: str
-    clock_sync_status: str
-    hash_algo: str
-    venue_id: str
-    symbol: str
-    account_id: str
-    operator_id: Optional[str] = None
-
-
-@dataclass
-class VCPTradeData:
-    """VCP-TRADE Payload Structure"""
-    order_id: Optional[str] = None
-    exchange_order_id: Optional[str] = None
-    side: Optional[str] = None              # BUY/SELL
-    order_type: Optional[str] = None        # MARKET/LIMIT/STOP/STOP_LIMIT
-    price: Optional[str] = None             # String for precision
-    quantity: Optional[str] = None          # String for precision
-    execution_price: Optional[str] = None
-    executed_qty: Optional[str] = None
-    commission: Optional[str] = None
-    slippage: Optional[str] = None
-    currency: Optional[str] = None
-    reject_reason: Optional[str] = None
-    reject_code: Optional[str] = None
-
-
-@dataclass
-class VCPRiskData:
-    """VCP-RISK Payload Structure"""
-    max_position_size: Optional[str] = None
-    current_position: Optional[str] = None
-    exposure_utilization: Optional[str] = None
-    daily_loss_limit: Optional[str] = None
-    current_daily_loss: Optional[str] = None
-    max_drawdown: Optional[str] = None
-    current_drawdown: Optional[str] = None
-    throttle_rate: Optional[str] = None
-    circuit_breaker: Optional[str] = None   # NORMAL/WARNING/TRIGGERED/DISABLED
-
-
-@dataclass
-class VCPGovData:
-    """VCP-GOV Payload Structure (AI Transparency - EU AI Act Art.12-14)"""
-    algo_id: Optional[str] = None
-    algo_version: Optional[str] = None
-    algo_type: Optional[str] = None         # RULE_BASED/ML/HYBRID/MANUAL
-    confidence: Optional[str] = None
-    decision_factors: Optional[List[Dict]] = None
-    model_hash: Optional[str] = None
-    training_date: Optional[str] = None
-
-
-@dataclass
-class VCPSecurity:
-    """VCP Security (Hash Chain) Structure"""
-    event_hash: str = ""
-    prev_hash: str = "0" * 64  # Genesis: 64 zeros
-    signature: Optional[str] = None
-    sign_algo: Optional[str] = None  # Ed25519
-
-
-@dataclass
-class VCPEvent:
-    """Complete VCP v1.0 Event Structure (3-layer)"""
-    header: VCPHeader
-    payload: Dict[str, Any] = field(default_factory=dict)
-    security: VCPSecurity = field(default_factory=VCPSecurity)
-    
-    # Internal fields (not serialized)
-    trade_data: Optional[VCPTradeData] = field(default=None, repr=False)
-    risk_data: Optional[VCPRiskData] = field(default=None, repr=False)
-    gov_data: Optional[VCPGovData] = field(default=None, repr=False)
+def _load_requests():
+    global requests
+    if requests is None:
+        import requests as _requests
+        requests = _requests
+    return requests
 
 
 # =============================================================================
-# UUID v7 Generator (RFC 9562 Compliant)
-# =============================================================================
-class UUIDv7Generator:
-    """
-    UUID v7 Generator compliant with RFC 9562
-    Format: xxxxxxxx-xxxx-7xxx-yxxx-xxxxxxxxxxxx
-    - First 48 bits: Unix timestamp in milliseconds
-    - 4 bits: Version (0111 = 7)
-    - 12 bits: Random
-    - 2 bits: Variant (10)
-    - 62 bits: Random
-    """
-    
-    @staticmethod
-    def generate() -> str:
-        """Generate a RFC 9562 compliant UUID v7"""
-        # Get current timestamp in milliseconds
-        timestamp_ms = int(time.time() * 1000)
-        
-        # Convert to bytes (48 bits = 6 bytes)
-        ts_bytes = timestamp_ms.to_bytes(6, byteorder='big')
-        
-        # Generate random bytes
-        rand_bytes = secrets.token_bytes(10)
-        
-        # Build UUID bytes (16 total)
-        uuid_bytes = bytearray(16)
-        
-        # First 6 bytes: timestamp
-        uuid_bytes[0:6] = ts_bytes
-        
-        # Bytes 6-7: version (7) and random
-        uuid_bytes[6] = (7 << 4) | (rand_bytes[0] & 0x0F)
-        uuid_bytes[7] = rand_bytes[1]
-        
-        # Byte 8: variant (10xx) and random
-        uuid_bytes[8] = (0b10 << 6) | (rand_bytes[2] & 0x3F)
-        
-        # Remaining bytes: random
-        uuid_bytes[9:16] = rand_bytes[3:10]
-        
-        # Format as UUID string
-        hex_str = uuid_bytes.hex()
-        return f"{hex_str[0:8]}-{hex_str[8:12]}-{hex_str[12:16]}-{hex_str[16:20]}-{hex_str[20:32]}"
-    
-    @staticmethod
-    def validate(uuid_str: str) -> bool:
-        """Validate UUID v7 format"""
-        import re
-        pattern = r'^[0-9a-f]{8}-[0-9a-f]{4}-7[0-9a-f]{3}-[89ab][0-9a-f]{3}-[0-9a-f]{12}$'
-        return bool(re.match(pattern, uuid_str.lower()))
-
-
-# =============================================================================
-# VCP Event Factory
+# VCP Cloud Client
 # =============================================================================
-class VCPEventFactory:
-    """Factory for creating VCP-compliant events"""
-    
-    def __init__(
-        self,
-        venue_id: str,
-        tier: str = Tier.SILVER,
-        hash_algo: str = "SHA256"
-    ):
-        self.venue_id = venue_id
-        self.tier = tier
-        self.hash_algo = hash_algo
-        self.prev_hash = "0" * 64  # Genesis hash
-        self._uuid_gen = UUIDv7Generator()
-        
-        # Tier-specific settings
-        if tier == Tier.SILVER:
-            self.timestamp_precision = TimestampPrecision.MILLISECOND
-            self.clock_sync_status = ClockSyncStatus.BEST_EFFORT
-        elif tier == Tier.GOLD:
-            self.timestamp_precision = TimestampPrecision.MICROSECOND
-            self.clock_sync_status = ClockSyncStatus.NTP_SYNCED
-        else:  # PLATINUM
-            self.timestamp_precision = TimestampPrecision.NANOSECOND
-            self.clock_sync_status = ClockSyncStatus.PTP_LOCKED
-    
-    def _get_timestamps(self) -> tuple:
-        """Get dual-format timestamps (nanoseconds string + ISO 8601)"""
-        now = datetime.now(timezone.utc)
-        
-        # Nanosecond timestamp as string
-        timestamp_ns = int(now.timestamp() * 1_000_000_000)
-        timestamp_int = str(timestamp_ns)
-        
-        # ISO 8601 format with milliseconds
-        timestamp_iso = now.strftime("%Y-%m-%dT%H:%M:%S.") + f"{now.microsecond // 1000:03d}Z"
-        
-        return timestamp_int, timestamp_iso
-    
-    def _compute_event_hash(self, event: VCPEvent) -> str:
-        """Compute SHA-256 hash of event (RFC 8785 canonical JSON)"""
-        # Create canonical JSON representation
-        canonical = {
-            "header": {
-                "event_id": event.header.event_id,
-                "trace_id": event.header.trace_id,
-                "timestamp_int": event.header.timestamp_int,
-                "event_type_code": event.header.event_type_code,
-            },
-            "payload": event.payload,
-            "prev_hash": event.security.prev_hash
-        }
-        
-        # Sort keys for RFC 8785 compliance
-        canonical_json = json.dumps(canonical, sort_keys=True, separators=(',', ':'))
-        
-        return hashlib.sha256(canonical_json.encode('utf-8')).hexdigest()
-    
-    def _pseudonymize_account(self, account_id: str, salt: str = "") -> str:
-        """Pseudonymize account ID (GDPR compliant)"""
-        if not salt:
-            salt = f"vcp_{self.venue_id}_"
-        combined = f"{salt}{account_id}"
-        hashed = hashlib.sha256(combined.encode()).hexdigest()[:16]
-        return f"acc_{hashed}"
-    
-    def create_header(
-        self,
-        event_type: EventTypeCode,
-        symbol: str,
-        account_id: str,
-        trace_id: Optional[str] = None,
-        operator_id: Optional[str] = None
-    ) -> VCPHeader:
-        """Create VCP-CORE compliant header"""
-        timestamp_int, timestamp_iso = self._get_timestamps()
-        
-        return VCPHeader(
-            event_id=self._uuid_gen.generate(),
-            trace_id=trace_id or self._uuid_gen.generate(),
-            timestamp_int=timestamp_int,
-            timestamp_iso=timestamp_iso,
-            event_type=EVENT_TYPE_NAMES[event_type],
-            event_type_code=int(event_type),
-            timestamp_precision=self.timestamp_precision,
-            clock_sync_status=self.clock_sync_status,
-            hash_algo=self.hash_algo,
-            venue_id=self.venue_id,
-            symbol=symbol,
-            account_id=self._pseudonymize_account(account_id),
-            operator_id=operator_id
-        )
-    
-    def create_signal_event(
-        self,
-        symbol: str,
-        account_id: str,
-        algo_id: str,
-        algo_version: str,
-        algo_type: str = "HYBRID",
-        confidence: str = "0.0",
-        decision_factors: Optional[List[Dict]] = None
-    ) -> VCPEvent:
-        """Create SIG (Signal) event with VCP-GOV payload"""
-        header = self.create_header(EventTypeCode.SIG, symbol, account_id)
-        
-        gov_data = VCPGovData(
-            algo_id=algo_id,
-            algo_version=algo_version,
-            algo_type=algo_type,
-            confidence=confidence,
-            decision_factors=decision_factors or []
-        )
-        
-        payload = {
-            "vcp_gov": {
-                k: v for k, v in asdict(gov_data).items() if v is not None
-            }
-        }
-        
-        event = VCPEvent(
-            header=header,
-            payload=payload,
-            security=VCPSecurity(prev_hash=self.prev_hash),
-            gov_data=gov_data
-        )
-        
-        # Compute hash and update chain
-        event.security.event_hash = self._compute_event_hash(event)
-        self.prev_hash = event.security.event_hash
-        
-        return event
-    
-    def create_order_event(
-        self,
-        symbol: str,
-        account_id: str,
-        trace_id: str,
-        order_id: str,
-        side: str,
-        order_type: str,
-        price: str,
-        quantity: str,
-        risk_data: Optional[VCPRiskData] = None
-    ) -> VCPEvent:
-        """Create ORD (Order) event with VCP-TRADE and VCP-RISK payload"""
-        header = self.create_header(EventTypeCode.ORD, symbol, account_id, trace_id)
-        
-        trade_data = VCPTradeData(
-            order_id=order_id,
-            side=side,
-            order_type=order_type,
-            price=price,
-            quantity=quantity
-        )
-        
-        payload = {
-            "trade_data": {
-                k: v for k, v in asdict(trade_data).items() if v is not None
-            }
-        }
-        
-        if risk_data:
-            payload["vcp_risk"] = {
-                k: v for k, v in asdict(risk_data).items() if v is not None
-            }
-        
-        event = VCPEvent(
-            header=header,
-            payload=payload,
-            security=VCPSecurity(prev_hash=self.prev_hash),
-            trade_data=trade_data,
-            risk_data=risk_data
-        )
-        
-        event.security.event_hash = self._compute_event_hash(event)
-        self.prev_hash = event.security.event_hash
-        
-        return event
-    
-    def create_execution_event(
-        self,
-        symbol: str,
-        account_id: str,
-        trace_id: str,
-        order_id: str,
-        exchange_order_id: str,
-        execution_price: str,
-        executed_qty: str,
-        slippage: str = "0",
-        commission: str = "0"
-    ) -> VCPEvent:
-        """Create EXE (Execution) event with VCP-TRADE payload"""
-        header = self.create_header(EventTypeCode.EXE, symbol, account_id, trace_id)
-        
-        trade_data = VCPTradeData(
-            order_id=order_id,
-            exchange_order_id=exchange_order_id,
-            execution_price=execution_price,
-            executed_qty=executed_qty,
-            slippage=slippage,
-            commission=commission
-        )
-        
-        payload = {
-            "trade_data": {
-                k: v for k, v in asdict(trade_data).items() if v is not None
-            }
-        }
-        
-        event = VCPEvent(
-            header=header,
-            payload=payload,
-            security=VCPSecurity(prev_hash=self.prev_hash),
-            trade_data=trade_data
-        )
-        
-        event.security.event_hash = self._compute_event_hash(event)
-        self.prev_hash = event.security.event_hash
-        
-        return event
-    
-    def create_reject_event(
-        self,
-        symbol: str,
-        account_id: str,
-        trace_id: str,
-        order_id: str,
-        reject_reason: str,
-        reject_code: str = ""
-    ) -> VCPEvent:
-        """Create REJ (Reject) event with VCP-TRADE payload"""
-        header = self.create_header(EventTypeCode.REJ, symbol, account_id, trace_id)
-        
-        trade_data = VCPTradeData(
-            order_id=order_id,
-            reject_reason=reject_reason,
-            reject_code=reject_code
-        )
-        
-        payload = {
-            "trade_data": {
-                k: v for k, v in asdict(trade_data).items() if v is not None
-            }
-        }
-        
-        event = VCPEvent(
-            header=header,
-            payload=payload,
-            security=VCPSecurity(prev_hash=self.prev_hash),
-            trade_data=trade_data
-        )
-        
-        event.security.event_hash = self._compute_event_hash(event)
-        self.prev_hash = event.security.event_hash
-        
-        return event
-    
-    def create_heartbeat_event(self) -> VCPEvent:
-        """Create HBT (Heartbeat) event"""
-        header = self.create_header(EventTypeCode.HBT, "", "system")
-        header.trace_id = header.event_id  # Self-referential for HBT
-        
-        event = VCPEvent(
-            header=header,
-            payload={},
-            security=VCPSecurity(prev_hash=self.prev_hash)
-        )
-        
-        event.security.event_hash = self._compute_event_hash(event)
-        self.prev_hash = event.security.event_hash
-        
-        return event
+def batch_idempotency_key(events: List[VCPEvent]) -> str:
+    """Idempotency-Key of a batch: the same events always give the same key"""
+    return _idempotency_key(event.header.event_id for event in events)
 
 
-# =============================================================================
-# VCP Event Serializer
-# =============================================================================
-class VCPEventSerializer:
-    """Serialize VCP events to JSON (RFC 8785 canonical)"""
-    
-    @staticmethod
-    def to_dict(event: VCPEvent) -> Dict:
-        """Convert VCPEvent to dictionary"""
-        header_dict = {
-            "event_id": event.header.event_id,
-            "trace_id": event.header.trace_id,
-            "timestamp_int": event.header.timestamp_int,
-            "timestamp_iso": event.header.timestamp_iso,
-            "event_type": event.header.event_type,
-            "event_type_code": event.header.event_type_code,
-            "timestamp_precision": event.header.timestamp_precision,
-            "clock_sync_status": event.header.clock_sync_status,
-            "hash_algo": event.header.hash_algo,
-            "venue_id": event.header.venue_id,
-            "symbol": event.header.symbol,
-            "account_id": event.header.account_id,
-        }
-        
-        if event.header.operator_id:
-            header_dict["operator_id"] = event.header.operator_id
-        
-        security_dict = {
-            "event_hash": event.security.event_hash,
-            "prev_hash": event.security.prev_hash,
-        }
-        
-        if event.security.signature:
-            security_dict["signature"] = event.security.signature
-            security_dict["sign_algo"] = event.security.sign_algo
-        
-        return {
-            "header": header_dict,
-            "payload": event.payload,
-            "security": security_dict
-        }
-    
-    @staticmethod
-    def to_json(event: VCPEvent, indent: Optional[int] = None) -> str:
-        """Convert VCPEvent to JSON string"""
-        return json.dumps(
-            VCPEventSerializer.to_dict(event),
-            indent=indent,
-            ensure_ascii=False
-        )
-    
-    @staticmethod
-    def to_jsonl(events: List[VCPEvent]) -> str:
-        """Convert list of events to JSONL format"""
-        lines = [VCPEventSerializer.to_json(e) for e in events]
-        return '\n'.join(lines)
+def _idempotency_key(event_ids: Iterable[str]) -> str:
+    digest = hashlib.sha256()
+    for event_id in event_ids:
+        digest.update(event_id.encode("ascii"))
+    return digest.hexdigest()
 
 
-# =============================================================================
-# VCP Cloud Client
-# =============================================================================
 class VCCClient:
-    """VeritasChain Cloud (VCC) API Client"""
+    """
+    VeritasChain Cloud (VCC) API Client
+    
+    Requests carry an Idempotency-Key derived from the event IDs, so VCC
+    can recognise resends. A batch response may list per-event failures
+    ({"rejected": [{"event_id": ..., "error": ...}]}, usually HTTP 207);
+    send_batch then reports status "partial" with only those events.
+    """
     
     def __init__(
         self,
@@ -593,7 +94,9 @@ class VCCClient:
         self.api_key = api_key
         self.timeout = timeout
         self.retry_count = retry_count
-        self._session = requests.Session()
+        self.last_success_time: Optional[float] = None
+        self.consecutive_failures = 0
+        self._session = _load_requests().Session()
         self._session.headers.update({
             "Content-Type": "application/json",
             "X-API-Key": api_key,
@@ -606,15 +109,21 @@ class VCCClient:
         payload = VCPEventSerializer.to_json(event)
         
         for attempt in range(self.retry_count):
+            if attempt:
+                _metrics.send_retries.inc()
             try:
+                started = time.perf_counter()
                 response = self._session.post(
                     url,
                     data=payload,
+                    headers={"Idempotency-Key": event.header.event_id},
                     timeout=self.timeout
                 )
+                _metrics.send_seconds.observe(time.perf_counter() - started)
                 
                 if response.status_code in (200, 201):
                     logger.debug(f"Event sent: {event.header.event_id}")
+                    self._record_success(1)
                     return {"status": "ok", "event_id": event.header.event_id}
                 else:
                     logger.warning(f"VCC error {response.status_code}: {response.text}")
@@ -624,35 +133,652 @@ class VCCClient:
                 if attempt < self.retry_count - 1:
                     time.sleep(2 ** attempt)  # Exponential backoff
         
+        self._record_failure()
         return {"status": "error", "event_id": event.header.event_id}
     
     def send_batch(self, events: List[VCPEvent]) -> Dict:
-        """Send batch of events to VCC"""
-        url = f"{self.endpoint}/v1/events/batch"
+        """
+        Send batch of events to VCC
+        
+        Returns status "ok", "partial" (with "rejected": event_id -> error
+        for the events VCC refused), "rejected" (4xx for the whole batch
+        naming the events at fault in "rejected", not retried) or "error"
+        (network, 5xx or a 4xx such as 401/403 that names no events, with
+        the last cause in "error").
+        """
+        batch_span = _tracing.active and _tracing.active.start(
+            "client.send_batch", {"events": len(events)}
+        )
+        span = _tracing.active and _tracing.active.start("client.serialize")
         payload = json.dumps({
             "events": [VCPEventSerializer.to_dict(e) for e in events]
         })
+        if span:
+            span.finish()
+        
+        _metrics.batch_size.observe(len(events))
+        headers = {"Idempotency-Key": batch_idempotency_key(events)}
+        return self._post_batch(payload, headers, len(events), batch_span)
+    
+    def send_serialized(
+        self, lines: List[str], event_ids: List[str], compresslevel: Optional[int] = 6
+    ) -> Dict:
+        """
+        Send a batch of events already serialized as JSON objects (e.g. read
+        back from the offline backlog) without rebuilding them
+        
+        The body is gzip-compressed (Content-Encoding: gzip) unless
+        compresslevel is None. Results as for send_batch.
+        """
+        batch_span = _tracing.active and _tracing.active.start(
+            "client.send_serialized", {"events": len(lines)}
+        )
+        payload = ('{"events":[' + ",".join(lines) + ']}').encode("utf-8")
+        headers = {"Idempotency-Key": _idempotency_key(event_ids)}
+        if compresslevel is not None:
+            payload = gzip.compress(payload, compresslevel, mtime=0)
+            headers["Content-Encoding"] = "gzip"
+        _metrics.batch_size.observe(len(lines))
+        return self._post_batch(payload, headers, len(lines), batch_span)
+    
+    def _post_batch(self, payload, headers: Dict[str, str], count: int, batch_span=None) -> Dict:
+        url = f"{self.endpoint}/v1/events/batch"
+        error = ""
         
         for attempt in range(self.retry_count):
+            if attempt:
+                _metrics.send_retries.inc()
             try:
-                response = self._session.post(
-                    url,
-                    data=payload,
-                    timeout=self.timeout * 2  # Longer timeout for batch
-                )
+                span = _tracing.active and _tracing.active.start("client.http_post")
+                started = time.perf_counter()
+                try:
+                    response = self._session.post(
+                        url,
+                        data=payload,
+                        headers=headers,
+                        timeout=self.timeout * 2  # Longer timeout for batch
+                    )
+                finally:
+                    if span:
+                        span.finish()
+                _metrics.send_seconds.observe(time.perf_counter() - started)
                 
-                if response.status_code in (200, 201):
-                    logger.info(f"Batch sent: {len(events)} events")
-                    return {"status": "ok", "count": len(events)}
+                if response.status_code in (200, 201, 207):
+                    rejected = self._rejected_events(response)
+                    accepted = count - len(rejected)
+                    self._record_success(accepted)
+                    if batch_span:
+                        batch_span.finish()
+                    if rejected:
+                        logger.warning(f"Batch partially rejected: {len(rejected)} of {count} events")
+                        return {"status": "partial", "count": accepted, "rejected": rejected}
+                    logger.info(f"Batch sent: {count} events")
+                    return {"status": "ok", "count": count}
+                elif 400 <= response.status_code < 500 and response.status_code not in (408, 429):
+                    rejected = self._rejected_events(response)
+                    if not rejected:
+                        # Auth (401/403) or a request VCC refused without naming events: nothing
+                        # in the batch is at fault, so keep it and let the breaker see the failure
+                        logger.error(f"VCC refused request {response.status_code}: {response.text}")
+                        error = f"HTTP {response.status_code}"
+                        break
+                    # The payload itself was refused; resending it unchanged cannot succeed
+                    logger.warning(f"VCC rejected batch {response.status_code}: {len(rejected)} events named")
+                    self._record_failure()
+                    if batch_span:
+                        batch_span.finish()
+                    return {"status": "rejected", "count": 0, "http_status": response.status_code,
+                            "rejected": rejected}
                 else:
                     logger.warning(f"VCC batch error {response.status_code}: {response.text}")
+                    error = f"HTTP {response.status_code}"
                     
             except requests.RequestException as e:
                 logger.error(f"Network error (attempt {attempt + 1}): {e}")
+                error = type(e).__name__
                 if attempt < self.retry_count - 1:
                     time.sleep(2 ** attempt)
         
-        return {"status": "error", "count": 0}
+        self._record_failure()
+        if batch_span:
+            batch_span.finish()
+        return {"status": "error", "count": 0, "error": error}
+    
+    @staticmethod
+    def _rejected_events(response) -> Dict[str, str]:
+        """event_id -> error for the events a batch response lists as failed"""
+        if not response.content:
+            return {}
+        try:
+            body = response.json()
+        except ValueError:
+            return {}
+        rejected = body.get("rejected") if isinstance(body, dict) else None
+        return {
+            str(item.get("event_id")): str(item.get("error", "rejected"))
+            for item in rejected or () if isinstance(item, dict)
+        }
+    
+    def _record_success(self, count: int):
+        self.last_success_time = time.time()
+        self.consecutive_failures = 0
+        _metrics.events_sent.inc(count)
+    
+    def _record_failure(self):
+        self.consecutive_failures += 1
+        _metrics.send_failures.inc()
+    
+    def get_status(self) -> Dict:
+        """Get current connection status"""
+        return {
+            "connected": self.consecutive_failures == 0,
+            "last_success": self.last_success_time,
+            "consecutive_failures": self.consecutive_failures
+        }
+
+
+# =============================================================================
+# Priority Lanes
+# =============================================================================
+LANE_CRITICAL = "critical"
+LANE_NORMAL = "normal"
+LANE_HEARTBEAT = "heartbeat"
+LANES = (LANE_CRITICAL, LANE_NORMAL, LANE_HEARTBEAT)
+
+# Regulatory trade outcomes go first, heartbeats last, everything else between
+LANE_OF_EVENT_TYPE = {
+    EventTypeCode.EXE: LANE_CRITICAL,
+    EventTypeCode.PRT: LANE_CRITICAL,
+    EventTypeCode.REJ: LANE_CRITICAL,
+    EventTypeCode.CXL: LANE_CRITICAL,
+    EventTypeCode.CLS: LANE_CRITICAL,
+    EventTypeCode.REC: LANE_CRITICAL,
+    EventTypeCode.HBT: LANE_HEARTBEAT,
+}
+
+
+def event_lane(event: VCPEvent) -> str:
+    return LANE_OF_EVENT_TYPE.get(event.header.event_type_code, LANE_NORMAL)
+
+
+class _SpillFile:
+    """
+    Append-only overflow file of one lane, one "<enqueued>\\t<event JSON>"
+    line per event. Truncated once fully read back; left over on disk
+    after a crash, it is served again on the next start.
+    """
+    
+    def __init__(self, path: str):
+        self.path = path
+        self._writer = open(path, "a", encoding="utf-8")
+        self._reader = open(path, "r", encoding="utf-8")
+        self.pending = sum(1 for line in self._reader if line.endswith("\n"))
+        self._reader.seek(0)
+        self.oldest = self._peek_time() if self.pending else None
+    
+    def append(self, event: VCPEvent, enqueued: float):
+        data = json.dumps(VCPEventSerializer.to_dict(event), ensure_ascii=False, separators=(',', ':'))
+        self._writer.write(f"{enqueued:.6f}\t{data}\n")
+        self._writer.flush()
+        if not self.pending:
+            self.oldest = enqueued
+        self.pending += 1
+    
+    def _peek_time(self) -> Optional[float]:
+        position = self._reader.tell()
+        line = self._reader.readline()
+        self._reader.seek(position)
+        try:
+            return float(line.partition("\t")[0])
+        except ValueError:
+            return None
+    
+    def read(self, count: int) -> List[tuple]:
+        """Up to count (enqueued, event) entries, oldest first"""
+        entries = []
+        while len(entries) < count and self.pending:
+            line = self._reader.readline()
+            if not line.endswith("\n"):
+                self.pending = 0  # Torn last line of a crashed run
+                break
+            self.pending -= 1
+            stamp, _, data = line.partition("\t")
+            try:
+                entries.append((float(stamp), VCPEventSerializer.from_dict(json.loads(data))))
+            except (ValueError, KeyError, TypeError) as e:
+                logger.error(f"Skipping unreadable spilled event in {self.path}: {e}")
+        if self.pending:
+            self.oldest = self._peek_time()
+        else:
+            self._writer.truncate(0)
+            self._reader.seek(0)
+            self.oldest = None
+        return entries
+    
+    def close(self):
+        self._writer.close()
+        self._reader.close()
+
+
+class LaneQueue:
+    """
+    Upload queue with priority lanes (critical > normal > heartbeat)
+    
+    Batches are filled from the critical lane first. `maxsize` events are
+    kept in memory, with the last `critical_reserve` share held back for
+    the critical lane. Beyond that, events spill to `<spill_dir>/<lane>.spill`
+    and are read back in order, or are refused (Full) without a spill_dir.
+    Once a lane has spilled, its new events go to the spill file too, so
+    each lane stays FIFO.
+    
+    Drop-in for queue.Queue where the adapter and its drains use it
+    (put_nowait, get, qsize, empty).
+    """
+    
+    def __init__(
+        self,
+        maxsize: int = 10000,
+        spill_dir: Optional[str] = None,
+        venue_id: str = "",
+        critical_reserve: float = 0.1,
+        backlog_threshold: Optional[int] = None,
+        refill_size: int = 1000
+    ):
+        self.maxsize = maxsize
+        self.venue_id = venue_id
+        self._soft_limit = max(1, int(maxsize * (1 - critical_reserve)))
+        self.backlog_threshold = backlog_threshold if backlog_threshold is not None else max(1, maxsize // 10)
+        self.refill_size = refill_size
+        self._lanes: Dict[str, deque] = {lane: deque() for lane in LANES}
+        self._memory = 0
+        self._spills: Dict[str, _SpillFile] = {}
+        if spill_dir:
+            os.makedirs(spill_dir, exist_ok=True)
+            for lane in LANES:
+                self._spills[lane] = _SpillFile(os.path.join(spill_dir, f"{lane}.spill"))
+        self._cond = Condition()
+        self._spilled = {lane: _metrics.events_spilled.labels(venue_id, lane) for lane in LANES}
+        for lane in LANES:
+            _metrics.lane_depth.labels(venue_id, lane).set_function(lambda lane=lane: self.depth(lane))
+            _metrics.lane_age.labels(venue_id, lane).set_function(lambda lane=lane: self.age(lane))
+    
+    def put_nowait(self, event: VCPEvent):
+        lane = event_lane(event)
+        now = time.time()
+        with self._cond:
+            spill = self._spills.get(lane)
+            limit = self.maxsize if lane == LANE_CRITICAL else self._soft_limit
+            if self._memory >= limit or (spill and spill.pending):
+                if spill is None:
+                    raise Full
+                spill.append(event, now)
+                self._spilled[lane].inc()
+            else:
+                self._lanes[lane].append((now, event))
+                self._memory += 1
+            self._cond.notify()
+    
+    def _available(self) -> bool:
+        return self._memory > 0 or any(spill.pending for spill in self._spills.values())
+    
+    def get_batch(self, max_items: int, timeout: Optional[float] = None) -> List[VCPEvent]:
+        """Up to max_items events in lane priority; waits up to timeout for the first"""
+        batch = []
+        with self._cond:
+            if not self._cond.wait_for(self._available, timeout):
+                return batch
+            for lane in LANES:
+                events = self._lanes[lane]
+                spill = self._spills.get(lane)
+                while len(batch) < max_items:
+                    if not events:
+                        if not (spill and spill.pending):
+                            break
+                        entries = spill.read(max(1, min(self.refill_size, self.maxsize - self._memory)))
+                        events.extend(entries)
+                        self._memory += len(entries)
+                        if not events:
+                            break
+                    batch.append(events.popleft()[1])
+                    self._memory -= 1
+        return batch
+    
+    def get(self, block: bool = True, timeout: Optional[float] = None) -> VCPEvent:
+        batch = self.get_batch(1, timeout if block else 0)
+        if not batch:
+            raise Empty
+        return batch[0]
+    
+    def depth(self, lane: str) -> int:
+        spill = self._spills.get(lane)
+        return len(self._lanes[lane]) + (spill.pending if spill else 0)
+    
+    def age(self, lane: str) -> float:
+        """Seconds the oldest waiting event of the lane has been queued"""
+        events = self._lanes[lane]
+        spill = self._spills.get(lane)
+        oldest = events[0][0] if events else (spill.oldest if spill and spill.pending else None)
+        return max(0.0, time.time() - oldest) if oldest else 0.0
+    
+    def depths(self) -> Dict[str, int]:
+        return {lane: self.depth(lane) for lane in LANES}
+    
+    def qsize(self) -> int:
+        return self._memory + sum(spill.pending for spill in self._spills.values())
+    
+    def empty(self) -> bool:
+        return self.qsize() == 0
+    
+    def backed_up(self) -> bool:
+        """Backlog over the threshold, or a heartbeat still waiting"""
+        return self.qsize() >= self.backlog_threshold or self.depth(LANE_HEARTBEAT) > 0
+    
+    def close(self):
+        with self._cond:
+            for spill in self._spills.values():
+                spill.close()
+            self._spills = {}
+
+
+# =============================================================================
+# Resubmission and Dead Letters
+# =============================================================================
+DEAD_LETTER_FILE = "dead_letter.ndjson"
+
+
+class ResubmitBuffer:
+    """
+    Events VCC refused individually, waiting to be sent again
+    
+    A refused event is retried after base_delay x 2^(attempts - 1),
+    capped at max_delay. After max_attempts refusals it is appended to
+    `dead_letter_path` as one JSON line ({"event", "error", "attempts",
+    "dead_lettered_at"}) and not retried again. Only refusals count:
+    requests that fail as a whole (network, 5xx, 401/403) do not move
+    events towards the dead-letter file.
+    """
+    
+    def __init__(
+        self,
+        max_attempts: int = 5,
+        base_delay: float = 1.0,
+        max_delay: float = 60.0,
+        dead_letter_path: str = DEAD_LETTER_FILE,
+        venue_id: str = "",
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.dead_letter_path = dead_letter_path
+        self.dead_lettered = 0
+        self._clock = clock
+        self._heap: List[tuple] = []           # (due, seq, event)
+        self._attempts: Dict[str, int] = {}    # event_id -> refusals so far
+        self._seq = itertools.count()
+        self._lock = Lock()
+        self._refused = _metrics.events_refused.labels(venue_id)
+        self._dead_lettered = _metrics.events_dead_lettered.labels(venue_id)
+        _metrics.resubmit_pending.labels(venue_id).set_function(self.__len__)
+    
+    def __len__(self) -> int:
+        return len(self._heap)
+    
+    def due(self, max_items: int) -> List[VCPEvent]:
+        """Up to max_items events whose backoff has expired"""
+        events = []
+        if not self._heap:
+            return events
+        now = self._clock()
+        with self._lock:
+            while self._heap and len(events) < max_items and self._heap[0][0] <= now:
+                events.append(heapq.heappop(self._heap)[2])
+        return events
+    
+    def defer(self, events: List[VCPEvent], delay: Optional[float] = None):
+        """Send again later without counting an attempt (the request failed as a whole)"""
+        due = self._clock() + (self.base_delay if delay is None else delay)
+        with self._lock:
+            for event in events:
+                heapq.heappush(self._heap, (due, next(self._seq), event))
+    
+    def settle(self, events: List[VCPEvent], refused: Dict[str, str]) -> List[VCPEvent]:
+        """Record the outcome of a sent batch (refused maps event_id -> error); returns the dead-lettered events"""
+        if not refused and not self._attempts:
+            return []
+        now = self._clock()
+        dead = []
+        with self._lock:
+            for event in events:
+                event_id = event.header.event_id
+                error = refused.get(event_id)
+                if error is None:
+                    self._attempts.pop(event_id, None)
+                    continue
+                attempts = self._attempts.get(event_id, 0) + 1
+                self._refused.inc()
+                if attempts >= self.max_attempts:
+                    self._attempts.pop(event_id, None)
+                    dead.append((event, error, attempts))
+                    continue
+                self._attempts[event_id] = attempts
+                delay = min(self.max_delay, self.base_delay * 2 ** (attempts - 1))
+                heapq.heappush(self._heap, (now + delay, next(self._seq), event))
+        for event, error, attempts in dead:
+            self._dead_letter(event, error, attempts)
+        return [event for event, _, _ in dead]
+    
+    def _dead_letter(self, event: VCPEvent, error: str, attempts: int):
+        self.dead_lettered += 1
+        self._dead_lettered.inc()
+        logger.error(f"Dead-lettering event {event.header.event_id} after {attempts} attempts: {error}")
+        record = {
+            "event": VCPEventSerializer.to_dict(event),
+            "error": error,
+            "attempts": attempts,
+            "dead_lettered_at": time.time(),
+        }
+        with open(self.dead_letter_path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(record, ensure_ascii=False, separators=(',', ':')) + "\n")
+
+
+# =============================================================================
+# Offline Mode
+# =============================================================================
+BREAKER_CLOSED = "closed"
+BREAKER_OPEN = "open"
+BREAKER_HALF_OPEN = "half_open"
+
+GENESIS_HASH = "0" * 64
+
+
+class CircuitBreaker:
+    """
+    VCC reachability as seen by the adapter (guide section 8)
+    
+    Closed: requests flow. After `failure_threshold` consecutive failed
+    requests it opens and records the break point: the last event VCC
+    acknowledged, when the failures started and why. While open, allow()
+    lets a single probe request through every probe_interval seconds
+    (doubling up to max_probe_interval); a probe that succeeds closes it
+    again, one that fails keeps it open.
+    """
+    
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        probe_interval: float = 1.0,
+        max_probe_interval: float = 30.0,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self.failure_threshold = max(1, failure_threshold)
+        self.probe_interval = probe_interval
+        self.max_probe_interval = max_probe_interval
+        self.state = BREAKER_CLOSED
+        self.failures = 0
+        self.last_acked: Tuple[str, str] = ("", GENESIS_HASH)  # (event_id, event_hash)
+        self.break_point: Optional[Dict] = None
+        self.opened_at: Optional[float] = None
+        self._clock = clock
+        self._first_failure: Optional[float] = None
+        self._interval = probe_interval
+        self._next_probe = 0.0
+        self._lock = Lock()
+    
+    @property
+    def is_open(self) -> bool:
+        return self.state != BREAKER_CLOSED
+    
+    def allow(self) -> bool:
+        """Whether a request may go to VCC now; while open, only the due probe may"""
+        if self.state == BREAKER_CLOSED:
+            return True
+        with self._lock:
+            if self.state == BREAKER_OPEN and self._clock() >= self._next_probe:
+                self.state = BREAKER_HALF_OPEN
+                return True
+        return False
+    
+    def record_success(self, acked: Optional[Tuple[str, str]] = None) -> bool:
+        """A request reached VCC (acked: its last accepted event); True if this closed the breaker"""
+        with self._lock:
+            if acked:
+                self.last_acked = acked
+            self.failures = 0
+            self._first_failure = None
+            if self.state == BREAKER_CLOSED:
+                return False
+            self.state = BREAKER_CLOSED
+            self._interval = self.probe_interval
+            return True
+    
+    def record_failure(self, reason: str = "") -> bool:
+        """A request failed after all retries; True if this opened the breaker"""
+        with self._lock:
+            self.failures += 1
+            if self._first_failure is None:
+                self._first_failure = time.time()
+            if self.state == BREAKER_HALF_OPEN:
+                self.state = BREAKER_OPEN
+                self._interval = min(self.max_probe_interval, self._interval * 2)
+                self._next_probe = self._clock() + self._interval
+                return False
+            if self.state == BREAKER_OPEN or self.failures < self.failure_threshold:
+                return False
+            self._open({
+                "last_valid_event_id": self.last_acked[0],
+                "last_valid_hash": self.last_acked[1],
+                "break_timestamp": int(self._first_failure * 1000),
+                "break_reason": f"VCC_UNREACHABLE: {reason}" if reason else "VCC_UNREACHABLE",
+            })
+            return True
+    
+    def restore(self, break_point: Dict):
+        """Reopen at a break point recorded before a restart; the first probe is due at once"""
+        with self._lock:
+            self._open(break_point)
+            self._next_probe = 0.0
+    
+    def _open(self, break_point: Dict):
+        self.state = BREAKER_OPEN
+        self.break_point = break_point
+        self.opened_at = time.time()
+        self._interval = self.probe_interval
+        self._next_probe = self._clock() + self._interval
+    
+    def get_status(self) -> Dict:
+        return {
+            "state": self.state,
+            "consecutive_failures": self.failures,
+            "opened_at": self.opened_at if self.is_open else None,
+            "break_point": self.break_point if self.is_open else None,
+        }
+
+
+def _line_field(line: str, key: str, last: bool = False) -> str:
+    """String field of a serialized event, found without parsing it"""
+    marker = f'"{key}":"'
+    start = (line.rindex(marker) if last else line.index(marker)) + len(marker)
+    return line[start:line.index('"', start)]
+
+
+class OfflineBacklog:
+    """
+    Events recorded while VCC is unreachable, as serialized JSON lines
+    
+    With a directory the lines go to `<directory>/offline.backlog` and
+    survive a restart; without one, up to max_events are held in memory
+    and further events are refused (Full). take() hands lines out oldest
+    first. The file is only truncated once everything taken has been
+    acknowledged (release() with nothing pending), so a crash mid-drain
+    sends the backlog again from the start and VCC recognises the resent
+    events by their IDs.
+    """
+    
+    def __init__(self, directory: Optional[str] = None, max_events: int = 100_000):
+        self.max_events = max_events
+        self.path = os.path.join(directory, "offline.backlog") if directory else None
+        self.pending = 0
+        self._taken = 0
+        self._lines: deque = deque()
+        self._writer = self._reader = None
+        self._lock = Lock()
+        if self.path:
+            os.makedirs(directory, exist_ok=True)
+            self._writer = open(self.path, "a", encoding="utf-8")
+            self._reader = open(self.path, "r", encoding="utf-8")
+            self.pending = sum(1 for line in self._reader if line.endswith("\n"))
+            self._reader.seek(0)
+    
+    def __len__(self) -> int:
+        """Events not yet acknowledged (pending and taken)"""
+        return self.pending + self._taken
+    
+    def append(self, event: VCPEvent):
+        line = json.dumps(VCPEventSerializer.to_dict(event), ensure_ascii=False, separators=(',', ':'))
+        with self._lock:
+            if self._writer:
+                self._writer.write(line + "\n")
+                self._writer.flush()
+            elif len(self._lines) >= self.max_events:
+                raise Full
+            else:
+                self._lines.append(line)
+            self.pending += 1
+    
+    def take(self, count: int) -> List[str]:
+        """Up to count lines, oldest first"""
+        lines = []
+        with self._lock:
+            if self._reader:
+                while len(lines) < count and self.pending:
+                    line = self._reader.readline()
+                    if not line.endswith("\n"):
+                        self.pending = 0  # Torn last line of a crashed run
+                        break
+                    lines.append(line[:-1])
+                    self.pending -= 1
+            else:
+                while len(lines) < count and self._lines:
+                    lines.append(self._lines.popleft())
+                self.pending = len(self._lines)
+            self._taken += len(lines)
+        return lines
+    
+    def release(self):
+        """Everything taken so far was acknowledged"""
+        with self._lock:
+            self._taken = 0
+            if self._writer and not self.pending:
+                self._writer.truncate(0)
+                self._reader.seek(0)
+    
+    def close(self):
+        with self._lock:
+            if self._writer:
+                self._writer.close()
+                self._reader.close()
+                self._writer = self._reader = None
 
 
 # =============================================================================
@@ -662,6 +788,12 @@ class VCPManagerAdapter:
     """
     VCP Manager API Adapter for MT4/MT5
     Polls trades from Manager API and converts to VCP events
+    
+    After failure_threshold failed requests the adapter goes offline:
+    new events are recorded to the offline backlog (under spill_dir when
+    given) and VCC is only probed. On reconnect it emits a REC event with
+    the break point and drains the backlog on its own thread in large
+    gzip-compressed batches, yielding to the live lanes.
     """
     
     def __init__(
@@ -671,34 +803,102 @@ class VCPManagerAdapter:
         vcc_api_key: str,
         tier: str = Tier.SILVER,
         poll_interval: float = 1.0,
-        batch_size: int = 100
+        batch_size: int = 100,
+        metrics_port: Optional[int] = None,
+        max_queue: int = 10000,
+        spill_dir: Optional[str] = None,
+        max_attempts: int = 5,
+        dead_letter_path: Optional[str] = None,
+        failure_threshold: int = 5,
+        max_backlog: int = 100_000,
+        drain_batch_size: int = 5000,
+        drain_compresslevel: Optional[int] = 1,
+        client: Optional[VCCClient] = None
     ):
+        self.venue_id = venue_id
         self.factory = VCPEventFactory(venue_id, tier)
-        self.client = VCCClient(vcc_endpoint, vcc_api_key)
+        # A shared client (see vcp_host_v1_0) serves both the live lanes and the drain
+        self.client = client or VCCClient(vcc_endpoint, vcc_api_key)
         self.poll_interval = poll_interval
         self.batch_size = batch_size
         
         # State management
         self.processed_deals: set = set()
         self.trace_id_map: Dict[str, str] = {}  # order_ticket -> trace_id
-        self.event_queue: Queue = Queue(maxsize=10000)
+        # Optional ticket -> EA trace_id lookup (see vcp_join_v1_0.TraceJoinEngine)
+        self.trace_lookup: Optional[Callable[[str], Optional[str]]] = None
+        # Price/volume digits per symbol for deal fields (see vcp_numeric_v1_0)
+        self.digits = DigitsTable()
+        # Optional signing stage between queue_event and upload (see vcp_signing_v1_0)
+        self.signing_stage = None
+        # Priority lanes; overflow spills to spill_dir instead of being dropped
+        self.event_queue = LaneQueue(max_queue, spill_dir, venue_id)
+        # Events VCC refused individually; poison events end in dead_letter_path
+        # Never dropped: without a path, they go next to the spill files (or to the working directory)
+        if not dead_letter_path:
+            dead_letter_path = os.path.join(spill_dir or os.getcwd(), f"{venue_id}.{DEAD_LETTER_FILE}")
+        self.resubmit = ResubmitBuffer(max_attempts, dead_letter_path=dead_letter_path, venue_id=venue_id)
+        # Offline mode: events recorded while VCC is unreachable, drained on reconnect
+        self.breaker = CircuitBreaker(failure_threshold)
+        self.backlog = OfflineBacklog(spill_dir, max_backlog)
+        self.drain_client = client or VCCClient(vcc_endpoint, vcc_api_key)  # Own session for the drain thread
+        self.drain_batch_size = drain_batch_size
+        self.drain_compresslevel = drain_compresslevel
+        self._break_path = os.path.join(spill_dir, "offline.json") if spill_dir else None
+        if self._break_path and os.path.exists(self._break_path):
+            with open(self._break_path, encoding="utf-8") as f:
+                self.breaker.restore(json.load(f))
+            logger.warning(f"Resuming offline mode from {self._break_path}, {len(self.backlog)} events backlogged")
         
         # Threading
         self._running = False
         self._worker_thread: Optional[Thread] = None
+        self._drain_thread: Optional[Thread] = None
+        self._hosted = False  # Uploads driven by a SidecarHost instead of own threads
+        # Called after each event accepted into the queue or backlog (see vcp_host_v1_0)
+        self.on_queued: Optional[Callable[[], None]] = None
+        # Optional local archive of every event put (see vcp_retention_v1_0.RetentionManager)
+        self.archive = None
+        # Guards the factory's chain head. Every thread that creates events holds it,
+        # including the worker or drain thread that emits REC (see EventRelay, SidecarCheckpointer)
+        self.factory_lock = RLock()
         self._lock = Lock()
+        # Queued events not yet acknowledged or durably recorded, by event_id. Tracked
+        # once a SidecarCheckpointer is attached, which snapshots them with the chain head
+        self.outstanding: Optional[Dict[str, VCPEvent]] = None
+        
+        # Observability
+        self.metrics_port = metrics_port
+        self._metrics_server: Optional[MetricsServer] = None
+        self._queue_depth = _metrics.queue_depth.labels(venue_id)
+        self._queue_depth.set_function(self.event_queue.qsize)
+        self._events_queued = _metrics.events_queued.labels(venue_id)
+        self._events_dropped = _metrics.events_dropped.labels(venue_id)
+        self._heartbeats_coalesced = _metrics.heartbeats_coalesced.labels(venue_id)
+        _metrics.breaker_open.labels(venue_id).set_function(lambda: 1 if self.breaker.is_open else 0)
+        self._events_backlogged = _metrics.events_backlogged.labels(venue_id)
+        self._events_drained = _metrics.events_drained.labels(venue_id)
+        self._recoveries = _metrics.recoveries.labels(venue_id)
+        self.last_event_time: Optional[float] = None
     
     def get_or_create_trace_id(self, order_ticket: str) -> str:
         """Get or create TraceID for order"""
+        span = _tracing.active and _tracing.active.start("adapter.trace_id_lock_wait")
         with self._lock:
+            if span:
+                span.finish()
             if order_ticket not in self.trace_id_map:
-                self.trace_id_map[order_ticket] = UUIDv7Generator.generate()
+                trace_id = self.trace_lookup and self.trace_lookup(order_ticket)
+                self.trace_id_map[order_ticket] = trace_id or UUIDv7Generator.generate()
             return self.trace_id_map[order_ticket]
     
-    def transform_deal_to_event(self, deal: Dict, account_id: str) -> VCPEvent:
-        """Transform MT5 deal to VCP event"""
+    def transform_deal_to_event(
+        self, deal: Dict, account_id: str, fields: Optional[Tuple[str, str, str]] = None
+    ) -> VCPEvent:
+        """Transform MT5 deal to VCP event (fields: preformatted price, volume, commission)"""
         order_ticket = str(deal.get('order', ''))
         trace_id = self.get_or_create_trace_id(order_ticket)
+        price, volume, commission = fields or format_deals([deal], self.digits)[0]
         
         return self.factory.create_execution_event(
             symbol=deal.get('symbol', ''),
@@ -706,23 +906,34 @@ class VCPManagerAdapter:
             trace_id=trace_id,
             order_id=order_ticket,
             exchange_order_id=str(deal.get('ticket', '')),
-            execution_price=str(deal.get('price', '0')),
-            executed_qty=str(deal.get('volume', '0')),
+            execution_price=price,
+            executed_qty=volume,
             slippage="0",
-            commission=str(deal.get('commission', '0'))
+            commission=commission
         )
     
     def process_deals(self, deals: List[Dict], account_id: str) -> List[VCPEvent]:
         """Process new deals and convert to VCP events"""
-        events = []
+        with self.factory_lock:
+            return self._process_deals(deals, account_id)
+    
+    def _process_deals(self, deals: List[Dict], account_id: str) -> List[VCPEvent]:
+        new_deals = {}
         
         for deal in deals:
             deal_key = (deal.get('ticket'), deal.get('time'))
             
-            if deal_key in self.processed_deals:
+            if deal_key in self.processed_deals or deal_key in new_deals:
                 continue
             
-            event = self.transform_deal_to_event(deal, account_id)
+            new_deals[deal_key] = deal
+        
+        # Numeric fields of the whole batch are formatted column-wise in one pass
+        fields = format_deals(list(new_deals.values()), self.digits)
+        events = []
+        
+        for (deal_key, deal), deal_fields in zip(new_deals.items(), fields):
+            event = self.transform_deal_to_event(deal, account_id, deal_fields)
             events.append(event)
             self.processed_deals.add(deal_key)
         
@@ -734,20 +945,28 @@ class VCPManagerAdapter:
         
         while self._running:
             try:
-                # Collect batch
-                while len(batch) < self.batch_size:
-                    try:
-                        event = self.event_queue.get(timeout=0.1)
-                        batch.append(event)
-                    except:
-                        break
+                span = _tracing.active and _tracing.active.start("worker.collect_batch")
+                try:
+                    self._collect_batch(batch, timeout=0.1)
+                finally:
+                    if span:
+                        span.finish()
                 
-                # Send batch if we have events
-                if batch:
-                    result = self.client.send_batch(batch)
-                    if result["status"] == "ok":
+                # Send batch if we have events (while offline, only as the due probe)
+                if batch and not self.breaker.allow():
+                    time.sleep(0.1)
+                elif batch:
+                    span = _tracing.active and _tracing.active.start(
+                        "worker.send_batch", {"events": len(batch)}
+                    )
+                    try:
+                        sent = self._send_batch(batch)
+                    finally:
+                        if span:
+                            span.finish()
+                    if sent:
                         batch = []
-                    else:
+                    elif not self.breaker.is_open:
                         # Retry later
                         time.sleep(1)
                 else:
@@ -755,122 +974,287 @@ class VCPManagerAdapter:
                     
             except Exception as e:
                 logger.error(f"Worker error: {e}")
+                _metrics.worker_errors.inc()
                 time.sleep(1)
     
-    def start(self):
-        """Start background worker"""
+    def _collect_batch(self, batch: List[VCPEvent], timeout: Optional[float] = None) -> List[VCPEvent]:
+        """Top batch up to batch_size: due resubmissions (at most half), then the queue"""
+        if len(batch) < self.batch_size:
+            batch.extend(self.resubmit.due(max(1, self.batch_size // 2)))
+        while len(batch) < self.batch_size:
+            events = self.event_queue.get_batch(self.batch_size - len(batch), timeout=timeout)
+            if not events:
+                break
+            batch.extend(events)
+        return batch
+    
+    def _send_batch(self, batch: List[VCPEvent], client: Optional[VCCClient] = None) -> bool:
+        """
+        Send one batch; False if VCC could not be reached (keep the batch)
+        
+        Refused events go to the resubmit buffer and the rest of the batch
+        is done, so a poison event never holds back healthy ones. A batch
+        refused as a whole goes back to the resubmit buffer, where only the
+        events VCC named count an attempt.
+        """
+        client = client or self.client
+        return self._batch_sent(batch, client.send_batch(batch), client)
+    
+    def _batch_sent(self, batch: List[VCPEvent], result: Dict, client: Optional[VCCClient] = None) -> bool:
+        """Apply the send_batch result for batch (also a venue's share of a batch sent by a SidecarHost)"""
+        status = result["status"]
+        if status == "error":
+            if self.breaker.record_failure(result.get("error", "")):
+                self._on_break()
+            return False
+        refused = result.get("rejected") or {}
+        acked = next((
+            (event.header.event_id, event.security.event_hash)
+            for event in reversed(batch) if event.header.event_id not in refused
+        ), None) if status != "rejected" else None
+        if self.breaker.record_success(acked):
+            self._on_reconnect(len(batch))
+        if status == "rejected":
+            # Refused as a whole: the named events count an attempt, the rest is sent again
+            dead = self.resubmit.settle([e for e in batch if e.header.event_id in refused], refused)
+            self._done(e.header.event_id for e in dead)
+            self.resubmit.defer([e for e in batch if e.header.event_id not in refused], 0)
+            return True
+        dead = self.resubmit.settle(batch, refused)
+        self._done(e.header.event_id for e in dead)
+        self._done(e.header.event_id for e in batch if e.header.event_id not in refused)
+        return True
+    
+    def _track(self, events):
+        """Count events as outstanding (no-op unless a checkpointer tracks them)"""
+        outstanding = self.outstanding
+        if outstanding is not None:
+            for event in events:
+                outstanding[event.header.event_id] = event
+    
+    def _done(self, event_ids):
+        """Events acknowledged, dead-lettered, recorded in a backlog file or dropped"""
+        outstanding = self.outstanding
+        if outstanding is not None:
+            for event_id in event_ids:
+                outstanding.pop(event_id, None)
+    
+    def _drain_loop(self):
+        """Background drain of the offline backlog, behind the live lanes"""
+        lines: List[str] = []
+        
+        while self._running:
+            try:
+                if not lines:
+                    lines = self.backlog.take(self.drain_batch_size)
+                    if not lines:
+                        time.sleep(0.1)
+                        continue
+                # Live events go first: hold back while the live queue is backed up
+                if self.event_queue.backed_up() or not self.breaker.allow():
+                    time.sleep(0.05)
+                    continue
+                if self._drain_batch(lines):
+                    lines = []
+                elif not self.breaker.is_open:
+                    time.sleep(1)
+                    
+            except Exception as e:
+                logger.error(f"Drain error: {e}")
+                _metrics.worker_errors.inc()
+                time.sleep(1)
+    
+    def _drain_batch(self, lines: List[str], client: Optional[VCCClient] = None) -> bool:
+        """Send one batch of backlog lines as they were recorded; False if VCC could not be reached"""
+        event_ids = [_line_field(line, "event_id") for line in lines]
+        result = (client or self.drain_client).send_serialized(lines, event_ids, self.drain_compresslevel)
+        status = result["status"]
+        if status == "error":
+            if self.breaker.record_failure(result.get("error", "")):
+                self._on_break()
+            return False
+        
+        acked = None
+        refused = result.get("rejected") or {}
+        if status == "rejected":
+            # Refused as a whole: the named events count an attempt, the worker sends the rest
+            # They leave the backlog with release() below, so they count as outstanding again
+            events = [VCPEventSerializer.from_dict(json.loads(line)) for line in lines]
+            self._track(events)
+            dead = self.resubmit.settle([e for e in events if e.header.event_id in refused], refused)
+            self._done(e.header.event_id for e in dead)
+            self.resubmit.defer([e for e in events if e.header.event_id not in refused], 0)
+        else:
+            if refused:
+                events = [
+                    VCPEventSerializer.from_dict(json.loads(line))
+                    for line, event_id in zip(lines, event_ids) if event_id in refused
+                ]
+                self._track(events)
+                self._done(e.header.event_id for e in self.resubmit.settle(events, refused))
+            self._done(event_id for event_id in event_ids if event_id not in refused)
+            last = next((i for i in range(len(lines) - 1, -1, -1) if event_ids[i] not in refused), None)
+            if last is not None:
+                acked = (event_ids[last], _line_field(lines[last], "event_hash", last=True))
+            self._events_drained.inc(result["count"])
+        if self.breaker.record_success(acked):
+            self._on_reconnect(len(lines))
+        self.backlog.release()
+        return True
+    
+    def _on_break(self):
+        """VCC became unreachable: persist the break point, record locally from now on"""
+        point = self.breaker.break_point
+        logger.warning(
+            f"VCC unreachable ({point['break_reason']}), recording events locally; "
+            f"last acknowledged event {point['last_valid_event_id'] or '-'}"
+        )
+        if self._break_path:
+            fd, tmp = tempfile.mkstemp(dir=os.path.dirname(self._break_path), prefix=".offline-")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(point, f)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, self._break_path)
+    
+    def _on_reconnect(self, in_flight: int = 0):
+        """VCC answered again: emit the REC event, the drain thread replays the backlog"""
+        point = self.breaker.break_point
+        recovered = len(self.backlog) + self.event_queue.qsize() + in_flight
+        # Runs on the worker or drain thread: chain REC under the producers' lock
+        with self.factory_lock:
+            event = self.factory.create_recovery_event(
+                point["last_valid_event_id"], point["last_valid_hash"],
+                point["break_timestamp"], point["break_reason"], recovered
+            )
+            self.queue_event(event)
+        self._recoveries.inc()
+        if self._break_path and os.path.exists(self._break_path):
+            os.remove(self._break_path)
+        outage = time.time() - point["break_timestamp"] / 1000
+        logger.info(f"VCC reachable again after {outage:.1f}s, REC emitted, {recovered} events to replay")
+    
+    def start(self, workers: bool = True):
+        """Start background worker (workers=False: uploads are driven by a SidecarHost)"""
+        if self.signing_stage:
+            self.signing_stage.start()
         self._running = True
-        self._worker_thread = Thread(target=self._worker_loop, daemon=True)
-        self._worker_thread.start()
+        self._hosted = not workers
+        if workers:
+            self._worker_thread = Thread(target=self._worker_loop, daemon=True)
+            self._worker_thread.start()
+            self._drain_thread = Thread(target=self._drain_loop, daemon=True)
+            self._drain_thread.start()
+        if self.metrics_port is not None and self._metrics_server is None:
+            self._metrics_server = MetricsServer(
+                port=self.metrics_port, health_fn=self.health_status
+            )
+            self._metrics_server.start()
         logger.info("VCP Manager Adapter started")
     
     def stop(self):
         """Stop background worker"""
+        if self.signing_stage:
+            self.signing_stage.stop()
         self._running = False
-        if self._worker_thread:
-            self._worker_thread.join(timeout=5)
+        for thread in (self._worker_thread, self._drain_thread):
+            if thread:
+                thread.join(timeout=5)
+        if self._metrics_server:
+            self._metrics_server.stop()
+            self._metrics_server = None
+        self.event_queue.close()
+        self.backlog.close()
         logger.info("VCP Manager Adapter stopped")
     
-    def queue_event(self, event: VCPEvent):
-        """Add event to queue"""
+    def queue_event(self, event: VCPEvent) -> bool:
+        """Add event to queue; returns False if the event was dropped"""
+        if self.outstanding is not None:
+            self.outstanding[event.header.event_id] = event
+        if self.signing_stage:
+            queued = self.signing_stage.submit(event)
+        else:
+            queued = self.put_event(event)
+        # Anchor once the chain head is queued, so anchors follow the events they cover
+        anchorer = self.factory.anchorer
+        if anchorer and anchorer.due(event):
+            with self.factory_lock:
+                self.queue_event(anchorer.emit())
+        return queued
+    
+    def put_event(self, event: VCPEvent) -> bool:
+        """Add an event to the upload queue directly (e.g. after signing); offline, to the backlog"""
+        if self.archive is not None:
+            self.archive.append(event)
+        if self.breaker.is_open:
+            try:
+                self.backlog.append(event)
+            except Full:
+                self._events_dropped.inc()
+                self._done([event.header.event_id])
+                logger.warning("Offline backlog full, dropping event")
+                return False
+            if self.backlog.path:
+                self._done([event.header.event_id])  # Kept in the backlog file until acknowledged
+            self._events_backlogged.inc()
+            self.last_event_time = time.time()
+            if self.on_queued:
+                self.on_queued()
+            return True
         try:
             self.event_queue.put_nowait(event)
-        except:
+            self._events_queued.inc()
+            self.last_event_time = time.time()
+            if self.on_queued:
+                self.on_queued()
+            return True
+        except Full:
+            self._events_dropped.inc()
+            self._done([event.header.event_id])
             logger.warning("Event queue full, dropping event")
+            return False
     
     def send_heartbeat(self):
-        """Send heartbeat event"""
-        event = self.factory.create_heartbeat_event()
-        self.queue_event(event)
-
-
-# =============================================================================
-# Event Correlator
-# =============================================================================
-class EventCorrelator:
-    """
-    Correlate events by TraceID and check sequence integrity
-    """
-    
-    EXPECTED_SEQUENCE = {
-        EventTypeCode.SIG: [EventTypeCode.ORD, EventTypeCode.REJ],
-        EventTypeCode.ORD: [EventTypeCode.ACK, EventTypeCode.REJ],
-        EventTypeCode.ACK: [EventTypeCode.EXE, EventTypeCode.PRT, EventTypeCode.CXL],
-        EventTypeCode.PRT: [EventTypeCode.EXE, EventTypeCode.CXL],
-    }
-    
-    def __init__(self):
-        self.event_chains: Dict[str, List[VCPEvent]] = {}
-    
-    def add_event(self, event: VCPEvent) -> Dict:
-        """Add event and check integrity"""
-        trace_id = event.header.trace_id
-        
-        if trace_id not in self.event_chains:
-            self.event_chains[trace_id] = []
-        
-        chain = self.event_chains[trace_id]
-        
-        # Check for duplicates
-        for existing in chain:
-            if existing.header.event_id == event.header.event_id:
-                return {"status": "duplicate", "event_id": event.header.event_id}
-        
-        # Check timestamp ordering
-        if chain and int(event.header.timestamp_int) < int(chain[-1].header.timestamp_int):
-            return {
-                "status": "warning",
-                "message": "Out of order timestamp",
-                "event_id": event.header.event_id
-            }
-        
-        # Check expected sequence
-        if chain:
-            last_type = EventTypeCode(chain[-1].header.event_type_code)
-            curr_type = EventTypeCode(event.header.event_type_code)
-            
-            if last_type in self.EXPECTED_SEQUENCE:
-                expected = self.EXPECTED_SEQUENCE[last_type]
-                if curr_type not in expected:
-                    return {
-                        "status": "warning",
-                        "message": f"Unexpected {curr_type.name} after {last_type.name}",
-                        "event_id": event.header.event_id
-                    }
+        """
+        Send heartbeat event
         
-        chain.append(event)
-        return {"status": "ok", "event_id": event.header.event_id}
-    
-    def get_chain(self, trace_id: str) -> List[VCPEvent]:
-        """Get event chain by TraceID"""
-        return self.event_chains.get(trace_id, [])
+        Skipped (coalesced) while the queue is backed up: the waiting
+        backlog or the heartbeat already queued shows the sidecar is alive.
+        Also skipped while offline, where the REC event covers the gap.
+        Skipping happens before the event is created, so the chain has no gap.
+        """
+        if self.breaker.is_open or self.event_queue.backed_up():
+            self._heartbeats_coalesced.inc()
+            return
+        with self.factory_lock:
+            event = self.factory.create_heartbeat_event()
+            self.queue_event(event)
     
-    def verify_chain_integrity(self, trace_id: str) -> Dict:
-        """Verify hash chain integrity"""
-        chain = self.get_chain(trace_id)
-        
-        if len(chain) < 2:
-            return {"valid": True, "events": len(chain)}
-        
-        for i in range(1, len(chain)):
-            prev_hash = chain[i - 1].security.event_hash
-            curr_prev_hash = chain[i].security.prev_hash
-            
-            if prev_hash != curr_prev_hash:
-                return {
-                    "valid": False,
-                    "error": f"Hash chain break at event {i}",
-                    "expected": prev_hash,
-                    "actual": curr_prev_hash
-                }
-        
-        return {"valid": True, "events": len(chain)}
+    def health_status(self) -> Dict:
+        """Health summary for the /health endpoint (guide section 11.3)"""
+        worker_alive = self._hosted or bool(self._worker_thread and self._worker_thread.is_alive())
+        return {
+            "status": "ok" if (worker_alive or not self._running) and not self.breaker.is_open else "degraded",
+            "vcc_connection": self.client.get_status(),
+            "offline": self.breaker.get_status(),
+            "backlog": len(self.backlog),
+            "queue_size": self.event_queue.qsize(),
+            "lanes": self.event_queue.depths(),
+            "resubmit_pending": len(self.resubmit),
+            "dead_lettered": self.resubmit.dead_lettered,
+            "last_event_time": self.last_event_time
+        }
 
 
 # =============================================================================
 # Example Usage
 # =============================================================================
 if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+    
     # Configuration
     VENUE_ID = "MY_PROP_FIRM"
     VCC_ENDPOINT = "https://api.veritaschain.org"
@@ -0,0 +1,961 @@
+#!/usr/bin/env python3
+"""
+VCP Sidecar Core v1.0 - Event Model, Factory and Serializer
+Document ID: VSO-SDK-PY-014
+License: CC BY 4.0 International
+Maintainer: VeritasChain Standards Organization (VSO)
+
+This module holds the transport-free part of the sidecar SDK:
+- Event generation with proper 3-layer structure
+- UUID v7 generation (RFC 9562)
+- Hash chain construction with pluggable hash algorithms (header.hash_algo)
+- Serialization and sequence/chain correlation
+
+It imports only the standard library (and the stdlib-only metrics and
+tracing modules) and configures no logging, so verification jobs and
+helper processes that only build or check events start fast.
+vcp_sidecar_adapter_v1_0 adds the VCC transport and re-exports all of it.
+"""
+
+import functools
+import hashlib
+import itertools
+import json
+import secrets
+import time
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from enum import IntEnum
+from typing import Any, Callable, Dict, List, Optional
+
+from vcp_metrics_v1_0 import REGISTRY, MetricsRegistry, NULL_METRIC
+import vcp_tracing_v1_0 as _tracing
+
+
+# =============================================================================
+# Metrics (see vcp_metrics_v1_0)
+# =============================================================================
+class _AdapterMetrics:
+    """
+    Metric handles used on the hot path, bound once per registry.
+    Counters are exact; per-event stage timers (factory, hash, serialize)
+    are sampled 1-in-N to keep instrumentation cost to a few percent.
+    """
+
+    def __init__(self, registry: Optional[MetricsRegistry], stage_sample_every: int = 8):
+        self._ticks = itertools.count()
+        self.stage_sample_every = max(1, stage_sample_every)
+        if registry is None or not registry.enabled:
+            self.stage_sample_every = 0
+            for name in (
+                "events_created", "stage_seconds", "factory_seconds", "hash_seconds",
+                "serialize_seconds", "send_seconds", "events_sent", "send_retries",
+                "send_failures", "batch_size", "queue_depth", "events_queued",
+                "events_dropped", "worker_errors", "lane_depth", "lane_age",
+                "events_spilled", "heartbeats_coalesced", "events_refused",
+                "events_dead_lettered", "resubmit_pending", "breaker_open",
+                "events_backlogged", "events_drained", "recoveries",
+            ):
+                setattr(self, name, NULL_METRIC)
+            return
+
+        self.events_created = registry.counter(
+            "vcp_events_created_total", "VCP events created by the factory", ("event_type",)
+        )
+        self.stage_seconds = registry.histogram(
+            "vcp_stage_duration_seconds", "Per-stage processing time", ("stage",)
+        )
+        self.factory_seconds = self.stage_seconds.labels("factory")
+        self.hash_seconds = self.stage_seconds.labels("hash")
+        self.serialize_seconds = self.stage_seconds.labels("serialize")
+        self.send_seconds = self.stage_seconds.labels("send")
+        self.events_sent = registry.counter(
+            "vcp_events_sent_total", "Events acknowledged by VCC"
+        )
+        self.send_retries = registry.counter(
+            "vcp_send_retries_total", "VCC request retries"
+        )
+        self.send_failures = registry.counter(
+            "vcp_send_failures_total", "VCC requests that failed after all retries"
+        )
+        self.batch_size = registry.histogram(
+            "vcp_batch_size", "Events per batch sent to VCC",
+            buckets=(1, 5, 10, 25, 50, 100, 250, 500, 1000)
+        )
+        self.queue_depth = registry.gauge(
+            "vcp_queue_depth", "Events waiting in the adapter queue", ("venue_id",)
+        )
+        self.events_queued = registry.counter(
+            "vcp_events_queued_total", "Events accepted into the adapter queue", ("venue_id",)
+        )
+        self.events_dropped = registry.counter(
+            "vcp_events_dropped_total", "Events dropped because the queue was full", ("venue_id",)
+        )
+        self.worker_errors = registry.counter(
+            "vcp_worker_errors_total", "Unexpected errors in the background worker"
+        )
+        self.lane_depth = registry.gauge(
+            "vcp_lane_depth", "Events waiting per priority lane (memory and spill)", ("venue_id", "lane")
+        )
+        self.lane_age = registry.gauge(
+            "vcp_lane_age_seconds", "Age of the oldest event waiting per priority lane", ("venue_id", "lane")
+        )
+        self.events_spilled = registry.counter(
+            "vcp_events_spilled_total", "Events spilled to disk because the queue was full", ("venue_id", "lane")
+        )
+        self.heartbeats_coalesced = registry.counter(
+            "vcp_heartbeats_coalesced_total", "Heartbeats skipped while the queue was backed up", ("venue_id",)
+        )
+        self.events_refused = registry.counter(
+            "vcp_events_refused_total", "Events VCC refused individually (queued for resubmission)", ("venue_id",)
+        )
+        self.events_dead_lettered = registry.counter(
+            "vcp_events_dead_lettered_total", "Events written to the dead-letter file after max attempts",
+            ("venue_id",)
+        )
+        self.resubmit_pending = registry.gauge(
+            "vcp_resubmit_pending", "Refused events waiting to be sent again", ("venue_id",)
+        )
+        self.breaker_open = registry.gauge(
+            "vcp_breaker_open", "1 while VCC is unreachable and the adapter records locally", ("venue_id",)
+        )
+        self.events_backlogged = registry.counter(
+            "vcp_events_backlogged_total", "Events recorded to the offline backlog", ("venue_id",)
+        )
+        self.events_drained = registry.counter(
+            "vcp_events_drained_total", "Offline backlog events acknowledged by VCC", ("venue_id",)
+        )
+        self.recoveries = registry.counter(
+            "vcp_recoveries_total", "Reconnects after an outage (REC events emitted)", ("venue_id",)
+        )
+
+
+    def sample(self) -> bool:
+        """Whether the current hot-path operation should be timed"""
+        return self.stage_sample_every > 0 and next(self._ticks) % self.stage_sample_every == 0
+
+
+_metrics = _AdapterMetrics(REGISTRY)
+
+
+def bind_metrics(registry: Optional[MetricsRegistry] = REGISTRY, stage_sample_every: int = 8):
+    """
+    Rebind adapter instrumentation to a registry.
+    Pass None to disable metrics entirely (no-op handles on the hot path).
+    Set stage_sample_every=1 to time every event.
+    Rebinds in place, so modules holding a reference to _metrics follow.
+    """
+    _metrics.__init__(registry, stage_sample_every)
+
+
+# =============================================================================
+# Event Type Codes (IMMUTABLE - VCP v1.0 Specification)
+# =============================================================================
+class EventTypeCode(IntEnum):
+    """VCP Event Type Codes - These are IMMUTABLE for backward compatibility"""
+    SIG = 1    # Signal/Decision generated
+    ORD = 2    # Order sent
+    ACK = 3    # Order acknowledged
+    EXE = 4    # Full execution
+    PRT = 5    # Partial fill
+    REJ = 6    # Order rejected
+    CXL = 7    # Order cancelled
+    MOD = 8    # Order modified
+    CLS = 9    # Position closed
+    ALG = 20   # Algorithm update
+    RSK = 21   # Risk parameter change
+    AUD = 22   # Audit request
+    HBT = 98   # Heartbeat
+    ERR = 99   # Error
+    REC = 100  # Recovery
+    SNC = 101  # Clock sync status
+
+
+EVENT_TYPE_NAMES = {
+    EventTypeCode.SIG: "SIG",
+    EventTypeCode.ORD: "ORD",
+    EventTypeCode.ACK: "ACK",
+    EventTypeCode.EXE: "EXE",
+    EventTypeCode.PRT: "PRT",
+    EventTypeCode.REJ: "REJ",
+    EventTypeCode.CXL: "CXL",
+    EventTypeCode.MOD: "MOD",
+    EventTypeCode.CLS: "CLS",
+    EventTypeCode.ALG: "ALG",
+    EventTypeCode.RSK: "RSK",
+    EventTypeCode.AUD: "AUD",
+    EventTypeCode.HBT: "HBT",
+    EventTypeCode.ERR: "ERR",
+    EventTypeCode.REC: "REC",
+    EventTypeCode.SNC: "SNC",
+}
+
+
+class TimestampPrecision:
+    NANOSECOND = "NANOSECOND"
+    MICROSECOND = "MICROSECOND"
+    MILLISECOND = "MILLISECOND"
+
+
+class ClockSyncStatus:
+    PTP_LOCKED = "PTP_LOCKED"
+    NTP_SYNCED = "NTP_SYNCED"
+    BEST_EFFORT = "BEST_EFFORT"
+    UNRELIABLE = "UNRELIABLE"
+
+
+class Tier:
+    PLATINUM = "PLATINUM"
+    GOLD = "GOLD"
+    SILVER = "SILVER"
+
+
+# =============================================================================
+# VCP v1.0 Data Structures
+# =============================================================================
+@dataclass
+class VCPHeader:
+    """VCP-CORE Header Structure"""
+    event_id: str
+    trace_id: str
+    timestamp_int: str           # Nanoseconds as string
+    timestamp_iso: str           # ISO 8601
+    event_type: str              # String representation (SIG, ORD, etc.)
+    event_type_code: int         # Integer code (1, 2, etc.)
+    timestamp_precision: str
+    clock_sync_status: str
+    hash_algo: str
+    venue_id: str
+    symbol: str
+    account_id: str
+    operator_id: Optional[str] = None
+
+
+@dataclass
+class VCPTradeData:
+    """VCP-TRADE Payload Structure"""
+    order_id: Optional[str] = None
+    exchange_order_id: Optional[str] = None
+    side: Optional[str] = None              # BUY/SELL
+    order_type: Optional[str] = None        # MARKET/LIMIT/STOP/STOP_LIMIT
+    price: Optional[str] = None             # String for precision
+    quantity: Optional[str] = None          # String for precision
+    execution_price: Optional[str] = None
+    executed_qty: Optional[str] = None
+    commission: Optional[str] = None
+    slippage: Optional[str] = None
+    currency: Optional[str] = None
+    reject_reason: Optional[str] = None
+    reject_code: Optional[str] = None
+
+
+@dataclass
+class VCPRiskData:
+    """VCP-RISK Payload Structure"""
+    max_position_size: Optional[str] = None
+    current_position: Optional[str] = None
+    exposure_utilization: Optional[str] = None
+    daily_loss_limit: Optional[str] = None
+    current_daily_loss: Optional[str] = None
+    max_drawdown: Optional[str] = None
+    current_drawdown: Optional[str] = None
+    throttle_rate: Optional[str] = None
+    circuit_breaker: Optional[str] = None   # NORMAL/WARNING/TRIGGERED/DISABLED
+
+
+@dataclass
+class VCPGovData:
+    """VCP-GOV Payload Structure (AI Transparency - EU AI Act Art.12-14)"""
+    algo_id: Optional[str] = None
+    algo_version: Optional[str] = None
+    algo_type: Optional[str] = None         # RULE_BASED/ML/HYBRID/MANUAL
+    confidence: Optional[str] = None
+    decision_factors: Optional[List[Dict]] = None
+    model_hash: Optional[str] = None
+    training_date: Optional[str] = None
+
+
+@dataclass
+class VCPSecurity:
+    """VCP Security (Hash Chain) Structure"""
+    event_hash: str = ""
+    prev_hash: str = "0" * 64  # Genesis: 64 zeros
+    signature: Optional[str] = None
+    sign_algo: Optional[str] = None  # Ed25519
+
+
+@dataclass
+class VCPEvent:
+    """Complete VCP v1.0 Event Structure (3-layer)"""
+    header: VCPHeader
+    payload: Dict[str, Any] = field(default_factory=dict)
+    security: VCPSecurity = field(default_factory=VCPSecurity)
+    
+    # Internal fields (not serialized)
+    trade_data: Optional[VCPTradeData] = field(default=None, repr=False)
+    risk_data: Optional[VCPRiskData] = field(default=None, repr=False)
+    gov_data: Optional[VCPGovData] = field(default=None, repr=False)
+
+
+def _compact(data) -> Dict[str, Any]:
+    """Dataclass to dict, omitting unset (None) fields"""
+    span = _tracing.active and _tracing.active.start("factory.asdict")
+    result = {k: v for k, v in asdict(data).items() if v is not None}
+    if span:
+        span.finish()
+    return result
+
+
+# =============================================================================
+# UUID v7 Generator (RFC 9562 Compliant)
+# =============================================================================
+class UUIDv7Generator:
+    """
+    UUID v7 Generator compliant with RFC 9562
+    Format: xxxxxxxx-xxxx-7xxx-yxxx-xxxxxxxxxxxx
+    - First 48 bits: Unix timestamp in milliseconds
+    - 4 bits: Version (0111 = 7)
+    - 12 bits: Random
+    - 2 bits: Variant (10)
+    - 62 bits: Random
+    """
+    
+    @staticmethod
+    def generate() -> str:
+        """Generate a RFC 9562 compliant UUID v7"""
+        # Get current timestamp in milliseconds
+        timestamp_ms = int(time.time() * 1000)
+        
+        # Convert to bytes (48 bits = 6 bytes)
+        ts_bytes = timestamp_ms.to_bytes(6, byteorder='big')
+        
+        # Generate random bytes
+        rand_bytes = secrets.token_bytes(10)
+        
+        # Build UUID bytes (16 total)
+        uuid_bytes = bytearray(16)
+        
+        # First 6 bytes: timestamp
+        uuid_bytes[0:6] = ts_bytes
+        
+        # Bytes 6-7: version (7) and random
+        uuid_bytes[6] = (7 << 4) | (rand_bytes[0] & 0x0F)
+        uuid_bytes[7] = rand_bytes[1]
+        
+        # Byte 8: variant (10xx) and random
+        uuid_bytes[8] = (0b10 << 6) | (rand_bytes[2] & 0x3F)
+        
+        # Remaining bytes: random
+        uuid_bytes[9:16] = rand_bytes[3:10]
+        
+        # Format as UUID string
+        hex_str = uuid_bytes.hex()
+        return f"{hex_str[0:8]}-{hex_str[8:12]}-{hex_str[12:16]}-{hex_str[16:20]}-{hex_str[20:32]}"
+    
+    @staticmethod
+    def validate(uuid_str: str) -> bool:
+        """Validate UUID v7 format"""
+        import re
+        pattern = r'^[0-9a-f]{8}-[0-9a-f]{4}-7[0-9a-f]{3}-[89ab][0-9a-f]{3}-[0-9a-f]{12}$'
+        return bool(re.match(pattern, uuid_str.lower()))
+
+
+# =============================================================================
+# Hash Algorithms
+# =============================================================================
+DEFAULT_HASH_ALGO = "SHA256"
+
+# header.hash_algo -> hashlib-style constructor; every digest is 32 bytes, so
+# prev_hash, checkpoints and Merkle leaves stay 64 hex characters
+HASH_ALGORITHMS: Dict[str, Callable[..., Any]] = {
+    "SHA256": hashlib.sha256,
+    "SHA3_256": hashlib.sha3_256,
+    "BLAKE2B_256": functools.partial(hashlib.blake2b, digest_size=32),
+}
+
+
+def register_hash_algo(name: str, constructor: Callable[..., Any]):
+    """Make `name` usable as hash_algo; constructor(data) must return a 32-byte hashlib-style object"""
+    if constructor(b"").digest_size != 32:
+        raise ValueError(f"Hash algorithm {name} must produce 32-byte digests")
+    HASH_ALGORITHMS[name] = constructor
+
+
+def get_hash_algo(name: Optional[str]) -> Callable[..., Any]:
+    """Constructor for a hash_algo name; empty means the default (SHA256)"""
+    try:
+        return HASH_ALGORITHMS[name or DEFAULT_HASH_ALGO]
+    except KeyError:
+        raise ValueError(
+            f"Unknown hash algorithm {name!r} (known: {', '.join(HASH_ALGORITHMS)})"
+        ) from None
+
+
+# =============================================================================
+# VCP Event Factory
+# =============================================================================
+def compute_event_hash(event: VCPEvent) -> str:
+    """Compute the event hash with header.hash_algo (RFC 8785 canonical JSON)"""
+    # Create canonical JSON representation
+    canonical = {
+        "header": {
+            "event_id": event.header.event_id,
+            "trace_id": event.header.trace_id,
+            "timestamp_int": event.header.timestamp_int,
+            "event_type_code": event.header.event_type_code,
+        },
+        "payload": event.payload,
+        "prev_hash": event.security.prev_hash
+    }
+    
+    # Sort keys for RFC 8785 compliance
+    span = _tracing.active and _tracing.active.start("hash.canonical_json")
+    canonical_json = json.dumps(canonical, sort_keys=True, separators=(',', ':'))
+    if span:
+        span.finish()
+        span = _tracing.active and _tracing.active.start("hash.digest")
+    
+    digest = get_hash_algo(event.header.hash_algo)(canonical_json.encode('utf-8')).hexdigest()
+    if span:
+        span.finish()
+    return digest
+
+
+class VCPEventFactory:
+    """Factory for creating VCP-compliant events"""
+    
+    def __init__(
+        self,
+        venue_id: str,
+        tier: str = Tier.SILVER,
+        hash_algo: str = "SHA256"
+    ):
+        get_hash_algo(hash_algo)  # Fail here on an unknown algorithm, not on the first event
+        self.venue_id = venue_id
+        self.tier = tier
+        # Read per event: may be switched mid-chain, each event records its own
+        self.hash_algo = hash_algo
+        self.prev_hash = "0" * 64  # Genesis hash
+        self.sequence = 0          # Events chained so far (restored from checkpoints)
+        # Optional observer of every chained event (see vcp_merkle_v1_0.MerkleAnchorer)
+        self.anchorer = None
+        # Optional keyed account pseudonyms (see vcp_pseudonym_v1_0.Pseudonymizer)
+        self.pseudonymizer: Optional[Callable[[str], str]] = None
+        self._uuid_gen = UUIDv7Generator()
+        
+        # Tier-specific settings
+        if tier == Tier.SILVER:
+            self.timestamp_precision = TimestampPrecision.MILLISECOND
+            self.clock_sync_status = ClockSyncStatus.BEST_EFFORT
+        elif tier == Tier.GOLD:
+            self.timestamp_precision = TimestampPrecision.MICROSECOND
+            self.clock_sync_status = ClockSyncStatus.NTP_SYNCED
+        else:  # PLATINUM
+            self.timestamp_precision = TimestampPrecision.NANOSECOND
+            self.clock_sync_status = ClockSyncStatus.PTP_LOCKED
+    
+    def _get_timestamps(self, timestamp_ns: Optional[int] = None) -> tuple:
+        """Get dual-format timestamps (nanoseconds string + ISO 8601)"""
+        if timestamp_ns is None:
+            now = datetime.now(timezone.utc)
+            timestamp_ns = int(now.timestamp() * 1_000_000_000)
+        else:
+            now = datetime.fromtimestamp(timestamp_ns // 1_000_000_000, timezone.utc).replace(
+                microsecond=timestamp_ns % 1_000_000_000 // 1000
+            )
+        
+        # Nanosecond timestamp as string
+        timestamp_int = str(timestamp_ns)
+        
+        # ISO 8601 format with milliseconds
+        timestamp_iso = now.strftime("%Y-%m-%dT%H:%M:%S.") + f"{now.microsecond // 1000:03d}Z"
+        
+        return timestamp_int, timestamp_iso
+    
+    def _compute_event_hash(self, event: VCPEvent) -> str:
+        """Compute the event hash with header.hash_algo (RFC 8785 canonical JSON)"""
+        return compute_event_hash(event)
+    
+    def _finalize_event(self, event: VCPEvent, started: float, span=None) -> VCPEvent:
+        """Compute event hash, advance the chain and record factory metrics"""
+        timed = _metrics.sample()
+        if timed:
+            hash_started = time.perf_counter()
+        
+        event.security.event_hash = self._compute_event_hash(event)
+        self.prev_hash = event.security.event_hash
+        self.sequence += 1
+        if self.anchorer:
+            self.anchorer.observe(event, self.sequence)
+        
+        if timed:
+            finished = time.perf_counter()
+            _metrics.hash_seconds.observe(finished - hash_started)
+            _metrics.factory_seconds.observe(finished - started)
+        _metrics.events_created.labels(event.header.event_type).inc()
+        
+        if span:
+            span.finish()
+        
+        return event
+    
+    def _pseudonymize_account(self, account_id: str, salt: str = "") -> str:
+        """Pseudonymize account ID (GDPR compliant)"""
+        if self.pseudonymizer is not None and not salt:
+            return self.pseudonymizer(account_id)
+        if not salt:
+            salt = f"vcp_{self.venue_id}_"
+        combined = f"{salt}{account_id}"
+        hashed = hashlib.sha256(combined.encode()).hexdigest()[:16]
+        return f"acc_{hashed}"
+    
+    def create_header(
+        self,
+        event_type: EventTypeCode,
+        symbol: str,
+        account_id: str,
+        trace_id: Optional[str] = None,
+        operator_id: Optional[str] = None,
+        event_id: Optional[str] = None,
+        timestamp_ns: Optional[int] = None
+    ) -> VCPHeader:
+        """Create VCP-CORE compliant header (event_id/timestamp_ns default to now)"""
+        span = _tracing.active and _tracing.active.start("factory.header")
+        timestamp_int, timestamp_iso = self._get_timestamps(timestamp_ns)
+        
+        header = VCPHeader(
+            event_id=event_id or self._uuid_gen.generate(),
+            trace_id=trace_id or self._uuid_gen.generate(),
+            timestamp_int=timestamp_int,
+            timestamp_iso=timestamp_iso,
+            event_type=EVENT_TYPE_NAMES[event_type],
+            event_type_code=int(event_type),
+            timestamp_precision=self.timestamp_precision,
+            clock_sync_status=self.clock_sync_status,
+            hash_algo=self.hash_algo,
+            venue_id=self.venue_id,
+            symbol=symbol,
+            account_id=self._pseudonymize_account(account_id),
+            operator_id=operator_id
+        )
+        if span:
+            span.finish()
+        return header
+    
+    def create_signal_event(
+        self,
+        symbol: str,
+        account_id: str,
+        algo_id: str,
+        algo_version: str,
+        algo_type: str = "HYBRID",
+        confidence: str = "0.0",
+        decision_factors: Optional[List[Dict]] = None
+    ) -> VCPEvent:
+        """Create SIG (Signal) event with VCP-GOV payload"""
+        started = time.perf_counter()
+        span = _tracing.active and _tracing.active.start("factory.create_event")
+        header = self.create_header(EventTypeCode.SIG, symbol, account_id)
+        
+        gov_data = VCPGovData(
+            algo_id=algo_id,
+            algo_version=algo_version,
+            algo_type=algo_type,
+            confidence=confidence,
+            decision_factors=decision_factors or []
+        )
+        
+        payload = {"vcp_gov": _compact(gov_data)}
+        
+        event = VCPEvent(
+            header=header,
+            payload=payload,
+            security=VCPSecurity(prev_hash=self.prev_hash),
+            gov_data=gov_data
+        )
+        
+        # Compute hash and update chain
+        return self._finalize_event(event, started, span)
+    
+    def create_order_event(
+        self,
+        symbol: str,
+        account_id: str,
+        trace_id: str,
+        order_id: str,
+        side: str,
+        order_type: str,
+        price: str,
+        quantity: str,
+        risk_data: Optional[VCPRiskData] = None
+    ) -> VCPEvent:
+        """Create ORD (Order) event with VCP-TRADE and VCP-RISK payload"""
+        started = time.perf_counter()
+        span = _tracing.active and _tracing.active.start("factory.create_event")
+        header = self.create_header(EventTypeCode.ORD, symbol, account_id, trace_id)
+        
+        trade_data = VCPTradeData(
+            order_id=order_id,
+            side=side,
+            order_type=order_type,
+            price=price,
+            quantity=quantity
+        )
+        
+        payload = {"trade_data": _compact(trade_data)}
+        
+        if risk_data:
+            payload["vcp_risk"] = _compact(risk_data)
+        
+        event = VCPEvent(
+            header=header,
+            payload=payload,
+            security=VCPSecurity(prev_hash=self.prev_hash),
+            trade_data=trade_data,
+            risk_data=risk_data
+        )
+        
+        return self._finalize_event(event, started, span)
+    
+    def create_execution_event(
+        self,
+        symbol: str,
+        account_id: str,
+        trace_id: str,
+        order_id: str,
+        exchange_order_id: str,
+        execution_price: str,
+        executed_qty: str,
+        slippage: str = "0",
+        commission: str = "0"
+    ) -> VCPEvent:
+        """Create EXE (Execution) event with VCP-TRADE payload"""
+        started = time.perf_counter()
+        span = _tracing.active and _tracing.active.start("factory.create_event")
+        header = self.create_header(EventTypeCode.EXE, symbol, account_id, trace_id)
+        
+        trade_data = VCPTradeData(
+            order_id=order_id,
+            exchange_order_id=exchange_order_id,
+            execution_price=execution_price,
+            executed_qty=executed_qty,
+            slippage=slippage,
+            commission=commission
+        )
+        
+        payload = {"trade_data": _compact(trade_data)}
+        
+        event = VCPEvent(
+            header=header,
+            payload=payload,
+            security=VCPSecurity(prev_hash=self.prev_hash),
+            trade_data=trade_data
+        )
+        
+        return self._finalize_event(event, started, span)
+    
+    def create_reject_event(
+        self,
+        symbol: str,
+        account_id: str,
+        trace_id: str,
+        order_id: str,
+        reject_reason: str,
+        reject_code: str = ""
+    ) -> VCPEvent:
+        """Create REJ (Reject) event with VCP-TRADE payload"""
+        started = time.perf_counter()
+        span = _tracing.active and _tracing.active.start("factory.create_event")
+        header = self.create_header(EventTypeCode.REJ, symbol, account_id, trace_id)
+        
+        trade_data = VCPTradeData(
+            order_id=order_id,
+            reject_reason=reject_reason,
+            reject_code=reject_code
+        )
+        
+        payload = {"trade_data": _compact(trade_data)}
+        
+        event = VCPEvent(
+            header=header,
+            payload=payload,
+            security=VCPSecurity(prev_hash=self.prev_hash),
+            trade_data=trade_data
+        )
+        
+        return self._finalize_event(event, started, span)
+    
+    def create_event(
+        self,
+        event_type: EventTypeCode,
+        symbol: str,
+        account_id: str,
+        payload: Dict[str, Any],
+        trace_id: Optional[str] = None,
+        event_id: Optional[str] = None,
+        timestamp_ns: Optional[int] = None
+    ) -> VCPEvent:
+        """Create an event of any type from a prepared payload (e.g. relayed from an EA)"""
+        started = time.perf_counter()
+        span = _tracing.active and _tracing.active.start("factory.create_event")
+        header = self.create_header(
+            event_type, symbol, account_id, trace_id,
+            event_id=event_id, timestamp_ns=timestamp_ns
+        )
+        
+        event = VCPEvent(
+            header=header,
+            payload=payload,
+            security=VCPSecurity(prev_hash=self.prev_hash)
+        )
+        
+        return self._finalize_event(event, started, span)
+    
+    def create_heartbeat_event(self) -> VCPEvent:
+        """Create HBT (Heartbeat) event"""
+        started = time.perf_counter()
+        span = _tracing.active and _tracing.active.start("factory.create_event")
+        header = self.create_header(EventTypeCode.HBT, "", "system")
+        header.trace_id = header.event_id  # Self-referential for HBT
+        
+        event = VCPEvent(
+            header=header,
+            payload={},
+            security=VCPSecurity(prev_hash=self.prev_hash)
+        )
+        
+        return self._finalize_event(event, started, span)
+    
+    def create_recovery_event(
+        self,
+        last_valid_event_id: str,
+        last_valid_hash: str,
+        break_timestamp: int,
+        break_reason: str,
+        recovered_events: int,
+        recovery_type: str = "CHAIN_BREAK",
+        method: str = "REBUILD",
+        validation_method: str = "CACHE_REPLAY"
+    ) -> VCPEvent:
+        """
+        Create REC (Recovery) event (guide section 8.4)
+        
+        break_timestamp is in epoch milliseconds; recovered_events counts
+        the events replayed from the local cache after reconnecting.
+        """
+        started = time.perf_counter()
+        span = _tracing.active and _tracing.active.start("factory.create_event")
+        header = self.create_header(EventTypeCode.REC, "", "system")
+        header.trace_id = header.event_id  # Self-referential, like HBT
+        
+        payload = {
+            "recovery_data": {
+                "version": "1.0",
+                "recovery_type": recovery_type,
+                "break_point": {
+                    "last_valid_event_id": last_valid_event_id,
+                    "last_valid_hash": last_valid_hash,
+                    "break_timestamp": break_timestamp,
+                    "break_reason": break_reason
+                },
+                "recovery_action": {
+                    "method": method,
+                    "recovered_events": recovered_events,
+                    "validation_method": validation_method
+                }
+            }
+        }
+        
+        event = VCPEvent(
+            header=header,
+            payload=payload,
+            security=VCPSecurity(prev_hash=self.prev_hash)
+        )
+        
+        return self._finalize_event(event, started, span)
+
+
+# =============================================================================
+# VCP Event Serializer
+# =============================================================================
+class VCPEventSerializer:
+    """Serialize VCP events to JSON (RFC 8785 canonical)"""
+    
+    @staticmethod
+    def to_dict(event: VCPEvent) -> Dict:
+        """Convert VCPEvent to dictionary"""
+        header_dict = {
+            "event_id": event.header.event_id,
+            "trace_id": event.header.trace_id,
+            "timestamp_int": event.header.timestamp_int,
+            "timestamp_iso": event.header.timestamp_iso,
+            "event_type": event.header.event_type,
+            "event_type_code": event.header.event_type_code,
+            "timestamp_precision": event.header.timestamp_precision,
+            "clock_sync_status": event.header.clock_sync_status,
+            "hash_algo": event.header.hash_algo,
+            "venue_id": event.header.venue_id,
+            "symbol": event.header.symbol,
+            "account_id": event.header.account_id,
+        }
+        
+        if event.header.operator_id:
+            header_dict["operator_id"] = event.header.operator_id
+        
+        security_dict = {
+            "event_hash": event.security.event_hash,
+            "prev_hash": event.security.prev_hash,
+        }
+        
+        if event.security.signature:
+            security_dict["signature"] = event.security.signature
+            security_dict["sign_algo"] = event.security.sign_algo
+        
+        return {
+            "header": header_dict,
+            "payload": event.payload,
+            "security": security_dict
+        }
+    
+    @staticmethod
+    def from_dict(data: Dict) -> VCPEvent:
+        """Rebuild a VCPEvent from to_dict() output (e.g. spilled to disk)"""
+        return VCPEvent(
+            header=VCPHeader(**data["header"]),
+            payload=data.get("payload", {}),
+            security=VCPSecurity(**data.get("security", {}))
+        )
+    
+    @staticmethod
+    def to_json(event: VCPEvent, indent: Optional[int] = None) -> str:
+        """Convert VCPEvent to JSON string"""
+        span = _tracing.active and _tracing.active.start("serializer.to_json")
+        timed = _metrics.sample()
+        if timed:
+            started = time.perf_counter()
+        result = json.dumps(
+            VCPEventSerializer.to_dict(event),
+            indent=indent,
+            ensure_ascii=False
+        )
+        if timed:
+            _metrics.serialize_seconds.observe(time.perf_counter() - started)
+        if span:
+            span.finish()
+        return result
+    
+    @staticmethod
+    def to_jsonl(events: List[VCPEvent]) -> str:
+        """Convert list of events to JSONL format"""
+        lines = [VCPEventSerializer.to_json(e) for e in events]
+        return '\n'.join(lines)
+
+
+# =============================================================================
+# Event Correlator
+# =============================================================================
+class EventCorrelator:
+    """
+    Correlate events by TraceID and check sequence integrity
+    """
+    
+    EXPECTED_SEQUENCE = {
+        EventTypeCode.SIG: [EventTypeCode.ORD, EventTypeCode.REJ],
+        EventTypeCode.ORD: [EventTypeCode.ACK, EventTypeCode.REJ],
+        EventTypeCode.ACK: [EventTypeCode.EXE, EventTypeCode.PRT, EventTypeCode.CXL],
+        EventTypeCode.PRT: [EventTypeCode.EXE, EventTypeCode.CXL],
+    }
+    
+    def __init__(self):
+        self.event_chains: Dict[str, List[VCPEvent]] = {}
+        # Chains restored from a checkpoint, materialized on first access
+        self.packed_chains = None
+    
+    def _unpack(self, trace_id: str):
+        if self.packed_chains is not None and trace_id in self.packed_chains:
+            self.event_chains[trace_id] = self.packed_chains.pop(trace_id)
+    
+    def add_event(self, event: VCPEvent) -> Dict:
+        """Add event and check integrity"""
+        trace_id = event.header.trace_id
+        
+        if trace_id not in self.event_chains:
+            self._unpack(trace_id)
+            if trace_id not in self.event_chains:
+                self.event_chains[trace_id] = []
+        
+        chain = self.event_chains[trace_id]
+        
+        # Check for duplicates
+        for existing in chain:
+            if existing.header.event_id == event.header.event_id:
+                return {"status": "duplicate", "event_id": event.header.event_id}
+        
+        # Check timestamp ordering
+        if chain and int(event.header.timestamp_int) < int(chain[-1].header.timestamp_int):
+            return {
+                "status": "warning",
+                "message": "Out of order timestamp",
+                "event_id": event.header.event_id
+            }
+        
+        # Check expected sequence
+        if chain:
+            last_type = EventTypeCode(chain[-1].header.event_type_code)
+            curr_type = EventTypeCode(event.header.event_type_code)
+            
+            if last_type in self.EXPECTED_SEQUENCE:
+                expected = self.EXPECTED_SEQUENCE[last_type]
+                if curr_type not in expected:
+                    return {
+                        "status": "warning",
+                        "message": f"Unexpected {curr_type.name} after {last_type.name}",
+                        "event_id": event.header.event_id
+                    }
+        
+        chain.append(event)
+        return {"status": "ok", "event_id": event.header.event_id}
+    
+    def get_chain(self, trace_id: str) -> List[VCPEvent]:
+        """Get event chain by TraceID"""
+        if trace_id not in self.event_chains:
+            self._unpack(trace_id)
+        return self.event_chains.get(trace_id, [])
+    
+    def verify_chain_integrity(self, trace_id: str, recompute: bool = False) -> Dict:
+        """
+        Verify hash chain integrity
+        
+        With recompute, each event hash is also recomputed with the event's
+        own header.hash_algo, so chains mixing algorithms verify. Events
+        restored from a checkpoint keep only their hashes (empty hash_algo)
+        and are checked for linkage only.
+        """
+        chain = self.get_chain(trace_id)
+        
+        if recompute:
+            for i, event in enumerate(chain):
+                if event.header.hash_algo and compute_event_hash(event) != event.security.event_hash:
+                    return {
+                        "valid": False,
+                        "error": f"Hash mismatch at event {i} ({event.header.hash_algo})",
+                        "expected": compute_event_hash(event),
+                        "actual": event.security.event_hash
+                    }
+        
+        if len(chain) < 2:
+            return {"valid": True, "events": len(chain)}
+        
+        for i in range(1, len(chain)):
+            prev_hash = chain[i - 1].security.event_hash
+            curr_prev_hash = chain[i].security.prev_hash
+            
+            if prev_hash != curr_prev_hash:
+                return {
+                    "valid": False,
+                    "error": f"Hash chain break at event {i}",
+                    "expected": prev_hash,
+                    "actual": curr_prev_hash
+                }
+        
+        return {"valid": True, "events": len(chain)}
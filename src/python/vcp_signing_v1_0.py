@@ -0,0 +1,505 @@
+#!/usr/bin/env python3
+"""
+VCP Event Signing v1.0 - Ed25519 Signatures for VCPSecurity
+Document ID: VSO-SDK-PY-010
+License: CC BY 4.0 International
+Maintainer: VeritasChain Standards Organization (VSO)
+
+This module adds per-event Ed25519 signatures for GOLD/PLATINUM tiers:
+- Pluggable signers: a software key loaded from a local file, or a local
+  stand-in for an HSM that holds the key in a separate process
+- A signing stage between VCPManagerAdapter.queue_event and the upload
+  worker; batches are signed in a thread or process pool, so signing
+  overlaps with hashing (producer) and upload (worker)
+- Batch verification for the verifier side
+
+The signature covers the raw 32-byte event_hash and is stored base64
+encoded in VCPSecurity.signature with sign_algo "Ed25519". Requires the
+optional `cryptography` package.
+"""
+
+import base64
+import hashlib
+import logging
+import multiprocessing
+import os
+import time
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from queue import Empty, Full, Queue
+from threading import Event, Thread
+from typing import Callable, List, Optional, Sequence
+
+try:
+    from cryptography.exceptions import InvalidSignature
+    from cryptography.hazmat.primitives import serialization
+    from cryptography.hazmat.primitives.asymmetric.ed25519 import (
+        Ed25519PrivateKey, Ed25519PublicKey
+    )
+except ImportError:  # Optional dependency
+    Ed25519PrivateKey = Ed25519PublicKey = None
+
+from vcp_metrics_v1_0 import REGISTRY
+from vcp_sidecar_core_v1_0 import VCPEvent
+
+logger = logging.getLogger("vcp_signing")
+
+SIGN_ALGO = "Ed25519"
+
+_events_signed = REGISTRY.counter("vcp_signing_events_total", "Events signed")
+_batch_seconds = REGISTRY.histogram("vcp_signing_batch_seconds", "Time to sign one batch")
+_backlog = REGISTRY.gauge("vcp_signing_backlog", "Events waiting to be signed")
+_signing_bypassed = REGISTRY.counter(
+    "vcp_signing_bypassed_total", "Events forwarded unsigned because the signing queue stayed full for submit_timeout"
+)
+_verify_failures = REGISTRY.counter("vcp_signing_verify_failures_total", "Signatures that failed verification")
+
+
+def _require_crypto():
+    if Ed25519PrivateKey is None:
+        raise ImportError("Ed25519 signing requires the 'cryptography' package (pip install cryptography)")
+
+
+# =============================================================================
+# Key Files
+# =============================================================================
+def load_private_key(path: str, password: Optional[bytes] = None) -> "Ed25519PrivateKey":
+    """Load a PEM (PKCS#8), raw 32-byte or hex-encoded Ed25519 private key"""
+    _require_crypto()
+    with open(path, "rb") as f:
+        data = f.read()
+    if data.startswith(b"-----BEGIN"):
+        key = serialization.load_pem_private_key(data, password=password)
+        if not isinstance(key, Ed25519PrivateKey):
+            raise ValueError(f"{path} is not an Ed25519 private key")
+        return key
+    if len(data) != 32:
+        data = bytes.fromhex(data.decode("ascii").strip())
+    return Ed25519PrivateKey.from_private_bytes(data)
+
+
+def load_public_key(path: str) -> "Ed25519PublicKey":
+    """Load a PEM (SubjectPublicKeyInfo), raw 32-byte or hex-encoded public key"""
+    _require_crypto()
+    with open(path, "rb") as f:
+        data = f.read()
+    if data.startswith(b"-----BEGIN"):
+        key = serialization.load_pem_public_key(data)
+        if not isinstance(key, Ed25519PublicKey):
+            raise ValueError(f"{path} is not an Ed25519 public key")
+        return key
+    if len(data) != 32:
+        data = bytes.fromhex(data.decode("ascii").strip())
+    return Ed25519PublicKey.from_public_bytes(data)
+
+
+def generate_key_file(path: str) -> "Ed25519PublicKey":
+    """Create a new PEM private key (mode 0600) and <path>.pub next to it"""
+    _require_crypto()
+    key = Ed25519PrivateKey.generate()
+    pem = key.private_bytes(
+        serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8, serialization.NoEncryption()
+    )
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, "wb") as f:
+        f.write(pem)
+    public_key = key.public_key()
+    with open(path + ".pub", "wb") as f:
+        f.write(public_key.public_bytes(
+            serialization.Encoding.PEM, serialization.PublicFormat.SubjectPublicKeyInfo
+        ))
+    return public_key
+
+
+def _raw_public(public_key: "Ed25519PublicKey") -> bytes:
+    return public_key.public_bytes(serialization.Encoding.Raw, serialization.PublicFormat.Raw)
+
+
+def key_id(public_key: "Ed25519PublicKey") -> str:
+    """Short fingerprint of a public key for logs"""
+    return hashlib.sha256(_raw_public(public_key)).hexdigest()[:16]
+
+
+# =============================================================================
+# Signers
+# =============================================================================
+class Signer:
+    """
+    Signs 32-byte event digests
+
+    cpu_bound signers are picklable and run in a process pool; others
+    (e.g. an HSM reached over a pipe) run in threads.
+    """
+
+    algorithm = SIGN_ALGO
+    cpu_bound = True
+
+    def public_key(self) -> "Ed25519PublicKey":
+        raise NotImplementedError
+
+    def sign_many(self, digests: Sequence[bytes]) -> List[bytes]:
+        raise NotImplementedError
+
+    def sign(self, digest: bytes) -> bytes:
+        return self.sign_many([digest])[0]
+
+    def close(self):
+        pass
+
+
+class SoftwareSigner(Signer):
+    """Ed25519 private key held in process memory"""
+
+    def __init__(self, private_key: "Ed25519PrivateKey"):
+        _require_crypto()
+        self._key = private_key
+
+    @classmethod
+    def from_file(cls, path: str, password: Optional[bytes] = None) -> "SoftwareSigner":
+        return cls(load_private_key(path, password))
+
+    @classmethod
+    def generate(cls) -> "SoftwareSigner":
+        _require_crypto()
+        return cls(Ed25519PrivateKey.generate())
+
+    def public_key(self) -> "Ed25519PublicKey":
+        return self._key.public_key()
+
+    def sign_many(self, digests: Sequence[bytes]) -> List[bytes]:
+        sign = self._key.sign
+        return [sign(digest) for digest in digests]
+
+    # Pool workers receive the raw key (local processes only)
+    def __getstate__(self):
+        return {"seed": self._key.private_bytes(
+            serialization.Encoding.Raw, serialization.PrivateFormat.Raw, serialization.NoEncryption()
+        )}
+
+    def __setstate__(self, state):
+        self._key = Ed25519PrivateKey.from_private_bytes(state["seed"])
+
+
+def _hsm_main(conn, key_path: str, latency: float):
+    """Stand-in HSM process: owns the key, signs batches sent over a pipe"""
+    key = load_private_key(key_path)
+    conn.send(_raw_public(key.public_key()))
+    while True:
+        try:
+            digests = conn.recv()
+        except EOFError:
+            break
+        if digests is None:
+            break
+        if latency:
+            time.sleep(latency)
+        conn.send([key.sign(digest) for digest in digests])
+
+
+class HSMStandinSigner(Signer):
+    """
+    Local stand-in for a network HSM
+
+    The key is loaded by separate processes (one per session) and never
+    enters the sidecar. Each batch is one round trip; `latency` adds the
+    per-call delay of a real device.
+    """
+
+    cpu_bound = False
+
+    def __init__(self, key_path: str, sessions: int = 2, latency: float = 0.0):
+        _require_crypto()
+        ctx = multiprocessing.get_context("spawn")
+        self._sessions: "Queue" = Queue()
+        self._processes = []
+        public = None
+        for _ in range(sessions):
+            parent, child = ctx.Pipe()
+            process = ctx.Process(target=_hsm_main, args=(child, key_path, latency), daemon=True)
+            process.start()
+            child.close()
+            public = parent.recv()
+            self._processes.append((process, parent))
+            self._sessions.put(parent)
+        self._public = Ed25519PublicKey.from_public_bytes(public)
+
+    def public_key(self) -> "Ed25519PublicKey":
+        return self._public
+
+    def sign_many(self, digests: Sequence[bytes]) -> List[bytes]:
+        conn = self._sessions.get()
+        try:
+            conn.send(list(digests))
+            return conn.recv()
+        finally:
+            self._sessions.put(conn)
+
+    def close(self):
+        for process, conn in self._processes:
+            try:
+                conn.send(None)
+            except OSError:
+                pass
+            process.join(timeout=5)
+            conn.close()
+        self._processes = []
+
+
+_worker_signer: Optional[Signer] = None
+
+
+def _init_sign_worker(signer: Signer):
+    global _worker_signer
+    _worker_signer = signer
+
+
+def _sign_in_worker(digests: List[bytes]) -> List[bytes]:
+    return _worker_signer.sign_many(digests)
+
+
+# =============================================================================
+# Signing Stage
+# =============================================================================
+class SigningStage:
+    """
+    Signs events between the producer and the upload worker
+
+        stage = SigningStage(SoftwareSigner.from_file("venue.pem")).attach(adapter)
+        adapter.start()        # also starts the stage
+        adapter.queue_event(event)  # hashed by the producer, signed here, uploaded by the worker
+
+    Events are collected into batches of up to batch_size and signed in a
+    pool; up to max_in_flight batches are signed concurrently. Batches are
+    handed to the adapter queue in submission order. Software keys use a
+    process pool when more than one CPU is available, threads otherwise.
+
+    A full stage holds the producer back until the pool catches up. As
+    producers queue under adapter.factory_lock, this backpressure reaches
+    every producer of the chain, which cannot outrun its signatures anyway.
+    A stage that is not running signs its backlog in the caller instead.
+    Only with a submit_timeout does an event that waited that long go to
+    the adapter queue unsigned (logged as an error), rather than wait on.
+    """
+
+    def __init__(
+        self,
+        signer: Signer,
+        workers: int = 2,
+        batch_size: int = 64,
+        max_in_flight: int = 8,
+        max_queue: int = 10000,
+        processes: Optional[bool] = None,
+        submit_timeout: Optional[float] = None
+    ):
+        self.signer = signer
+        self.workers = workers
+        self.batch_size = batch_size
+        self.max_in_flight = max_in_flight
+        self.submit_timeout = submit_timeout
+        if processes is None:
+            # Processes only pay off with a spare core for the pool
+            processes = signer.cpu_bound and (os.cpu_count() or 1) > 1
+        self.processes = processes
+        self.sink: Optional[Callable[[VCPEvent], bool]] = None
+        self._queue: Queue = Queue(maxsize=max_queue)
+        _backlog.set_function(self._queue.qsize)
+        self._executor: Optional[Executor] = None
+        self._thread: Optional[Thread] = None
+        self._stop = Event()
+
+    def attach(self, adapter) -> "SigningStage":
+        """Route adapter.queue_event through this stage"""
+        self.sink = adapter.put_event
+        adapter.signing_stage = self
+        return self
+
+    def submit(self, event: VCPEvent) -> bool:
+        """Queue an event for signing, waiting while the stage is full"""
+        deadline = None if self.submit_timeout is None else time.monotonic() + self.submit_timeout
+        while True:
+            try:
+                self._queue.put(event, timeout=0.1)
+                return True
+            except Full:
+                pass
+            if self._thread is None or not self._thread.is_alive():
+                self._sign_backlog()
+            elif deadline is not None and time.monotonic() >= deadline:
+                _signing_bypassed.inc()
+                logger.error(f"Signing queue full for {self.submit_timeout}s, forwarding event unsigned")
+                return self.sink(event)
+
+    def _sign_backlog(self):
+        """Sign and forward the queued events in the caller, in order (stage not running)"""
+        while True:
+            events = self._collect(0)
+            if not events:
+                return
+            for event in self.sign_events(events):
+                self.sink(event)
+
+    def sign_events(self, events: List[VCPEvent]) -> List[VCPEvent]:
+        """Sign events synchronously in the calling thread"""
+        self._apply(events, self.signer.sign_many(self._digests(events)))
+        return events
+
+    @staticmethod
+    def _digests(events: List[VCPEvent]) -> List[bytes]:
+        return [bytes.fromhex(event.security.event_hash) for event in events]
+
+    @staticmethod
+    def _apply(events: List[VCPEvent], signatures: List[bytes]):
+        encode = base64.b64encode
+        for event, signature in zip(events, signatures):
+            event.security.signature = encode(signature).decode("ascii")
+            event.security.sign_algo = SIGN_ALGO
+        _events_signed.inc(len(events))
+
+    def _collect(self, timeout: float) -> List[VCPEvent]:
+        batch = []
+        try:
+            batch.append(self._queue.get(timeout=timeout) if timeout else self._queue.get_nowait())
+            while len(batch) < self.batch_size:
+                batch.append(self._queue.get_nowait())
+        except Empty:
+            pass
+        return batch
+
+    def _run(self):
+        in_flight = deque()
+        while not self._stop.is_set() or in_flight or not self._queue.empty():
+            batch = self._collect(0 if in_flight else 0.1)
+            if batch:
+                future = self._executor.submit(self._sign_task(), self._digests(batch))
+                in_flight.append((batch, future, time.perf_counter()))
+            # Hand over finished batches in order; block only if the pipeline is full or idle
+            while in_flight and (
+                in_flight[0][1].done() or len(in_flight) >= self.max_in_flight or not batch
+            ):
+                events, future, started = in_flight.popleft()
+                try:
+                    self._apply(events, future.result())
+                except Exception as e:
+                    logger.error(f"Signing failed, forwarding {len(events)} events unsigned: {e}")
+                _batch_seconds.observe(time.perf_counter() - started)
+                for event in events:
+                    self.sink(event)
+
+    def _sign_task(self):
+        return _sign_in_worker if self.processes else self.signer.sign_many
+
+    def start(self) -> "SigningStage":
+        if self.sink is None:
+            raise RuntimeError("SigningStage has no sink; call attach(adapter) first")
+        if self.processes:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_sign_worker,
+                initargs=(self.signer,)
+            )
+            # Spawn the workers now rather than stalling the first batches
+            for future in [self._executor.submit(_sign_in_worker, []) for _ in range(self.workers)]:
+                future.result()
+        else:
+            self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="vcp-sign")
+        self._stop.clear()
+        self._thread = Thread(target=self._run, name="vcp-signing", daemon=True)
+        self._thread.start()
+        logger.info(
+            f"Signing with {type(self.signer).__name__} key {key_id(self.signer.public_key())} "
+            f"({self.workers} {'processes' if self.processes else 'threads'})"
+        )
+        return self
+
+    def stop(self):
+        """Sign and forward everything already submitted, then stop"""
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=30)
+            self._thread = None
+        if self._executor:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+
+# =============================================================================
+# Verification
+# =============================================================================
+_worker_public_key = None
+
+
+def _init_verify_worker(public_raw: bytes):
+    global _worker_public_key
+    _worker_public_key = Ed25519PublicKey.from_public_bytes(public_raw)
+
+
+def _verify_chunk(items: List, public_key=None) -> List[int]:
+    """Indices (into items) of (digest, signature) pairs that do not verify"""
+    verify = (public_key or _worker_public_key).verify
+    failed = []
+    for i, (digest, signature) in enumerate(items):
+        try:
+            verify(signature, digest)
+        except (InvalidSignature, ValueError, TypeError):
+            failed.append(i)
+    return failed
+
+
+def verify_event(public_key: "Ed25519PublicKey", event: VCPEvent) -> bool:
+    """Check one event's signature over its event_hash"""
+    return not BatchVerifier(public_key).verify([event])
+
+
+class BatchVerifier:
+    """
+    Verifies many event signatures against one venue public key
+
+    With workers > 0, chunks are verified in a process pool. Events that
+    are unsigned, signed with another algorithm or malformed count as failures.
+    """
+
+    def __init__(self, public_key: "Ed25519PublicKey", workers: int = 0, chunk_size: int = 512):
+        _require_crypto()
+        self.public_key = public_key
+        self.workers = workers
+        self.chunk_size = chunk_size
+        self._executor: Optional[ProcessPoolExecutor] = None
+        if workers > 0:
+            self._executor = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_verify_worker,
+                initargs=(_raw_public(public_key),)
+            )
+
+    def verify(self, events: Sequence[VCPEvent]) -> List[int]:
+        """Indices of events whose signature is missing or invalid"""
+        failed, items, positions = [], [], []
+        for i, event in enumerate(events):
+            security = event.security
+            try:
+                if security.sign_algo != SIGN_ALGO or not security.signature:
+                    raise ValueError("unsigned")
+                items.append((bytes.fromhex(security.event_hash), base64.b64decode(security.signature)))
+                positions.append(i)
+            except ValueError:
+                failed.append(i)
+
+        chunks = [items[i:i + self.chunk_size] for i in range(0, len(items), self.chunk_size)]
+        if self._executor:
+            results = self._executor.map(_verify_chunk, chunks)
+        else:
+            results = (_verify_chunk(chunk, self.public_key) for chunk in chunks)
+        for n, chunk_failed in enumerate(results):
+            base = n * self.chunk_size
+            failed.extend(positions[base + i] for i in chunk_failed)
+
+        if failed:
+            _verify_failures.inc(len(failed))
+        return sorted(failed)
+
+    def close(self):
+        if self._executor:
+            self._executor.shutdown(wait=True)
+            self._executor = None
@@ -0,0 +1,404 @@
+#!/usr/bin/env python3
+"""
+VCP Spool Tailer v1.0 - Bulk Ingestion of MQL5 Bridge Spool Files
+Document ID: VSO-SDK-PY-007
+License: CC BY 4.0 International
+Maintainer: VeritasChain Standards Organization (VSO)
+
+This module tails the append-only spool files written by the MQL5 bridge
+(VCP_TRANSPORT_RELAY_SPOOL, one file per terminal and day):
+- Kernel change notification (inotify via ctypes) with a polling fallback
+- Many files drained concurrently, in large chunks, whole lines only
+- Byte offsets checkpointed atomically, so restarts resume where they stopped
+- Records fed into the relay pipeline (EventRelay.submit_lines)
+
+With a relay on a VCPManagerAdapter, the checkpointed offset of a file only
+passes lines whose events the adapter no longer holds: acknowledged by VCC,
+dead-lettered or written to the offline backlog file. After a crash, lines
+whose events were still queued are read again, so delivery is
+at-least-once; records keep the EA's event_id, so VCC can drop the repeats.
+"""
+
+import ctypes
+import ctypes.util
+import fnmatch
+import json
+import logging
+import os
+import select
+import struct
+import tempfile
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from threading import Event, Lock, Thread
+from typing import Dict, List, Optional, Set, Tuple
+
+from vcp_metrics_v1_0 import REGISTRY
+
+logger = logging.getLogger("vcp_spool")
+
+_lines_read = REGISTRY.counter("vcp_spool_lines_total", "Spool lines read")
+_bytes_read = REGISTRY.counter("vcp_spool_bytes_total", "Spool bytes read")
+_files_tracked = REGISTRY.gauge("vcp_spool_files", "Spool files being tailed")
+_lag_bytes = REGISTRY.gauge("vcp_spool_lag_bytes", "Spool bytes written but not yet ingested")
+
+
+# =============================================================================
+# Change Notification Backends
+# =============================================================================
+class _InotifyBackend:
+    """Linux inotify on the spool directory (ctypes, no extra dependency)"""
+
+    IN_MODIFY = 0x00000002
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+    IN_Q_OVERFLOW = 0x00004000
+    IN_NONBLOCK = 0o4000
+    IN_CLOEXEC = 0o2000000
+
+    _EVENT = struct.Struct("iIII")
+
+    name = "inotify"
+
+    def __init__(self, directory: str):
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        self._fd = libc.inotify_init1(self.IN_NONBLOCK | self.IN_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        mask = self.IN_MODIFY | self.IN_CLOSE_WRITE | self.IN_MOVED_TO | self.IN_CREATE
+        if libc.inotify_add_watch(self._fd, os.fsencode(directory), mask) < 0:
+            errno = ctypes.get_errno()
+            os.close(self._fd)
+            raise OSError(errno, f"inotify_add_watch failed for {directory}")
+
+    def wait(self, timeout: float) -> Optional[Set[str]]:
+        """Names changed within timeout; None means rescan everything"""
+        ready, _, _ = select.select([self._fd], [], [], timeout)
+        if not ready:
+            return set()
+        names: Set[str] = set()
+        while True:
+            try:
+                data = os.read(self._fd, 256 * 1024)
+            except BlockingIOError:
+                break
+            pos = 0
+            while pos < len(data):
+                _, mask, _, length = self._EVENT.unpack_from(data, pos)
+                pos += self._EVENT.size
+                if mask & self.IN_Q_OVERFLOW:
+                    return None
+                if length:
+                    names.add(os.fsdecode(data[pos:pos + length].rstrip(b"\0")))
+                pos += length
+        return names
+
+    def close(self):
+        os.close(self._fd)
+
+
+class _PollingBackend:
+    """Portable fallback: report every file at a fixed interval"""
+
+    name = "polling"
+
+    def __init__(self, directory: str, interval: float = 0.1):
+        self.interval = interval
+
+    def wait(self, timeout: float) -> Optional[Set[str]]:
+        time.sleep(min(timeout, self.interval))
+        return None
+
+    def close(self):
+        pass
+
+
+def _create_backend(directory: str, backend: str, poll_interval: float):
+    if backend in ("auto", "inotify") and hasattr(select, "select") and os.name == "posix":
+        try:
+            return _InotifyBackend(directory)
+        except (OSError, AttributeError) as e:
+            if backend == "inotify":
+                raise
+            logger.info(f"inotify unavailable ({e}), falling back to polling")
+    return _PollingBackend(directory, poll_interval)
+
+
+# =============================================================================
+# Offsets
+# =============================================================================
+@dataclass
+class _FileState:
+    inode: int = 0
+    offset: int = 0     # Read position
+    size: int = 0
+    acked: int = 0      # Checkpointed position: every line before it is delivered
+    unacked: deque = field(default_factory=deque)  # (end offset, event IDs) per chunk read
+
+
+class OffsetCheckpoint:
+    """Per-file (inode, offset) saved as JSON with an atomic replace"""
+
+    def __init__(self, path: Optional[str]):
+        self.path = path
+
+    def load(self) -> Dict[str, _FileState]:
+        if not self.path or not os.path.exists(self.path):
+            return {}
+        try:
+            with open(self.path, 'r') as f:
+                data = json.load(f)
+            return {
+                name: _FileState(int(value["inode"]), int(value["offset"]), acked=int(value["offset"]))
+                for name, value in data.get("files", {}).items()
+            }
+        except (OSError, ValueError, KeyError) as e:
+            logger.error(f"Failed to load spool offsets from {self.path}: {e}")
+            return {}
+
+    def save(self, files: Dict[str, _FileState]):
+        if not self.path:
+            return
+        data = {
+            "version": 1,
+            "files": {
+                name: {"inode": state.inode, "offset": state.offset}
+                for name, state in files.items()
+            },
+        }
+        directory = os.path.dirname(os.path.abspath(self.path))
+        fd, tmp_path = tempfile.mkstemp(prefix=".spool-offsets-", dir=directory)
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump(data, f, separators=(',', ':'))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.path)
+        except OSError:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+
+
+# =============================================================================
+# Spool Tailer
+# =============================================================================
+class SpoolTailer:
+    """
+    Tails every spool file in a directory and feeds whole lines to a relay
+
+    Files are drained concurrently by a small thread pool (one worker per
+    file at a time). Each read takes up to chunk_size bytes and hands all
+    complete lines to relay.submit_lines in one call; a trailing partial
+    line is left for the next read.
+
+    If relay has an adapter, the event IDs of each chunk are kept until the
+    adapter no longer counts them as outstanding (this turns on its
+    tracking), and checkpoint() saves offsets only up to there. Other
+    relays are checkpointed at the read position.
+    """
+
+    def __init__(
+        self,
+        relay,
+        directory: str,
+        pattern: str = "*.ndjson",
+        checkpoint_path: Optional[str] = None,
+        backend: str = "auto",
+        poll_interval: float = 0.1,
+        rescan_interval: float = 5.0,
+        checkpoint_interval: float = 1.0,
+        chunk_size: int = 1 << 20,
+        workers: int = 4
+    ):
+        self.relay = relay
+        self.directory = directory
+        self.pattern = pattern
+        self.backend = backend
+        self.poll_interval = poll_interval
+        self.rescan_interval = rescan_interval
+        self.checkpoint_interval = checkpoint_interval
+        self.chunk_size = chunk_size
+        self.workers = workers
+
+        self._checkpoint = OffsetCheckpoint(checkpoint_path)
+        self._files: Dict[str, _FileState] = self._checkpoint.load()
+        self._files_lock = Lock()
+        self._saved = self._positions()
+        adapter = getattr(relay, "adapter", None)
+        if adapter is not None and adapter.outstanding is None:
+            adapter.outstanding = {}
+        self._outstanding = adapter.outstanding if adapter is not None else None
+        self._stop = Event()
+        self._thread: Optional[Thread] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._backend = None
+        self.lines_read = 0
+
+    # -------------------------------------------------------------------------
+    def _list_files(self) -> List[str]:
+        try:
+            return [n for n in os.listdir(self.directory) if fnmatch.fnmatch(n, self.pattern)]
+        except FileNotFoundError:
+            return []
+
+    def _drain(self, name: str) -> int:
+        """Read all complete lines appended to one file; returns lines read"""
+        path = os.path.join(self.directory, name)
+        with self._files_lock:
+            state = self._files.setdefault(name, _FileState())
+        try:
+            f = open(path, "rb")
+        except FileNotFoundError:
+            return 0
+
+        total = 0
+        with f:
+            st = os.fstat(f.fileno())
+            if st.st_ino != state.inode or st.st_size < state.offset:
+                # New, replaced or truncated file: start from the beginning
+                state.inode, state.offset, state.acked = st.st_ino, 0, 0
+                state.unacked.clear()
+            state.size = st.st_size
+            f.seek(state.offset)
+            chunk_size = self.chunk_size
+            while True:
+                chunk = f.read(chunk_size)
+                if not chunk:
+                    break
+                end = chunk.rfind(b"\n")
+                if end < 0:
+                    if len(chunk) < chunk_size:
+                        break  # Partial line still being written
+                    chunk_size *= 2  # Line longer than a chunk
+                    f.seek(state.offset)
+                    continue
+                lines = chunk[:end].split(b"\n")
+                if self._outstanding is None:
+                    self.relay.submit_lines(lines, "spool")
+                    state.offset = state.acked = state.offset + end + 1
+                else:
+                    event_ids: List[str] = []
+                    self.relay.submit_lines(lines, "spool", event_ids)
+                    state.offset += end + 1
+                    state.unacked.append((state.offset, event_ids))
+                total += len(lines)
+                _bytes_read.inc(end + 1)
+                if end + 1 < len(chunk):
+                    f.seek(state.offset)
+            state.size = max(state.size, state.offset)
+
+        if total:
+            _lines_read.inc(total)
+            with self._files_lock:
+                self.lines_read += total
+        return total
+
+    def drain_all(self, names: Optional[Set[str]] = None) -> int:
+        """Drain the given files (default: all matching) concurrently"""
+        if names is None:
+            targets = self._list_files()
+        else:
+            targets = [n for n in names if fnmatch.fnmatch(n, self.pattern)]
+        if not targets:
+            return 0
+        if self._executor is None or len(targets) == 1:
+            total = sum(self._drain(name) for name in targets)
+        else:
+            total = sum(self._executor.map(self._drain, targets))
+        self._update_gauges()
+        return total
+
+    def _update_gauges(self):
+        with self._files_lock:
+            _files_tracked.set(len(self._files))
+            _lag_bytes.set(sum(max(0, s.size - s.offset) for s in self._files.values()))
+
+    def _positions(self) -> Dict[str, Tuple[int, int]]:
+        return {name: (s.inode, s.acked) for name, s in self._files.items()}
+
+    def checkpoint(self):
+        """Persist the delivered offsets if they moved since the last checkpoint"""
+        outstanding = self._outstanding
+        with self._files_lock:
+            if outstanding is not None:
+                for state in self._files.values():
+                    unacked = state.unacked
+                    while unacked and not any(event_id in outstanding for event_id in unacked[0][1]):
+                        state.acked = unacked.popleft()[0]
+            positions = self._positions()
+            if positions == self._saved:
+                return
+            self._saved = positions
+        self._checkpoint.save({name: _FileState(inode, acked) for name, (inode, acked) in positions.items()})
+
+    def offsets(self) -> Dict[str, Tuple[int, int]]:
+        """
+        Current (inode, read offset) per file, e.g. for a sidecar checkpoint
+        (which holds the events still outstanding itself)
+        """
+        with self._files_lock:
+            return {name: (s.inode, s.offset) for name, s in self._files.items()}
+
+    def restore_offsets(self, offsets: Dict[str, Tuple[int, int]]):
+        """Resume from offsets captured by offsets() (call before start)"""
+        with self._files_lock:
+            self._files = {
+                name: _FileState(inode, offset, acked=offset) for name, (inode, offset) in offsets.items()
+            }
+
+    def _forget_missing(self):
+        """Drop state for spool files that were removed"""
+        present = set(self._list_files())
+        with self._files_lock:
+            for name in [n for n in self._files if n not in present]:
+                del self._files[name]
+
+    # -------------------------------------------------------------------------
+    def _run(self):
+        self.drain_all()
+        last_rescan = last_checkpoint = time.monotonic()
+        while not self._stop.is_set():
+            try:
+                changed = self._backend.wait(self.poll_interval)
+                now = time.monotonic()
+                if now - last_rescan >= self.rescan_interval:
+                    changed = None  # Safety net for missed notifications
+                    self._forget_missing()
+                    last_rescan = now
+                if changed is None or changed:
+                    self.drain_all(changed)
+                if now - last_checkpoint >= self.checkpoint_interval:
+                    self.checkpoint()
+                    last_checkpoint = now
+            except Exception as e:
+                logger.error(f"Spool tailer error: {e}")
+                self._stop.wait(1)
+
+    def start(self) -> "SpoolTailer":
+        """Start tailing in a background thread"""
+        os.makedirs(self.directory, exist_ok=True)
+        self._backend = _create_backend(self.directory, self.backend, self.poll_interval)
+        self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="vcp-spool")
+        self._stop.clear()
+        self._thread = Thread(target=self._run, name="vcp-spool-tailer", daemon=True)
+        self._thread.start()
+        logger.info(f"Tailing {self.directory}/{self.pattern} ({self._backend.name})")
+        return self
+
+    def stop(self):
+        """Stop tailing, drain what is already written and checkpoint"""
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=10)
+        self.drain_all()
+        if self._executor:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        if self._backend:
+            self._backend.close()
+            self._backend = None
+        self.checkpoint()
@@ -0,0 +1,359 @@
+#!/usr/bin/env python3
+"""
+VCP Sidecar Tracing v1.0 - Opt-in Profiling Hooks
+Document ID: VSO-SDK-PY-003
+License: CC BY 4.0 International
+Maintainer: VeritasChain Standards Organization (VSO)
+
+This module provides span-based tracing for the sidecar hot path:
+- Span start/end callbacks around event creation and transmission
+- Sampling per top-level operation
+- Ring-buffer recorder with Chrome trace and speedscope export
+- Live capture on a running process (e.g. via SIGUSR1)
+
+Tracing is disabled by default. Instrumented code checks the module-level
+`active` tracer and does nothing else while it is None.
+"""
+
+import json
+import logging
+import os
+import random
+import signal
+import tempfile
+import threading
+import time
+from collections import deque
+from typing import Callable, Dict, List, Optional
+
+logger = logging.getLogger("vcp_tracing")
+
+
+# The tracer hot-path hooks report to; None means tracing is off
+active: Optional["Tracer"] = None
+
+# Depth beyond which per-thread span state is assumed leaked and reset
+_MAX_DEPTH = 64
+
+
+# =============================================================================
+# Spans
+# =============================================================================
+class _ThreadState:
+    """Per-thread nesting depth and sampling decision"""
+
+    __slots__ = ("depth", "sampled", "unsampled")
+
+    def __init__(self):
+        self.depth = 0
+        self.sampled = False
+        self.unsampled = _UnsampledSpan(self)
+
+
+class Span:
+    """A timed stage of work on one thread"""
+
+    __slots__ = ("tracer", "state", "name", "start_ns", "end_ns", "thread_id", "args")
+
+    def __init__(self, tracer: "Tracer", state: _ThreadState, name: str,
+                 args: Optional[Dict], thread_id: int):
+        self.tracer = tracer
+        self.state = state
+        self.name = name
+        self.args = args
+        self.thread_id = thread_id
+        self.end_ns = 0
+        self.start_ns = time.perf_counter_ns()
+
+    @property
+    def duration_ns(self) -> int:
+        return self.end_ns - self.start_ns
+
+    def finish(self):
+        """End the span and notify listeners"""
+        self.end_ns = time.perf_counter_ns()
+        self.state.depth -= 1
+        for callback in self.tracer._end_callbacks:
+            callback(self)
+
+
+class _UnsampledSpan:
+    """Placeholder returned for spans skipped by sampling"""
+
+    __slots__ = ("state",)
+
+    def __init__(self, state: "_ThreadState"):
+        self.state = state
+
+    def finish(self):
+        self.state.depth -= 1
+
+
+# =============================================================================
+# Tracer
+# =============================================================================
+class Tracer:
+    """
+    Span factory with sampling and pluggable callbacks
+
+    Sampling is decided once per top-level span (e.g. one create_*_event
+    or one send_batch call); nested spans follow their parent's decision.
+    """
+
+    def __init__(self, sample_rate: float = 1.0):
+        if not 0.0 <= sample_rate <= 1.0:
+            raise ValueError("sample_rate must be between 0.0 and 1.0")
+        self.sample_rate = sample_rate
+        self._start_callbacks: List[Callable[[Span], None]] = []
+        self._end_callbacks: List[Callable[[Span], None]] = []
+        self._states: Dict[int, _ThreadState] = {}
+
+    def add_callbacks(
+        self,
+        on_start: Optional[Callable[[Span], None]] = None,
+        on_end: Optional[Callable[[Span], None]] = None
+    ):
+        """Register span start/end callbacks (called on the traced thread)"""
+        if on_start:
+            self._start_callbacks.append(on_start)
+        if on_end:
+            self._end_callbacks.append(on_end)
+
+    def start(self, name: str, args: Optional[Dict] = None):
+        """Start a span; returns an object with finish()"""
+        thread_id = threading.get_ident()
+        state = self._states.get(thread_id)
+        if state is None:
+            state = self._states.setdefault(thread_id, _ThreadState())
+
+        if state.depth == 0 or state.depth > _MAX_DEPTH:
+            state.depth = 0
+            state.sampled = self.sample_rate >= 1.0 or random.random() < self.sample_rate
+        state.depth += 1
+
+        if not state.sampled:
+            return state.unsampled
+
+        span = Span(self, state, name, args, thread_id)
+        for callback in self._start_callbacks:
+            callback(span)
+        return span
+
+
+# =============================================================================
+# Ring-Buffer Recorder
+# =============================================================================
+class RingBufferRecorder:
+    """Keeps the most recent finished spans in memory for export"""
+
+    def __init__(self, capacity: int = 200_000):
+        self._spans: deque = deque(maxlen=capacity)
+        self._thread_names: Dict[int, str] = {}
+
+    def attach(self, tracer: Tracer) -> "RingBufferRecorder":
+        tracer.add_callbacks(on_end=self.record)
+        return self
+
+    def record(self, span: Span):
+        self._spans.append((span.name, span.start_ns, span.end_ns, span.thread_id, span.args))
+        if span.thread_id not in self._thread_names:
+            self._thread_names[span.thread_id] = threading.current_thread().name
+
+    def __len__(self) -> int:
+        return len(self._spans)
+
+    def clear(self):
+        self._spans.clear()
+
+    def summary(self) -> Dict[str, Dict]:
+        """Per-stage totals: count, total and mean duration in microseconds"""
+        totals: Dict[str, List[int]] = {}
+        for name, start_ns, end_ns, _, _ in list(self._spans):
+            entry = totals.setdefault(name, [0, 0])
+            entry[0] += 1
+            entry[1] += end_ns - start_ns
+        return {
+            name: {
+                "count": count,
+                "total_us": total / 1000,
+                "mean_us": total / count / 1000
+            }
+            for name, (count, total) in sorted(totals.items(), key=lambda i: -i[1][1])
+        }
+
+    def to_chrome_trace(self) -> Dict:
+        """Chrome Trace Event Format (chrome://tracing, Perfetto)"""
+        pid = os.getpid()
+        events = []
+        for tid, thread_name in self._thread_names.items():
+            events.append({
+                "name": "thread_name", "ph": "M", "pid": pid, "tid": tid,
+                "args": {"name": thread_name}
+            })
+        for name, start_ns, end_ns, tid, args in list(self._spans):
+            event = {
+                "name": name,
+                "cat": name.split(".", 1)[0],
+                "ph": "X",
+                "ts": start_ns / 1000,
+                "dur": (end_ns - start_ns) / 1000,
+                "pid": pid,
+                "tid": tid,
+            }
+            if args:
+                event["args"] = args
+            events.append(event)
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def to_speedscope(self, name: str = "vcp-sidecar") -> Dict:
+        """speedscope evented profile, one profile per thread"""
+        frames: List[Dict] = []
+        frame_index: Dict[str, int] = {}
+        by_thread: Dict[int, List] = {}
+        for span_name, start_ns, end_ns, tid, _ in list(self._spans):
+            if span_name not in frame_index:
+                frame_index[span_name] = len(frames)
+                frames.append({"name": span_name})
+            by_thread.setdefault(tid, []).append((start_ns, end_ns, frame_index[span_name]))
+
+        profiles = []
+        for tid, spans in by_thread.items():
+            # Outer spans first when they start together, so nesting is well-formed
+            spans.sort(key=lambda s: (s[0], -s[1]))
+            events = []
+            stack: List = []
+            for start_ns, end_ns, frame in spans:
+                while stack and stack[-1][0] <= start_ns:
+                    closed_end, closed_frame = stack.pop()
+                    events.append({"type": "C", "frame": closed_frame, "at": closed_end})
+                if stack and end_ns > stack[-1][0]:
+                    # Partially overlapping span (ring buffer cut) - clamp to parent
+                    end_ns = stack[-1][0]
+                events.append({"type": "O", "frame": frame, "at": start_ns})
+                stack.append((end_ns, frame))
+            while stack:
+                closed_end, closed_frame = stack.pop()
+                events.append({"type": "C", "frame": closed_frame, "at": closed_end})
+            profiles.append({
+                "type": "evented",
+                "name": self._thread_names.get(tid, str(tid)),
+                "unit": "nanoseconds",
+                "startValue": events[0]["at"],
+                "endValue": events[-1]["at"],
+                "events": events,
+            })
+
+        return {
+            "$schema": "https://www.speedscope.app/file-format-schema.json",
+            "name": name,
+            "shared": {"frames": frames},
+            "profiles": profiles,
+            "exporter": "vcp_tracing_v1_0",
+        }
+
+    def dump(self, path: str, fmt: str = "chrome") -> str:
+        """Write the buffer as 'chrome' or 'speedscope' JSON"""
+        if fmt == "chrome":
+            data = self.to_chrome_trace()
+        elif fmt == "speedscope":
+            data = self.to_speedscope()
+        else:
+            raise ValueError(f"Unknown trace format: {fmt}")
+        with open(path, "w") as f:
+            json.dump(data, f)
+        logger.info(f"Wrote {len(self)} spans to {path} ({fmt})")
+        return path
+
+
+# =============================================================================
+# Activation and Live Capture
+# =============================================================================
+def enable(tracer: Tracer) -> Tracer:
+    """Route all instrumented hot-path hooks to tracer"""
+    global active
+    active = tracer
+    return tracer
+
+
+def disable():
+    """Turn tracing off (hooks become a single None check)"""
+    global active
+    active = None
+
+
+def capture(
+    duration: float = 30.0,
+    path: Optional[str] = None,
+    fmt: str = "chrome",
+    sample_rate: float = 1.0,
+    capacity: int = 1_000_000
+) -> str:
+    """
+    Trace the live process for duration seconds and dump the result.
+    Blocks the calling thread; run it from a helper thread in production.
+    """
+    recorder = RingBufferRecorder(capacity)
+    tracer = Tracer(sample_rate)
+    recorder.attach(tracer)
+
+    previous = active
+    enable(tracer)
+    try:
+        time.sleep(duration)
+    finally:
+        if previous is not None:
+            enable(previous)
+        else:
+            disable()
+
+    if path is None:
+        suffix = ".speedscope.json" if fmt == "speedscope" else ".trace.json"
+        path = os.path.join(
+            tempfile.gettempdir(),
+            f"vcp_trace_{os.getpid()}_{int(time.time())}{suffix}"
+        )
+    return recorder.dump(path, fmt)
+
+
+def install_signal_handler(
+    signum: Optional[int] = None,
+    duration: float = 30.0,
+    directory: Optional[str] = None,
+    fmt: str = "chrome",
+    sample_rate: float = 1.0
+) -> bool:
+    """
+    Capture a profile when the process receives signum (default SIGUSR1):
+        kill -USR1 <pid>
+    The capture runs on a background thread; the trace file path is logged.
+    Must be called from the main thread. Where SIGUSR1 does not exist
+    (Windows) nothing is installed unless signum is given explicitly;
+    returns whether a handler was installed.
+    """
+    if signum is None:
+        signum = getattr(signal, "SIGUSR1", None)
+        if signum is None:
+            logger.warning("SIGUSR1 is not available on this platform; trace capture signal not installed")
+            return False
+    busy = threading.Lock()
+
+    def _run():
+        try:
+            suffix = ".speedscope.json" if fmt == "speedscope" else ".trace.json"
+            path = os.path.join(
+                directory or tempfile.gettempdir(),
+                f"vcp_trace_{os.getpid()}_{int(time.time())}{suffix}"
+            )
+            capture(duration, path, fmt, sample_rate)
+        finally:
+            busy.release()
+
+    def _handler(received, frame):
+        if not busy.acquire(blocking=False):
+            logger.warning("Trace capture already running, ignoring signal")
+            return
+        logger.info(f"Starting {duration:.0f}s trace capture")
+        threading.Thread(target=_run, name="vcp-trace-capture", daemon=True).start()
+
+    signal.signal(signum, _handler)
+    return True
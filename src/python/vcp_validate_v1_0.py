@@ -0,0 +1,386 @@
+#!/usr/bin/env python3
+"""
+VCP Bulk Sequence Validator v1.0 - Table-driven Trace Checks for Archives
+Document ID: VSO-SDK-PY-018
+License: CC BY 4.0 International
+Maintainer: VeritasChain Standards Organization (VSO)
+
+This module runs the checks of EventCorrelator.add_event over whole
+archives instead of one event at a time:
+- EXPECTED_SEQUENCE compiled into a dense 256x256 transition table over
+  type codes, so a check is one index instead of enum construction and
+  list membership
+- Columns of integers (trace, type code, timestamp) grouped by trace
+  with one stable sort
+- With numpy, vectorized passes flag every trace with a duplicate ID, an
+  out-of-order timestamp, an unknown type code or a disallowed
+  transition; only those traces are replayed event by event
+- Without numpy, one pass over the columns with per-trace state in lists
+- A compact report: positions, kinds and type codes of the violations
+
+The result for every event is the one add_event would give when fed the
+same events in the same order into a fresh EventCorrelator. add_event
+raises ValueError for an unknown type code; the report lists that event
+as INVALID_TYPE.
+
+Usage:
+    report = validate_events(events)
+    report = validate_archive("/var/lib/vcp/backfill/segment-000001.ndjson.gz")
+    print(report.counts())
+    python vcp_validate_v1_0.py segment-*.ndjson.gz
+"""
+
+import argparse
+import gzip
+import json
+import logging
+import time
+from array import array
+from dataclasses import dataclass
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # Optional dependency
+    np = None
+
+from vcp_metrics_v1_0 import REGISTRY
+from vcp_sidecar_core_v1_0 import EventCorrelator, EventTypeCode, VCPEvent
+
+logger = logging.getLogger("vcp_validate")
+
+# Violation kinds, in the order add_event checks them
+DUPLICATE = 1
+OUT_OF_ORDER = 2
+INVALID_TYPE = 3
+UNEXPECTED = 4
+KIND_NAMES = {DUPLICATE: "duplicate", OUT_OF_ORDER: "out_of_order", INVALID_TYPE: "invalid_type",
+              UNEXPECTED: "unexpected"}
+
+TABLE_SIZE = 256  # Type codes outside 0..255 are never valid EventTypeCodes
+
+_validated = REGISTRY.counter("vcp_validate_events_total", "Events checked by the bulk sequence validator")
+_violations = REGISTRY.counter(
+    "vcp_validate_violations_total", "Sequence violations found by the bulk validator", ("kind",)
+)
+
+
+# =============================================================================
+# Transition table
+# =============================================================================
+def compile_transitions(expected=None) -> Tuple[bytes, bytes]:
+    """
+    Compile EXPECTED_SEQUENCE into (known, allowed) byte tables
+
+    known[code] is 1 for valid EventTypeCodes. allowed[prev << 8 | code]
+    is 1 when code may follow prev: anything known after a type without
+    an entry, the listed types after one with an entry, and never when
+    either side is unknown.
+    """
+    expected = EventCorrelator.EXPECTED_SEQUENCE if expected is None else expected
+    known = bytearray(TABLE_SIZE)
+    for code in EventTypeCode:
+        known[code] = 1
+    allowed = bytearray(TABLE_SIZE * TABLE_SIZE)
+    for prev in EventTypeCode:
+        following = expected.get(prev)
+        for code in EventTypeCode:
+            if following is None or code in following:
+                allowed[prev << 8 | code] = 1
+    return bytes(known), bytes(allowed)
+
+
+KNOWN, ALLOWED = compile_transitions()
+
+
+def _known(code: int) -> bool:
+    return 0 <= code < TABLE_SIZE and KNOWN[code] == 1
+
+
+# =============================================================================
+# Report
+# =============================================================================
+@dataclass
+class SequenceReport:
+    """
+    Violations of one validation, ordered by event position
+
+    kinds[i] is one of the kind constants for the event at indices[i];
+    codes[i] is the type code its message names (the previous type for
+    UNEXPECTED, the invalid code for INVALID_TYPE, else 0). event_ids and
+    type_codes are the validated columns, kept for rendering messages.
+    """
+    events: int
+    traces: int
+    indices: array
+    kinds: array
+    codes: array
+    event_ids: Sequence
+    type_codes: Sequence
+    backend: str
+    seconds: float
+
+    @property
+    def ok(self) -> bool:
+        return not self.indices
+
+    def __len__(self) -> int:
+        return len(self.indices)
+
+    def counts(self) -> Dict[str, int]:
+        counts = dict.fromkeys(KIND_NAMES.values(), 0)
+        for kind in self.kinds:
+            counts[KIND_NAMES[kind]] += 1
+        return counts
+
+    def result(self, n: int) -> Dict:
+        """The add_event result of the n-th violation"""
+        index, kind, code = self.indices[n], self.kinds[n], self.codes[n]
+        event_id = self.event_ids[index]
+        if kind == DUPLICATE:
+            return {"status": "duplicate", "event_id": event_id}
+        if kind == OUT_OF_ORDER:
+            return {"status": "warning", "message": "Out of order timestamp", "event_id": event_id}
+        if kind == INVALID_TYPE:
+            return {"status": "error", "message": f"{code} is not a valid EventTypeCode", "event_id": event_id}
+        current = EventTypeCode(int(self.type_codes[index])).name
+        return {"status": "warning", "message": f"Unexpected {current} after {EventTypeCode(code).name}",
+                "event_id": event_id}
+
+    def results(self) -> Iterator[Tuple[int, Dict]]:
+        """(event position, add_event result) of every violation"""
+        for n in range(len(self.indices)):
+            yield self.indices[n], self.result(n)
+
+    def to_dict(self, limit: int = 100) -> Dict:
+        return {
+            "events": self.events,
+            "traces": self.traces,
+            "violations": self.counts(),
+            "first": [dict(self.result(n), index=self.indices[n]) for n in range(min(limit, len(self.indices)))],
+            "backend": self.backend,
+            "seconds": round(self.seconds, 3),
+        }
+
+
+# =============================================================================
+# Validation
+# =============================================================================
+def _factorize(values: Iterable) -> Tuple[List[int], int]:
+    """Integer codes in first-seen order and the number of distinct values"""
+    index = dict.fromkeys(values)
+    for code, value in enumerate(index):
+        index[value] = code
+    return list(map(index.__getitem__, values)), len(index)
+
+
+def _repeated_ids(ids: Sequence) -> Optional[List[bool]]:
+    """Per event, whether its ID occurs more than once; None if all IDs are distinct"""
+    seen: set = set()
+    add = seen.add
+    repeated = {value for value in ids if value in seen or add(value)}
+    if not repeated:
+        return None
+    return [value in repeated for value in ids]
+
+
+def _replay(order: Iterable[int], traces: Sequence[int], ids: Sequence, types: Sequence[int],
+            stamps: Sequence[int], repeated, trace_count: int, found: list):
+    """
+    Run the add_event checks over events in order, appending (index, kind, code)
+
+    Only the accepted events of a trace advance its state, as in
+    add_event. Accepted IDs are kept only for events whose ID occurs
+    more than once in the input (repeated[i]); no other event can be a
+    duplicate.
+    """
+    last_type: List[Optional[int]] = [None] * trace_count
+    last_stamp = [0] * trace_count
+    accepted: Dict[int, set] = {}
+    append = found.append
+    for i in order:
+        trace = traces[i]
+        if repeated is not None and repeated[i]:
+            seen = accepted.get(trace)
+            if seen is not None and ids[i] in seen:
+                append((i, DUPLICATE, 0))
+                continue
+        code = types[i]
+        prev = last_type[trace]
+        if prev is not None:
+            if stamps[i] < last_stamp[trace]:
+                append((i, OUT_OF_ORDER, 0))
+                continue
+            if not (0 <= code < TABLE_SIZE and 0 <= prev < TABLE_SIZE and ALLOWED[prev << 8 | code]):
+                if not _known(prev):
+                    append((i, INVALID_TYPE, prev))
+                    continue
+                if not _known(code):
+                    append((i, INVALID_TYPE, code))
+                    continue
+                append((i, UNEXPECTED, prev))
+                continue
+        last_type[trace] = code
+        last_stamp[trace] = stamps[i]
+        if repeated is not None and repeated[i]:
+            accepted.setdefault(trace, set()).add(ids[i])
+
+
+def _validate_python(traces, ids, types, stamps, trace_count: int) -> list:
+    found: list = []
+    _replay(range(len(traces)), traces, ids, types, stamps, _repeated_ids(ids), trace_count, found)
+    return found
+
+
+def _validate_numpy(traces, ids, types, stamps, trace_count: int) -> list:
+    trace = np.asarray(traces, dtype=np.int64)
+    code = np.asarray(types, dtype=np.int64)
+    stamp = np.asarray(stamps, dtype=np.int64)
+
+    # Events grouped by trace, input order kept inside each trace
+    order = np.argsort(trace.astype(np.int32) if trace_count < 2 ** 31 else trace, kind="stable")
+    grouped = trace[order]
+    same = grouped[1:] == grouped[:-1]
+    prev, cur = order[:-1][same], order[1:][same]
+
+    # Every event checked against its predecessor; a trace without a hit accepts all its events
+    allowed = np.frombuffer(ALLOWED, dtype=np.uint8).astype(bool)
+    table_code = np.where((code >= 0) & (code < TABLE_SIZE), code, 0)
+    hit = (stamp[cur] < stamp[prev]) | ~allowed[table_code[prev] * TABLE_SIZE + table_code[cur]]
+    suspect = np.zeros(trace_count, dtype=bool)
+    suspect[trace[cur[hit]]] = True
+
+    repeated = None
+    if isinstance(ids, np.ndarray) and ids.dtype.kind in "iu":
+        id_sorted = np.sort(ids)
+        dup_values = np.unique(id_sorted[1:][id_sorted[1:] == id_sorted[:-1]])
+        if len(dup_values):
+            repeated = np.isin(ids, dup_values)
+    else:
+        flags = _repeated_ids(ids)
+        if flags is not None:
+            repeated = np.array(flags, dtype=bool)
+    if repeated is not None:
+        suspect[trace[repeated]] = True
+
+    found: list = []
+    if suspect.any():
+        # Replay the suspect traces only, on compact copies of their columns
+        replay = order[suspect[grouped]]
+        distinct, traces = np.unique(trace[replay], return_inverse=True)
+        replay_ids = ids[replay] if isinstance(ids, np.ndarray) else [ids[i] for i in replay.tolist()]
+        _replay(range(len(replay)), traces.tolist(), replay_ids, code[replay].tolist(), stamp[replay].tolist(),
+                None if repeated is None else repeated[replay].tolist(), len(distinct), found)
+        positions = replay.tolist()
+        found = sorted((positions[i], kind, value) for i, kind, value in found)
+    return found
+
+
+def validate_columns(
+    trace_ids: Sequence,
+    event_ids: Sequence,
+    type_codes: Sequence[int],
+    timestamps: Sequence[int],
+    use_numpy: Optional[bool] = None
+) -> SequenceReport:
+    """
+    Validate events given as columns, in input order
+
+    trace_ids and event_ids may be strings or integer codes (for example
+    numpy arrays from a columnar archive); timestamps are integer
+    timestamp_int values. use_numpy defaults to whether numpy is installed.
+    """
+    started = time.perf_counter()
+    n = len(trace_ids)
+    if not len(event_ids) == len(type_codes) == len(timestamps) == n:
+        raise ValueError("Columns must have the same length")
+    use_numpy = np is not None if use_numpy is None else use_numpy
+    if use_numpy and np is None:
+        raise RuntimeError("numpy is not installed")
+
+    if use_numpy and isinstance(trace_ids, np.ndarray) and trace_ids.dtype.kind in "iu":
+        if n and 0 <= trace_ids.min() and trace_ids.max() < 2 * n:  # Already dense codes
+            traces, trace_count = trace_ids, int(trace_ids.max()) + 1
+            distinct_traces = int(np.count_nonzero(np.bincount(trace_ids)))
+        else:
+            distinct, traces = np.unique(trace_ids, return_inverse=True)
+            trace_count = distinct_traces = len(distinct)
+    else:
+        traces, trace_count = _factorize(trace_ids)
+        distinct_traces = trace_count
+
+    if use_numpy:
+        found = _validate_numpy(traces, event_ids, type_codes, timestamps, trace_count)
+    else:
+        found = _validate_python(traces, event_ids, type_codes, timestamps, trace_count)
+
+    report = SequenceReport(
+        events=n,
+        traces=distinct_traces,
+        indices=array("q", [f[0] for f in found]),
+        kinds=array("b", [f[1] for f in found]),
+        codes=array("q", [f[2] for f in found]),
+        event_ids=event_ids,
+        type_codes=type_codes,
+        backend="numpy" if use_numpy else "python",
+        seconds=time.perf_counter() - started,
+    )
+    _validated.inc(n)
+    for name, count in report.counts().items():
+        if count:
+            _violations.labels(name).inc(count)
+    return report
+
+
+def validate_events(events: Sequence[VCPEvent], use_numpy: Optional[bool] = None) -> SequenceReport:
+    """Validate VCPEvent objects in order (same results as add_event on a fresh EventCorrelator)"""
+    headers = [event.header for event in events]
+    return validate_columns(
+        [h.trace_id for h in headers],
+        [h.event_id for h in headers],
+        [h.event_type_code for h in headers],
+        [int(h.timestamp_int) for h in headers],
+        use_numpy=use_numpy,
+    )
+
+
+def read_columns(paths: Iterable[str]) -> Tuple[List[str], List[str], List[int], List[int]]:
+    """Header columns of NDJSON event files (gzip when named *.gz), in file order"""
+    traces, ids, types, stamps = [], [], [], []
+    for path in paths:
+        opener = gzip.open if path.endswith(".gz") else open
+        with opener(path, "rt", encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                header = json.loads(line)["header"]
+                traces.append(header["trace_id"])
+                ids.append(header["event_id"])
+                types.append(header["event_type_code"])
+                stamps.append(int(header["timestamp_int"]))
+    return traces, ids, types, stamps
+
+
+def validate_archive(*paths: str, use_numpy: Optional[bool] = None) -> SequenceReport:
+    """Validate archive segments (NDJSON, optionally gzip) read in the given order"""
+    return validate_columns(*read_columns(paths), use_numpy=use_numpy)
+
+
+# =============================================================================
+# Command line
+# =============================================================================
+def main():
+    parser = argparse.ArgumentParser(description="Check trace sequences of VCP event archives")
+    parser.add_argument("archives", nargs="+", help="NDJSON event files or gzip segments, in chain order")
+    parser.add_argument("--limit", type=int, default=20, help="Violations to list")
+    parser.add_argument("--no-numpy", action="store_true", help="Use the pure-Python pass")
+    args = parser.parse_args()
+
+    report = validate_archive(*args.archives, use_numpy=False if args.no_numpy else None)
+    print(json.dumps(report.to_dict(limit=args.limit), indent=2))
+    if not report.ok:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()